@@ -2,16 +2,23 @@
 
 import logging
 import time
-from typing import override
+from pathlib import Path
+from typing import TYPE_CHECKING, override
 
 from claude_code_sdk import ClaudeSDKClient, ClaudeCodeOptions
-from claude_code_sdk.types import ResultMessage
 
 from ..core.agent_base import BaseAgent
 from ..core.types import AgentResult, Success, Error, AnalystContext
 from ..core.config import AnalystConfig
 from ..utils.file_operations import load_prompt_with_includes
 from ..utils.text_processing import create_slug
+from ..utils.artifact_inlining import append_inlined_artifacts
+from ..utils.analysis_linter import format_lint_issues, lint_analysis
+from ..utils.analysis_sections import parse_sections
+from ..research.knowledge_base import KB_SERVER, KB_TOOL, server_config
+
+if TYPE_CHECKING:
+    from ..core.run_analytics import RunAnalytics
 
 # Module-level logger
 logger = logging.getLogger(__name__)
@@ -72,6 +79,7 @@ class AnalystAgent(BaseAgent[AnalystConfig, AnalystContext]):
         run_analytics = context.run_analytics if context else None
         # Get iteration number from context (1-based: 1 = first iteration)
         iteration = context.iteration if context else 1
+        analytics_name = context.analytics_name
 
         # Setup interrupt handling
         original_handler = self.setup_interrupt_handler()  # type: ignore[reportAny]
@@ -81,16 +89,18 @@ class AnalystAgent(BaseAgent[AnalystConfig, AnalystContext]):
         logger.info(f"Starting analysis for {idea_slug}, iteration {iteration}")
 
         try:
-            # Load the analyst prompt with includes processed
-            system_prompt_template = load_prompt_with_includes(
-                self.get_system_prompt_path(), self.config.prompts_dir
-            )
-
             # Determine web tools availability (WebSearch and WebFetch are always together)
             web_tools_enabled = "WebSearch" in allowed_tools
 
+            # Earlier research is looked up locally before searching the web
+            knowledge_base = context.knowledge_base_path if web_tools_enabled else None
+            if knowledge_base:
+                allowed_tools = [*allowed_tools, KB_TOOL]
+
             # Build tools list - TodoWrite is always available
             tools_list = ["WebSearch", "WebFetch"] if web_tools_enabled else []
+            if knowledge_base:
+                tools_list.append(KB_TOOL)
             tools_list.extend(["TodoWrite", "Read", "Edit", "MultiEdit"])
 
             # Load appropriate web tools content based on availability
@@ -106,34 +116,66 @@ class AnalystAgent(BaseAgent[AnalystConfig, AnalystContext]):
                 max_websearches=self.config.max_websearches
             )
 
-            # Format the system prompt with all variables
-            system_prompt = system_prompt_template.format(
-                max_turns=self.config.max_turns,
+            # Static system prompt first, session settings appended last
+            system_prompt = self.build_system_prompt(
+                max_turns=self.get_max_turns(context),
                 max_websearches=self.config.max_websearches,
                 tools_list=", ".join(tools_list),
-                web_tools_content=web_tools_content,
+                web_tools_content=web_tools_content.strip(),
             )
 
             # Log the formatted system prompt for observability
             if run_analytics:
-                run_analytics.log_system_prompt("analyst", iteration, system_prompt)
+                run_analytics.log_system_prompt(analytics_name, iteration, system_prompt)
                 logger.debug(f"System prompt logged for iteration {iteration}")
 
             # Use output path from context
             output_file = context.analysis_output_path
 
+            # Lint standard sessions against the sections of their template
+            lint_enabled = self.config.lint_gate and not context.user_prompt_template
+            initial_text = output_file.read_text() if output_file.exists() else ""
+            required_sections = list(parse_sections(initial_text)) if lint_enabled else []
+
+            # Use the previous analysis path if available, otherwise empty string
+            previous_file = (
+                str(context.previous_analysis_input_path)
+                if context.previous_analysis_input_path
+                else ""
+            )
+
             # Build user prompt based on whether this is a revision
-            if context.feedback_input_path:
+            inline_inputs: list[tuple[str, Path | None]] = []
+            if context.user_prompt_template:
+                # Caller-supplied prompt (e.g. section groups, consistency pass)
+                custom_template = load_prompt_with_includes(
+                    context.user_prompt_template, self.config.prompts_dir
+                )
+                user_prompt = custom_template.format(
+                    idea=input_data,
+                    output_file=str(output_file),
+                    **context.prompt_vars,
+                )
+            elif context.revision_brief_input_path:
+                # Compact brief replaces the raw reviewer and fact-check files
+                brief_template = load_prompt_with_includes(
+                    "agents/analyst/user/revision_brief.md", self.config.prompts_dir
+                )
+                user_prompt = brief_template.format(
+                    idea=input_data,
+                    previous_analysis_file=previous_file,
+                    revision_brief_file=str(context.revision_brief_input_path),
+                    output_file=str(output_file),
+                )
+                inline_inputs = [
+                    ("Previous analysis", context.previous_analysis_input_path),
+                    ("Revision brief", context.revision_brief_input_path),
+                ]
+            elif context.feedback_input_path:
                 # Load revision-specific user prompt (includes constraints.md)
                 revision_template = load_prompt_with_includes(
                     "agents/analyst/user/revision.md", self.config.prompts_dir
                 )
-                # Use the previous analysis path if available, otherwise empty string
-                previous_file = (
-                    str(context.previous_analysis_input_path)
-                    if context.previous_analysis_input_path
-                    else ""
-                )
 
                 # Build optional fact-check line
                 fact_check_line = ""
@@ -152,6 +194,11 @@ class AnalystAgent(BaseAgent[AnalystConfig, AnalystContext]):
                     fact_check_line=fact_check_line,
                     output_file=str(output_file),
                 )
+                inline_inputs = [
+                    ("Previous analysis", context.previous_analysis_input_path),
+                    ("Reviewer feedback", context.feedback_input_path),
+                    ("Fact-check results", context.fact_check_input_path),
+                ]
             else:
                 # Load and format standard user prompt template (includes constraints.md)
                 user_template = load_prompt_with_includes(
@@ -163,59 +210,115 @@ class AnalystAgent(BaseAgent[AnalystConfig, AnalystContext]):
                     output_file=str(output_file),
                 )
 
+            if context.research_input_path:
+                # Pre-research results replace most of the session's searches
+                research_note = load_prompt_with_includes(
+                    "agents/analyst/snippets/pre_research.md", self.config.prompts_dir
+                )
+                user_prompt, _ = append_inlined_artifacts(
+                    f"{user_prompt.rstrip()}\n\n{research_note}",
+                    [("Pre-research results", context.research_input_path)],
+                    self.config.inline_artifact_max_chars,
+                )
+
+            if context.source_notes:
+                user_prompt = f"{user_prompt.rstrip()}\n\n{context.source_notes}"
+            if knowledge_base:
+                kb_note = load_prompt_with_includes(
+                    "agents/analyst/snippets/knowledge_base.md", self.config.prompts_dir
+                )
+                user_prompt = f"{user_prompt.rstrip()}\n\n{kb_note.format(tool=KB_TOOL)}"
+
+            # Inline read-only revision inputs to save Read tool round trips
+            if self.config.inline_artifacts and inline_inputs:
+                user_prompt, inlined = append_inlined_artifacts(
+                    user_prompt, inline_inputs, self.config.inline_artifact_max_chars
+                )
+                if run_analytics and inlined:
+                    run_analytics.record_savings(
+                        analytics_name, iteration, "inline_artifacts", turns=len(inlined)
+                    )
+
             # Configure options
             options = ClaudeCodeOptions(
                 system_prompt=system_prompt,
-                max_turns=self.config.max_turns,
+                max_turns=self.get_max_turns(context),
                 allowed_tools=allowed_tools,
                 permission_mode="acceptEdits",  # Allow agent to edit files directly
             )
+            if knowledge_base:
+                options.mcp_servers = {
+                    KB_SERVER: server_config(
+                        knowledge_base, self.config.knowledge_base_max_age_days
+                    )
+                }
+            self.apply_model_selection(options, iteration)
+            self.apply_thinking_budget(options, iteration, run_analytics, analytics_name)
+            if run_analytics:
+                run_analytics.record_turn_limit(analytics_name, iteration, options.max_turns)
             logger.debug(
                 msg=f"Analyst options: allowed_tools={options.allowed_tools}, max_turns={options.max_turns} "
             )
 
             # Create client and analyze
+            governor = self.create_governor(
+                {"WebSearch": self.config.max_websearches},
+                output_file,
+                context.output_limit,
+            )
             async with ClaudeSDKClient(options=options) as client:
                 await client.query(user_prompt)
+                lint_rounds = 0
 
-                async for message in client.receive_response():
-                    # Check for interrupt
+                # One pass per query: the initial prompt, then any lint fix requests
+                while True:
+                    result_message = await self.receive_result(
+                        client, run_analytics, analytics_name, iteration, governor
+                    )
                     if self.interrupt_event.is_set():
-                        await client.interrupt()
                         logger.warning("Analysis interrupted by user")
                         return Error(message="Analysis interrupted by user")
 
-                    # Track message with RunAnalytics if available
-                    if run_analytics:
-                        run_analytics.track_message(message, "analyst", iteration)
+                    if result_message is None:
+                        break
+
+                    # Ask the agent to write each file if it hasn't, before giving up
+                    failed_files: list[Path] = []
+                    for path in [output_file, *context.extra_output_paths]:
+                        problem = await self.repair_output(
+                            client,
+                            lambda path=path: self._output_problem(path, initial_text),
+                            path,
+                            run_analytics,
+                            analytics_name,
+                            iteration,
+                            governor,
+                        )
+                        if problem is not None:
+                            failed_files.append(path)
+                    if failed_files:
+                        # Agent didn't create the file - this is an error
+                        names = ", ".join(str(path) for path in failed_files)
+                        logger.error(f"Agent failed to write analysis to {names}")
+                        return Error(message=f"Agent failed to write analysis to {names}")
+
+                    # Send blocking lint issues back before the analysis goes to review
+                    if lint_enabled and lint_rounds < self.config.lint_max_rounds:
+                        lint_prompt = self._lint_follow_up(
+                            output_file, required_sections, iteration, run_analytics
+                        )
+                        if lint_prompt:
+                            lint_rounds += 1
+                            await client.query(lint_prompt)
+                            continue
 
-                    # Get counts from RunAnalytics (always available in practice)
                     message_count = run_analytics.message_count if run_analytics else 0
                     search_count = run_analytics.search_count if run_analytics else 0
-
-                    if message_count > 0 and message_count % 5 == 0:
-                        logger.debug(
-                            f"Analysis progress: {message_count} messages processed"
-                        )
-
-                    # Check for completion
-                    if isinstance(message, ResultMessage):
-                        # Check if the output file was created
-                        if output_file.exists():
-                            logger.info(
-                                f"Analysis complete: {message_count} messages, {search_count} searches"
-                            )
-                            logger.info(f"Analysis written to: {output_file}")
-
-                            return Success()
-                        else:
-                            # Agent didn't create the file - this is an error
-                            logger.error(
-                                f"Agent failed to write analysis to {output_file}"
-                            )
-                            return Error(
-                                message=f"Agent failed to write analysis to {output_file}"
-                            )
+                    logger.info(
+                        f"Analysis complete: {message_count} messages, {search_count} searches"
+                    )
+                    logger.info(f"Analysis written to: {output_file}")
+                    return Success()
 
             # If no ResultMessage was found, log error
             logger.error("Analysis failed: No ResultMessage received")
@@ -236,3 +339,62 @@ class AnalystAgent(BaseAgent[AnalystConfig, AnalystContext]):
                 + f"Duration: {time.time() - start_time:.1f}s, "
                 + f"Iteration: {iteration}"
             )
+
+    @staticmethod
+    def _output_problem(output_file: Path, initial_text: str) -> str | None:
+        """Describe a missing or untouched analysis file, or None if it was written."""
+        if not output_file.exists():
+            return f"The analysis file {output_file} does not exist. Write the complete analysis there."
+        if initial_text and output_file.read_text() == initial_text:
+            return (
+                f"The analysis file {output_file} is still the unedited template. "
+                + "Write the complete analysis there."
+            )
+        return None
+
+    def _lint_follow_up(
+        self,
+        output_file: Path,
+        required_sections: list[str],
+        iteration: int,
+        run_analytics: "RunAnalytics | None",
+    ) -> str | None:
+        """Lint the written analysis and build a fix request if anything blocks.
+
+        Args:
+            output_file: Analysis written by this session
+            required_sections: Sections the analysis must contain
+            iteration: Current iteration number
+            run_analytics: Analytics tracker, if any
+
+        Returns:
+            Follow-up prompt listing blocking issues, or None if the analysis passes
+        """
+        started = time.perf_counter()
+        issues = lint_analysis(
+            output_file.read_text(),
+            required_sections,
+            self.config.min_words,
+            self.config.lint_max_uncited_figures,
+        )
+        blocking = [issue for issue in issues if issue.blocking]
+        if run_analytics:
+            run_analytics.record_lint(
+                iteration,
+                time.perf_counter() - started,
+                [issue.rule for issue in blocking],
+                warnings=len(issues) - len(blocking),
+            )
+        if not blocking:
+            return None
+
+        logger.info(
+            f"Lint gate: {len(blocking)} blocking issues, sending back to the analyst"
+        )
+        template = load_prompt_with_includes(
+            "agents/analyst/user/lint_fix.md", self.config.prompts_dir
+        )
+        return template.format(
+            output_file=str(output_file), issues=format_lint_issues(blocking)
+        )
+
@@ -1,24 +1,57 @@
 """FactChecker agent implementation for verifying claims and citations."""
 
+import asyncio
 import json
 import logging
+import math
 import time
-from typing import override
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, override
 from pathlib import Path
 
 from claude_code_sdk import ClaudeSDKClient, ClaudeCodeOptions
-from claude_code_sdk.types import ResultMessage
 
 from ..core.agent_base import BaseAgent
 from ..core.types import AgentResult, Success, Error, FactCheckContext
 from ..core.config import FactCheckerConfig
 from ..utils.file_operations import load_prompt
-from ..utils.json_validator import JsonResponseValidator
+from ..utils.json_validator import JsonResponseValidator, load_json_object
+from ..utils.artifact_inlining import append_inlined_artifacts
+from ..utils.claims import (
+    Claim,
+    ClaimDiff,
+    carry_forward_issues,
+    diff_claims,
+    extract_claims,
+    merge_carried_forward,
+    merge_shard_results,
+    partition_claims,
+)
+from ..research.claim_memo import MemoHit, load_memo_hits, render_memo_hits
+from ..research.prefetch import (
+    SUPPORTED,
+    PreVerification,
+    load_pre_verifications,
+    render_pre_verifications,
+)
+
+if TYPE_CHECKING:
+    from ..core.run_analytics import RunAnalytics
 
 # Module-level logger
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _IncrementalPlan:
+    """Claims to verify and verdicts to carry forward for one iteration."""
+
+    diff: ClaimDiff
+    carried: list[dict[str, Any]]  # pyright: ignore[reportExplicitAny]
+    previous_iteration: int
+
+
 class FactCheckerAgent(BaseAgent[FactCheckerConfig, FactCheckContext]):
     """Agent responsible for fact-checking claims and citations in analyses."""
 
@@ -89,8 +122,10 @@ class FactCheckerAgent(BaseAgent[FactCheckerConfig, FactCheckContext]):
                 str(context.analysis_input_path)
             )
 
-            # Load the fact-checker prompt with includes
-            system_prompt = self.load_system_prompt()
+            # Load the fact-checker prompt with session limits appended
+            system_prompt = self.build_system_prompt(
+                webfetch_per_iteration=self.config.webfetch_per_iteration
+            )
             
             # Log the system prompt if analytics available
             if context and context.run_analytics:
@@ -101,61 +136,138 @@ class FactCheckerAgent(BaseAgent[FactCheckerConfig, FactCheckContext]):
 
             # Fact-check file should be pre-created by pipeline
 
-            # Load and format fact-check instructions template
-            fact_check_template = load_prompt(
-                "agents/factchecker/user/fact-check.md",
-                self.config.prompts_dir,
+            # Incremental mode: only verify claims that changed since N-1
+            plan = (
+                self._plan_incremental(context, analysis_path, iteration)
+                if self.config.incremental
+                else None
             )
-            user_prompt = fact_check_template.format(
-                iteration=iteration,
-                max_iterations=context.max_iterations,
-                analysis_path=analysis_path,
-                fact_check_file=fact_check_file,
+            if plan is not None and not plan.diff.new:
+                # Nothing to verify - every verdict carries forward
+                logger.info(
+                    "Incremental fact-check: no claims changed, "
+                    + "carrying forward all previous verdicts"
+                )
+                _ = self._write_merged_fact_check(fact_check_file, {}, plan)
+                return Success()
+
+            # Sharded mode: split the claims across concurrent sub-sessions
+            shards = (
+                partition_claims(
+                    plan.diff.new
+                    if plan is not None
+                    else extract_claims(analysis_path.read_text()),
+                    self.config.claims_per_shard,
+                    self.config.max_shards,
+                )
+                if self.config.sharded
+                else []
             )
 
+            # Verdicts pre-computed while the analyst was writing
+            claims_to_check = (
+                plan.diff.new
+                if plan is not None
+                else [c for shard in shards for c in shard] or None
+            )
+            memo_hits = self._load_memo_hits(context, claims_to_check)
+            memoized = {hit.claim_key for hit in memo_hits}
+            pre_verified = [
+                r
+                for r in self._load_pre_verified(context, claims_to_check)
+                if r.claim_key not in memoized
+            ]
+            if run_analytics and memo_hits:
+                run_analytics.record_savings(
+                    "fact_checker",
+                    iteration,
+                    "claim_memo",
+                    turns=min(
+                        len({e.url for hit in memo_hits for e in hit.entries}),
+                        self.config.webfetch_per_iteration,
+                    ),
+                )
+            if run_analytics and pre_verified:
+                run_analytics.record_savings(
+                    "fact_checker",
+                    iteration,
+                    "prefetch",
+                    turns=len(
+                        {r.url for r in pre_verified if r.status == SUPPORTED or r.excerpt}
+                    ),
+                )
+
             # Configure options
             options = ClaudeCodeOptions(
                 system_prompt=system_prompt,
-                max_turns=self.config.max_turns,
+                max_turns=self.get_max_turns(context),
                 allowed_tools=allowed_tools,
                 permission_mode="acceptEdits",  # Allow agent to edit files directly
             )
+            self.apply_model_selection(options, iteration)
+            self.apply_thinking_budget(options, iteration, run_analytics, "fact_checker")
+            if run_analytics:
+                run_analytics.record_turn_limit("fact_checker", iteration, options.max_turns)
             logger.debug(
                 msg=f"FactChecker options: allowed_tools={options.allowed_tools}, max_turns={options.max_turns}"
             )
 
-            # Create client and fact-check
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(user_prompt)
-
-                async for message in client.receive_response():
-                    # Check for interrupt
-                    if self.interrupt_event.is_set():
-                        await client.interrupt()
-                        logger.warning("Fact-check interrupted by user")
-                        return Error(message="Fact-check interrupted by user")
-
-                    # Track message with RunAnalytics if available
-                    if run_analytics:
-                        run_analytics.track_message(message, "fact_checker", iteration)
-
-                    # Get counts from RunAnalytics (always available in practice)
-                    message_count = run_analytics.message_count if run_analytics else 0
+            if len(shards) > 1:
+                session_error = await self._run_shards(
+                    options,
+                    shards,
+                    context,
+                    analysis_path,
+                    iteration,
+                    pre_verified,
+                    memo_hits,
+                )
+            else:
+                if plan is not None:
+                    user_prompt = self._build_incremental_prompt(
+                        context, analysis_path, iteration, plan
+                    )
+                else:
+                    # Load and format fact-check instructions template
+                    fact_check_template = load_prompt(
+                        "agents/factchecker/user/fact-check.md",
+                        self.config.prompts_dir,
+                    )
+                    user_prompt = fact_check_template.format(
+                        iteration=iteration,
+                        max_iterations=context.max_iterations,
+                        analysis_path=analysis_path,
+                        fact_check_file=fact_check_file,
+                    )
 
-                    # Progress tracking
-                    if message_count > 0 and message_count % 5 == 0:
-                        logger.debug(
-                            f"Fact-check progress: {message_count} messages processed"
+                # Inline the analysis to save the Read tool round trip
+                # (incremental prompts already carry the claims to verify)
+                if self.config.inline_artifacts and plan is None:
+                    user_prompt, inlined = append_inlined_artifacts(
+                        user_prompt,
+                        [("Analysis to fact-check", analysis_path)],
+                        self.config.inline_artifact_max_chars,
+                    )
+                    if run_analytics and inlined:
+                        run_analytics.record_savings(
+                            "fact_checker",
+                            iteration,
+                            "inline_artifacts",
+                            turns=len(inlined),
                         )
 
-                    # Process when we hit ResultMessage (end of stream)
-                    if isinstance(message, ResultMessage):
-                        if message.is_error:
-                            logger.error(f"SDK returned error: {message.subtype}")
-                            return Error(
-                                message="SDK error during fact-check generation"
-                            )
-                        break
+                if memo_hits:
+                    user_prompt += "\n" + render_memo_hits(memo_hits)
+                if context.source_notes:
+                    user_prompt += "\n" + context.source_notes
+                if pre_verified:
+                    user_prompt += "\n" + render_pre_verifications(pre_verified)
+
+                session_error = await self._run_session(
+                    options, user_prompt, run_analytics, iteration, fact_check_file
+                )
+            if session_error is not None:
+                return session_error
 
             # Check if the fact-check file has content (not just empty template)
             if fact_check_file.exists() and fact_check_file.stat().st_size > 2:
@@ -167,6 +279,12 @@ class FactCheckerAgent(BaseAgent[FactCheckerConfig, FactCheckContext]):
                         message="Invalid fact-check structure could not be fixed"
                     )
 
+                # Add verdicts for unchanged claims
+                if plan is not None:
+                    fact_check_json = self._write_merged_fact_check(
+                        fact_check_file, fact_check_json, plan
+                    )
+
                 # Create metadata from fact-check
                 metadata = self._create_fact_check_metadata(
                     fact_check_json, iteration, fact_check_file
@@ -200,6 +318,337 @@ class FactCheckerAgent(BaseAgent[FactCheckerConfig, FactCheckContext]):
                 + f"Iteration: {iteration}"
             )
 
+    async def _run_session(
+        self,
+        options: ClaudeCodeOptions,
+        user_prompt: str,
+        run_analytics: "RunAnalytics | None",
+        iteration: int,
+        output_file: Path | None = None,
+        webfetch_budget: int | None = None,
+    ) -> Error | None:
+        """Run one fact-check session until its ResultMessage.
+
+        Args:
+            options: SDK options for the session
+            user_prompt: Fact-check instructions
+            run_analytics: Analytics tracker, if any
+            iteration: Current iteration number
+            output_file: Fact-check file to repair in-session if invalid
+            webfetch_budget: WebFetch calls allowed (defaults to the per-iteration budget)
+
+        Returns:
+            Error if the session failed or was interrupted, otherwise None
+        """
+        if webfetch_budget is None:
+            webfetch_budget = self.config.webfetch_per_iteration
+        governor = self.create_governor({"WebFetch": webfetch_budget})
+        async with ClaudeSDKClient(options=options) as client:
+            await client.query(user_prompt)
+
+            result = await self.receive_result(
+                client, run_analytics, "fact_checker", iteration, governor
+            )
+            if self.interrupt_event.is_set():
+                logger.warning("Fact-check interrupted by user")
+                return Error(message="Fact-check interrupted by user")
+            if result is not None and result.is_error:
+                logger.error(f"SDK returned error: {result.subtype}")
+                return Error(message="SDK error during fact-check generation")
+
+            # Fix a missing or invalid fact-check file before the session closes
+            if output_file is not None:
+                _ = await self.repair_output(
+                    client,
+                    lambda: self._fact_check_problem(output_file),
+                    output_file,
+                    run_analytics,
+                    "fact_checker",
+                    iteration,
+                    governor,
+                )
+
+        return None
+
+    async def _run_shards(
+        self,
+        options: ClaudeCodeOptions,
+        shards: list[list[Claim]],
+        context: FactCheckContext,
+        analysis_path: Path,
+        iteration: int,
+        pre_verified: list[PreVerification],
+        memo_hits: list[MemoHit],
+    ) -> Error | None:
+        """Fact-check claim shards in concurrent sessions and merge their output.
+
+        Each shard writes its own copy of the fact-check template; the merged,
+        validated result is written to the context's fact-check output path.
+
+        Args:
+            options: SDK options shared by all shard sessions
+            shards: Claims to verify, one list per shard
+            context: Fact-check context
+            analysis_path: Validated path of the analysis to fact-check
+            iteration: Current iteration number
+            pre_verified: Background verdicts, passed to the shard owning each claim
+            memo_hits: Memoized verdicts, passed to the shard owning each claim
+
+        Returns:
+            Error if any shard failed, otherwise None
+        """
+        fact_check_file = context.fact_check_output_path
+        template_text = fact_check_file.read_text()
+        # Split the WebFetch budget so sharding doesn't multiply it
+        webfetch_budget = math.ceil(self.config.webfetch_per_iteration / len(shards))
+        prompt_template = load_prompt(
+            "agents/factchecker/user/shard_fact_check.md", self.config.prompts_dir
+        )
+
+        shard_files: list[Path] = []
+        sessions: list[Awaitable[Error | None]] = []
+        for number, claims in enumerate(shards, start=1):
+            shard_file = fact_check_file.with_name(
+                f"{fact_check_file.stem}.shard_{number}.json"
+            )
+            _ = shard_file.write_text(template_text)
+            shard_files.append(shard_file)
+            user_prompt = prompt_template.format(
+                iteration=iteration,
+                max_iterations=context.max_iterations,
+                shard_number=number,
+                shard_count=len(shards),
+                analysis_path=analysis_path,
+                fact_check_file=shard_file,
+                claims_count=len(claims),
+                webfetch_budget=webfetch_budget,
+                claims=self._format_claims(claims),
+            )
+            keys = {claim.key for claim in claims}
+            if context.source_notes:
+                user_prompt += "\n" + context.source_notes
+            shard_memo_hits = [hit for hit in memo_hits if hit.claim_key in keys]
+            if shard_memo_hits:
+                user_prompt += "\n" + render_memo_hits(shard_memo_hits)
+            shard_pre_verified = [r for r in pre_verified if r.claim_key in keys]
+            if shard_pre_verified:
+                user_prompt += "\n" + render_pre_verifications(shard_pre_verified)
+            sessions.append(
+                self._run_session(
+                    options,
+                    user_prompt,
+                    context.run_analytics,
+                    iteration,
+                    shard_file,
+                    webfetch_budget,
+                )
+            )
+
+        logger.info(
+            f"Sharded fact-check: {len(shards)} shards with "
+            + f"{[len(s) for s in shards]} claims"
+        )
+        errors = await asyncio.gather(*sessions)
+        failed = [n for n, error in enumerate(errors, start=1) if error is not None]
+        if failed:
+            return Error(message=f"Fact-check shards {failed} failed")
+
+        results: list[dict[str, object]] = []
+        for number, shard_file in enumerate(shard_files, start=1):
+            shard_json = (
+                self._validate_and_fix_fact_check(shard_file)
+                if shard_file.stat().st_size > 2
+                else None
+            )
+            if shard_json is None:
+                return Error(message=f"Invalid fact-check structure in shard {number}")
+            results.append(shard_json)
+
+        with open(fact_check_file, "w") as f:
+            json.dump(merge_shard_results(results), f, indent=2)
+        return None
+
+    @staticmethod
+    def _format_claims(claims: list[Claim]) -> str:
+        """Render claims as a markdown list with their resolved references."""
+        lines: list[str] = []
+        for claim in claims:
+            lines.append(f"- **{claim.section}**: {claim.text}")
+            for number, source in zip(claim.citations, claim.sources):
+                if source != f"[{number}]":
+                    lines.append(f"  - [{number}] {source}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _load_pre_verified(
+        context: FactCheckContext, claims: list[Claim] | None
+    ) -> list[PreVerification]:
+        """Load background pre-verifications written by the pipeline.
+
+        Args:
+            context: Fact-check context with the prefetch results path
+            claims: Restrict to these claims (None keeps every result)
+
+        Returns:
+            Pre-verifications, empty if prefetching was not enabled
+        """
+        path = context.prefetch_results_path
+        if path is None:
+            return []
+        results = load_pre_verifications(path)
+        if claims is None:
+            return results
+        keys = {claim.key for claim in claims}
+        return [r for r in results if r.claim_key in keys]
+
+    @staticmethod
+    def _load_memo_hits(
+        context: FactCheckContext, claims: list[Claim] | None
+    ) -> list[MemoHit]:
+        """Load memoized verdicts looked up by the pipeline.
+
+        Args:
+            context: Fact-check context with the memo hits path
+            claims: Restrict to these claims (None keeps every hit)
+
+        Returns:
+            Memo hits, empty if the claim memo was not enabled
+        """
+        path = context.memo_hits_path
+        if path is None:
+            return []
+        hits = load_memo_hits(path)
+        if claims is None:
+            return hits
+        keys = {claim.key for claim in claims}
+        return [hit for hit in hits if hit.claim_key in keys]
+
+    def _plan_incremental(
+        self, context: FactCheckContext, analysis_path: Path, iteration: int
+    ) -> "_IncrementalPlan | None":
+        """Work out which claims need verification and which verdicts carry over.
+
+        Args:
+            context: Fact-check context with previous analysis and fact-check paths
+            analysis_path: Validated path of the analysis to fact-check
+            iteration: Current iteration number
+
+        Returns:
+            Incremental plan, or None if a full fact-check is needed
+        """
+        previous_analysis = context.previous_analysis_path
+        previous_fact_check = context.previous_fact_check_path
+        if iteration < 2 or not previous_analysis or not previous_fact_check:
+            return None
+        if not previous_analysis.exists() or not previous_fact_check.exists():
+            return None
+
+        try:
+            previous_json = load_json_object(previous_fact_check.read_text())
+        except json.JSONDecodeError:
+            logger.warning(f"Unreadable previous fact-check: {previous_fact_check}")
+            return None
+        if not previous_json:
+            return None
+
+        old_text = previous_analysis.read_text()
+        new_text = analysis_path.read_text()
+        diff = diff_claims(old_text, new_text)
+        if diff.changed_fraction > self.config.incremental_max_changed:
+            logger.info(
+                f"Incremental fact-check skipped: {diff.changed_fraction:.0%} of "
+                + "claims changed, running full fact-check"
+            )
+            return None
+
+        carried = carry_forward_issues(
+            previous_json, old_text, new_text, diff, iteration - 1
+        )
+        logger.info(
+            f"Incremental fact-check: {len(diff.new)} new or modified claims, "
+            + f"{len(diff.unchanged)} unchanged, {len(carried)} issues carried forward"
+        )
+
+        if context.run_analytics:
+            # Each distinct unchanged source is a WebFetch the agent can skip
+            sources = {s for claim in diff.unchanged for s in claim.sources}
+            context.run_analytics.record_savings(
+                "fact_checker",
+                iteration,
+                "incremental_fact_check",
+                turns=min(len(sources), self.config.webfetch_per_iteration),
+            )
+
+        return _IncrementalPlan(diff=diff, carried=carried, previous_iteration=iteration - 1)
+
+    def _build_incremental_prompt(
+        self,
+        context: FactCheckContext,
+        analysis_path: Path,
+        iteration: int,
+        plan: "_IncrementalPlan",
+    ) -> str:
+        """Build the user prompt listing only the claims to verify.
+
+        Args:
+            context: Fact-check context
+            analysis_path: Validated path of the analysis to fact-check
+            iteration: Current iteration number
+            plan: Incremental plan from _plan_incremental
+
+        Returns:
+            Formatted user prompt
+        """
+        template = load_prompt(
+            "agents/factchecker/user/incremental_fact_check.md",
+            self.config.prompts_dir,
+        )
+        return template.format(
+            iteration=iteration,
+            max_iterations=context.max_iterations,
+            previous_iteration=plan.previous_iteration,
+            analysis_path=analysis_path,
+            fact_check_file=context.fact_check_output_path,
+            claims_count=len(plan.diff.new),
+            unchanged_count=len(plan.diff.unchanged),
+            claims=self._format_claims(plan.diff.new),
+        )
+
+    def _write_merged_fact_check(
+        self,
+        fact_check_file: Path,
+        fact_check_json: dict[str, object],
+        plan: "_IncrementalPlan",
+    ) -> dict[str, object]:
+        """Merge carried-forward verdicts into the fact-check file.
+
+        Args:
+            fact_check_file: Path to the fact-check JSON file
+            fact_check_json: Fact-check of the changed claims (empty if none)
+            plan: Incremental plan from _plan_incremental
+
+        Returns:
+            Merged fact-check dictionary
+        """
+        merged = merge_carried_forward(
+            fact_check_json,
+            plan.carried,
+            len(plan.diff.unchanged),
+            plan.previous_iteration,
+        )
+        with open(fact_check_file, "w") as f:
+            json.dump(merged, f, indent=2)
+        return merged
+
+    @staticmethod
+    def _fact_check_problem(fact_check_file: Path) -> str | None:
+        """Describe why a fact-check file is unusable, or None if it can be used."""
+        if not fact_check_file.exists() or fact_check_file.stat().st_size <= 2:
+            return f"The fact-check file {fact_check_file} was not filled in."
+        return JsonResponseValidator(schema_type="fact_checker").describe_problem(
+            fact_check_file
+        )
+
     def _validate_and_fix_fact_check(
         self, fact_check_file: Path
     ) -> dict[str, object] | None:
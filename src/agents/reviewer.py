@@ -7,13 +7,15 @@ from typing import override
 from pathlib import Path
 
 from claude_code_sdk import ClaudeSDKClient, ClaudeCodeOptions
-from claude_code_sdk.types import ResultMessage
 
 from ..core.agent_base import BaseAgent
 from ..core.types import AgentResult, Success, Error, ReviewerContext
 from ..core.config import ReviewerConfig
 from ..utils.file_operations import load_prompt
 from ..utils.json_validator import JsonResponseValidator
+from ..utils.artifact_inlining import append_inlined_artifacts
+from ..utils.analysis_sections import diff_sections, parse_sections, summarize_section
+from ..utils.text_processing import estimate_tokens
 
 # Module-level logger
 logger = logging.getLogger(__name__)
@@ -89,8 +91,10 @@ class ReviewerAgent(BaseAgent[ReviewerConfig, ReviewerContext]):
                 str(context.analysis_input_path)
             )
 
-            # Load the reviewer prompt with includes
-            system_prompt = self.load_system_prompt()
+            # Load the reviewer prompt with session limits appended
+            system_prompt = self.build_system_prompt(
+                max_websearches=self.config.max_websearches
+            )
             
             # Log the system prompt if analytics available
             if context and context.run_analytics:
@@ -101,63 +105,92 @@ class ReviewerAgent(BaseAgent[ReviewerConfig, ReviewerContext]):
 
             # Feedback file should be pre-created by pipeline
 
-            # Load and format review instructions template
-            review_template = load_prompt(
-                "agents/reviewer/user/review.md",
-                self.config.prompts_dir,
-            )
-            # Pass previous feedback path or "None" if not available
-            previous_feedback_path = "None"
-            if context.previous_feedback_path and context.previous_feedback_path.exists():
-                previous_feedback_path = str(context.previous_feedback_path)
-            
-            user_prompt = review_template.format(
-                iteration=iteration,
-                max_iterations=self.config.max_iterations,
-                max_websearches=self.config.max_websearches,
-                analysis_path=analysis_path,
-                feedback_file=feedback_file,
-                previous_feedback_path=previous_feedback_path,
-            )
+            # Incremental review sends only the changed sections (iteration 2+)
+            user_prompt = None
+            if self.config.incremental_review:
+                user_prompt = self._build_incremental_prompt(
+                    context, analysis_path, iteration
+                )
+
+            if user_prompt is None:
+                # Load and format review instructions template
+                review_template = load_prompt(
+                    "agents/reviewer/user/review.md",
+                    self.config.prompts_dir,
+                )
+                # Pass previous feedback path or "None" if not available
+                previous_feedback_path = "None"
+                if (
+                    context.previous_feedback_path
+                    and context.previous_feedback_path.exists()
+                ):
+                    previous_feedback_path = str(context.previous_feedback_path)
+
+                user_prompt = review_template.format(
+                    iteration=iteration,
+                    max_iterations=self.config.max_iterations,
+                    max_websearches=self.config.max_websearches,
+                    analysis_path=analysis_path,
+                    feedback_file=feedback_file,
+                    previous_feedback_path=previous_feedback_path,
+                )
+
+                # Inline read-only inputs to save the Read tool round trips
+                if self.config.inline_artifacts:
+                    user_prompt, inlined = append_inlined_artifacts(
+                        user_prompt,
+                        [
+                            ("Analysis to review", analysis_path),
+                            ("Previous feedback", context.previous_feedback_path),
+                        ],
+                        self.config.inline_artifact_max_chars,
+                    )
+                    if run_analytics and inlined:
+                        run_analytics.record_savings(
+                            "reviewer", iteration, "inline_artifacts", turns=len(inlined)
+                        )
 
             # Configure options
             options = ClaudeCodeOptions(
                 system_prompt=system_prompt,
-                max_turns=self.config.max_turns,
+                max_turns=self.get_max_turns(context),
                 allowed_tools=allowed_tools,
                 permission_mode="acceptEdits",  # Allow agent to edit files directly
             )
+            self.apply_model_selection(options, iteration)
+            self.apply_thinking_budget(options, iteration, run_analytics, "reviewer")
+            if run_analytics:
+                run_analytics.record_turn_limit("reviewer", iteration, options.max_turns)
             logger.debug(
                 msg=f"Reviewer options: allowed_tools={options.allowed_tools}, max_turns={options.max_turns} "
             )
 
             # Create client and review
+            governor = self.create_governor(
+                {"WebSearch": self.config.max_websearches},
+                feedback_file,
+                context.output_limit,
+            )
             async with ClaudeSDKClient(options=options) as client:
                 await client.query(user_prompt)
 
-                async for message in client.receive_response():
-                    # Check for interrupt
-                    if self.interrupt_event.is_set():
-                        await client.interrupt()
-                        logger.warning("Review interrupted by user")
-                        return Error(message="Review interrupted by user")
-
-                    # Track message with RunAnalytics if available
-                    if run_analytics:
-                        run_analytics.track_message(message, "reviewer", iteration)
-
-                    # Get counts from RunAnalytics (always available in practice)
-                    message_count = run_analytics.message_count if run_analytics else 0
-
-                    # Progress tracking
-                    if message_count > 0 and message_count % 5 == 0:
-                        logger.debug(
-                            f"Review progress: {message_count} messages processed"
-                        )
-
-                    # Process when we hit ResultMessage (end of stream)
-                    if isinstance(message, ResultMessage):
-                        break
+                _ = await self.receive_result(
+                    client, run_analytics, "reviewer", iteration, governor
+                )
+                if self.interrupt_event.is_set():
+                    logger.warning("Review interrupted by user")
+                    return Error(message="Review interrupted by user")
+
+                # Fix a missing or invalid feedback file before the session closes
+                _ = await self.repair_output(
+                    client,
+                    lambda: self._feedback_problem(feedback_file),
+                    feedback_file,
+                    run_analytics,
+                    "reviewer",
+                    iteration,
+                    governor,
+                )
 
             # Check if the feedback file has content (not just empty template)
             if feedback_file.exists() and feedback_file.stat().st_size > 2:
@@ -203,6 +236,88 @@ class ReviewerAgent(BaseAgent[ReviewerConfig, ReviewerContext]):
                 + f"Iteration: {iteration}"
             )
 
+    def _build_incremental_prompt(
+        self, context: ReviewerContext, analysis_path: Path, iteration: int
+    ) -> str | None:
+        """Build an incremental review prompt from the section-level diff.
+
+        Args:
+            context: Reviewer context with previous analysis and feedback paths
+            analysis_path: Validated path of the analysis under review
+            iteration: Current iteration number
+
+        Returns:
+            Formatted user prompt, or None if a full review is needed
+        """
+        previous_analysis = context.previous_analysis_path
+        previous_feedback = context.previous_feedback_path
+        if iteration < 2 or not previous_analysis or not previous_feedback:
+            return None
+        if not previous_analysis.exists() or not previous_feedback.exists():
+            return None
+
+        current_text = analysis_path.read_text()
+        diff = diff_sections(previous_analysis.read_text(), current_text)
+        if diff.changed_fraction > self.config.incremental_review_max_changed:
+            logger.info(
+                f"Incremental review skipped: {diff.changed_fraction:.0%} of the "
+                + "analysis changed, running full review"
+            )
+            return None
+
+        sections = parse_sections(current_text)
+        changed_sections = "\n\n".join(
+            f"### {name}\n\n{sections[name]}" for name in diff.modified
+        )
+        unchanged_summary = "\n".join(
+            f"- **{name}**: {summarize_section(sections[name])}"
+            for name in diff.unchanged
+        )
+        if diff.removed:
+            unchanged_summary += "\n" + "\n".join(
+                f"- **{name}**: (section removed)" for name in diff.removed
+            )
+
+        template = load_prompt(
+            "agents/reviewer/user/incremental_review.md", self.config.prompts_dir
+        )
+        user_prompt = template.format(
+            iteration=iteration,
+            max_iterations=self.config.max_iterations,
+            analysis_path=analysis_path,
+            feedback_file=context.feedback_output_path,
+            previous_feedback=previous_feedback.read_text().strip(),
+            unchanged_summary=unchanged_summary or "(none)",
+            changed_sections=changed_sections or "(no sections changed)",
+        )
+
+        logger.info(
+            f"Incremental review: {len(diff.modified)} changed, "
+            + f"{len(diff.unchanged)} unchanged sections"
+        )
+        if context.run_analytics:
+            full_tokens = estimate_tokens(current_text)
+            sent_tokens = estimate_tokens(changed_sections + unchanged_summary)
+            # Analysis and previous feedback no longer need a Read each
+            context.run_analytics.record_savings(
+                "reviewer",
+                iteration,
+                "incremental_review",
+                turns=2,
+                tokens=max(full_tokens - sent_tokens, 0),
+            )
+
+        return user_prompt
+
+    @staticmethod
+    def _feedback_problem(feedback_file: Path) -> str | None:
+        """Describe why the feedback file is unusable, or None if it can be used."""
+        if not feedback_file.exists() or feedback_file.stat().st_size <= 2:
+            return f"The feedback file {feedback_file} was not filled in."
+        return JsonResponseValidator(schema_type="reviewer").describe_problem(
+            feedback_file
+        )
+
     def _validate_and_fix_feedback(
         self, feedback_file: Path
     ) -> dict[str, object] | None:
@@ -3,6 +3,7 @@
 from .processor import BatchProcessor, show_progress
 from .parser import parse_ideas_file
 from .file_manager import move_idea_to_completed, move_idea_to_failed
+from .triage import TriageStore, idea_key, select_promoted
 
 __all__ = [
     'BatchProcessor',
@@ -10,4 +11,7 @@ __all__ = [
     'parse_ideas_file',
     'move_idea_to_completed',
     'move_idea_to_failed',
+    'TriageStore',
+    'idea_key',
+    'select_promoted',
 ]
\ No newline at end of file
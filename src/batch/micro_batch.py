@@ -0,0 +1,173 @@
+"""Micro-batching: analyze several short ideas in one analyst session.
+
+Short ideas leave most of a session's fixed cost (system prompt, tool
+setup, warm-up turns) unamortized. In micro-batch mode the batch processor
+groups up to K short ideas and runs one analyst session that writes each
+idea's iteration_1.md under its own slug. Each file is then judged on its
+own: a file the session didn't complete is removed, so that idea falls back
+to a regular single-idea pipeline while the others keep their drafts. The
+session's cost is attributed to ideas by their share of written words.
+"""
+
+import logging
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+
+from ..agents.analyst import AnalystAgent
+from ..core.config import AnalystConfig, SystemConfig
+from ..core.run_analytics import RunAnalytics
+from ..core.types import AnalystContext, Success
+from ..utils.analysis_sections import assess_completeness, parse_sections
+from ..utils.file_operations import create_file_from_template
+from ..utils.text_processing import create_slug
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MicroBatchOutcome:
+    """Result of one idea within a micro-batched analyst session."""
+
+    slug: str
+    idea: str
+    analysis_file: Path
+    succeeded: bool
+    cost_share_usd: float = 0.0
+    words: int = 0
+
+
+def idea_text(title: str, description: str) -> str:
+    """Combine title and description the way the batch processor does."""
+    return f"{title}\n\n{description}" if description else title
+
+
+def plan_micro_batches(
+    ideas: list[tuple[str, str]], size: int, max_chars: int
+) -> tuple[list[list[tuple[str, str]]], list[tuple[str, str]]]:
+    """
+    Split ideas into micro-batch groups and ideas to run on their own.
+
+    Args:
+        ideas: List of (title, description) tuples
+        size: Maximum ideas per group (0 or 1 disables micro-batching)
+        max_chars: Ideas longer than this run on their own
+
+    Returns:
+        Tuple of (groups of two or more short ideas, remaining ideas)
+    """
+    if size < 2:
+        return [], list(ideas)
+
+    short = [idea for idea in ideas if len(idea_text(*idea)) <= max_chars]
+    singles = [idea for idea in ideas if len(idea_text(*idea)) > max_chars]
+    groups = [short[i : i + size] for i in range(0, len(short), size)]
+    # A group of one gains nothing from batching
+    if groups and len(groups[-1]) == 1:
+        singles.extend(groups.pop())
+    return groups, singles
+
+
+async def run_micro_batch(
+    group: list[tuple[str, str]],
+    system_config: SystemConfig,
+    analyst_config: AnalystConfig,
+) -> list[MicroBatchOutcome]:
+    """
+    Write first drafts for a group of ideas in one analyst session.
+
+    Args:
+        group: List of (title, description) tuples
+        system_config: System configuration
+        analyst_config: Analyst configuration; turn and search limits are
+            scaled by the group size
+
+    Returns:
+        One outcome per idea, in group order
+    """
+    # template_dir is guaranteed to be set after __post_init__
+    assert system_config.template_dir is not None
+    template_path = system_config.template_dir / "agents" / "analyst" / "analysis.md"
+    template = template_path.read_text()
+    required = list(parse_sections(template))
+
+    outcomes: list[MicroBatchOutcome] = []
+    for title, description in group:
+        idea = idea_text(title, description)
+        slug = create_slug(idea)
+        iterations_dir = system_config.analyses_dir / slug / "iterations"
+        iterations_dir.mkdir(parents=True, exist_ok=True)
+        analysis_file = iterations_dir / "iteration_1.md"
+        create_file_from_template(template_path, analysis_file)
+        outcomes.append(MicroBatchOutcome(slug, idea, analysis_file, succeeded=False))
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    analytics = RunAnalytics(
+        run_id=f"{timestamp}_micro_batch_{outcomes[0].slug}",
+        output_dir=Path("logs/runs"),
+        mode="micro_batch",
+    )
+    size = len(group)
+    batch_config = replace(
+        analyst_config,
+        max_turns=analyst_config.max_turns * size,
+        max_websearches=analyst_config.max_websearches * size,
+    )
+    ideas_list = "\n\n".join(
+        f"### Idea {i}: {outcome.slug}\n\nOutput file: {outcome.analysis_file}\n\n"
+        + outcome.idea
+        for i, outcome in enumerate(outcomes, 1)
+    )
+    context = AnalystContext(
+        idea_slug=outcomes[0].slug,
+        output_limit=system_config.output_limit,
+        analysis_output_path=outcomes[0].analysis_file,
+        extra_output_paths=[outcome.analysis_file for outcome in outcomes[1:]],
+        iteration=1,
+        user_prompt_template="agents/analyst/user/micro_batch.md",
+        prompt_vars={"ideas": ideas_list, "idea_count": str(size)},
+    )
+    context.run_analytics = analytics
+
+    logger.info(f"📦 Micro-batch session for {size} ideas")
+    try:
+        result = await AnalystAgent(batch_config).process(outcomes[0].idea, context)
+        if not isinstance(result, Success):
+            # Some files may still be complete; each is judged below
+            logger.warning(f"Micro-batch session reported: {result.message}")
+    except Exception as e:
+        logger.error(f"Micro-batch session failed: {e}")
+
+    for outcome in outcomes:
+        path = outcome.analysis_file
+        text = path.read_text() if path.exists() else ""
+        state = assess_completeness(text, required)
+        outcome.words = state.words
+        outcome.succeeded = text != template and not state.missing
+        if not outcome.succeeded and path.exists():
+            # Let the idea's own pipeline start again from the template
+            path.unlink()
+
+    total_words = sum(o.words for o in outcomes if o.succeeded)
+    total_cost = analytics.total_cost_usd()
+    for outcome in outcomes:
+        if not total_words:
+            outcome.cost_share_usd = total_cost / size  # Nothing usable, split evenly
+        elif outcome.succeeded:
+            outcome.cost_share_usd = total_cost * outcome.words / total_words
+
+    analytics.record_micro_batch(
+        [
+            {
+                "slug": o.slug,
+                "succeeded": o.succeeded,
+                "words": o.words,
+                "cost_share_usd": round(o.cost_share_usd, 4),
+            }
+            for o in outcomes
+        ]
+    )
+    analytics.finalize()
+    succeeded = sum(1 for o in outcomes if o.succeeded)
+    logger.info(f"📦 Micro-batch wrote {succeeded}/{size} drafts (${total_cost:.4f})")
+    return outcomes
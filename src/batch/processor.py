@@ -10,6 +10,8 @@ from ..core.pipeline import AnalysisPipeline
 from ..core.types import PipelineMode, PipelineResult
 from ..utils.text_processing import create_slug
 from .file_manager import move_idea_to_completed, move_idea_to_failed
+from .micro_batch import MicroBatchOutcome, idea_text, plan_micro_batches, run_micro_batch
+from .triage import TriageEntry, TriageStore, idea_key, screen_ideas
 
 
 class BatchProcessor:
@@ -23,6 +25,8 @@ class BatchProcessor:
         fact_checker_config: FactCheckerConfig,
         mode: PipelineMode = PipelineMode.ANALYZE,
         max_concurrent: int = 3,
+        micro_batch_size: int = 0,
+        micro_batch_max_chars: int = 300,
     ):
         """Initialize batch processor.
         
@@ -33,6 +37,9 @@ class BatchProcessor:
             fact_checker_config: Fact-checker agent configuration
             mode: Pipeline execution mode
             max_concurrent: Maximum concurrent pipelines (default 3)
+            micro_batch_size: Short ideas per shared first-draft analyst
+                session (0 or 1 disables micro-batching)
+            micro_batch_max_chars: Ideas longer than this are never micro-batched
         """
         self.system_config: SystemConfig = system_config
         self.analyst_config: AnalystConfig = analyst_config
@@ -41,12 +48,19 @@ class BatchProcessor:
         self.mode: PipelineMode = mode
         self.max_concurrent: int = max_concurrent
         self.semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent)
+        self.micro_batch_size: int = micro_batch_size
+        self.micro_batch_max_chars: int = micro_batch_max_chars
         
         # Track processing status
         self.results: dict[str, PipelineResult] = {}
         self.start_times: dict[str, datetime] = {}
         self.end_times: dict[str, datetime] = {}
         self.progress: dict[str, str] = {}  # Track progress by idea slug
+        # Micro-batched ideas: outcome and share of the shared session's time
+        self.micro_batch_outcomes: dict[str, MicroBatchOutcome] = {}
+        self.shared_seconds: dict[str, float] = {}
+        # Screening results of the last triage batch (stored and new)
+        self.triage_entries: list[TriageEntry] = []
         
         # Get logger for batch orchestration
         self.logger: logging.Logger = logging.getLogger(__name__)
@@ -54,13 +68,15 @@ class BatchProcessor:
     async def process_with_semaphore(
         self, 
         title: str, 
-        description: str
+        description: str,
+        first_draft_ready: bool = False,
     ) -> tuple[str, PipelineResult]:
         """Process a single idea with semaphore control.
         
         Args:
             title: Idea title
             description: Idea description
+            first_draft_ready: iteration_1.md was written by a micro-batch session
             
         Returns:
             Tuple of (slug, result)
@@ -87,6 +103,7 @@ class BatchProcessor:
                     reviewer_config=self.reviewer_config,
                     fact_checker_config=self.fact_checker_config,
                     mode=self.mode,
+                    first_draft_ready=first_draft_ready,
                 )
                 
                 result = await pipeline.process()
@@ -113,6 +130,47 @@ class BatchProcessor:
                 }
                 return slug, error_result
     
+    async def process_group(
+        self, group: list[tuple[str, str]]
+    ) -> list[tuple[str, PipelineResult]]:
+        """Process a micro-batch group: one shared first-draft session, then
+        each idea's own pipeline. A single-idea group goes straight to its pipeline.
+        
+        Args:
+            group: List of (title, description) tuples
+            
+        Returns:
+            List of (slug, result), in group order
+        """
+        if len(group) == 1:
+            return [await self.process_with_semaphore(*group[0])]
+        
+        async with self.semaphore:
+            started = datetime.now()
+            try:
+                outcomes = await run_micro_batch(
+                    group, self.system_config, self.analyst_config
+                )
+            except Exception as e:
+                self.logger.error(f"Micro-batch session failed: {e}")
+                outcomes = []
+            shared = (datetime.now() - started).total_seconds() / len(group)
+        
+        drafted = {outcome.idea for outcome in outcomes if outcome.succeeded}
+        for title, _ in group:
+            self.shared_seconds[create_slug(title)] = shared
+        for (title, _), outcome in zip(group, outcomes):
+            self.micro_batch_outcomes[create_slug(title)] = outcome
+        
+        # Ideas without a usable draft start their pipeline from scratch
+        return await asyncio.gather(*(
+            self.process_with_semaphore(
+                title, description,
+                first_draft_ready=idea_text(title, description) in drafted,
+            )
+            for title, description in group
+        ))
+    
     async def process_batch(
         self,
         ideas: list[tuple[str, str]],
@@ -140,11 +198,21 @@ class BatchProcessor:
         self.logger.info(f"Max concurrent pipelines: {self.max_concurrent}")
         self.logger.info(f"Pipeline mode: {self.mode.value}")
         
+        if self.mode == PipelineMode.TRIAGE:
+            return await self.triage_batch(ideas, pending_file)
+        
+        # Group short ideas for shared first-draft sessions when enabled
+        groups, singles = plan_micro_batches(
+            ideas, self.micro_batch_size, self.micro_batch_max_chars
+        )
+        if groups:
+            self.logger.info(
+                f"Micro-batching {sum(len(g) for g in groups)} short ideas in {len(groups)} sessions"
+            )
+        batches = groups + [[idea] for idea in singles]
+        
         # Create tasks for all ideas
-        tasks = [
-            self.process_with_semaphore(title, description)
-            for title, description in ideas
-        ]
+        tasks = [self.process_group(group) for group in batches]
         
         # Simple progress display
         print(f"\nProcessing {len(ideas)} ideas with max {self.max_concurrent} concurrent pipelines...")
@@ -153,9 +221,17 @@ class BatchProcessor:
         # Run all tasks concurrently
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
+        # Flatten group results back to one entry per idea
+        idea_results: list[tuple[tuple[str, str], BaseException | tuple[str, PipelineResult]]] = []
+        for group, group_result in zip(batches, results):
+            if isinstance(group_result, BaseException):
+                idea_results.extend((idea, group_result) for idea in group)
+            else:
+                idea_results.extend(zip(group, group_result))
+        
         # Process results and update files
-        for (title, description), result_tuple in zip(ideas, results):
-            if isinstance(result_tuple, Exception):
+        for (title, description), result_tuple in idea_results:
+            if isinstance(result_tuple, BaseException):
                 # Handle unexpected exceptions
                 slug = create_slug(title)
                 error_result: PipelineResult = {
@@ -206,6 +282,109 @@ class BatchProcessor:
         
         return self.results
     
+    async def triage_batch(
+        self,
+        ideas: list[tuple[str, str]],
+        pending_file: Path | None = None,
+    ) -> dict[str, PipelineResult]:
+        """Score ideas with screening sessions, reusing stored scores.
+        
+        Ideas whose text is unchanged since they were last screened keep
+        their stored score. The rest are screened triage_batch_size at a
+        time, up to max_concurrent sessions at once.
+        
+        Args:
+            ideas: List of (title, description) tuples
+            pending_file: Ideas file; the store is kept next to it as triage.json
+            
+        Returns:
+            Dictionary mapping slugs to results with their score
+        """
+        store_dir = pending_file.parent if pending_file else self.system_config.analyses_dir
+        store = TriageStore(store_dir / "triage.json")
+        entries: list[TriageEntry] = []
+        to_screen: list[tuple[str, str]] = []
+        for title, description in ideas:
+            entry = store.get(title, description)
+            if entry:
+                entries.append(entry)
+            else:
+                to_screen.append((title, description))
+        
+        size = max(1, self.analyst_config.triage_batch_size)
+        groups = [to_screen[i:i + size] for i in range(0, len(to_screen), size)]
+        print(
+            f"\nScreening {len(to_screen)} ideas in {len(groups)} sessions "
+            + f"({len(entries)} unchanged ideas already scored)..."
+        )
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        session_dir = store_dir / "triage"
+        
+        async def screen(index: int, group: list[tuple[str, str]]) -> list[TriageEntry]:
+            async with self.semaphore:
+                return await screen_ideas(
+                    group, self.analyst_config,
+                    session_dir / f"{timestamp}_{index}.json",
+                )
+        
+        screened = await asyncio.gather(
+            *(screen(i, group) for i, group in enumerate(groups, 1)),
+            return_exceptions=True,
+        )
+        for group_entries in screened:
+            if isinstance(group_entries, BaseException):
+                # Failed sessions leave their ideas unscored for the next run
+                self.logger.error(f"Screening session failed: {group_entries}")
+                continue
+            for entry in group_entries:
+                store.put(entry)
+                entries.append(entry)
+        store.save()
+        self.triage_entries = entries
+        
+        scored = {entry.key: entry for entry in entries}
+        for title, description in ideas:
+            slug = create_slug(title)
+            entry = scored.get(idea_key(title, description))
+            result: PipelineResult = {
+                "success": entry is not None,
+                "analysis_path": None,
+                "feedback_path": None,
+                "idea_slug": slug,
+                "iterations": 0,
+                "message": None if entry else "Not scored by the screening session",
+            }
+            if entry:
+                result["score"] = entry.score
+            self.results[slug] = result
+        
+        self.display_triage_summary()
+        return self.results
+    
+    def display_triage_summary(self, limit: int = 20) -> None:
+        """Display screening scores, best first.
+        
+        Args:
+            limit: Maximum ideas to list
+        """
+        ranked = sorted(self.triage_entries, key=lambda entry: entry.score, reverse=True)
+        print("\n" + "=" * 60)
+        print("TRIAGE SUMMARY")
+        print("=" * 60)
+        for entry in ranked[:limit]:
+            print(f"{entry.score:>5.1f}  {entry.title[:50]}")
+            if entry.rationale:
+                print(f"       {entry.rationale[:100]}")
+        if len(ranked) > limit:
+            print(f"  ... {len(ranked) - limit} more in the triage store")
+        
+        unscored = len(self.results) - len(ranked)
+        print("\n" + "-" * 60)
+        print(f"Scored: {len(ranked)}")
+        print(f"Unscored: {unscored}")
+        print("=" * 60)
+    
     def display_summary(self) -> None:
         """Display a summary table of results."""
         print("\n" + "=" * 60)
@@ -231,6 +410,8 @@ class BatchProcessor:
             print(f"  Status: {status}")
             print(f"  Duration: {duration}")
             print(f"  Iterations: {iterations}")
+            if result["success"] and result.get("stop_reason"):
+                print(f"  Stopped: {result.get('stop_reason')}")
             if not result["success"] and result.get("message"):
                 msg = result.get("message", "")
                 if msg:
@@ -249,7 +430,58 @@ class BatchProcessor:
         print(f"Successful: {successful}")
         print(f"Failed: {failed}")
         print(f"Total time: {total_time:.1f}s")
+        
+        comparison = self.micro_batch_comparison()
+        if comparison:
+            print("\nMicro-batching (amortized per idea):")
+            for label, stats in comparison.items():
+                print(
+                    f"  {label}: {int(stats['ideas'])} ideas, "
+                    + f"${stats['cost_per_idea_usd']:.4f}/idea, "
+                    + f"{stats['ideas_per_hour']:.1f} ideas/hour"
+                )
         print("=" * 60)
+    
+    def micro_batch_comparison(self) -> dict[str, dict[str, float]]:
+        """Compare amortized cost and throughput of micro-batched vs single-idea sessions.
+        
+        A micro-batched idea is charged its share of the shared session (cost
+        by written words, time split evenly) plus its own pipeline.
+        
+        Returns:
+            {"micro_batched": stats, "single": stats} with ideas,
+            cost_per_idea_usd and ideas_per_hour; empty without micro-batching
+        """
+        if not self.shared_seconds:
+            return {}
+        
+        groups: dict[str, tuple[list[float], list[float]]] = {
+            "micro_batched": ([], []),
+            "single": ([], []),
+        }
+        for slug, result in self.results.items():
+            seconds = self.shared_seconds.get(slug, 0.0)
+            if slug in self.start_times and slug in self.end_times:
+                seconds += (self.end_times[slug] - self.start_times[slug]).total_seconds()
+            cost = result.get("cost_usd", 0.0)
+            outcome = self.micro_batch_outcomes.get(slug)
+            if outcome:
+                cost += outcome.cost_share_usd
+            costs, durations = groups["micro_batched" if slug in self.shared_seconds else "single"]
+            costs.append(cost)
+            durations.append(seconds)
+        
+        comparison: dict[str, dict[str, float]] = {}
+        for label, (costs, durations) in groups.items():
+            if not costs:
+                continue
+            mean_seconds = sum(durations) / len(durations)
+            comparison[label] = {
+                "ideas": float(len(costs)),
+                "cost_per_idea_usd": sum(costs) / len(costs),
+                "ideas_per_hour": 3600 / mean_seconds if mean_seconds else 0.0,
+            }
+        return comparison
 
 
 async def show_progress(batch_processor: BatchProcessor, update_interval: float = 2.0) -> None:
@@ -0,0 +1,215 @@
+"""Triage: cheap screening of large idea lists before the full pipeline.
+
+Screening runs a small tool-less session with its own system prompt that
+scores many ideas (1-10) at once and replies with the scores as JSON. Only ideas
+at or above a threshold, optionally capped at the top K, are promoted to
+the full pipeline. Scores are kept in a JSON store keyed by a hash of the
+idea text, so re-runs only screen new or edited ideas.
+"""
+# pyright: reportAny=false, reportExplicitAny=false
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from claude_code_sdk import (
+    AssistantMessage,
+    ClaudeCodeOptions,
+    ResultMessage,
+    TextBlock,
+    query,
+)
+
+from ..core.config import AnalystConfig
+from ..core.run_analytics import RunAnalytics
+from ..core.types import PipelineMode
+from ..utils.file_operations import load_prompt
+from ..utils.json_validator import json_object, json_objects
+from ..utils.text_processing import create_slug
+from .micro_batch import idea_text
+
+logger = logging.getLogger(__name__)
+
+# Analytics agent name for screening sessions
+TRIAGE = "triage"
+
+
+def idea_key(title: str, description: str) -> str:
+    """Stable key for an idea's text; changes whenever the idea is edited."""
+    return hashlib.sha256(idea_text(title, description).encode()).hexdigest()[:16]
+
+
+@dataclass
+class TriageEntry:
+    """Screening result for one idea."""
+
+    key: str
+    slug: str
+    title: str
+    score: float
+    rationale: str
+    screened_at: str
+
+
+class TriageStore:
+    """Screening results persisted as JSON, keyed by idea_key."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Load the store, starting empty if the file is missing or unreadable.
+
+        Args:
+            path: JSON file holding the results (e.g., ideas/triage.json)
+        """
+        self.path: Path = path
+        self.entries: dict[str, TriageEntry] = {}
+        if path.exists():
+            try:
+                data: dict[str, dict[str, Any]] = json.loads(path.read_text())
+                self.entries = {key: TriageEntry(**entry) for key, entry in data.items()}
+            except (json.JSONDecodeError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable triage store {path}: {e}")
+
+    def get(self, title: str, description: str) -> TriageEntry | None:
+        """Return the stored result for an idea, if its text is unchanged."""
+        return self.entries.get(idea_key(title, description))
+
+    def put(self, entry: TriageEntry) -> None:
+        """Add or replace a result."""
+        self.entries[entry.key] = entry
+
+    def save(self) -> None:
+        """Write the store to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {key: asdict(entry) for key, entry in self.entries.items()}
+        _ = self.path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def select_promoted(
+    entries: list[TriageEntry], threshold: float, top_k: int | None = None
+) -> list[TriageEntry]:
+    """
+    Pick the ideas that go on to the full pipeline.
+
+    Args:
+        entries: Screening results
+        threshold: Minimum score to be promoted
+        top_k: If set, promote at most this many of the best scores
+
+    Returns:
+        Promoted entries, best score first
+    """
+    ranked = sorted(entries, key=lambda entry: entry.score, reverse=True)
+    promoted = [entry for entry in ranked if entry.score >= threshold]
+    return promoted[:top_k] if top_k is not None else promoted
+
+
+def parse_scores(
+    text: str, group: list[tuple[str, str]]
+) -> dict[int, tuple[float, str]]:
+    """
+    Parse a screening session's reply.
+
+    Args:
+        text: Reply holding the scores JSON object, possibly in a code fence
+        group: The (title, description) tuples screened, in prompt order
+
+    Returns:
+        Mapping of group index to (score, rationale); invalid entries are skipped
+    """
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        return {}
+    try:
+        data = json_object(json.loads(text[start : end + 1]))
+    except json.JSONDecodeError:
+        return {}
+
+    scores: dict[int, tuple[float, str]] = {}
+    for item in json_objects(data.get("scores")):
+        try:
+            index = int(item["id"]) - 1
+            score = float(item["score"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 0 <= index < len(group) and 1 <= score <= 10:
+            scores[index] = (score, str(item.get("rationale", "")))
+    return scores
+
+
+async def screen_ideas(
+    group: list[tuple[str, str]],
+    analyst_config: AnalystConfig,
+    output_file: Path,
+) -> list[TriageEntry]:
+    """
+    Score a group of ideas in one short, tool-less screening session.
+
+    Args:
+        group: List of (title, description) tuples
+        analyst_config: Analyst configuration (triage_max_turns and model apply)
+        output_file: File the session's reply is saved to
+
+    Returns:
+        Entries for the ideas that received a valid score
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    analytics = RunAnalytics(
+        run_id=f"{timestamp}_triage_{output_file.stem}",
+        output_dir=Path("logs/runs"),
+        mode=PipelineMode.TRIAGE.value,
+    )
+    ideas_list = "\n\n".join(
+        f"### Idea {i}\n\n{idea_text(title, description)}"
+        for i, (title, description) in enumerate(group, 1)
+    )
+    prompt = load_prompt(
+        "agents/analyst/triage/screen.md", analyst_config.prompts_dir
+    ).format(ideas=ideas_list, idea_count=len(group))
+    # No tools: screening uses existing knowledge and replies with the scores
+    options = ClaudeCodeOptions(
+        system_prompt=load_prompt(
+            "agents/analyst/triage/system.md", analyst_config.prompts_dir
+        ),
+        allowed_tools=[],
+        max_turns=analyst_config.triage_max_turns,
+        model=analyst_config.model,
+    )
+
+    texts: list[str] = []
+    try:
+        async for message in query(prompt=prompt, options=options):
+            analytics.track_message(message, TRIAGE, 1)
+            if isinstance(message, AssistantMessage):
+                texts.extend(b.text for b in message.content if isinstance(b, TextBlock))
+            elif isinstance(message, ResultMessage) and message.is_error:
+                logger.warning(f"Screening session reported: {message.subtype}")
+    except Exception as e:
+        logger.error(f"Screening session failed: {e}")
+    finally:
+        analytics.finalize()
+
+    reply = "\n\n".join(texts).strip()
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    _ = output_file.write_text(reply + "\n")
+
+    scores = parse_scores(reply, group)
+    screened_at = datetime.now().isoformat(timespec="seconds")
+    entries = [
+        TriageEntry(
+            key=idea_key(title, description),
+            slug=create_slug(idea_text(title, description)),
+            title=title,
+            score=scores[i][0],
+            rationale=scores[i][1],
+            screened_at=screened_at,
+        )
+        for i, (title, description) in enumerate(group)
+        if i in scores
+    ]
+    logger.info(f"🔎 Screened {len(entries)}/{len(group)} ideas in {output_file.name}")
+    return entries
@@ -19,7 +19,7 @@ from src.core.types import PipelineMode
 from src.utils.text_processing import create_slug
 from src.utils.logger import setup_logging
 from src.utils.result_formatter import format_pipeline_result
-from src.batch import BatchProcessor, show_progress, parse_ideas_file
+from src.batch import BatchProcessor, show_progress, parse_ideas_file, idea_key, select_promoted
 
 
 async def main():
@@ -65,6 +65,34 @@ Examples:
         help="Maximum concurrent analyses for batch mode (default: 3, max: 5)"
     )
 
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--micro-batch",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Batch mode: write first drafts of up to K short ideas in one analyst session (default: off)"
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--triage",
+        action="store_true",
+        help="Batch mode: screen all ideas with a quick no-web score first and run the full pipeline only on promoted ones"
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--triage-threshold",
+        type=float,
+        metavar="SCORE",
+        help="Minimum screening score (1-10) promoted to the full pipeline (default: 7)"
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--triage-top",
+        type=int,
+        metavar="K",
+        help="Promote at most the K best-scoring ideas"
+    )
+
     parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
         "--debug", action="store_true", help="Enable debug logging to logs/ directory"
     )
@@ -109,6 +137,152 @@ Examples:
         help="Maximum iterations for reviewer feedback (default: 3)",
     )
 
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--inline-artifacts",
+        action="store_true",
+        help="Inline input files (analysis, feedback) into agent prompts to skip Read round trips",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--revision-brief",
+        action="store_true",
+        help="Send the analyst a compact revision brief instead of raw feedback JSON",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--parallel-sections",
+        action="store_true",
+        help="Write the first iteration with concurrent analyst sessions, one per section group",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--incremental-review",
+        action="store_true",
+        help="From iteration 2, send the reviewer only changed sections plus its prior feedback",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--incremental-fact-check",
+        action="store_true",
+        help="From iteration 2, fact-check only new or modified claims and carry prior verdicts forward",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--speculative-revision",
+        action="store_true",
+        help="Start the next analyst iteration as soon as reviewer or fact-checker rejects",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--sharded-fact-check",
+        action="store_true",
+        help="Split claims across concurrent fact-check sessions (shard count adapts to claim count)",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--prefetch-citations",
+        action="store_true",
+        help="Fetch and pre-verify cited sources while the analyst is still writing",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--prefetch-before-fact-check",
+        action="store_true",
+        help="Fetch every cited URL concurrently right before each fact-check, so the fact-checker verifies against local page content",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--claim-memo",
+        action="store_true",
+        help="Reuse fact-check verdicts on claims already checked against the same source, across iterations and ideas",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--source-registry",
+        action="store_true",
+        help="Learn source health across runs: skip known-dead or paywalled URLs and steer agents toward reliable sources",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--knowledge-base",
+        action="store_true",
+        help="Index every run's web searches locally and let the analyst look them up before searching the web",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--stop-on-convergence",
+        action="store_true",
+        help="Stop the review loop early when revisions stop reducing reviewer issues",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--pre-research",
+        action="store_true",
+        help="Plan iteration 1's web searches in one call and run them concurrently before the analyst starts",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--two-tier-draft",
+        action="store_true",
+        help="Draft iteration 1 without web tools, then cite only its uncited figures in a short web session",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--lint-gate",
+        action="store_true",
+        help="Lint the analysis locally and have the analyst fix blocking issues before review",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--repair-turns",
+        type=int,
+        help="Fix-up requests per session when an agent's output is missing or invalid (default: 2, 0 disables)",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--salvage-partial",
+        action="store_true",
+        help="Keep or complete a near-finished analysis when the analyst session fails",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--no-budget-enforcement",
+        action="store_true",
+        help="Only state tool budgets in prompts instead of interrupting calls over budget",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--model",
+        help="Model for all agents, as an alias or full name (default: CLI default)",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--reviewer-model",
+        help="Model for the reviewer, overriding --model",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--fact-checker-model",
+        help="Model for the fact-checker, overriding --model",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--fallback-model",
+        help="Model used by all agents when the selected model is overloaded or unavailable",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--thinking-tokens",
+        type=int,
+        help="Extended thinking budget in tokens for all agents (0 disables thinking)",
+    )
+
+    parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
+        "--adaptive-turns",
+        action="store_true",
+        help="Set each agent's max_turns from turn usage in past runs (logs/runs)",
+    )
+
     parser.add_argument(  # pyright: ignore[reportUnusedCallResult]
         "--slug-suffix",
         help="Suffix to append to analysis slug (e.g., 'baseline', 'v2')",
@@ -121,6 +295,10 @@ Examples:
     batch: bool = args.batch
     ideas_file: str = args.ideas_file
     max_concurrent: int = args.max_concurrent
+    micro_batch: int = args.micro_batch
+    triage: bool = args.triage
+    triage_threshold: float | None = args.triage_threshold
+    triage_top: int | None = args.triage_top
     debug: bool = args.debug
     no_web_tools: bool = args.no_web_tools
     with_review: bool = args.with_review
@@ -129,6 +307,31 @@ Examples:
     analyst_prompt: str | None = getattr(args, "analyst_prompt", None)
     reviewer_prompt: str | None = getattr(args, "reviewer_prompt", None)
     slug_suffix: str | None = getattr(args, "slug_suffix", None)
+    inline_artifacts: bool = getattr(args, "inline_artifacts", False)
+    revision_brief: bool = getattr(args, "revision_brief", False)
+    parallel_sections: bool = getattr(args, "parallel_sections", False)
+    incremental_review: bool = getattr(args, "incremental_review", False)
+    incremental_fact_check: bool = getattr(args, "incremental_fact_check", False)
+    sharded_fact_check: bool = getattr(args, "sharded_fact_check", False)
+    speculative_revision: bool = getattr(args, "speculative_revision", False)
+    prefetch_citations: bool = getattr(args, "prefetch_citations", False)
+    prefetch_before_fact_check: bool = getattr(args, "prefetch_before_fact_check", False)
+    claim_memo: bool = getattr(args, "claim_memo", False)
+    source_registry: bool = getattr(args, "source_registry", False)
+    knowledge_base: bool = getattr(args, "knowledge_base", False)
+    stop_on_convergence: bool = getattr(args, "stop_on_convergence", False)
+    lint_gate: bool = getattr(args, "lint_gate", False)
+    two_tier_draft: bool = getattr(args, "two_tier_draft", False)
+    pre_research: bool = getattr(args, "pre_research", False)
+    repair_turns: int | None = getattr(args, "repair_turns", None)
+    salvage_partial: bool = getattr(args, "salvage_partial", False)
+    no_budget_enforcement: bool = getattr(args, "no_budget_enforcement", False)
+    model: str | None = getattr(args, "model", None)
+    reviewer_model: str | None = getattr(args, "reviewer_model", None)
+    fact_checker_model: str | None = getattr(args, "fact_checker_model", None)
+    fallback_model: str | None = getattr(args, "fallback_model", None)
+    thinking_tokens: int | None = getattr(args, "thinking_tokens", None)
+    adaptive_turns: bool = getattr(args, "adaptive_turns", False)
 
     # Validate arguments
     if not batch and not idea:
@@ -137,6 +340,9 @@ Examples:
     if batch and idea:
         parser.error("Cannot specify both an idea and --batch flag")
 
+    if triage and not batch:
+        parser.error("--triage requires --batch")
+
     # Setup logging based on mode
     if batch:
         # Batch mode logging - creates logs/batch/*/ via special handling in logger
@@ -172,6 +378,66 @@ Examples:
         # Remove only web tools, keep TodoWrite
         analyst_config.allowed_tools = ["TodoWrite"]
         analyst_config.max_websearches = 0  # No searches when web tools disabled
+    if inline_artifacts:
+        for agent_config in (analyst_config, reviewer_config, fact_checker_config):
+            agent_config.inline_artifacts = True
+    if revision_brief:
+        analyst_config.use_revision_brief = True
+    if parallel_sections:
+        analyst_config.parallel_sections = True
+    if incremental_review:
+        reviewer_config.incremental_review = True
+    if incremental_fact_check:
+        fact_checker_config.incremental = True
+    if sharded_fact_check:
+        fact_checker_config.sharded = True
+    if speculative_revision:
+        reviewer_config.speculative_revision = True
+    if prefetch_citations:
+        fact_checker_config.prefetch_during_analysis = True
+    if prefetch_before_fact_check:
+        fact_checker_config.prefetch_before_fact_check = True
+    if claim_memo:
+        fact_checker_config.claim_memo = True
+    if source_registry:
+        system_config.source_registry = True
+    if knowledge_base:
+        analyst_config.knowledge_base = True
+    if stop_on_convergence:
+        reviewer_config.convergence_detection = True
+    if lint_gate:
+        analyst_config.lint_gate = True
+    if pre_research:
+        analyst_config.pre_research = True
+    if two_tier_draft:
+        if no_web_tools:
+            parser.error("--two-tier-draft needs web tools for its enrichment pass")
+        analyst_config.two_tier_draft = True
+    if salvage_partial:
+        analyst_config.salvage_partial = True
+    if repair_turns is not None:
+        for agent_config in (analyst_config, reviewer_config, fact_checker_config):
+            agent_config.max_repair_turns = repair_turns
+    if no_budget_enforcement:
+        for agent_config in (analyst_config, reviewer_config, fact_checker_config):
+            agent_config.enforce_budgets = False
+    for agent_config in (analyst_config, reviewer_config, fact_checker_config):
+        if model:
+            agent_config.model = model
+        if fallback_model:
+            agent_config.fallback_model = fallback_model
+        if thinking_tokens is not None:
+            agent_config.max_thinking_tokens = thinking_tokens
+    if adaptive_turns:
+        system_config.adaptive_max_turns = True
+    if triage_threshold is not None:
+        analyst_config.triage_threshold = triage_threshold
+    if triage_top is not None:
+        analyst_config.triage_top_k = triage_top
+    if reviewer_model:
+        reviewer_config.model = reviewer_model
+    if fact_checker_model:
+        fact_checker_config.model = fact_checker_model
     if (with_review or with_review_and_fact_check) and max_iterations:
         reviewer_config.max_iterations = max_iterations
 
@@ -205,9 +471,33 @@ Examples:
             print(f"❌ No ideas found in {ideas_path}")
             sys.exit(1)
         
+        if triage:
+            # Screen everything cheaply; only promoted ideas get the full pipeline
+            screener = BatchProcessor(
+                system_config=system_config,
+                analyst_config=analyst_config,
+                reviewer_config=reviewer_config,
+                fact_checker_config=fact_checker_config,
+                mode=PipelineMode.TRIAGE,
+                max_concurrent=max_concurrent,
+            )
+            _ = await screener.process_batch(ideas, pending_file=ideas_path)
+            promoted = select_promoted(
+                screener.triage_entries,
+                analyst_config.triage_threshold,
+                analyst_config.triage_top_k,
+            )
+            promoted_keys = {entry.key for entry in promoted}
+            ideas = [idea for idea in ideas if idea_key(*idea) in promoted_keys]
+            print(f"\n🔎 Promoted {len(ideas)} ideas to the full pipeline")
+            if not ideas:
+                sys.exit(0)
+        
         print(f"\n🚀 Processing {len(ideas)} ideas from {ideas_path}")
         print(f"   Mode: {mode_desc}")
         print(f"   Max concurrent: {max_concurrent}")
+        if micro_batch > 1:
+            print(f"   Micro-batch: up to {micro_batch} short ideas per analyst session")
         
         # Create batch processor
         processor = BatchProcessor(
@@ -216,7 +506,8 @@ Examples:
             reviewer_config=reviewer_config,
             fact_checker_config=fact_checker_config,
             mode=mode,
-            max_concurrent=max_concurrent
+            max_concurrent=max_concurrent,
+            micro_batch_size=micro_batch,
         )
         
         # Determine file paths for management
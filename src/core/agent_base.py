@@ -5,13 +5,21 @@ from __future__ import annotations
 import logging
 import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
 from typing import TYPE_CHECKING, Generic, TypeVar
 import signal
 
+from claude_code_sdk.types import ResultMessage
+
 from .types import AgentResult
 
 if TYPE_CHECKING:
+    from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient
+
     from .config import BaseAgentConfig
+    from .governor import ToolBudgetGovernor
+    from .run_analytics import RunAnalytics
     from .types import BaseContext
 
 # Module-level logger
@@ -96,6 +104,97 @@ class BaseAgent(ABC, Generic[TConfig, TContext]):
             self.get_system_prompt_path(), self.config.prompts_dir
         )
 
+    def build_system_prompt(self, **session_vars: object) -> str:
+        """
+        Build the system prompt with session-specific settings at the end.
+
+        The system prompt itself is static so it forms an identical prefix
+        across ideas and iterations, which the prompt cache can reuse. Values
+        that vary per session (limits, available tools) are rendered from the
+        agent's session.md and appended after it.
+
+        Args:
+            **session_vars: Values for the placeholders in session.md
+
+        Returns:
+            The complete system prompt
+        """
+        from ..utils.file_operations import load_prompt
+
+        system_prompt = self.load_system_prompt()
+        session_path = Path("agents") / self.agent_name.lower() / "session.md"
+        if not (Path(self.config.prompts_dir) / session_path).exists():
+            return system_prompt
+        session = load_prompt(str(session_path), self.config.prompts_dir)
+        return system_prompt.rstrip() + "\n\n" + session.format(**session_vars)
+
+    def create_governor(
+        self,
+        budgets: dict[str, int],
+        output_file: Path | None = None,
+        output_limit: int | None = None,
+    ) -> ToolBudgetGovernor | None:
+        """
+        Build the budget governor for one session, if enforcement is enabled.
+
+        Args:
+            budgets: Maximum calls per tool name
+            output_file: File the session writes
+            output_limit: Maximum characters of output_file (None disables)
+
+        Returns:
+            Governor for the session, or None when budgets are not enforced
+        """
+        from .governor import ToolBudgetGovernor
+
+        if not self.config.enforce_budgets:
+            return None
+        return ToolBudgetGovernor(budgets, output_file, output_limit)
+
+    def apply_model_selection(self, options: ClaudeCodeOptions, iteration: int) -> None:
+        """
+        Set the session's model and fallback model from config.
+
+        Args:
+            options: SDK options to update in place
+            iteration: Current iteration, for per-iteration overrides
+        """
+        model = self.config.model_for_iteration(iteration)
+        if model:
+            options.model = model
+        fallback = self.config.fallback_model
+        if fallback and fallback != model:
+            options.extra_args["fallback-model"] = fallback
+        logger.debug(f"{self.agent_name} model: {model or 'default'}, fallback: {fallback}")
+
+    def apply_thinking_budget(
+        self,
+        options: ClaudeCodeOptions,
+        iteration: int,
+        run_analytics: RunAnalytics | None,
+        analytics_name: str,
+    ) -> None:
+        """
+        Set the session's thinking budget from config and record it.
+
+        The budget is passed as the CLI's --max-thinking-tokens flag: the
+        pinned SDK does not forward ClaudeCodeOptions.max_thinking_tokens to
+        the CLI, and newer SDKs no longer have that field. Sessions without a
+        configured budget keep the CLI default and record nothing.
+
+        Args:
+            options: SDK options to update in place
+            iteration: Current iteration, for per-iteration overrides
+            run_analytics: Analytics tracker, if any
+            analytics_name: Agent name used in analytics (e.g., "reviewer")
+        """
+        budget = self.config.thinking_tokens_for_iteration(iteration)
+        if budget is None:
+            return
+        options.extra_args["max-thinking-tokens"] = str(budget)
+        if run_analytics:
+            run_analytics.record_thinking_budget(analytics_name, iteration, budget)
+
     def get_allowed_tools(self, context: TContext) -> list[str]:
         """
         Return list of allowed tools for this agent.
@@ -126,13 +225,137 @@ class BaseAgent(ABC, Generic[TConfig, TContext]):
         """
         pass
 
-    def get_max_turns(self) -> int:
+    async def repair_output(
+        self,
+        client: ClaudeSDKClient,
+        check: Callable[[], str | None],
+        output_file: Path,
+        run_analytics: RunAnalytics | None,
+        analytics_name: str,
+        iteration: int,
+        governor: ToolBudgetGovernor | None = None,
+    ) -> str | None:
+        """
+        Ask a still-open session to fix its output until it passes or turns run out.
+
+        Each repair turn sends the specific problem reported by check, so the
+        agent fixes only that instead of the pipeline rerunning the session.
+
+        Args:
+            client: Connected SDK client of the session that wrote the output
+            check: Returns a problem description, or None if the output is usable
+            output_file: File the agent should fix
+            run_analytics: Analytics tracker, if any
+            analytics_name: Agent name used in analytics (e.g., "reviewer")
+            iteration: Current iteration number
+            governor: Budget governor of the session, if enforced
+
+        Returns:
+            The remaining problem, or None if the output is usable
+        """
+        from ..utils.file_operations import load_prompt
+
+        problem = check()
+        first_problem = problem
+        turns = 0
+        while problem is not None and turns < self.config.max_repair_turns:
+            turns += 1
+            logger.warning(
+                f"{self.agent_name}: {problem} "
+                + f"(repair {turns}/{self.config.max_repair_turns})"
+            )
+            template = load_prompt("shared/repair.md", self.config.prompts_dir)
+            await client.query(
+                template.format(problem=problem, output_file=str(output_file))
+            )
+
+            result = await self.receive_result(
+                client, run_analytics, analytics_name, iteration, governor
+            )
+            if result is None or result.is_error:
+                break
+            problem = check()
+
+        if turns and run_analytics and first_problem is not None:
+            run_analytics.record_repair(
+                analytics_name, iteration, turns, problem is None, first_problem
+            )
+        return problem
+
+    async def receive_result(
+        self,
+        client: ClaudeSDKClient,
+        run_analytics: RunAnalytics | None,
+        analytics_name: str,
+        iteration: int,
+        governor: ToolBudgetGovernor | None = None,
+    ) -> ResultMessage | None:
+        """
+        Receive the response to the last query, enforcing the session's budgets.
+
+        When the governor flags a tool call or output over its limit, the turn
+        is interrupted and the governor's correction is sent as a new query,
+        so the agent finishes without further calls. The flagged call itself
+        may already have run: the SDK has no pre-tool hook to deny it.
+
+        Args:
+            client: Connected SDK client with a query in flight
+            run_analytics: Analytics tracker, if any
+            analytics_name: Agent name used in analytics (e.g., "analyst")
+            iteration: Current iteration number
+            governor: Budget governor for this session, if enforced
+
+        Returns:
+            The final ResultMessage, or None if interrupted by the user or the
+            stream ended without one
+        """
+        while True:
+            result: ResultMessage | None = None
+            correction: str | None = None
+            async for message in client.receive_response():
+                if self.interrupt_event.is_set():
+                    await client.interrupt()
+                    return None
+                if run_analytics:
+                    run_analytics.track_message(message, analytics_name, iteration)
+                if governor and correction is None:
+                    seen = len(governor.events)
+                    correction = governor.observe(message)
+                    if run_analytics:
+                        for event in governor.events[seen:]:
+                            run_analytics.record_budget_event(
+                                analytics_name, iteration, event.to_dict()
+                            )
+                    if correction is not None:
+                        logger.warning(f"{self.agent_name}: {correction}")
+                        await client.interrupt()
+                if isinstance(message, ResultMessage):
+                    result = message
+                    break
+            if (
+                result is not None
+                and result.subtype == "error_max_turns"
+                and self.config.warn_on_turn_limit
+            ):
+                logger.warning(
+                    f"{self.agent_name}: turn limit reached after {result.num_turns} turns"
+                )
+            if correction is None or result is None:
+                return result
+            await client.query(correction)
+
+    def get_max_turns(self, context: TContext | None = None) -> int:
         """
         Get the maximum number of conversation turns for this agent.
 
+        Args:
+            context: Runtime context that may carry a learned turn limit
+
         Returns:
-            Maximum turns from agent's config
+            Turn limit from the context if set, otherwise from agent's config
         """
+        if context and context.max_turns:
+            return context.max_turns
         if hasattr(self.config, "max_turns"):
             return self.config.max_turns  # type: ignore[attr-defined]
         return 30  # Fallback default
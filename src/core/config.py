@@ -14,10 +14,26 @@ class SystemConfig:
     config_dir: Path
     logs_dir: Path
     template_dir: Path | None = None  # Directory for file templates
+    cache_dir: Path | None = None  # Directory for fetched-page caches
 
     # System limits
     output_limit: int = 50000
 
+    # Adaptive max_turns learned from past run summaries (core/turn_budget.py):
+    # the given percentile of turns used per agent, mode and iteration kind,
+    # plus an overflow margin, once enough samples exist
+    adaptive_max_turns: bool = False
+    turn_budget_percentile: float = 0.9
+    turn_budget_margin: float = 0.25
+    turn_budget_min_samples: int = 5
+
+    # Source registry (research/source_registry.py): learn per-URL and
+    # per-domain fetch health across runs, skip known-bad URLs and steer
+    # agents toward reliable sources
+    source_registry: bool = False
+    source_retry_after_days: float = 7.0  # Known-bad URLs are retried after this
+    source_slow_seconds: float = 15.0  # Average fetch latency of a slow domain
+
     def __post_init__(self):
         """Ensure all paths are absolute."""
         self.project_root = Path(self.project_root).resolve()
@@ -31,6 +47,12 @@ class SystemConfig:
         else:
             self.template_dir = Path(self.template_dir).resolve()
 
+        # Set default cache_dir if not provided
+        if self.cache_dir is None:
+            self.cache_dir = self.project_root / ".cache"
+        else:
+            self.cache_dir = Path(self.cache_dir).resolve()
+
 
 @dataclass
 class BaseAgentConfig:
@@ -44,6 +66,39 @@ class BaseAgentConfig:
     # Tools configuration
     allowed_tools: list[str] = field(default_factory=list)
 
+    # Artifact inlining (embed input files in the user prompt instead of paths)
+    inline_artifacts: bool = False
+    inline_artifact_max_chars: int = 40000  # Larger artifacts fall back to paths
+
+    # In-session repair: fix-up requests sent before closing a session whose
+    # output is missing or invalid
+    max_repair_turns: int = 2
+
+    # Enforce tool budgets (e.g., max_websearches) and output_limit during
+    # sessions by interrupting calls over budget, not just stating them in prompts
+    enforce_budgets: bool = True
+    warn_on_turn_limit: bool = True  # Log a warning when a session runs out of turns
+
+    # Model selection: None uses the CLI default. iteration_models overrides the
+    # model per iteration, e.g. {1: "haiku", 3: "opus"} for a cheap first draft
+    # and a strong final pass
+    model: str | None = None
+    fallback_model: str | None = None  # Used when the model is overloaded
+    iteration_models: dict[int, str] = field(default_factory=dict)
+
+    # Extended thinking budget in tokens: None keeps the CLI default.
+    # iteration_thinking_tokens overrides it per iteration (0 disables thinking)
+    max_thinking_tokens: int | None = None
+    iteration_thinking_tokens: dict[int, int] = field(default_factory=dict)
+
+    def model_for_iteration(self, iteration: int) -> str | None:
+        """Get the model for an iteration, falling back to the agent's model."""
+        return self.iteration_models.get(iteration, self.model)
+
+    def thinking_tokens_for_iteration(self, iteration: int) -> int | None:
+        """Get the thinking budget for an iteration, falling back to the agent's."""
+        return self.iteration_thinking_tokens.get(iteration, self.max_thinking_tokens)
+
     def get_allowed_tools(self) -> list[str]:
         """Get the list of allowed tools for this agent."""
         return self.allowed_tools.copy()
@@ -56,6 +111,55 @@ class AnalystConfig(BaseAgentConfig):
     # Analyst-specific settings
     max_websearches: int = 8
     min_words: int = 800
+    use_revision_brief: bool = False  # Send a compact brief instead of raw feedback JSON
+
+    # Section-parallel first iteration: one sub-session per group, then merge
+    parallel_sections: bool = False
+    section_groups: list[list[str]] = field(
+        default_factory=lambda: [
+            ["What We Do", "The Problem", "The Solution"],
+            ["Market Size", "Business Model", "Why Now?"],
+            ["Competition & Moat", "Key Risks & Mitigation", "Milestones"],
+        ]
+    )
+    consistency_max_turns: int = 10  # Turn limit for the post-merge consistency pass
+
+    # Pre-review lint gate: fix mechanical issues in-session before review
+    lint_gate: bool = False
+    lint_max_rounds: int = 2  # Follow-up fix requests per analyst session
+    lint_max_uncited_figures: int = 3  # Uncited figures tolerated before blocking
+
+    # Salvage: keep a failed session's partial analysis instead of failing the run
+    salvage_partial: bool = False
+    salvage_min_filled: float = 0.5  # Min filled-section fraction worth continuing
+    salvage_min_words: float = 0.8  # Fraction of min_words needed to accept as-is
+    salvage_continuation_max_turns: int = 15  # Turns for the missing-sections session
+
+    # Pre-research: plan the first draft's searches in one call and run them
+    # concurrently before the analyst session, which gets the results inline
+    pre_research: bool = False
+    pre_research_max_queries: int = 8
+    pre_research_concurrency: int = 4
+    pre_research_min_interval: float = 0.5  # Seconds between search starts
+    pre_research_search_turns: int = 3  # Turn limit per single-query session
+
+    # Research knowledge base: earlier runs' searches, looked up through a
+    # local tool before each live WebSearch
+    knowledge_base: bool = False
+    knowledge_base_max_age_days: float = 180.0  # Older entries are not returned
+
+    # Two-tier first draft: no-web draft, then a short web session that cites
+    # only the uncited figures and fills the gaps the local check finds
+    two_tier_draft: bool = False
+    enrichment_max_websearches: int = 3
+    enrichment_max_turns: int = 15
+    enrichment_max_targets: int = 12  # Uncited figures listed for the enrichment session
+
+    # Triage: short, no-web screening sessions that score many ideas each
+    triage_batch_size: int = 20  # Ideas scored per session
+    triage_max_turns: int = 1  # Screening sessions are tool-less: one reply
+    triage_threshold: float = 7.0  # Min score (1-10) promoted to the full pipeline
+    triage_top_k: int | None = None  # Also cap promotions at the K best scores
 
     # Default tools for analyst: web research + task organization
     allowed_tools: list[str] = field(
@@ -72,6 +176,20 @@ class ReviewerConfig(BaseAgentConfig):
     strictness: str = "normal"  # normal, strict, lenient
     max_websearches: int = 8  # Web searches for strategic verification
 
+    # Incremental review: at iteration 2+ send only changed sections + prior feedback
+    incremental_review: bool = False
+    incremental_review_max_changed: float = 0.6  # Full review above this changed fraction
+
+    # Speculative revision: start the next analyst on the first rejection
+    speculative_revision: bool = False
+    speculative_follow_up_max_turns: int = 10  # Turns to merge late feedback
+
+    # Convergence detection: stop once revisions no longer improve the analysis
+    convergence_detection: bool = False
+    convergence_min_changed: float = 0.1  # Changed fraction below which edits are marginal
+    convergence_min_improvement: float = 0.2  # Min relative drop in weighted issues
+    convergence_min_carry_over: float = 0.6  # Repeated-issue fraction that signals a plateau
+
     # Enhanced reviewer tools for verification
     allowed_tools: list[str] = field(
         default_factory=lambda: ["WebSearch", "WebFetch", "TodoWrite"]
@@ -85,6 +203,32 @@ class FactCheckerConfig(BaseAgentConfig):
     # FactChecker-specific settings
     webfetch_per_iteration: int = 10  # WebFetch calls allowed per iteration
 
+    # Incremental fact-check: verify only new/modified claims from iteration 2
+    incremental: bool = False
+    incremental_max_changed: float = 0.6  # Full fact-check above this claim fraction
+
+    # Sharded fact-check: split claims across concurrent sessions
+    sharded: bool = False
+    claims_per_shard: int = 8  # One shard per this many claims
+    max_shards: int = 4
+
+    # Citation prefetch: pre-verify cited pages while the analyst is writing
+    prefetch_during_analysis: bool = False
+    prefetch_concurrency: int = 4  # Concurrent background fetches
+    prefetch_poll_interval: float = 2.0  # Seconds between analysis file polls
+    prefetch_drain_timeout: float = 30.0  # Max wait for pending fetches at fact-check
+    # Fetch every cited URL concurrently right before fact-checking (also
+    # completes the during-analysis prefetch with late-added citations)
+    prefetch_before_fact_check: bool = False
+    prefetch_fetch_timeout: float = 20.0  # Overall deadline per page fetch
+    prefetch_max_bytes: int = 2_000_000  # Response bytes read per page
+    prefetch_max_page_chars: int = 200_000  # Page text kept per URL
+
+    # Claim memo: reuse verdicts on claim/source pairs checked before, across
+    # iterations and ideas (stored in <cache_dir>/claim_memo.json)
+    claim_memo: bool = False
+    claim_memo_ttl_days: float = 30.0  # Days before a verdict is re-checked
+
     # FactChecker tools for verification
     allowed_tools: list[str] = field(
         default_factory=lambda: ["WebFetch", "Edit", "TodoWrite"]
@@ -0,0 +1,128 @@
+"""Detect when the analyst/reviewer loop has stopped making progress.
+
+After each rejected review the detector records three signals: how much of
+the analysis changed since the previous iteration (section-level diff), the
+severity-weighted count of open issues, and how many of those issues were
+already raised last time. When issues mostly carry over and either the edits
+were marginal or the weighted issue count barely dropped, another iteration
+is unlikely to help and the loop stops with the latest analysis.
+"""
+# pyright: reportExplicitAny=false
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..utils.analysis_sections import diff_sections
+from ..utils.revision_brief import BriefItem, feedback_items, is_same_issue
+from .config import ReviewerConfig
+
+# Issue weight per severity tier (Must Fix, Should Fix, Optional Polish)
+TIER_WEIGHTS: dict[int, float] = {0: 3.0, 1: 1.0, 2: 0.25}
+
+
+@dataclass
+class IterationSignals:
+    """Progress signals for one reviewed iteration."""
+
+    iteration: int
+    changed_fraction: float  # Of the analysis vs the previous iteration (1.0 at first)
+    severity_counts: dict[int, int] = field(default_factory=dict)
+    carried_over: int = 0  # Issues already raised on the previous iteration
+    issues: list[BriefItem] = field(default_factory=list)
+
+    @property
+    def weighted_issues(self) -> float:
+        """Severity-weighted number of open issues."""
+        return sum(TIER_WEIGHTS.get(t, 1.0) * n for t, n in self.severity_counts.items())
+
+    @property
+    def carry_over_fraction(self) -> float:
+        """Fraction of this iteration's issues that were raised before."""
+        return self.carried_over / len(self.issues) if self.issues else 0.0
+
+
+class ConvergenceDetector:
+    """Track review signals across iterations and decide when to stop."""
+
+    def __init__(self, config: ReviewerConfig) -> None:
+        """
+        Initialize the detector.
+
+        Args:
+            config: Reviewer configuration with convergence thresholds
+        """
+        self.min_changed: float = config.convergence_min_changed
+        self.min_improvement: float = config.convergence_min_improvement
+        self.min_carry_over: float = config.convergence_min_carry_over
+        self.history: list[IterationSignals] = []
+
+    def observe(
+        self,
+        iteration: int,
+        analysis_text: str,
+        previous_analysis_text: str | None,
+        feedback: dict[str, Any] | None,
+        fact_check: dict[str, Any] | None = None,
+    ) -> IterationSignals:
+        """
+        Record the signals for a reviewed iteration.
+
+        Args:
+            iteration: Iteration number
+            analysis_text: Analysis that was reviewed
+            previous_analysis_text: Previous iteration's analysis (None at first)
+            feedback: Parsed reviewer feedback
+            fact_check: Parsed fact-check results, if the mode has them
+
+        Returns:
+            Signals for this iteration
+        """
+        changed = (
+            diff_sections(previous_analysis_text, analysis_text).changed_fraction
+            if previous_analysis_text is not None
+            else 1.0
+        )
+        issues = feedback_items(feedback, fact_check)
+        signals = IterationSignals(iteration=iteration, changed_fraction=changed, issues=issues)
+        for item in issues:
+            signals.severity_counts[item.tier] = signals.severity_counts.get(item.tier, 0) + 1
+
+        if self.history:
+            previous = self.history[-1].issues
+            signals.carried_over = sum(
+                1 for item in issues if any(is_same_issue(item, p) for p in previous)
+            )
+
+        self.history.append(signals)
+        return signals
+
+    def stop_reason(self) -> str | None:
+        """
+        Decide whether the loop has converged.
+
+        Returns:
+            Human-readable reason to stop, or None to keep iterating
+        """
+        if len(self.history) < 2:
+            return None
+        previous, current = self.history[-2], self.history[-1]
+
+        if current.carry_over_fraction < self.min_carry_over:
+            return None  # Mostly new issues - the review is still finding things
+
+        improvement = (
+            (previous.weighted_issues - current.weighted_issues) / previous.weighted_issues
+            if previous.weighted_issues > 0
+            else 0.0
+        )
+        marginal_edits = current.changed_fraction < self.min_changed
+        if not marginal_edits and improvement >= self.min_improvement:
+            return None
+
+        cause = "marginal edits" if marginal_edits else "no meaningful improvement"
+        return (
+            f"{cause}: {current.changed_fraction:.0%} of the analysis changed, "
+            + f"{current.carry_over_fraction:.0%} of issues carried over, "
+            + f"weighted issues {previous.weighted_issues:.1f} -> "
+            + f"{current.weighted_issues:.1f}"
+        )
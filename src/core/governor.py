@@ -0,0 +1,123 @@
+"""Enforce tool-use budgets and output size limits during an agent session.
+
+Budgets such as `max_websearches` were only stated in prompts, so an agent
+could exceed them freely. The governor watches the session's message stream,
+counts tool calls per tool and checks the size of the agent's output file
+after each tool result. When a limit is crossed it returns a corrective
+message: the caller interrupts the running turn and sends that message as
+the next query, telling the agent to finish without further calls.
+
+This cannot deny a call. The SDK version in use (claude-code-sdk 0.0.20)
+has no pre-tool hooks, so the governor only sees a ToolUseBlock after the
+call has been issued, and the over-budget call may still run before the
+interrupt lands. Events therefore record calls as "interrupted" (the turn
+was cut short and the agent corrected) or "exceeded" (corrections exhausted,
+only recorded), never as denied.
+"""
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from claude_code_sdk.types import AssistantMessage, ToolUseBlock, UserMessage
+
+# Output limit is checked with this pseudo tool name in events
+OUTPUT_LIMIT = "output_limit"
+
+
+@dataclass
+class BudgetEvent:
+    """A tool call or output that went over its limit."""
+
+    tool: str  # Tool name, or OUTPUT_LIMIT for the output file size
+    limit: int
+    used: int  # Calls made including this one, or output characters
+    action: str  # "interrupted" (agent was corrected) or "exceeded" (corrections exhausted)
+
+    def to_dict(self) -> dict[str, str | int]:
+        """Serialize for analytics."""
+        return asdict(self)
+
+
+class ToolBudgetGovernor:
+    """Count tool calls in one agent session and flag calls over budget.
+
+    Flagging happens after a call is issued; see the module docstring.
+    """
+
+    def __init__(
+        self,
+        budgets: dict[str, int],
+        output_file: Path | None = None,
+        output_limit: int | None = None,
+        max_corrections: int = 3,
+    ) -> None:
+        """
+        Initialize the governor.
+
+        Args:
+            budgets: Maximum calls per tool name (e.g., {"WebSearch": 8})
+            output_file: File the agent writes, checked against output_limit
+            output_limit: Maximum characters in output_file (None disables)
+            max_corrections: Corrective messages to send before only recording
+        """
+        self.budgets: dict[str, int] = budgets
+        self.output_file: Path | None = output_file
+        self.output_limit: int | None = output_limit
+        self.max_corrections: int = max_corrections
+        self.counts: dict[str, int] = {}
+        self.events: list[BudgetEvent] = []
+        self._corrections: int = 0
+        self._output_flagged: bool = False
+
+    def observe(self, message: object) -> str | None:
+        """
+        Account for one session message.
+
+        Args:
+            message: Message received from the SDK client
+
+        Returns:
+            Corrective message to send the agent, or None if within limits
+        """
+        if isinstance(message, AssistantMessage):
+            for block in message.content:
+                if not isinstance(block, ToolUseBlock):
+                    continue
+                self.counts[block.name] = self.counts.get(block.name, 0) + 1
+                limit = self.budgets.get(block.name)
+                if limit is not None and self.counts[block.name] > limit:
+                    return self._flag(block.name, limit, self.counts[block.name])
+        elif isinstance(message, UserMessage):
+            size = self._output_size()
+            if size is not None and not self._output_flagged:
+                self._output_flagged = True
+                return self._flag(OUTPUT_LIMIT, self.output_limit or 0, size)
+        return None
+
+    def _output_size(self) -> int | None:
+        """Return the output file size if it is over the limit."""
+        if not self.output_limit or not self.output_file:
+            return None
+        if not self.output_file.exists():
+            return None
+        size = len(self.output_file.read_text())
+        return size if size > self.output_limit else None
+
+    def _flag(self, tool: str, limit: int, used: int) -> str | None:
+        """Record an event and build its correction if any are left."""
+        if self._corrections >= self.max_corrections:
+            self.events.append(BudgetEvent(tool, limit, used, "exceeded"))
+            return None
+        self._corrections += 1
+        self.events.append(BudgetEvent(tool, limit, used, "interrupted"))
+        if tool == OUTPUT_LIMIT:
+            return (
+                f"Output limit exceeded: {self.output_file} has {used} characters "
+                + f"and the limit is {limit}. Shorten it below the limit, keeping "
+                + "every section, and do not add more content."
+            )
+        return (
+            f"Budget reached: the {tool} call you just made went over the limit "
+            + f"of {limit} for this session. Do not call {tool} again. "
+            + "Finish the task with the information you already have."
+        )
@@ -1,7 +1,15 @@
 """Pipeline orchestration for business idea analysis."""
 
+import asyncio
+import contextlib
 import json
+import math
 import shutil
+import signal
+import sqlite3
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import asdict, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -11,23 +19,66 @@ import logging
 from ..agents.analyst import AnalystAgent
 from ..agents.reviewer import ReviewerAgent
 from ..agents.fact_checker import FactCheckerAgent
+from ..research import (
+    AnalysisWatcher,
+    CitationPrefetcher,
+    ClaimMemo,
+    ClaudeSearcher,
+    FetchCache,
+    FetchResult,
+    Fetcher,
+    KnowledgeBase,
+    SearchCache,
+    SearchExecutor,
+    SourceRegistry,
+    UrlFetcher,
+    load_pre_verifications,
+    plan_queries,
+    render_cited_sources,
+    render_research,
+    render_unreliable_sources,
+    save_memo_hits,
+)
+from ..research.prefetch import extract_url
+from ..utils.analysis_linter import find_uncited_figures
+from ..utils.analysis_sections import TITLE_KEY, assess_completeness, parse_sections
+from ..utils.claims import extract_claims, parse_reference_entries
 from ..utils.text_processing import create_slug
 from ..utils.file_operations import create_file_from_template
-from ..utils.file_operations import append_metadata_to_analysis
-from .config import SystemConfig, AnalystConfig, ReviewerConfig, FactCheckerConfig
+from ..utils.file_operations import append_metadata_to_analysis, load_prompt
+from ..utils.revision_brief import build_revision_brief, count_must_fix
+from ..utils.text_processing import estimate_tokens
+from ..utils.section_groups import (
+    build_group_template,
+    merge_group_analyses,
+    render_research_cache,
+)
+from .config import (
+    AnalystConfig,
+    BaseAgentConfig,
+    FactCheckerConfig,
+    ReviewerConfig,
+    SystemConfig,
+)
 from .types import (
     PipelineMode,
     Success,
     Error,
     PipelineResult,
+    AgentResult,
     AnalystContext,
     ReviewerContext,
     FactCheckContext,
 )
+from .convergence import ConvergenceDetector
 from .run_analytics import RunAnalytics
+from .turn_budget import TurnBudgetPolicy
 
 logger = logging.getLogger(__name__)
 
+# How often the shared research cache is rewritten during section-parallel runs
+RESEARCH_CACHE_REFRESH_SECONDS = 5.0
+
 
 class AnalysisPipeline:
     """Orchestrates the analysis pipeline for business ideas."""
@@ -41,6 +92,7 @@ class AnalysisPipeline:
         fact_checker_config: FactCheckerConfig,
         mode: PipelineMode = PipelineMode.ANALYZE,
         slug_suffix: str | None = None,
+        first_draft_ready: bool = False,
     ) -> None:
         """
         Initialize the pipeline with idea and configuration.
@@ -53,7 +105,12 @@ class AnalysisPipeline:
             fact_checker_config: Fact-checker agent configuration
             mode: Pipeline execution mode
             slug_suffix: Optional suffix to append to the slug
+            first_draft_ready: iteration_1.md was already written by a
+                micro-batched analyst session, so skip the first analyst run
         """
+        if mode == PipelineMode.TRIAGE:
+            raise ValueError("Triage mode screens ideas in batches (BatchProcessor)")
+
         # Core configuration
         self.idea: str = idea
         self.slug: str = create_slug(idea)
@@ -64,6 +121,7 @@ class AnalysisPipeline:
         self.reviewer_config: ReviewerConfig = reviewer_config
         self.fact_checker_config: FactCheckerConfig = fact_checker_config
         self.mode: PipelineMode = mode
+        self.first_draft_ready: bool = first_draft_ready
 
         # Setup output directories
         self.output_dir: Path = system_config.analyses_dir / self.slug
@@ -87,6 +145,17 @@ class AnalysisPipeline:
         self.last_fact_check_file: Path | None = None
         self.last_feedback: dict[str, Any] | None = None  # pyright: ignore[reportExplicitAny]
         self.analytics: RunAnalytics | None = None
+        self.prefetcher: CitationPrefetcher | None = None
+        self.citation_fetcher: Fetcher | None = None  # None uses UrlFetcher
+        self.claim_memo: ClaimMemo | None = None
+        self.source_registry: SourceRegistry | None = None
+        self.stop_reason: str | None = None
+        self.turn_policy: TurnBudgetPolicy | None = None
+        self.convergence: ConvergenceDetector | None = (
+            ConvergenceDetector(reviewer_config)
+            if reviewer_config.convergence_detection
+            else None
+        )
 
     async def process(self) -> PipelineResult:
         """
@@ -98,7 +167,15 @@ class AnalysisPipeline:
         # Initialize analytics for this run
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         run_id = f"{timestamp}_{self.slug}"
-        self.analytics = RunAnalytics(run_id=run_id, output_dir=Path("logs/runs"))
+        runs_dir = Path("logs/runs")
+        if self.system_config.adaptive_max_turns:
+            # Learn from earlier runs before this one adds its own folder
+            self.turn_policy = TurnBudgetPolicy.from_runs(runs_dir, self.system_config)
+        self.analytics = RunAnalytics(
+            run_id=run_id, output_dir=runs_dir, mode=self.mode.value
+        )
+        if self.system_config.source_registry:
+            self.source_registry = self._load_source_registry()
 
         logger.info(
             f"🎯 Pipeline started - Mode: {self.mode.value}, Max iterations: {self.max_iterations}"
@@ -120,9 +197,18 @@ class AnalysisPipeline:
             return result
 
         finally:
+            fetch_log = self.prefetcher.fetch_log if self.prefetcher else []
+            if self.prefetcher:
+                await self.prefetcher.stop()
+                self.prefetcher = None
+
             # Clean up analytics
             if self.analytics:
                 self.analytics.finalize()
+                if self.source_registry:
+                    self._update_source_registry(self.analytics.output_dir, fetch_log)
+                if self.analyst_config.knowledge_base:
+                    self._update_knowledge_base(self.analytics.output_dir)
             self.analytics = None
 
     async def _analyze_only(self) -> PipelineResult:
@@ -144,6 +230,7 @@ class AnalysisPipeline:
 
         while self.iteration_count < self.max_iterations:
             self.iteration_count += 1
+            self.stop_reason = None
 
             # Run analyst
             if not await self._run_analyst(analyst):
@@ -152,11 +239,16 @@ class AnalysisPipeline:
             # Skip review on last iteration
             if self.iteration_count >= self.max_iterations:
                 logger.info("✅ Max iterations reached, skipping review")
+                self.stop_reason = "max_iterations"
                 break
 
             # Run reviewer and check if should continue
             should_continue = await self._run_reviewer(reviewer)
             if not should_continue:
+                self.stop_reason = self.stop_reason or "approved"
+                break
+
+            if self._has_converged():
                 break
 
         return self._build_result()
@@ -166,25 +258,45 @@ class AnalysisPipeline:
         analyst = AnalystAgent(self.analyst_config)
         reviewer = ReviewerAgent(self.reviewer_config)
         fact_checker = FactCheckerAgent(self.fact_checker_config)
+        speculative_ready = False
 
         while self.iteration_count < self.max_iterations:
             self.iteration_count += 1
+            self.stop_reason = None
 
-            # Run analyst (unchanged)
-            if not await self._run_analyst(analyst):
+            if speculative_ready:
+                # Analysis for this iteration was written speculatively
+                self._finalize_analysis(
+                    self.iterations_dir / f"iteration_{self.iteration_count}.md"
+                )
+                speculative_ready = False
+            elif not await self._run_analyst(analyst):
                 return self._build_result(error="Analyst failed")
 
             # Skip review on last iteration
             if self.iteration_count >= self.max_iterations:
                 logger.info("✅ Max iterations reached, skipping review")
+                self.stop_reason = "max_iterations"
                 break
 
             # Run reviewer and fact-checker in parallel
-            should_continue = await self._run_parallel_review_fact_check(
-                reviewer, fact_checker
-            )
+            if self.reviewer_config.speculative_revision:
+                should_continue, speculative_ready = (
+                    await self._run_speculative_review_fact_check(
+                        analyst, reviewer, fact_checker
+                    )
+                )
+            else:
+                should_continue = await self._run_parallel_review_fact_check(
+                    reviewer, fact_checker
+                )
 
             if not should_continue:
+                self.stop_reason = self.stop_reason or "approved"
+                break
+
+            # A speculative next iteration is already written, so keep it
+            if not speculative_ready and self._has_converged():
                 break
 
         return self._build_result()
@@ -216,6 +328,15 @@ class AnalysisPipeline:
 
         # Create analysis file from template
         analysis_file = self.iterations_dir / f"iteration_{self.iteration_count}.md"
+        if (
+            self.iteration_count == 1
+            and self.first_draft_ready
+            and analysis_file.exists()
+        ):
+            # Written by a micro-batched analyst session shared with other ideas
+            logger.info("📝 Using first draft from the micro-batch session")
+            self._finalize_analysis(analysis_file)
+            return True
         if not analysis_file.exists():
             # template_dir is guaranteed to be set after __post_init__
             assert self.system_config.template_dir is not None
@@ -235,10 +356,19 @@ class AnalysisPipeline:
                 logger.warning(f"Previous analysis not found: {previous_analysis}")
                 previous_analysis = None
 
+        # Condense reviewer and fact-check outputs into a single brief
+        revision_brief = None
+        if self.iteration_count > 1 and self.analyst_config.use_revision_brief:
+            revision_brief = self._write_revision_brief(
+                self.iteration_count, self.last_feedback_file, self.last_fact_check_file
+            )
+
         analyst_context = AnalystContext(
             idea_slug=self.slug,
+            output_limit=self.system_config.output_limit,
             analysis_output_path=analysis_file,
             previous_analysis_input_path=previous_analysis,
+            revision_brief_input_path=revision_brief,
             feedback_input_path=self.last_feedback_file
             if self.iteration_count > 1
             else None,
@@ -248,12 +378,51 @@ class AnalysisPipeline:
             iteration=self.iteration_count,
         )
         analyst_context.run_analytics = self.analytics
+        analyst_context.source_notes = self._analyst_source_notes()
+        analyst_context.knowledge_base_path = self._knowledge_base_path()
+        analyst_context.max_turns = self._turn_limit("analyst", self.analyst_config)
+        if (
+            self.iteration_count == 1
+            and self.analyst_config.pre_research
+            and "WebSearch" in self.analyst_config.allowed_tools
+        ):
+            analyst_context.research_input_path = await self._run_pre_research()
 
         logger.info(
             f"📝 Running analyst iteration {self.iteration_count}/{self.max_iterations}"
         )
 
-        analyst_result = await analyst.process(self.idea, analyst_context)
+        parallel = self.iteration_count == 1 and self.analyst_config.parallel_sections
+        two_tier = (
+            self.iteration_count == 1
+            and self.analyst_config.two_tier_draft
+            and not parallel
+            and "WebSearch" in self.analyst_config.allowed_tools
+        )
+        watched = [analysis_file]
+        if parallel:
+            watched += [
+                self.iterations_dir / f"iteration_1.part_{number}.md"
+                for number in range(1, len(self.analyst_config.section_groups) + 1)
+            ]
+
+        async with self._watch_analysis(watched):
+            if parallel:
+                analyst_result = await self._run_section_parallel_analyst(
+                    analyst, analysis_file, analyst_context
+                )
+            elif two_tier:
+                analyst_result = await self._run_two_tier_analyst(
+                    analyst, analysis_file, analyst_context
+                )
+            else:
+                analyst_result = await analyst.process(self.idea, analyst_context)
+
+        # A failed session may still have written most of the analysis
+        if isinstance(analyst_result, Error) and self.analyst_config.salvage_partial:
+            analyst_result = await self._salvage_analysis(
+                analysis_file, analyst_result.message
+            )
 
         # Pattern match on result type
         match analyst_result:
@@ -261,23 +430,754 @@ class AnalysisPipeline:
                 logger.error(f"Analyst failed: {msg}")
                 return False
             case Success():
-                # Append metadata to the completed analysis
-                websearch_count = self.analytics.search_count if self.analytics else 0
-                webfetch_count = self.analytics.webfetch_count if self.analytics else 0
-
-                append_metadata_to_analysis(
-                    analysis_file,
-                    self.idea,
-                    self.slug,
-                    self.iteration_count,
-                    websearch_count,
-                    webfetch_count,
+                self._finalize_analysis(analysis_file)
+
+        return True
+
+    async def _run_pre_research(self) -> Path | None:
+        """Plan the first draft's searches and run them concurrently.
+
+        Returns:
+            Path to the consolidated results, or None if nothing was found
+        """
+        config = self.analyst_config
+        assert self.system_config.template_dir is not None
+        assert self.system_config.cache_dir is not None
+        template = (
+            self.system_config.template_dir / "agents" / "analyst" / "analysis.md"
+        ).read_text()
+        sections = [name for name in parse_sections(template) if name != TITLE_KEY]
+        system_prompt = load_prompt("agents/analyst/research/system.md", config.prompts_dir)
+
+        started = time.monotonic()
+        queries = await plan_queries(
+            load_prompt("agents/analyst/research/plan.md", config.prompts_dir).format(
+                idea=self.idea,
+                sections=", ".join(sections),
+                max_queries=config.pre_research_max_queries,
+            ),
+            system_prompt,
+            config.pre_research_max_queries,
+            model=config.model,
+            run_analytics=self.analytics,
+        )
+        if not queries:
+            logger.warning("Pre-research planned no queries, analyst will search itself")
+            return None
+
+        executor = SearchExecutor(
+            ClaudeSearcher(
+                load_prompt("agents/analyst/research/query.md", config.prompts_dir),
+                system_prompt,
+                model=config.model,
+                max_turns=config.pre_research_search_turns,
+                run_analytics=self.analytics,
+            ),
+            SearchCache(self.system_config.cache_dir / "search"),
+            concurrency=config.pre_research_concurrency,
+            min_interval=config.pre_research_min_interval,
+        )
+        logger.info(f"🔍 Pre-research: running {len(queries)} searches concurrently")
+        results = await executor.run(queries)
+        found = [result for result in results if result.ok]
+        elapsed = time.monotonic() - started
+        logger.info(
+            f"🔍 Pre-research done in {elapsed:.1f}s: {len(found)}/{len(queries)} "
+            + f"queries answered ({executor.cache_hits} from cache)"
+        )
+        if self.analytics:
+            self.analytics.record_timing("analyst", 1, "pre_research_wall_clock", elapsed)
+            # Each answered query is a WebSearch turn the analyst doesn't take
+            self.analytics.record_savings("analyst", 1, "pre_research", turns=len(found))
+        if not found:
+            return None
+
+        research_file = self.iterations_dir / "pre_research.md"
+        _ = research_file.write_text(render_research(results))
+        return research_file
+
+    async def _run_two_tier_analyst(
+        self,
+        analyst: AnalystAgent,
+        analysis_file: Path,
+        analyst_context: AnalystContext,
+    ) -> AgentResult:
+        """Write the first iteration as a no-web draft plus targeted enrichment.
+
+        The draft session runs without web tools. A local pass then lists the
+        draft's uncited figures and unfinished sections, and a short session
+        with a small search budget cites or fixes exactly those.
+
+        Args:
+            analyst: Analyst agent for the draft session
+            analysis_file: File holding the template, overwritten with the analysis
+            analyst_context: Context for the draft session
+
+        Returns:
+            Result of the enrichment session, or of the draft if none was needed
+        """
+        started = time.monotonic()
+        analyst_context.tools = ["TodoWrite"]  # Draft from existing knowledge
+        draft_result = await analyst.process(self.idea, analyst_context)
+        if self.analytics:
+            self.analytics.record_timing(
+                "analyst", 1, "draft_wall_clock", time.monotonic() - started
+            )
+        if isinstance(draft_result, Error):
+            return draft_result
+
+        assert self.system_config.template_dir is not None
+        template = (
+            self.system_config.template_dir / "agents" / "analyst" / "analysis.md"
+        ).read_text()
+        text = analysis_file.read_text()
+        uncited = find_uncited_figures(text)
+        missing = assess_completeness(text, list(parse_sections(template))).missing
+        if not uncited and not missing:
+            logger.info("✅ Draft is complete and cited, skipping enrichment")
+            return draft_result
+
+        limit = self.analyst_config.enrichment_max_targets
+        targets = [f'- **{name}**: "{sentence}"' for name, sentence in uncited[:limit]]
+        if len(uncited) > limit:
+            targets.append(
+                f"- ...and {len(uncited) - limit} more uncited figures; cite these "
+                + "only if the searches above also cover them"
+            )
+        targets += [f"- **{name}**: section is missing or unfinished" for name in missing]
+
+        context = AnalystContext(
+            idea_slug=self.slug,
+            output_limit=self.system_config.output_limit,
+            analysis_output_path=analysis_file,
+            iteration=1,
+            analytics_name="analyst_enrichment",
+            user_prompt_template="agents/analyst/user/enrichment.md",
+            prompt_vars={
+                "targets": "\n".join(targets),
+                "max_websearches": str(self.analyst_config.enrichment_max_websearches),
+            },
+        )
+        context.run_analytics = self.analytics
+        context.source_notes = self._analyst_source_notes()
+        context.knowledge_base_path = self._knowledge_base_path()
+        enrichment_config = replace(
+            self.analyst_config,
+            max_websearches=self.analyst_config.enrichment_max_websearches,
+            max_turns=self.analyst_config.enrichment_max_turns,
+        )
+        logger.info(
+            f"🔗 Enriching draft: {len(uncited)} uncited figures, {len(missing)} gaps"
+        )
+        started = time.monotonic()
+        result = await AnalystAgent(enrichment_config).process(self.idea, context)
+        if self.analytics:
+            self.analytics.record_timing(
+                "analyst", 1, "enrichment_wall_clock", time.monotonic() - started
+            )
+        if isinstance(result, Error) and not missing:
+            # The draft is complete without sources; review will flag them
+            logger.warning(f"Enrichment failed, keeping the draft: {result.message}")
+            return draft_result
+        return result
+
+    async def _salvage_analysis(self, analysis_file: Path, error: str) -> AgentResult:
+        """Accept, complete or reject the partial output of a failed analyst session.
+
+        Near-complete analyses are accepted as they are. Analyses with most
+        sections filled get a short continuation session for the rest. Anything
+        less fails as before.
+
+        Args:
+            analysis_file: Analysis the failed session was writing
+            error: Error message from the failed session
+
+        Returns:
+            Success if the analysis can be used, otherwise Error
+        """
+        assert self.system_config.template_dir is not None
+        template = (
+            self.system_config.template_dir / "agents" / "analyst" / "analysis.md"
+        ).read_text()
+        if not analysis_file.exists() or analysis_file.read_text() == template:
+            return Error(message=error)  # Nothing written, nothing to salvage
+
+        required = list(parse_sections(template))
+        state = assess_completeness(analysis_file.read_text(), required)
+        min_words = self.analyst_config.min_words * self.analyst_config.salvage_min_words
+        problem = f"salvage after: {error}"
+        logger.info(
+            f"Salvaging analysis: {len(state.filled)} of "
+            + f"{len(state.filled) + len(state.missing)} sections filled, {state.words} words"
+        )
+
+        if not state.missing and state.words >= min_words:
+            logger.info("✅ Accepting partial analysis as complete")
+            if self.analytics:
+                self.analytics.record_repair(
+                    "analyst", self.iteration_count, 0, True, problem
                 )
+            return Success()
+
+        if state.filled_fraction < self.analyst_config.salvage_min_filled:
+            logger.warning("Too little of the analysis was written to salvage")
+            if self.analytics:
+                self.analytics.record_repair(
+                    "analyst", self.iteration_count, 0, False, problem
+                )
+            return Error(message=error)
+
+        # Short continuation for the missing sections (or the thinnest ones)
+        if state.missing:
+            targets = [f"- {name}" for name in state.missing]
+        else:
+            sections = parse_sections(analysis_file.read_text())
+            thinnest = sorted(state.filled, key=lambda n: len(sections[n].split()))[:3]
+            targets = [
+                f"- {name} (too short: expand it; the analysis needs "
+                + f"{self.analyst_config.min_words} words)"
+                for name in thinnest
+            ]
+        context = AnalystContext(
+            idea_slug=self.slug,
+            output_limit=self.system_config.output_limit,
+            analysis_output_path=analysis_file,
+            iteration=self.iteration_count,
+            analytics_name="analyst_continuation",
+            user_prompt_template="agents/analyst/user/continuation.md",
+            prompt_vars={"missing_sections": "\n".join(targets)},
+        )
+        context.run_analytics = self.analytics
+        continuation_config = replace(
+            self.analyst_config,
+            max_turns=self.analyst_config.salvage_continuation_max_turns,
+        )
+        logger.info(f"📝 Running continuation session for {len(targets)} sections")
+        _ = await AnalystAgent(continuation_config).process(self.idea, context)
+
+        after = assess_completeness(analysis_file.read_text(), required)
+        completed = not after.missing
+        if self.analytics:
+            self.analytics.record_repair(
+                "analyst", self.iteration_count, 1, completed, problem
+            )
+        if not completed:
+            return Error(
+                message=f"{error} (continuation left {', '.join(after.missing)} incomplete)"
+            )
+        return Success()
+
+    @contextlib.asynccontextmanager
+    async def _watch_analysis(self, paths: list[Path]) -> AsyncGenerator[None]:
+        """Pre-verify citations of completed sections while the analyst writes.
+
+        A no-op unless citation prefetch is enabled and the mode fact-checks.
+        """
+        if (
+            not self.fact_checker_config.prefetch_during_analysis
+            or self.mode != PipelineMode.ANALYZE_REVIEW_WITH_FACT_CHECK
+        ):
+            yield
+            return
+
+        watcher = AnalysisWatcher(
+            paths, self._get_prefetcher(), self.fact_checker_config.prefetch_poll_interval
+        )
+        stop = asyncio.Event()
+        task = asyncio.create_task(watcher.run(stop))
+        try:
+            yield
+        finally:
+            stop.set()
+            await task
+
+    def _get_prefetcher(self) -> CitationPrefetcher:
+        """Return the run's citation prefetcher, starting it on first use."""
+        if self.prefetcher is None:
+            config = self.fact_checker_config
+            assert self.system_config.cache_dir is not None
+            self.prefetcher = CitationPrefetcher(
+                self.citation_fetcher
+                or UrlFetcher(
+                    timeout=config.prefetch_fetch_timeout,
+                    max_bytes=config.prefetch_max_bytes,
+                ),
+                FetchCache(self.system_config.cache_dir / "fetch"),
+                config.prefetch_concurrency,
+                fetch_timeout=config.prefetch_fetch_timeout,
+                max_page_chars=config.prefetch_max_page_chars,
+                registry=self.source_registry,
+            )
+            self.prefetcher.start()
+        return self.prefetcher
+
+    def _load_source_registry(self) -> SourceRegistry:
+        """Load the source registry from the cache directory."""
+        assert self.system_config.cache_dir is not None
+        return SourceRegistry(
+            self.system_config.cache_dir / "source_registry.json",
+            self.system_config.source_retry_after_days,
+            self.system_config.source_slow_seconds,
+        )
+
+    def _analyst_source_notes(self) -> str:
+        """Prompt section steering the analyst away from unreliable sources."""
+        if self.source_registry is None:
+            return ""
+        return render_unreliable_sources(self.source_registry)
+
+    def _cited_source_notes(self, analysis_file: Path) -> str:
+        """Prompt section warning the fact-checker about unusable cited URLs."""
+        if self.source_registry is None:
+            return ""
+        references = parse_reference_entries(analysis_file.read_text())
+        urls = [url for entry in references.values() if (url := extract_url(entry))]
+        return render_cited_sources(self.source_registry, urls)
+
+    def _update_source_registry(
+        self, run_dir: Path, fetch_log: list[tuple[FetchResult, float]]
+    ) -> None:
+        """Teach the source registry this run's fetches and citation issues.
+
+        The registry is reloaded first so concurrent runs don't overwrite
+        each other's updates.
+
+        Args:
+            run_dir: This run's analytics folder (holds messages.jsonl)
+            fetch_log: Pages fetched by the citation prefetcher, with latency
+        """
+        registry = self._load_source_registry()
+        fetches = registry.learn_from_run(run_dir)
+        for page, seconds in fetch_log:
+            registry.record_page(page, seconds)
+        fetches += len(fetch_log)
+        issues = registry.learn_from_fact_check_files(
+            sorted(self.iterations_dir.glob("fact_check_iteration_*.json"))
+        )
+        try:
+            registry.save()
+        except OSError as e:
+            logger.warning(f"Failed to save source registry: {e}")
+            return
+        logger.info(
+            f"📡 Source registry learned {fetches} fetches and {issues} citation issues"
+        )
+
+    def _knowledge_base_path(self) -> Path | None:
+        """Knowledge base offered to analyst sessions, if enabled."""
+        if not self.analyst_config.knowledge_base:
+            return None
+        assert self.system_config.cache_dir is not None
+        return self.system_config.cache_dir / "knowledge_base.sqlite3"
+
+    def _update_knowledge_base(self, run_dir: Path) -> None:
+        """Index this run's web searches and any new pre-research results.
+
+        Args:
+            run_dir: This run's analytics folder (holds messages.jsonl)
+        """
+        path = self._knowledge_base_path()
+        assert path is not None and self.system_config.cache_dir is not None
+        try:
+            kb = KnowledgeBase(path)
+            try:
+                searches = kb.learn_from_run(
+                    run_dir, FetchCache(self.system_config.cache_dir / "fetch")
+                )
+                searches += kb.learn_from_search_cache(
+                    self.system_config.cache_dir / "search"
+                )
+            finally:
+                kb.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update knowledge base: {e}")
+            return
+        logger.info(f"📚 Knowledge base indexed {searches} searches")
+
+    def _get_claim_memo(self) -> ClaimMemo:
+        """Return the run's claim memo, loading it on first use."""
+        if self.claim_memo is None:
+            assert self.system_config.cache_dir is not None
+            self.claim_memo = ClaimMemo(
+                self.system_config.cache_dir / "claim_memo.json",
+                self.fact_checker_config.claim_memo_ttl_days,
+            )
+        return self.claim_memo
+
+    def _write_memo_hits(self, analysis_file: Path) -> tuple[Path | None, set[str]]:
+        """Look up memoized verdicts for the analysis's claims and save them.
+
+        Returns:
+            Path of the saved hits (None if the claim memo is disabled) and
+            the keys of the memoized claims
+        """
+        if not self.fact_checker_config.claim_memo:
+            return None, set()
+
+        memo = self._get_claim_memo()
+        memo.reset_counters()
+        hits = memo.lookup(analysis_file.read_text())
+        hits_file = self.iterations_dir / f"memo_iteration_{self.iteration_count}.json"
+        save_memo_hits(hits, hits_file)
+        logger.info(
+            f"🧠 Claim memo: {len(hits)} claims already checked "
+            + f"({memo.hits} hits, {memo.stale} stale, {memo.misses} misses)"
+        )
+        return hits_file, {hit.claim_key for hit in hits}
+
+    def _memoize_fact_check(
+        self,
+        analysis_file: Path,
+        fact_check_file: Path,
+        prefetch_file: Path | None,
+        memoized: set[str],
+    ) -> None:
+        """Store the verdicts of a completed fact-check and record memo usage.
+
+        Args:
+            analysis_file: Analysis that was fact-checked
+            fact_check_file: Its fact-check JSON
+            prefetch_file: Pre-verifications given to the fact-checker, if any
+            memoized: Keys of claims whose memoized verdicts were reused
+        """
+        if self.claim_memo is None:
+            return
+        pre_verified = load_pre_verifications(prefetch_file) if prefetch_file else []
+        metrics = (
+            self.analytics.agent_metrics.get(("fact_checker", self.iteration_count))
+            if self.analytics
+            else None
+        )
+        stored = self.claim_memo.ingest(
+            analysis_file,
+            fact_check_file,
+            pre_verified,
+            fetched_urls=set(metrics.fetched_urls) if metrics else set(),
+            reused=memoized,
+        )
+        try:
+            self.claim_memo.save()
+        except OSError as e:
+            logger.warning(f"Failed to save claim memo: {e}")
+        if self.analytics:
+            self.analytics.record_claim_memo(
+                self.iteration_count,
+                self.claim_memo.hits,
+                self.claim_memo.stale,
+                self.claim_memo.misses,
+                stored,
+            )
+
+    async def _write_prefetch_results(
+        self, analysis_file: Path, memoized: set[str] | None = None
+    ) -> Path | None:
+        """Pre-verify the analysis's citations and save its verdicts.
+
+        With prefetch_before_fact_check, every cited URL is queued now and
+        fetched concurrently, so the wait is about the slowest fetch rather
+        than the sum of them.
+
+        Args:
+            analysis_file: Analysis about to be fact-checked
+            memoized: Keys of claims with memoized verdicts, which are not fetched
+
+        Returns:
+            Path of the saved results, or None if prefetching is not active
+        """
+        if self.fact_checker_config.prefetch_before_fact_check:
+            queued = self._get_prefetcher().submit_analysis(
+                analysis_file.read_text(), exclude=memoized
+            )
+            logger.info(f"🔗 Prefetching citations: {queued} claim/URL pairs queued")
+        if self.prefetcher is None:
+            return None
+
+        started = time.monotonic()
+        drained = await self.prefetcher.drain(
+            self.fact_checker_config.prefetch_drain_timeout
+        )
+        if not drained:
+            logger.warning("Citation prefetch timed out, using partial results")
+
+        keys = {claim.key for claim in extract_claims(analysis_file.read_text())}
+        results = self.prefetcher.results(keys)
+        prefetch_file = (
+            self.iterations_dir / f"prefetch_iteration_{self.iteration_count}.json"
+        )
+        with open(prefetch_file, "w") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+
+        logger.info(
+            f"🔗 Pre-verified {len(results)} citations "
+            + f"({self.prefetcher.fetch_count} fetches, "
+            + f"{self.prefetcher.cache_hits} cache hits)"
+        )
+        if self.analytics:
+            self.analytics.record_timing(
+                "fact_checker",
+                self.iteration_count,
+                "prefetch_wait",
+                time.monotonic() - started,
+            )
+            # Sequential cost of the same fetches, for comparison with the wait
+            self.analytics.record_timing(
+                "fact_checker",
+                self.iteration_count,
+                "prefetch_fetch_sum",
+                self.prefetcher.fetch_seconds,
+            )
+            self.analytics.record_timing(
+                "fact_checker",
+                self.iteration_count,
+                "prefetch_slowest_fetch",
+                self.prefetcher.slowest_fetch,
+            )
+        # Count the next iteration's fetches on their own
+        self.prefetcher.fetch_seconds = 0.0
+        self.prefetcher.slowest_fetch = 0.0
+        return prefetch_file
+
+    def _finalize_analysis(self, analysis_file: Path) -> None:
+        """Append metadata to a completed analysis and make it current."""
+        websearch_count = self.analytics.search_count if self.analytics else 0
+        webfetch_count = self.analytics.webfetch_count if self.analytics else 0
+
+        append_metadata_to_analysis(
+            analysis_file,
+            self.idea,
+            self.slug,
+            self.iteration_count,
+            websearch_count,
+            webfetch_count,
+        )
 
         # Save analysis iteration
         self._save_analysis_iteration()
         self.current_analysis_file = analysis_file
-        return True
+
+    async def _run_section_parallel_analyst(
+        self,
+        analyst: AnalystAgent,
+        analysis_file: Path,
+        analyst_context: AnalystContext,
+    ) -> AgentResult:
+        """Write the first iteration with one analyst sub-session per section group.
+
+        Sub-sessions run concurrently on partial templates and share a research
+        cache. Their output is merged into analysis_file and tidied by a short
+        consistency pass. Falls back to a single session if any group fails.
+
+        Returns:
+            Success, or the result of the single-session fallback
+        """
+        assert self.system_config.template_dir is not None
+        template = (
+            self.system_config.template_dir / "agents" / "analyst" / "analysis.md"
+        ).read_text()
+        groups = self.analyst_config.section_groups
+
+        # Split the search budget so the fan-out doesn't multiply it
+        group_config = replace(
+            self.analyst_config,
+            max_websearches=math.ceil(self.analyst_config.max_websearches / len(groups)),
+        )
+        research_cache = self.iterations_dir / "research_cache.md"
+        self._write_research_cache(research_cache)
+
+        part_files: list[Path] = []
+        contexts: list[AnalystContext] = []
+        for number, group in enumerate(groups, start=1):
+            part_file = self.iterations_dir / f"iteration_1.part_{number}.md"
+            _ = part_file.write_text(build_group_template(template, group))
+            part_files.append(part_file)
+            context = AnalystContext(
+                idea_slug=self.slug,
+                output_limit=self.system_config.output_limit,
+                analysis_output_path=part_file,
+                iteration=1,
+                analytics_name=f"analyst_group_{number}",
+                research_input_path=analyst_context.research_input_path,
+                user_prompt_template="agents/analyst/user/section_group.md",
+                prompt_vars={
+                    "sections": ", ".join(group),
+                    "group_number": str(number),
+                    "group_count": str(len(groups)),
+                    "research_cache_file": str(research_cache),
+                },
+            )
+            context.run_analytics = self.analytics
+            context.source_notes = self._analyst_source_notes()
+            context.knowledge_base_path = self._knowledge_base_path()
+            contexts.append(context)
+
+        async def run_group(context: AnalystContext) -> tuple[AgentResult, float]:
+            started = time.monotonic()
+            result = await AnalystAgent(group_config).process(self.idea, context)
+            return result, time.monotonic() - started
+
+        logger.info(f"⚡ Running {len(groups)} section-group analysts in parallel")
+        original_handler = signal.getsignal(signal.SIGINT)
+        stop = asyncio.Event()
+        refresher = asyncio.create_task(
+            self._refresh_research_cache(research_cache, stop)
+        )
+        started = time.monotonic()
+        try:
+            outcomes = await asyncio.gather(*(run_group(c) for c in contexts))
+        finally:
+            stop.set()
+            await refresher
+            # Concurrent sub-sessions restore SIGINT handlers out of order
+            _ = signal.signal(signal.SIGINT, original_handler)
+        fan_out_seconds = time.monotonic() - started
+
+        failed = [
+            number
+            for number, (result, _) in enumerate(outcomes, start=1)
+            if isinstance(result, Error)
+        ]
+        if failed:
+            logger.warning(
+                f"Section groups {failed} failed, falling back to a single analyst session"
+            )
+            if self.analytics:
+                self.analytics.record_rerun(
+                    "analyst", 1, f"section groups {failed} failed"
+                )
+            return await analyst.process(self.idea, analyst_context)
+
+        merged = merge_group_analyses(template, [p.read_text() for p in part_files])
+        _ = analysis_file.write_text(merged)
+
+        # Short consistency pass over the merged file, no research
+        consistency_context = AnalystContext(
+            idea_slug=self.slug,
+            output_limit=self.system_config.output_limit,
+            analysis_output_path=analysis_file,
+            iteration=1,
+            tools=["Read", "Edit", "MultiEdit", "TodoWrite"],
+            analytics_name="analyst_consistency",
+            user_prompt_template="agents/analyst/user/consistency.md",
+        )
+        consistency_context.run_analytics = self.analytics
+        consistency_config = replace(
+            self.analyst_config, max_turns=self.analyst_config.consistency_max_turns
+        )
+        consistency_started = time.monotonic()
+        consistency_result = await AnalystAgent(consistency_config).process(
+            self.idea, consistency_context
+        )
+        consistency_seconds = time.monotonic() - consistency_started
+        if isinstance(consistency_result, Error):
+            logger.warning(
+                f"Consistency pass failed ({consistency_result.message}), "
+                + "keeping merged analysis"
+            )
+
+        # Sequential estimate: the sub-sessions run back to back in one session
+        sequential_seconds = sum(seconds for _, seconds in outcomes)
+        first_analysis_seconds = fan_out_seconds + consistency_seconds
+        logger.info(
+            f"⚡ First analysis ready in {first_analysis_seconds:.1f}s wall clock "
+            + f"vs ~{sequential_seconds:.1f}s for a single session "
+            + f"({len(groups)} groups, consistency pass {consistency_seconds:.1f}s)"
+        )
+        if self.analytics:
+            for name, seconds in (
+                ("parallel_fan_out", fan_out_seconds),
+                ("consistency_pass", consistency_seconds),
+                ("first_analysis_wall_clock", first_analysis_seconds),
+                ("single_session_estimate", sequential_seconds),
+            ):
+                self.analytics.record_timing("analyst", 1, name, seconds)
+
+        return Success()
+
+    async def _refresh_research_cache(
+        self, cache_file: Path, stop: asyncio.Event
+    ) -> None:
+        """Keep the shared research cache current until stop is set."""
+        while not stop.is_set():
+            try:
+                _ = await asyncio.wait_for(
+                    stop.wait(), timeout=RESEARCH_CACHE_REFRESH_SECONDS
+                )
+            except asyncio.TimeoutError:
+                self._write_research_cache(cache_file)
+
+    def _write_research_cache(self, cache_file: Path) -> None:
+        """Write first-iteration analyst searches and results to the cache file."""
+        all_metrics = self.analytics.agent_metrics if self.analytics else {}
+        sessions = [
+            metrics
+            for (name, iteration), metrics in all_metrics.items()
+            if iteration == 1 and name.startswith("analyst")
+        ]
+        _ = cache_file.write_text(
+            render_research_cache(
+                [query for metrics in sessions for query in metrics.search_queries],
+                [result for metrics in sessions for result in metrics.search_results],
+            )
+        )
+
+    def _load_feedback_json(
+        self, source: Path | None
+    ) -> dict[str, Any] | None:  # pyright: ignore[reportExplicitAny]
+        """Parse a reviewer or fact-check JSON file, or None if unavailable."""
+        if not source or not source.exists():
+            return None
+        try:
+            data = json.loads(source.read_text())  # pyright: ignore[reportAny]
+        except json.JSONDecodeError as e:
+            logger.warning(f"Could not parse {source}: {e}")
+            return None
+        return data if isinstance(data, dict) else None  # pyright: ignore[reportUnknownVariableType]
+
+    def _write_revision_brief(
+        self,
+        iteration: int,
+        feedback_file: Path | None,
+        fact_check_file: Path | None,
+    ) -> Path | None:
+        """Build the revision brief for an iteration from the given feedback files.
+
+        Args:
+            iteration: Iteration the analyst is about to write
+            feedback_file: Reviewer feedback on the previous iteration
+            fact_check_file: Fact-check results on the previous iteration
+
+        Returns:
+            Path to the written brief, or None if there is no feedback to condense
+        """
+        raw_files = [f for f in (feedback_file, fact_check_file) if f and f.exists()]
+        if not raw_files:
+            return None
+
+        feedback = self._load_feedback_json(feedback_file)
+        fact_check = self._load_feedback_json(fact_check_file)
+        previous_iteration = iteration - 1
+        brief = build_revision_brief(feedback, fact_check, previous_iteration)
+        brief_file = (
+            self.iterations_dir / f"revision_brief_iteration_{previous_iteration}.md"
+        )
+        _ = brief_file.write_text(brief)
+
+        raw_tokens = sum(estimate_tokens(f.read_text()) for f in raw_files)
+        brief_tokens = estimate_tokens(brief)
+        logger.info(
+            f"📋 Revision brief: {brief_tokens} tokens vs {raw_tokens} raw "
+            + f"({len(raw_files)} files -> 1)"
+        )
+        if self.analytics:
+            self.analytics.record_savings(
+                "analyst",
+                iteration,
+                "revision_brief",
+                turns=len(raw_files) - 1,
+                tokens=max(raw_tokens - brief_tokens, 0),
+            )
+
+        return brief_file
 
     async def _run_reviewer(self, reviewer: ReviewerAgent) -> bool:
         """Run reviewer and process feedback.
@@ -308,13 +1208,21 @@ class AnalysisPipeline:
             logger.error("No current analysis file to review")
             return False
 
+        previous_analysis = (
+            self.iterations_dir / f"iteration_{self.iteration_count - 1}.md"
+            if self.iteration_count > 1
+            else None
+        )
+
         reviewer_context = ReviewerContext(
             analysis_input_path=self.current_analysis_file,
             feedback_output_path=feedback_file,
             iteration=self.iteration_count,
             previous_feedback_path=self.last_feedback_file,  # Pass previous feedback for iterations 2+
+            previous_analysis_path=previous_analysis,  # Used by incremental review
         )
         reviewer_context.run_analytics = self.analytics
+        reviewer_context.max_turns = self._turn_limit("reviewer", self.reviewer_config)
 
         logger.info(f"🔍 Running reviewer for iteration {self.iteration_count}")
         reviewer_result = await reviewer.process("", reviewer_context)
@@ -323,6 +1231,7 @@ class AnalysisPipeline:
         match reviewer_result:
             case Error(message=msg):
                 logger.error(f"Reviewer failed: {msg}")
+                self.stop_reason = "reviewer_failed"
                 return False
             case Success():
                 pass
@@ -330,6 +1239,7 @@ class AnalysisPipeline:
         # Parse reviewer feedback
         if not feedback_file.exists():
             logger.warning(f"No feedback file found at {feedback_file}")
+            self.stop_reason = "reviewer_failed"
             return False
 
         try:
@@ -341,6 +1251,10 @@ class AnalysisPipeline:
             # Check recommendation
             recommendation = feedback.get("iteration_recommendation", "reject")  # pyright: ignore[reportAny]
             logger.debug(f"Reviewer recommendation value: '{recommendation}'")
+            if self.analytics:
+                self.analytics.record_outcome(
+                    "reviewer", self.iteration_count, str(recommendation)  # pyright: ignore[reportAny]
+                )
             if recommendation == "approve":
                 logger.info(f"✅ Reviewer approved at iteration {self.iteration_count}")
                 return False  # Stop iterating - approved
@@ -352,6 +1266,7 @@ class AnalysisPipeline:
 
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Failed to parse feedback: {e}")
+            self.stop_reason = "reviewer_failed"
             return False
 
     async def _run_fact_checker(self, fact_checker: FactCheckerAgent) -> bool:
@@ -381,13 +1296,33 @@ class AnalysisPipeline:
             logger.error("No current analysis file to fact-check")
             return False
 
+        previous_analysis = (
+            self.iterations_dir / f"iteration_{self.iteration_count - 1}.md"
+            if self.iteration_count > 1
+            else None
+        )
+
+        memo_hits_file, memoized = self._write_memo_hits(self.current_analysis_file)
+        prefetch_file = await self._write_prefetch_results(
+            self.current_analysis_file, memoized
+        )
         fact_check_context = FactCheckContext(
             analysis_input_path=self.current_analysis_file,
             fact_check_output_path=fact_check_file,
             iteration=self.iteration_count,
             max_iterations=self.max_iterations,
+            previous_analysis_path=previous_analysis,  # Used by incremental fact-check
+            previous_fact_check_path=self.last_fact_check_file,
+            prefetch_results_path=prefetch_file,
+            memo_hits_path=memo_hits_file,
         )
         fact_check_context.run_analytics = self.analytics
+        fact_check_context.source_notes = self._cited_source_notes(
+            self.current_analysis_file
+        )
+        fact_check_context.max_turns = self._turn_limit(
+            "fact_checker", self.fact_checker_config
+        )
 
         logger.info(f"🔎 Running fact-checker for iteration {self.iteration_count}")
         fact_checker_result = await fact_checker.process("", fact_check_context)
@@ -396,6 +1331,7 @@ class AnalysisPipeline:
         match fact_checker_result:
             case Error(message=msg):
                 logger.error(f"Fact-checker failed: {msg}")
+                self.stop_reason = "fact_checker_failed"
                 return False
             case Success():
                 pass
@@ -403,16 +1339,24 @@ class AnalysisPipeline:
         # Parse fact-check results
         if not fact_check_file.exists():
             logger.warning(f"No fact-check file found at {fact_check_file}")
+            self.stop_reason = "fact_checker_failed"
             return False
 
         try:
             fact_check_text = fact_check_file.read_text()
             fact_check = json.loads(fact_check_text)  # pyright: ignore[reportAny]
             self.last_fact_check_file = fact_check_file
+            self._memoize_fact_check(
+                self.current_analysis_file, fact_check_file, prefetch_file, memoized
+            )
 
             # Check recommendation (default to reject for safety)
             recommendation = fact_check.get("iteration_recommendation", "reject")  # pyright: ignore[reportAny]
             logger.debug(f"Fact-checker recommendation value: '{recommendation}'")
+            if self.analytics:
+                self.analytics.record_outcome(
+                    "fact_checker", self.iteration_count, str(recommendation)  # pyright: ignore[reportAny]
+                )
             if recommendation == "approve":
                 logger.info(
                     f"✅ Fact-checker approved at iteration {self.iteration_count}"
@@ -426,6 +1370,7 @@ class AnalysisPipeline:
 
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Failed to parse fact-check: {e}")
+            self.stop_reason = "fact_checker_failed"
             return False
 
     async def _run_parallel_review_fact_check(
@@ -439,8 +1384,6 @@ class AnalysisPipeline:
         Returns:
             True if should continue iterating, False if both approved
         """
-        import asyncio
-
         # Run both agents in parallel
         try:
             results = await asyncio.gather(
@@ -483,6 +1426,276 @@ class AnalysisPipeline:
 
         return should_continue
 
+    async def _run_speculative_review_fact_check(
+        self,
+        analyst: AnalystAgent,
+        reviewer: ReviewerAgent,
+        fact_checker: FactCheckerAgent,
+    ) -> tuple[bool, bool]:
+        """
+        Run reviewer and fact-checker, starting the next analyst on the first rejection.
+
+        The speculative analysis is kept as is if the other check approves,
+        patched with a short follow-up edit if it rejects with no must-fix
+        items, and discarded if it raises must-fix items.
+
+        Returns:
+            Tuple of (should_continue, next_analysis_ready). next_analysis_ready
+            is True when the next iteration's analysis was written speculatively.
+        """
+        iteration = self.iteration_count
+        tasks = {
+            asyncio.create_task(self._run_reviewer(reviewer)): "reviewer",
+            asyncio.create_task(self._run_fact_checker(fact_checker)): "fact_checker",
+        }
+        done, pending = await asyncio.wait(
+            tasks.keys(), return_when=asyncio.FIRST_COMPLETED
+        )
+        first = next(iter(done))
+        first_continue = self._check_task_result(first, tasks[first])
+
+        if not pending or not first_continue:
+            # Nothing to speculate on: wait for both checks as usual
+            if pending:
+                _ = await asyncio.wait(pending)
+            results = [self._check_task_result(t, name) for t, name in tasks.items()]
+            return any(results), False
+
+        second = next(iter(pending))
+        second_name = tasks[second]
+        next_iteration = iteration + 1
+        feedback_file = (
+            self.iterations_dir / f"reviewer_feedback_iteration_{iteration}.json"
+        )
+        fact_check_file = self.iterations_dir / f"fact_check_iteration_{iteration}.json"
+
+        logger.info(
+            f"⏩ {tasks[first]} rejected iteration {iteration}, starting analyst "
+            + f"iteration {next_iteration} speculatively"
+        )
+        started = time.monotonic()
+        speculative = asyncio.create_task(
+            self._run_speculative_analyst(
+                analyst,
+                next_iteration,
+                feedback_file if tasks[first] == "reviewer" else None,
+                fact_check_file if tasks[first] == "fact_checker" else None,
+            )
+        )
+
+        _ = await asyncio.wait({second})
+        second_done = time.monotonic()
+        second_continue = self._check_task_result(second, second_name)
+        second_json = (
+            self._load_feedback_json(
+                feedback_file if second_name == "reviewer" else fact_check_file
+            )
+            if second_continue
+            else None
+        )
+        second_feedback = second_json if second_name == "reviewer" else None
+        second_fact_check = second_json if second_name == "fact_checker" else None
+
+        # Must-fix items from the second check change the picture: start over
+        if count_must_fix(second_feedback, second_fact_check):
+            _ = speculative.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                _ = await speculative
+            self._discard_speculation(next_iteration, time.monotonic() - started)
+            logger.info(
+                f"🗑️ {second_name} raised must-fix issues, discarding speculative "
+                + f"iteration {next_iteration}"
+            )
+            return True, False
+
+        result, analyst_done = await speculative
+        if isinstance(result, Error):
+            self._discard_speculation(next_iteration, time.monotonic() - started)
+            return True, False
+        # Only the analyst time that overlapped the wait for the second check is saved
+        seconds_saved = min(analyst_done, second_done) - started
+
+        outcome = "accepted"
+        if second_json is not None:
+            follow_up_started = time.monotonic()
+            follow_up = await self._run_follow_up(
+                next_iteration, second_feedback, second_fact_check
+            )
+            if isinstance(follow_up, Error):
+                self._discard_speculation(next_iteration, time.monotonic() - started)
+                return True, False
+            seconds_saved -= time.monotonic() - follow_up_started
+            outcome = "follow_up"
+
+        logger.info(
+            f"⏩ Speculative iteration {next_iteration} kept ({outcome}), "
+            + f"saved ~{seconds_saved:.1f}s"
+        )
+        if self.analytics:
+            self.analytics.record_speculation(
+                next_iteration, outcome, seconds_saved=max(seconds_saved, 0.0)
+            )
+        return True, True
+
+    def _check_task_result(self, task: asyncio.Task[bool], agent_name: str) -> bool:
+        """Return a review task's should-continue flag, treating exceptions as continue."""
+        try:
+            return task.result()
+        except Exception as e:
+            logger.error(f"{agent_name} failed with exception: {e}")
+            return True  # Continue iterating on error
+
+    async def _run_speculative_analyst(
+        self,
+        analyst: AnalystAgent,
+        iteration: int,
+        feedback_file: Path | None,
+        fact_check_file: Path | None,
+    ) -> tuple[AgentResult, float]:
+        """
+        Run the analyst for the next iteration using only the feedback available so far.
+
+        Returns:
+            The analyst result and the monotonic time the session finished
+        """
+        analysis_file = self.iterations_dir / f"iteration_{iteration}.md"
+        assert self.system_config.template_dir is not None
+        create_file_from_template(
+            self.system_config.template_dir / "agents" / "analyst" / "analysis.md",
+            analysis_file,
+        )
+
+        # A brief accepts either feedback source on its own
+        context = AnalystContext(
+            idea_slug=self.slug,
+            output_limit=self.system_config.output_limit,
+            analysis_output_path=analysis_file,
+            previous_analysis_input_path=self.iterations_dir
+            / f"iteration_{iteration - 1}.md",
+            revision_brief_input_path=self._write_revision_brief(
+                iteration, feedback_file, fact_check_file
+            ),
+            iteration=iteration,
+        )
+        context.run_analytics = self.analytics
+        context.source_notes = self._analyst_source_notes()
+        context.knowledge_base_path = self._knowledge_base_path()
+        context.max_turns = self._turn_limit("analyst", self.analyst_config, iteration)
+        async with self._watch_analysis([analysis_file]):
+            result = await analyst.process(self.idea, context)
+        return result, time.monotonic()
+
+    async def _run_follow_up(
+        self,
+        iteration: int,
+        feedback: dict[str, Any] | None,  # pyright: ignore[reportExplicitAny]
+        fact_check: dict[str, Any] | None,  # pyright: ignore[reportExplicitAny]
+    ) -> AgentResult:
+        """Apply late-arriving feedback to a speculative analysis with a short edit session."""
+        brief_file = (
+            self.iterations_dir / f"follow_up_brief_iteration_{iteration - 1}.md"
+        )
+        _ = brief_file.write_text(
+            build_revision_brief(feedback, fact_check, iteration - 1)
+        )
+
+        context = AnalystContext(
+            idea_slug=self.slug,
+            output_limit=self.system_config.output_limit,
+            analysis_output_path=self.iterations_dir / f"iteration_{iteration}.md",
+            iteration=iteration,
+            analytics_name="analyst_follow_up",
+            user_prompt_template="agents/analyst/user/follow_up.md",
+            prompt_vars={"follow_up_file": str(brief_file)},
+        )
+        context.run_analytics = self.analytics
+        follow_up_config = replace(
+            self.analyst_config,
+            max_turns=self.reviewer_config.speculative_follow_up_max_turns,
+        )
+        return await AnalystAgent(follow_up_config).process(self.idea, context)
+
+    def _discard_speculation(self, iteration: int, seconds: float) -> None:
+        """Drop a speculative analysis so the iteration is rerun from the template."""
+        (self.iterations_dir / f"iteration_{iteration}.md").unlink(missing_ok=True)
+
+        cost = 0.0
+        if self.analytics:
+            metrics = self.analytics.agent_metrics.get(("analyst", iteration))
+            if metrics and metrics.total_cost_usd:
+                cost = metrics.total_cost_usd
+                metrics.total_cost_usd = None  # The rerun reports its own cost
+            self.analytics.record_rerun(
+                "analyst", iteration, "speculative revision discarded"
+            )
+            self.analytics.record_speculation(
+                iteration,
+                "discarded",
+                discarded_seconds=seconds,
+                discarded_cost_usd=cost,
+            )
+        logger.info(
+            f"Discarded speculative iteration {iteration}: {seconds:.1f}s, ${cost:.4f}"
+        )
+
+    def _turn_limit(
+        self, agent_name: str, config: BaseAgentConfig, iteration: int | None = None
+    ) -> int | None:
+        """
+        Get the learned turn limit for an agent session, if adaptive turns are on.
+
+        Args:
+            agent_name: Analytics agent name (e.g., "reviewer")
+            config: Agent configuration holding the default max_turns
+            iteration: Iteration of the session (defaults to the current one)
+
+        Returns:
+            Turn limit for the session context, or None to use the config's
+        """
+        if self.turn_policy is None:
+            return None
+        limit = self.turn_policy.max_turns(
+            agent_name,
+            self.mode.value,
+            iteration or self.iteration_count,
+            config.max_turns,
+        )
+        if limit != config.max_turns:
+            logger.debug(f"Adaptive max_turns for {agent_name}: {limit}")
+        return limit
+
+    def _has_converged(self) -> bool:
+        """Record this iteration's review signals and check for convergence.
+
+        Sets stop_reason when the loop should stop with the current analysis.
+        """
+        if self.convergence is None or self.current_analysis_file is None:
+            return False
+
+        previous = self.iterations_dir / f"iteration_{self.iteration_count - 1}.md"
+        signals = self.convergence.observe(
+            self.iteration_count,
+            self.current_analysis_file.read_text(),
+            previous.read_text() if self.iteration_count > 1 and previous.exists() else None,
+            self.last_feedback,
+            self._load_feedback_json(self.last_fact_check_file)
+            if self.mode == PipelineMode.ANALYZE_REVIEW_WITH_FACT_CHECK
+            else None,
+        )
+        logger.debug(
+            f"Convergence signals for iteration {self.iteration_count}: "
+            + f"changed={signals.changed_fraction:.2f}, "
+            + f"weighted_issues={signals.weighted_issues:.1f}, "
+            + f"carried_over={signals.carried_over}/{len(signals.issues)}"
+        )
+
+        reason = self.convergence.stop_reason()
+        if reason is None:
+            return False
+        logger.info(f"🧭 Review loop converged at iteration {self.iteration_count}: {reason}")
+        self.stop_reason = f"converged: {reason}"
+        return True
+
     def _build_result(self, error: str | None = None) -> PipelineResult:
         """Build consistent result dictionary."""
         if error:
@@ -493,6 +1706,7 @@ class AnalysisPipeline:
                 "idea_slug": self.slug,
                 "iterations": self.iteration_count,
                 "message": error,
+                "stop_reason": "error",
             }
 
         # Get feedback path if it exists
@@ -509,6 +1723,8 @@ class AnalysisPipeline:
             "idea_slug": self.slug,
             "iterations": self.iteration_count,
             "message": None,
+            "stop_reason": self.stop_reason,
+            "cost_usd": self.analytics.total_cost_usd() if self.analytics else 0.0,
         }
 
     def _save_analysis_iteration(self) -> None:
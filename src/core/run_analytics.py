@@ -30,6 +30,13 @@ from claude_code_sdk.types import (
 logger = logging.getLogger(__name__)
 
 
+# Sessions using at most this fraction of their turn limit count as early finishes
+EARLY_FINISH_FRACTION = 0.25
+
+# Characters of WebSearch summary text logged with each search's results
+SEARCH_SUMMARY_CHARS = 2000
+
+
 @dataclass
 class AgentMetrics:
     """Metrics for a single agent's execution."""
@@ -44,6 +51,7 @@ class AgentMetrics:
     total_thinking_length: int = 0
     search_queries: list[str] = field(default_factory=list)
     search_results: list[dict[str, str]] = field(default_factory=list)
+    fetched_urls: list[str] = field(default_factory=list)  # WebFetch inputs
     files_read: list[str] = field(default_factory=list)
     files_written: list[str] = field(default_factory=list)
     start_time: datetime = field(default_factory=datetime.now)
@@ -51,7 +59,24 @@ class AgentMetrics:
     duration_seconds: float | None = None
     session_id: str | None = None
     total_cost_usd: float | None = None
+    model: str | None = None  # Model reported by the latest assistant message
+    thinking_budget: int | None = None  # Configured thinking budget, None for the default
+    max_turns: int | None = None  # Turn limit of the session
+    turn_limit_hit: bool = False  # Session ended because it ran out of turns
+    outcome: str | None = None  # Reviewer/fact-checker recommendation, if any
     token_usage: dict[str, int] = field(default_factory=dict)
+    # Prompt cache usage summed over the agent's result messages
+    input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    num_turns: int | None = None
+    duration_api_ms: int | None = None
+    # Estimated savings per optimization source, e.g. {"inline_artifacts": {"turns": 2}}
+    savings: dict[str, dict[str, float]] = field(default_factory=dict)
+    # Named wall-clock measurements taken by the pipeline, in seconds
+    timings: dict[str, float] = field(default_factory=dict)
+    # Tool calls or output over budget, e.g. {"tool": "WebSearch", "limit": 8, ...}
+    budget_events: list[dict[str, Any]] = field(default_factory=list)
 
 
 class RunAnalytics:
@@ -69,15 +94,17 @@ class RunAnalytics:
     - run_summary.json: Aggregated metrics for the entire run
     """
 
-    def __init__(self, run_id: str, output_dir: Path) -> None:
+    def __init__(self, run_id: str, output_dir: Path, mode: str | None = None) -> None:
         """
         Initialize analytics for a pipeline run.
 
         Args:
             run_id: Unique identifier for this run (typically timestamp_slug)
             output_dir: Directory to write output files (typically logs/runs)
+            mode: Pipeline mode value, recorded so runs can be compared by mode
         """
         self.run_id: str = run_id
+        self.mode: str | None = mode
         # Create a subfolder for this run using the run_id
         self.output_dir: Path = Path(output_dir) / run_id
         self.start_time: datetime = datetime.now()
@@ -96,6 +123,26 @@ class RunAnalytics:
         self.search_count: int = 0
         self.webfetch_count: int = 0
 
+        # Speculative revision outcomes, one entry per attempt
+        self.speculation: list[dict[str, Any]] = []
+
+        # In-session output repairs and full agent reruns
+        self.repairs: list[dict[str, Any]] = []
+        self.reruns: list[dict[str, Any]] = []
+
+        # Pre-review lint gate runs, one entry per check
+        self.lint_runs: list[dict[str, Any]] = []
+
+        # Per-idea attribution of a micro-batched analyst session
+        self.micro_batch: list[dict[str, Any]] = []
+
+        # Claim memo lookups and stores, one entry per fact-check
+        self.claim_memo: list[dict[str, Any]] = []
+
+        # Cost, latency and turns per model, accumulated from result messages
+        self.model_usage: dict[str, dict[str, float]] = {}
+        self._session_costs: dict[str, float] = {}  # session_id -> cost so far
+
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -115,12 +162,7 @@ class RunAnalytics:
         """
         self.message_count += 1
 
-        # Get or create agent metrics
-        key = (agent_name, iteration)
-        if key not in self.agent_metrics:
-            self.agent_metrics[key] = AgentMetrics(agent_name, iteration)
-
-        metrics = self.agent_metrics[key]
+        metrics = self._get_metrics(agent_name, iteration)
         metrics.message_count += 1
 
         # Extract artifacts based on message type
@@ -133,6 +175,8 @@ class RunAnalytics:
 
         elif isinstance(message, (UserMessage, AssistantMessage)):
             artifacts = self._extract_content_artifacts(message, metrics)
+            if isinstance(message, AssistantMessage):
+                metrics.model = message.model
 
         elif isinstance(message, ResultMessage):
             artifacts = self._extract_result_artifacts(message, metrics)
@@ -148,6 +192,312 @@ class RunAnalytics:
         if self.message_count % 10 == 0:
             logger.debug(f"Tracked {self.message_count} messages")
 
+    def _get_metrics(self, agent_name: str, iteration: int) -> AgentMetrics:
+        """Get or create the metrics entry for an agent iteration."""
+        key = (agent_name, iteration)
+        if key not in self.agent_metrics:
+            self.agent_metrics[key] = AgentMetrics(agent_name, iteration)
+        return self.agent_metrics[key]
+
+    def record_savings(
+        self,
+        agent_name: str,
+        iteration: int,
+        source: str,
+        turns: float = 0,
+        tokens: float = 0,
+    ) -> None:
+        """
+        Record estimated savings from a pipeline optimization.
+
+        Latency savings are derived from turns at finalize time, using the
+        session's average API latency per turn.
+
+        Args:
+            agent_name: Name of the agent that benefited (e.g., "reviewer")
+            iteration: Iteration number
+            source: Optimization that produced the saving (e.g., "inline_artifacts")
+            turns: Estimated model turns avoided
+            tokens: Estimated input tokens avoided
+        """
+        metrics = self._get_metrics(agent_name, iteration)
+        entry = metrics.savings.setdefault(source, {"turns": 0, "tokens": 0})
+        entry["turns"] = entry["turns"] + turns
+        entry["tokens"] = entry["tokens"] + tokens
+        logger.debug(
+            f"Savings recorded for {agent_name} iteration {iteration} from {source}: "
+            + f"{turns} turns, {tokens} tokens"
+        )
+
+    def record_timing(
+        self, agent_name: str, iteration: int, name: str, seconds: float
+    ) -> None:
+        """
+        Record a wall-clock measurement for an agent iteration.
+
+        Args:
+            agent_name: Name of the agent being timed (e.g., "analyst")
+            iteration: Iteration number
+            name: Measurement name (e.g., "parallel_wall_clock")
+            seconds: Measured duration in seconds
+        """
+        metrics = self._get_metrics(agent_name, iteration)
+        metrics.timings[name] = round(seconds, 3)
+        logger.debug(
+            f"Timing recorded for {agent_name} iteration {iteration}: {name}={seconds:.1f}s"
+        )
+
+    def record_speculation(
+        self,
+        iteration: int,
+        outcome: str,
+        seconds_saved: float = 0.0,
+        discarded_seconds: float = 0.0,
+        discarded_cost_usd: float = 0.0,
+    ) -> None:
+        """
+        Record the outcome of a speculative revision.
+
+        Args:
+            iteration: Iteration the speculative analyst wrote
+            outcome: "accepted", "follow_up" or "discarded"
+            seconds_saved: Net wall-clock time saved versus waiting for both checks
+            discarded_seconds: Analyst time thrown away when the speculation was discarded
+            discarded_cost_usd: Cost of the discarded analyst run, if known
+        """
+        self.speculation.append(
+            {
+                "iteration": iteration,
+                "outcome": outcome,
+                "seconds_saved": round(seconds_saved, 3),
+                "discarded_seconds": round(discarded_seconds, 3),
+                "discarded_cost_usd": discarded_cost_usd,
+            }
+        )
+        logger.debug(f"Speculation recorded for iteration {iteration}: {outcome}")
+
+    def total_cost_usd(self) -> float:
+        """Total cost of the run so far, summed over all result messages."""
+        return sum(usage["cost_usd"] for usage in self.model_usage.values())
+
+    def record_micro_batch(self, ideas: list[dict[str, Any]]) -> None:
+        """
+        Record how a micro-batched analyst session split across its ideas.
+
+        Args:
+            ideas: One entry per idea with its slug, success flag and cost share
+        """
+        self.micro_batch.extend(ideas)
+
+    def record_claim_memo(
+        self, iteration: int, hits: int, stale: int, misses: int, stored: int = 0
+    ) -> None:
+        """
+        Record claim memo lookups for one fact-check.
+
+        Args:
+            iteration: Iteration being fact-checked
+            hits: Claim/source lookups answered by a fresh verdict
+            stale: Lookups that found only an expired verdict
+            misses: Lookups with no verdict at all
+            stored: Verdicts stored from this iteration's fact-check
+        """
+        self.claim_memo.append(
+            {
+                "iteration": iteration,
+                "hits": hits,
+                "stale": stale,
+                "misses": misses,
+                "stored": stored,
+            }
+        )
+
+    def _calculate_claim_memo(self) -> dict[str, Any]:
+        """Summarize claim memo lookups: hit rate and share of expired verdicts."""
+        hits = sum(entry["hits"] for entry in self.claim_memo)
+        stale = sum(entry["stale"] for entry in self.claim_memo)
+        lookups = hits + stale + sum(entry["misses"] for entry in self.claim_memo)
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "stale": stale,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "stale_rate": round(stale / lookups, 3) if lookups else 0.0,
+            "stored": sum(entry["stored"] for entry in self.claim_memo),
+            "entries": self.claim_memo,
+        }
+
+    def record_thinking_budget(
+        self, agent_name: str, iteration: int, budget: int
+    ) -> None:
+        """
+        Record the thinking-token budget an agent session ran with.
+
+        Args:
+            agent_name: Name of the agent (e.g., "reviewer")
+            iteration: Iteration number
+            budget: Thinking-token budget passed to the CLI
+        """
+        self._get_metrics(agent_name, iteration).thinking_budget = budget
+
+    def record_turn_limit(
+        self, agent_name: str, iteration: int, max_turns: int | None
+    ) -> None:
+        """
+        Record the turn limit an agent session ran with.
+
+        Args:
+            agent_name: Name of the agent (e.g., "reviewer")
+            iteration: Iteration number
+            max_turns: max_turns passed to the SDK
+        """
+        self._get_metrics(agent_name, iteration).max_turns = max_turns
+
+    def record_outcome(self, agent_name: str, iteration: int, outcome: str) -> None:
+        """
+        Record the recommendation an agent iteration ended with.
+
+        Args:
+            agent_name: Name of the agent (e.g., "reviewer")
+            iteration: Iteration number
+            outcome: Recommendation such as "approve" or "reject"
+        """
+        self._get_metrics(agent_name, iteration).outcome = outcome
+
+    def record_budget_event(
+        self, agent_name: str, iteration: int, event: dict[str, Any]
+    ) -> None:
+        """
+        Record a tool call or output that went over its budget.
+
+        Args:
+            agent_name: Agent whose session hit the limit (e.g., "analyst")
+            iteration: Iteration number
+            event: Serialized BudgetEvent (tool, limit, used, action)
+        """
+        metrics = self._get_metrics(agent_name, iteration)
+        metrics.budget_events.append(event)
+        logger.debug(
+            f"Budget event for {agent_name} iteration {iteration}: {event}"
+        )
+
+    def record_repair(
+        self,
+        agent_name: str,
+        iteration: int,
+        turns: int,
+        succeeded: bool,
+        problem: str,
+    ) -> None:
+        """
+        Record an in-session repair of an agent's output.
+
+        Args:
+            agent_name: Agent whose output was repaired (e.g., "reviewer")
+            iteration: Iteration number
+            turns: Repair requests sent
+            succeeded: Whether the output was usable afterwards
+            problem: First problem reported to the agent
+        """
+        self.repairs.append(
+            {
+                "agent": agent_name,
+                "iteration": iteration,
+                "turns": turns,
+                "succeeded": succeeded,
+                "problem": problem,
+            }
+        )
+        logger.debug(
+            f"Repair recorded for {agent_name} iteration {iteration}: "
+            + f"{turns} turns, {'succeeded' if succeeded else 'failed'}"
+        )
+
+    def record_rerun(self, agent_name: str, iteration: int, reason: str) -> None:
+        """
+        Record a full rerun of an agent session.
+
+        Args:
+            agent_name: Agent that was rerun (e.g., "analyst")
+            iteration: Iteration number
+            reason: Why the earlier session's work was thrown away
+        """
+        self.reruns.append(
+            {"agent": agent_name, "iteration": iteration, "reason": reason}
+        )
+        logger.debug(f"Rerun recorded for {agent_name} iteration {iteration}: {reason}")
+
+    def _calculate_repairs(self) -> dict[str, Any]:
+        """Summarize in-session repairs separately from full reruns."""
+        return {
+            "attempts": len(self.repairs),
+            "succeeded": sum(1 for r in self.repairs if r["succeeded"]),
+            "failed": sum(1 for r in self.repairs if not r["succeeded"]),
+            "repair_turns": sum(r["turns"] for r in self.repairs),
+            "full_reruns": len(self.reruns),
+            "entries": self.repairs,
+            "reruns": self.reruns,
+        }
+
+    def record_lint(
+        self,
+        iteration: int,
+        seconds: float,
+        blocking_rules: list[str],
+        warnings: int = 0,
+    ) -> None:
+        """
+        Record one run of the pre-review lint gate.
+
+        Args:
+            iteration: Iteration of the linted analysis
+            seconds: Time spent linting
+            blocking_rules: Rule name of each blocking issue (empty if it passed)
+            warnings: Number of non-blocking issues
+        """
+        self.lint_runs.append(
+            {
+                "iteration": iteration,
+                "seconds": round(seconds, 4),
+                "rejected": bool(blocking_rules),
+                "blocking_rules": blocking_rules,
+                "warnings": warnings,
+            }
+        )
+        logger.debug(
+            f"Lint recorded for iteration {iteration}: {len(blocking_rules)} blocking issues"
+        )
+
+    def _calculate_lint(self) -> dict[str, Any]:
+        """Summarize lint gate runs: rejections, time spent and rules triggered."""
+        rules: dict[str, int] = {}
+        for run in self.lint_runs:
+            for rule in run["blocking_rules"]:
+                rules[rule] = rules.get(rule, 0) + 1
+        return {
+            "runs": len(self.lint_runs),
+            "rejections": sum(1 for run in self.lint_runs if run["rejected"]),
+            "total_seconds": round(sum(run["seconds"] for run in self.lint_runs), 4),
+            "blocking_rules": rules,
+            "entries": self.lint_runs,
+        }
+
+    def _calculate_speculation(self) -> dict[str, Any]:
+        """Summarize speculative revisions: time saved versus discarded spend."""
+        outcomes = [entry["outcome"] for entry in self.speculation]
+        return {
+            "attempts": len(self.speculation),
+            "accepted": outcomes.count("accepted"),
+            "follow_up": outcomes.count("follow_up"),
+            "discarded": outcomes.count("discarded"),
+            "seconds_saved": sum(e["seconds_saved"] for e in self.speculation),
+            "discarded_seconds": sum(e["discarded_seconds"] for e in self.speculation),
+            "discarded_cost_usd": sum(
+                e["discarded_cost_usd"] for e in self.speculation
+            ),
+            "entries": self.speculation,
+        }
+
     def _extract_system_artifacts(self, message: SystemMessage) -> dict[str, Any]:
         """Extract artifacts from SystemMessage."""
         artifacts = {"subtype": message.subtype, "data": message.data or {}}
@@ -224,6 +574,8 @@ class RunAnalytics:
                     tool_artifacts["tool_input"]["query"] = query
             elif tool_name == "WebFetch":
                 self.webfetch_count += 1
+                if block.input and block.input.get("url"):
+                    metrics.fetched_urls.append(str(block.input["url"]))
             elif tool_name == "Read" and block.input:
                 file_path = block.input.get("file_path", "")
                 if file_path:
@@ -257,6 +609,7 @@ class RunAnalytics:
                 "tool_use_id": getattr(block, "tool_use_id", None),
                 "is_error": block.is_error,
                 "content_preview": str(block.content)[:500] if block.content else None,
+                "content_length": len(str(block.content)) if block.content else 0,
             }
 
             # Correlate with tool use
@@ -283,6 +636,13 @@ class RunAnalytics:
                                 ]
                                 result_artifacts["search_results"] = search_results
                                 metrics.search_results.extend(search_results)
+                                # Kept for the research knowledge base
+                                result_artifacts["search_query"] = str(
+                                    (tool_info["input"] or {}).get("query", "")
+                                )
+                                result_artifacts["search_summary"] = block.content[
+                                    links_match.end() :
+                                ].strip()[:SEARCH_SUMMARY_CHARS]
                             except json.JSONDecodeError:
                                 logger.debug(
                                     f"Failed to parse search results JSON for tool {tool_use_id}"
@@ -310,9 +670,47 @@ class RunAnalytics:
             metrics.total_cost_usd = message.total_cost_usd
         if message.usage:
             metrics.token_usage = message.usage
+            metrics.input_tokens += message.usage.get("input_tokens", 0)
+            metrics.cache_creation_input_tokens += message.usage.get(
+                "cache_creation_input_tokens", 0
+            )
+            metrics.cache_read_input_tokens += message.usage.get(
+                "cache_read_input_tokens", 0
+            )
+        metrics.num_turns = message.num_turns
+        metrics.duration_api_ms = message.duration_api_ms
+        if message.subtype == "error_max_turns":
+            metrics.turn_limit_hit = True
+        self._add_model_usage(metrics.model, message)
 
         return artifacts
 
+    def _add_model_usage(self, model: str | None, message: ResultMessage) -> None:
+        """Accumulate one result's cost, latency and turns under its model."""
+        usage = self.model_usage.setdefault(
+            model or "default",
+            {
+                "results": 0,
+                "cost_usd": 0.0,
+                "duration_seconds": 0.0,
+                "api_seconds": 0.0,
+                "turns": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+            },
+        )
+        usage["results"] += 1
+        # Cost is cumulative within a session, so add only this result's share
+        if message.total_cost_usd:
+            previous = self._session_costs.get(message.session_id, 0.0)
+            usage["cost_usd"] += max(message.total_cost_usd - previous, 0.0)
+            self._session_costs[message.session_id] = message.total_cost_usd
+        usage["duration_seconds"] += message.duration_ms / 1000
+        usage["api_seconds"] += message.duration_api_ms / 1000
+        usage["turns"] += message.num_turns
+        for key in ("input_tokens", "output_tokens"):
+            usage[key] += (message.usage or {}).get(key, 0)
+
     def _write_message_log(
         self,
         message: object,
@@ -471,6 +869,7 @@ class RunAnalytics:
 
         summary = {
             "run_id": self.run_id,
+            "mode": self.mode,
             "start_time": self.start_time.isoformat(),
             "end_time": datetime.now().isoformat(),
             "duration_seconds": (datetime.now() - self.start_time).total_seconds(),
@@ -551,6 +950,39 @@ class RunAnalytics:
             if isinstance(stats["all_search_results"], list):
                 stats["all_search_results"].extend(metrics.search_results)
 
+        stats["estimated_savings"] = self._calculate_savings()
+        if self.speculation:
+            stats["speculation"] = self._calculate_speculation()
+        if self.lint_runs:
+            stats["lint"] = self._calculate_lint()
+        if self.repairs or self.reruns:
+            stats["repairs"] = self._calculate_repairs()
+        if self.claim_memo:
+            stats["claim_memo"] = self._calculate_claim_memo()
+        if self.model_usage:
+            stats["by_model"] = self._calculate_by_model()
+        if self.micro_batch:
+            stats["micro_batch"] = {
+                "ideas": self.micro_batch,
+                "succeeded": sum(1 for idea in self.micro_batch if idea["succeeded"]),
+                "amortized_cost_usd": round(
+                    self.total_cost_usd() / len(self.micro_batch), 4
+                ),
+            }
+        prompt_cache = self._calculate_prompt_cache()
+        if prompt_cache:
+            stats["prompt_cache"] = prompt_cache
+        turn_limits = self._calculate_turn_limits()
+        if turn_limits["sessions"]:
+            stats["turn_limits"] = turn_limits
+        budget_events = [
+            {"agent": metrics.agent_name, "iteration": metrics.iteration, **event}
+            for metrics in self.agent_metrics.values()
+            for event in metrics.budget_events
+        ]
+        if budget_events:
+            stats["budget_events"] = budget_events
+
         # Convert sets to lists for JSON serialization
         if isinstance(stats["unique_files_read"], set):
             stats["unique_files_read"] = list(stats["unique_files_read"])
@@ -559,6 +991,96 @@ class RunAnalytics:
 
         return stats
 
+    def _calculate_prompt_cache(self) -> dict[str, Any]:
+        """Prompt cache hit rate per agent and for the whole run.
+
+        The hit rate is the share of prompt tokens read from the cache, out of
+        all prompt tokens (uncached input, cache writes and cache reads).
+        """
+
+        def summarize(metrics_list: list[AgentMetrics]) -> dict[str, Any]:
+            read = sum(m.cache_read_input_tokens for m in metrics_list)
+            created = sum(m.cache_creation_input_tokens for m in metrics_list)
+            uncached = sum(m.input_tokens for m in metrics_list)
+            total = read + created + uncached
+            return {
+                "cache_read_input_tokens": read,
+                "cache_creation_input_tokens": created,
+                "input_tokens": uncached,
+                "hit_rate": round(read / total, 3) if total else 0.0,
+            }
+
+        all_metrics = list(self.agent_metrics.values())
+        if not any(
+            m.cache_read_input_tokens or m.cache_creation_input_tokens or m.input_tokens
+            for m in all_metrics
+        ):
+            return {}
+        agents = sorted({m.agent_name for m in all_metrics})
+        return {
+            **summarize(all_metrics),
+            "by_agent": {
+                agent: summarize([m for m in all_metrics if m.agent_name == agent])
+                for agent in agents
+            },
+        }
+
+    def _calculate_turn_limits(self) -> dict[str, Any]:
+        """Report sessions that hit their turn limit or finished far below it."""
+        limit_hits: list[dict[str, Any]] = []
+        early_finishes: list[dict[str, Any]] = []
+        sessions = 0
+        for metrics in self.agent_metrics.values():
+            if not metrics.max_turns or metrics.num_turns is None:
+                continue
+            sessions += 1
+            entry = {
+                "agent": metrics.agent_name,
+                "iteration": metrics.iteration,
+                "max_turns": metrics.max_turns,
+                "num_turns": metrics.num_turns,
+            }
+            if metrics.turn_limit_hit:
+                limit_hits.append(entry)
+            elif metrics.num_turns <= metrics.max_turns * EARLY_FINISH_FRACTION:
+                early_finishes.append(entry)
+        return {
+            "sessions": sessions,
+            "limit_hits": limit_hits,
+            "early_finishes": early_finishes,
+        }
+
+    def _calculate_by_model(self) -> dict[str, dict[str, float]]:
+        """Round per-model usage and add averages for comparing models."""
+        by_model: dict[str, dict[str, float]] = {}
+        for model, usage in self.model_usage.items():
+            results = usage["results"] or 1
+            by_model[model] = {
+                **{k: round(v, 4) for k, v in usage.items()},
+                "avg_cost_usd": round(usage["cost_usd"] / results, 4),
+                "avg_duration_seconds": round(usage["duration_seconds"] / results, 2),
+            }
+        return by_model
+
+    def _calculate_savings(self) -> dict[str, dict[str, float]]:
+        """Aggregate recorded savings per source, including estimated latency."""
+        totals: dict[str, dict[str, float]] = {}
+
+        for metrics in self.agent_metrics.values():
+            seconds_per_turn = 0.0
+            if metrics.num_turns and metrics.duration_api_ms:
+                seconds_per_turn = metrics.duration_api_ms / 1000 / metrics.num_turns
+
+            for source, entry in metrics.savings.items():
+                total = totals.setdefault(
+                    source, {"turns": 0, "tokens": 0, "latency_seconds": 0.0}
+                )
+                total["turns"] += entry.get("turns", 0)
+                total["tokens"] += entry.get("tokens", 0)
+                total["latency_seconds"] += entry.get("turns", 0) * seconds_per_turn
+
+        return totals
+
     def get_current_stats(self) -> dict[str, int]:
         """
         Get current statistics for display.
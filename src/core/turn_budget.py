@@ -0,0 +1,107 @@
+"""Learn per-agent max_turns from the turn usage of past runs.
+
+Every run_summary.json records `num_turns` per agent iteration. The policy
+collects these per agent, pipeline mode and iteration kind (first draft vs
+revision), takes a high percentile and adds an overflow margin. Agents with
+too little history keep their configured max_turns.
+"""
+
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .config import SystemConfig
+
+logger = logging.getLogger(__name__)
+
+
+def iteration_kind(iteration: int) -> str:
+    """Group iterations: the first draft behaves differently from revisions."""
+    return "first" if iteration <= 1 else "revision"
+
+
+def _percentile(values: list[int], fraction: float) -> float:
+    """Linear-interpolated percentile of a non-empty list."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+@dataclass
+class TurnBudgetPolicy:
+    """Turn limits derived from historical turn usage."""
+
+    percentile: float = 0.9
+    margin: float = 0.25  # Overflow margin on top of the percentile
+    min_samples: int = 5
+    min_turns: int = 5
+    # (agent, mode, iteration kind) -> observed num_turns
+    samples: dict[tuple[str, str, str], list[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_runs(cls, runs_dir: Path, config: SystemConfig) -> "TurnBudgetPolicy":
+        """
+        Build a policy from the run summaries in a directory.
+
+        Args:
+            runs_dir: Directory holding one folder per run (e.g., logs/runs)
+            config: System configuration with the policy settings
+
+        Returns:
+            Policy holding every sample found (possibly none)
+        """
+        policy = cls(
+            percentile=config.turn_budget_percentile,
+            margin=config.turn_budget_margin,
+            min_samples=config.turn_budget_min_samples,
+        )
+        for summary_file in runs_dir.glob("*/run_summary.json"):
+            try:
+                summary: dict[str, Any] = json.loads(summary_file.read_text())  # pyright: ignore[reportAny, reportExplicitAny]
+            except (OSError, json.JSONDecodeError):
+                continue
+            mode = summary.get("mode")
+            if not mode:
+                continue  # Runs from before modes were recorded
+            for metrics in summary.get("agent_metrics", {}).values():  # pyright: ignore[reportAny]
+                if metrics.get("num_turns"):  # pyright: ignore[reportAny]
+                    policy.add(
+                        metrics["agent_name"],  # pyright: ignore[reportAny]
+                        mode,  # pyright: ignore[reportAny]
+                        metrics["iteration"],  # pyright: ignore[reportAny]
+                        metrics["num_turns"],  # pyright: ignore[reportAny]
+                    )
+        logger.debug(
+            f"Turn budget policy: {sum(len(v) for v in policy.samples.values())} "
+            + f"samples from {runs_dir}"
+        )
+        return policy
+
+    def add(self, agent: str, mode: str, iteration: int, num_turns: int) -> None:
+        """Record the turns one agent session used."""
+        key = (agent, mode, iteration_kind(iteration))
+        self.samples.setdefault(key, []).append(num_turns)
+
+    def max_turns(self, agent: str, mode: str, iteration: int, default: int) -> int:
+        """
+        Get the learned turn limit for an agent session.
+
+        Args:
+            agent: Analytics agent name (e.g., "reviewer")
+            mode: Pipeline mode value
+            iteration: Iteration number
+            default: Configured max_turns, used without enough history
+
+        Returns:
+            Percentile of past usage plus the margin, or default
+        """
+        values = self.samples.get((agent, mode, iteration_kind(iteration)), [])
+        if len(values) < self.min_samples:
+            return default
+        limit = math.ceil(_percentile(values, self.percentile) * (1 + self.margin))
+        return max(limit, self.min_turns)
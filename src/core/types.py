@@ -4,10 +4,10 @@ This module consolidates all type definitions for the project,
 including pipeline modes, result types, and context classes.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, NotRequired, TypedDict
 
 if TYPE_CHECKING:
     from src.core.run_analytics import RunAnalytics
@@ -28,6 +28,7 @@ class PipelineMode(Enum):
         "analyze_review_with_fact_check"  # + FactChecker parallel
     )
     FULL_EVALUATION = "full_evaluation"  # All agents (Phase 4)
+    TRIAGE = "triage"  # Batch screening score per idea, no web (batch only)
 
 
 # ============================================================================
@@ -62,6 +63,10 @@ class PipelineResult(TypedDict):
     idea_slug: str
     iterations: int
     message: str | None
+    # Why the review loop ended: "approved", "max_iterations", "converged", ...
+    stop_reason: NotRequired[str | None]
+    cost_usd: NotRequired[float]  # Total cost of the run's agent sessions
+    score: NotRequired[float]  # Triage screening score (1-10)
 
 
 # ============================================================================
@@ -77,6 +82,8 @@ class BaseContext:
     iteration: int = 1
     tools: list[str] | None = None
     run_analytics: "RunAnalytics | None" = None
+    output_limit: int | None = None  # Max characters of the agent's output file
+    max_turns: int | None = None  # Overrides the agent's configured max_turns
 
 
 @dataclass
@@ -88,6 +95,23 @@ class AnalystContext(BaseContext):
     previous_analysis_input_path: Path | None = None  # Only on iteration 2+
     feedback_input_path: Path | None = None  # Only on iteration 2+ (reviewer)
     fact_check_input_path: Path | None = None  # Only on iteration 2+ (fact-checker)
+    revision_brief_input_path: Path | None = None  # Replaces raw feedback when set
+    research_input_path: Path | None = None  # Pre-research results, inlined into any prompt
+
+    # Custom user prompt (relative to prompts_dir); formatted with idea,
+    # output_file and prompt_vars. Overrides the initial/revision prompts.
+    user_prompt_template: str | None = None
+    prompt_vars: dict[str, str] = field(default_factory=dict)
+    # Further analyses written by the same session (micro-batched ideas)
+    extra_output_paths: list[Path] = field(default_factory=list)
+    # Prompt section on unreliable sources, appended to the user prompt
+    source_notes: str = ""
+    # Research knowledge base offered as a lookup tool (web sessions only)
+    knowledge_base_path: Path | None = None
+
+    # Analytics key for the session; auxiliary sessions (enrichment, section
+    # groups, follow-ups) use their own so the main analyst metrics stay intact
+    analytics_name: str = "analyst"
 
     # Analyst-specific state
     idea_slug: str = ""
@@ -102,6 +126,7 @@ class ReviewerContext(BaseContext):
     analysis_input_path: Path = Path("analysis.md")
     feedback_output_path: Path = Path("feedback.md")
     previous_feedback_path: Path | None = None  # Path to previous iteration's feedback
+    previous_analysis_path: Path | None = None  # Previous iteration (incremental review)
 
 
 @dataclass
@@ -112,6 +137,19 @@ class FactCheckContext(BaseContext):
     analysis_input_path: Path = Path("analysis.md")
     fact_check_output_path: Path = Path("fact-check.json")
 
+    # Previous iteration, used by incremental fact-checking
+    previous_analysis_path: Path | None = None
+    previous_fact_check_path: Path | None = None
+
+    # Citations pre-verified while the analysis was written (JSON list)
+    prefetch_results_path: Path | None = None
+
+    # Verdicts memoized from earlier fact-checks (JSON list of memo hits)
+    memo_hits_path: Path | None = None
+
+    # Prompt section on the health of the cited URLs, appended to the user prompt
+    source_notes: str = ""
+
     # Max iterations from ReviewerConfig (shared between reviewer and fact-checker)
     max_iterations: int = 3
 
@@ -0,0 +1,72 @@
+"""Background research helpers that run outside agent sessions."""
+
+from .claim_memo import (
+    ClaimMemo,
+    MemoEntry,
+    MemoHit,
+    load_memo_hits,
+    render_memo_hits,
+    save_memo_hits,
+)
+from .fetcher import FetchResult, Fetcher, UrlFetcher, html_to_text
+from .fetch_cache import FetchCache
+from .knowledge_base import KnowledgeBase, KnowledgeHit, render_hits
+from .prefetch import (
+    AnalysisWatcher,
+    CitationPrefetcher,
+    PreVerification,
+    completed_sections,
+    load_pre_verifications,
+    pre_verify,
+    render_pre_verifications,
+)
+from .source_registry import (
+    SourceRegistry,
+    SourceStats,
+    render_cited_sources,
+    render_unreliable_sources,
+)
+from .pre_research import (
+    ClaudeSearcher,
+    SearchCache,
+    SearchExecutor,
+    SearchResult,
+    plan_queries,
+    render_research,
+)
+from .urls import canonicalize_url
+
+__all__ = [
+    "ClaimMemo",
+    "MemoEntry",
+    "MemoHit",
+    "load_memo_hits",
+    "render_memo_hits",
+    "save_memo_hits",
+    "FetchResult",
+    "Fetcher",
+    "UrlFetcher",
+    "html_to_text",
+    "FetchCache",
+    "KnowledgeBase",
+    "KnowledgeHit",
+    "render_hits",
+    "AnalysisWatcher",
+    "CitationPrefetcher",
+    "PreVerification",
+    "completed_sections",
+    "load_pre_verifications",
+    "pre_verify",
+    "render_pre_verifications",
+    "SourceRegistry",
+    "SourceStats",
+    "render_cited_sources",
+    "render_unreliable_sources",
+    "ClaudeSearcher",
+    "SearchCache",
+    "SearchExecutor",
+    "SearchResult",
+    "plan_queries",
+    "render_research",
+    "canonicalize_url",
+]
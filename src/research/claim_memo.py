@@ -0,0 +1,396 @@
+"""Memoize fact-check verdicts across iterations and ideas.
+
+Analyses often repeat the same facts (market sizes, report statistics,
+regulations) cited to the same sources. ClaimMemo stores one verdict per
+normalized claim and canonical source URL, filled from validated
+fact_check_iteration_N.json files. Only verdicts backed by evidence are
+stored: claims flagged by an issue keep its issue type and evidence; claims
+the fact-check passed are stored as "supported" when the prefetcher found
+their key figures next to the claim on the page, and as "no_issue" when the
+fact-checker fetched the cited page itself and raised nothing. Passed claims
+whose page nobody fetched are not memoized. Entries expire after a TTL, so
+verdicts on changing facts are re-checked; verdicts that were reused or
+carried forward instead of re-checked keep their original timestamps.
+Before a fact-check, the pipeline looks up the analysis's claims and hands
+the fresh verdicts to the fact-checker, which then skips fetching those pages.
+"""
+# pyright: reportAny=false, reportExplicitAny=false
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from ..utils.claims import (
+    Claim,
+    extract_claims,
+    match_claim,
+    normalize_claim,
+    parse_reference_entries,
+)
+from ..utils.json_validator import JsonResponseValidator, json_object, json_objects
+from .prefetch import SUPPORTED, PreVerification, extract_url
+from .urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# Verdicts for claims the fact-check did not flag
+NO_ISSUE = "no_issue"  # The fact-checker fetched the page and raised no issue
+PASSED = (SUPPORTED, NO_ISSUE)
+
+
+@dataclass
+class MemoEntry:
+    """Memoized verdict for one claim/source pair."""
+
+    claim: str  # Normalized claim text
+    url: str  # Canonical source URL
+    verdict: str  # SUPPORTED, NO_ISSUE or the issue_type of a fact-check issue
+    evidence: str
+    checked_at: str
+    expires_at: str
+    severity: str = ""  # Severity of the issue, if any
+    origin: str = ""  # Fact-check file the verdict came from
+
+    @property
+    def passed(self) -> bool:
+        """Whether the claim passed the fact-check."""
+        return self.verdict in PASSED
+
+
+@dataclass
+class MemoHit:
+    """A claim of the current analysis with fresh verdicts for all its sources."""
+
+    claim_key: str
+    claim: str
+    section: str
+    entries: list[MemoEntry]
+
+    @property
+    def passed(self) -> bool:
+        """Whether every source's verdict passed."""
+        return all(entry.passed for entry in self.entries)
+
+
+def memo_key(claim_text: str, url: str) -> str:
+    """Store key for a claim and its canonical source URL."""
+    text = normalize_claim(claim_text) + "|" + url
+    return hashlib.sha256(text.encode()).hexdigest()[:24]
+
+
+def claim_urls(claim: Claim, references: dict[str, str]) -> list[str]:
+    """Canonical URLs of the references a claim cites, in citation order."""
+    urls: list[str] = []
+    for citation in claim.citations:
+        url = extract_url(references.get(citation, ""))
+        if url and url not in urls:
+            urls.append(url)
+    return urls
+
+
+class ClaimMemo:
+    """Claim verdicts persisted as JSON, keyed by memo_key."""
+
+    def __init__(self, path: Path, ttl_days: float = 30.0) -> None:
+        """
+        Load the memo, starting empty if the file is missing or unreadable.
+
+        Args:
+            path: JSON file holding the verdicts (e.g., .cache/claim_memo.json)
+            ttl_days: Days a new verdict stays fresh
+        """
+        self.path: Path = path
+        self.ttl: timedelta = timedelta(days=ttl_days)
+        self.entries: dict[str, MemoEntry] = {}
+        # Lookup outcomes since the last reset_counters()
+        self.hits: int = 0
+        self.stale: int = 0
+        self.misses: int = 0
+        if path.exists():
+            try:
+                data: dict[str, dict[str, Any]] = json.loads(path.read_text())
+                self.entries = {key: MemoEntry(**entry) for key, entry in data.items()}
+            except (json.JSONDecodeError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable claim memo {path}: {e}")
+
+    def get(self, claim_text: str, url: str, now: datetime | None = None) -> MemoEntry | None:
+        """
+        Return the fresh verdict for a claim/source pair, counting the lookup.
+
+        Args:
+            claim_text: Claim as written
+            url: Canonical source URL
+            now: Current time (defaults to now)
+
+        Returns:
+            The entry, or None if missing or expired
+        """
+        entry = self.entries.get(memo_key(claim_text, url))
+        if entry is None:
+            self.misses += 1
+            return None
+        if datetime.fromisoformat(entry.expires_at) <= (now or datetime.now()):
+            self.stale += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def lookup(self, text: str, now: datetime | None = None) -> list[MemoHit]:
+        """
+        Find the claims of an analysis whose every cited source has a fresh verdict.
+
+        Args:
+            text: Analysis markdown
+            now: Current time (defaults to now)
+
+        Returns:
+            Memo hits in document order
+        """
+        references = parse_reference_entries(text)
+        hits: list[MemoHit] = []
+        for claim in extract_claims(text):
+            urls = claim_urls(claim, references)
+            if not urls:
+                continue
+            entries = [self.get(claim.text, url, now) for url in urls]
+            found = [entry for entry in entries if entry is not None]
+            if len(found) == len(urls):
+                hits.append(
+                    MemoHit(
+                        claim_key=claim.key,
+                        claim=claim.text,
+                        section=claim.section,
+                        entries=found,
+                    )
+                )
+        return hits
+
+    def record_fact_check(
+        self,
+        analysis_text: str,
+        fact_check: dict[str, Any],
+        pre_verified: list[PreVerification] | None = None,
+        origin: str = "",
+        now: datetime | None = None,
+        fetched_urls: set[str] | None = None,
+        reused: set[str] | None = None,
+    ) -> int:
+        """
+        Store the evidence-backed verdicts of a validated fact-check.
+
+        Issues carried forward from an earlier iteration and claims whose
+        verdicts were reused from the memo were not re-checked, so their
+        entries are left as they are.
+
+        Args:
+            analysis_text: Markdown of the analysis that was fact-checked
+            fact_check: Validated fact-check JSON
+            pre_verified: Prefetch verdicts for the same analysis, if any
+            origin: Name of the fact-check file, kept for provenance
+            now: Time of the check (defaults to now)
+            fetched_urls: URLs the fact-checker fetched during the check
+            reused: Keys of claims whose memoized verdicts the check was given
+
+        Returns:
+            Number of claim/source verdicts stored
+        """
+        checked = now or datetime.now()
+        claims = extract_claims(analysis_text)
+        references = parse_reference_entries(analysis_text)
+        fetched = {canonicalize_url(url) for url in fetched_urls or set()}
+        skipped = set(reused or set())
+
+        flagged: dict[str, dict[str, Any]] = {}
+        for issue in json_objects(fact_check.get("issues")):
+            claim = match_claim(str(issue.get("claim", "")), claims)
+            if claim is None:
+                continue
+            if "carried_forward_from" in issue:
+                skipped.add(claim.key)
+            else:
+                _ = flagged.setdefault(claim.key, issue)
+        supported = {
+            (r.claim_key, r.url): r.excerpt
+            for r in pre_verified or []
+            if r.status == SUPPORTED
+        }
+
+        stored = 0
+        for claim in claims:
+            if claim.key in skipped:
+                continue
+            for url in claim_urls(claim, references):
+                key = memo_key(claim.text, url)
+                issue = flagged.get(claim.key)
+                details = json_object(issue.get("details")) if issue else {}
+                if issue is not None:
+                    verdict = str(details.get("issue_type", "unsupported_claim"))
+                    evidence = str(details.get("evidence", ""))
+                elif (claim.key, url) in supported:
+                    verdict = SUPPORTED
+                    evidence = supported[(claim.key, url)]
+                elif url in fetched and not self._fresh(key, checked):
+                    # The fetch may have served another claim: never renew a verdict
+                    verdict, evidence = NO_ISSUE, ""
+                else:
+                    continue  # Nobody looked at the page for this claim
+                self.entries[key] = MemoEntry(
+                    claim=normalize_claim(claim.text),
+                    url=url,
+                    verdict=verdict,
+                    evidence=evidence,
+                    checked_at=checked.isoformat(timespec="seconds"),
+                    expires_at=(checked + self.ttl).isoformat(timespec="seconds"),
+                    severity=str(issue.get("severity", "")) if issue else "",
+                    origin=origin,
+                )
+                stored += 1
+        return stored
+
+    def _fresh(self, key: str, now: datetime) -> bool:
+        """Whether an unexpired entry exists for a key (not counted as a lookup)."""
+        entry = self.entries.get(key)
+        return entry is not None and datetime.fromisoformat(entry.expires_at) > now
+
+    def ingest(
+        self,
+        analysis_path: Path,
+        fact_check_path: Path,
+        pre_verified: list[PreVerification] | None = None,
+        fetched_urls: set[str] | None = None,
+        reused: set[str] | None = None,
+    ) -> int:
+        """
+        Store the verdicts of a fact-check file if it passes validation.
+
+        Args:
+            analysis_path: Analysis iteration that was fact-checked
+            fact_check_path: Its fact_check_iteration_N.json
+            pre_verified: Prefetch verdicts for the same analysis, if any
+            fetched_urls: URLs the fact-checker fetched during the check
+            reused: Keys of claims whose memoized verdicts the check was given
+
+        Returns:
+            Number of claim/source verdicts stored (0 if the file is invalid)
+        """
+        try:
+            fact_check: Any = json.loads(fact_check_path.read_text())
+            analysis_text = analysis_path.read_text()
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Not memoizing {fact_check_path}: {e}")
+            return 0
+        is_valid, error = JsonResponseValidator(schema_type="fact_checker").validate(
+            fact_check
+        )
+        if not is_valid:
+            logger.warning(f"Not memoizing invalid fact-check {fact_check_path}: {error}")
+            return 0
+        return self.record_fact_check(
+            analysis_text,
+            fact_check,
+            pre_verified,
+            origin=fact_check_path.name,
+            fetched_urls=fetched_urls,
+            reused=reused,
+        )
+
+    def reset_counters(self) -> None:
+        """Start counting lookups afresh (e.g. for the next iteration)."""
+        self.hits = self.stale = self.misses = 0
+
+    def save(self) -> None:
+        """Write the memo to disk, merging verdicts saved meanwhile by other runs.
+
+        The most recent verdict per key wins; expired entries are dropped.
+        """
+        for key, entry in ClaimMemo(self.path).entries.items():
+            current = self.entries.get(key)
+            if current is None or entry.checked_at > current.checked_at:
+                self.entries[key] = entry
+        now = datetime.now()
+        self.entries = {
+            key: entry
+            for key, entry in self.entries.items()
+            if datetime.fromisoformat(entry.expires_at) > now
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {key: asdict(entry) for key, entry in self.entries.items()}
+        _ = self.path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def save_memo_hits(hits: list[MemoHit], path: Path) -> None:
+    """Write memo hits for the fact-checker to load."""
+    _ = path.write_text(json.dumps([asdict(hit) for hit in hits], indent=2))
+
+
+def load_memo_hits(path: Path) -> list[MemoHit]:
+    """
+    Load memo hits written by save_memo_hits.
+
+    Args:
+        path: JSON file of memo hits
+
+    Returns:
+        Memo hits, empty if the file is missing or unreadable
+    """
+    if not path.exists():
+        return []
+    try:
+        data: list[dict[str, Any]] = json.loads(path.read_text())
+        hits: list[MemoHit] = []
+        for hit in data:
+            entries = [MemoEntry(**e) for e in hit.pop("entries")]
+            hits.append(MemoHit(**hit, entries=entries))
+        return hits
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable memo hits {path}: {e}")
+        return []
+
+
+def render_memo_hits(hits: list[MemoHit]) -> str:
+    """
+    Render memoized verdicts as a prompt section for the fact-checker.
+
+    Args:
+        hits: Memo hits to include
+
+    Returns:
+        Markdown section, or an empty string if there are no hits
+    """
+    if not hits:
+        return ""
+
+    lines = [
+        "## Previously Checked Claims",
+        "",
+        "These claims, cited to the same sources, were checked by an earlier "
+        + "fact-check. Do not fetch their sources again.",
+    ]
+    passed = [hit for hit in hits if hit.passed]
+    if passed:
+        lines.extend(["", "**Passed: count them as verified.**", ""])
+        for hit in passed:
+            lines.append(f"- {hit.section}: {hit.claim}")
+            for entry in hit.entries:
+                if entry.evidence:
+                    lines.append(f'  - Evidence from <{entry.url}>: "{entry.evidence}"')
+    flagged = [hit for hit in hits if not hit.passed]
+    if flagged:
+        lines.extend(["", "**Flagged: report these issues again without re-fetching.**", ""])
+        for hit in flagged:
+            lines.append(f"- {hit.section}: {hit.claim}")
+            for entry in hit.entries:
+                if entry.passed:
+                    continue
+                detail = f"  - {entry.verdict}"
+                if entry.severity:
+                    detail += f" ({entry.severity})"
+                detail += f" for <{entry.url}>"
+                if entry.evidence:
+                    detail += f': "{entry.evidence}"'
+                lines.append(detail)
+    return "\n".join(lines) + "\n"
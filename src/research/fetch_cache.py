@@ -0,0 +1,51 @@
+"""Disk cache for fetched pages, shared across iterations and runs."""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+
+from .fetcher import FetchResult
+
+logger = logging.getLogger(__name__)
+
+
+class FetchCache:
+    """Store FetchResults as one JSON file per URL."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached pages (created if missing)
+        """
+        self.cache_dir: Path = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, url: str) -> Path:
+        """Cache file path for a URL."""
+        digest = hashlib.sha256(url.encode()).hexdigest()[:24]
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, url: str) -> FetchResult | None:
+        """Return the cached result for a URL, if any."""
+        path = self.path_for(url)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text())  # pyright: ignore[reportAny]
+            return FetchResult(**data)  # pyright: ignore[reportAny]
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.debug(f"Ignoring corrupt cache entry {path}: {e}")
+            return None
+
+    def put(self, result: FetchResult) -> None:
+        """Store a successful fetch result (failures are retried on the next run)."""
+        if not result.ok:
+            return
+        try:
+            _ = self.path_for(result.url).write_text(json.dumps(asdict(result)))
+        except OSError as e:
+            logger.warning(f"Failed to cache {result.url}: {e}")
@@ -0,0 +1,95 @@
+"""Fetch web pages outside agent sessions.
+
+Agents verify citations with the WebFetch tool, one model turn per URL. The
+pipeline can fetch the same pages itself in the background, so fetchers are
+plain async callables that return page text. UrlFetcher uses the standard
+library; anything with the same fetch signature can replace it (tests use
+stubs).
+"""
+
+import asyncio
+import html
+import re
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Protocol
+
+# Browsers get fewer bot blocks than the default urllib agent
+_USER_AGENT = "Mozilla/5.0 (compatible; idea-assess citation checker)"
+
+_SCRIPT_STYLE = re.compile(r"<(script|style|noscript)[^>]*>.*?</\1>", re.DOTALL | re.I)
+_TAG = re.compile(r"<[^>]+>")
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one URL."""
+
+    url: str
+    status: int = 0  # HTTP status, 0 if the request never completed
+    text: str = ""  # Page text with markup removed
+    error: str = ""
+    fetched_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def ok(self) -> bool:
+        """Whether the page was retrieved with usable content."""
+        return 200 <= self.status < 300 and bool(self.text)
+
+
+class Fetcher(Protocol):
+    """Anything that can fetch a URL asynchronously."""
+
+    async def fetch(self, url: str) -> FetchResult:
+        """Fetch a URL and return its text content."""
+        ...
+
+
+def html_to_text(raw: str) -> str:
+    """Strip scripts, styles and tags from HTML and collapse whitespace."""
+    text = _SCRIPT_STYLE.sub(" ", raw)
+    text = _TAG.sub(" ", text)
+    return " ".join(html.unescape(text).split())
+
+
+class UrlFetcher:
+    """Fetch pages with urllib in a worker thread."""
+
+    def __init__(self, timeout: float = 15.0, max_bytes: int = 2_000_000) -> None:
+        """
+        Initialize the fetcher.
+
+        Args:
+            timeout: Per-request timeout in seconds
+            max_bytes: Maximum response size read per page
+        """
+        self.timeout: float = timeout
+        self.max_bytes: int = max_bytes
+
+    async def fetch(self, url: str) -> FetchResult:
+        """Fetch a URL without blocking the event loop."""
+        return await asyncio.to_thread(self._fetch_sync, url)
+
+    def _fetch_sync(self, url: str) -> FetchResult:
+        """Blocking fetch used from a worker thread."""
+        request = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:  # pyright: ignore[reportAny]
+                raw: bytes = response.read(self.max_bytes)  # pyright: ignore[reportAny]
+                charset: str = response.headers.get_content_charset() or "utf-8"  # pyright: ignore[reportAny]
+                content_type: str = response.headers.get("Content-Type", "")  # pyright: ignore[reportAny]
+                status: int = response.status  # pyright: ignore[reportAny]
+        except urllib.error.HTTPError as e:
+            return FetchResult(url=url, status=e.code, error=str(e))
+        except (urllib.error.URLError, TimeoutError, ValueError, OSError) as e:
+            return FetchResult(url=url, error=str(e))
+
+        if "pdf" in content_type.lower():
+            return FetchResult(url=url, status=status, error="PDF content not parsed")
+
+        text = raw.decode(charset, errors="replace")
+        if "html" in content_type.lower() or "<html" in text[:1000].lower():
+            text = html_to_text(text)
+        return FetchResult(url=url, status=status, text=text)
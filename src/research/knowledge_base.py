@@ -0,0 +1,518 @@
+"""Local research knowledge base built from past web searches.
+
+Every WebSearch an agent runs is logged by RunAnalytics with its query,
+summary and result links; pre-research keeps its results in SearchCache,
+and cited pages end up in FetchCache. KnowledgeBase indexes all of them in a
+SQLite FTS5 table, so research done for one idea can be found again for
+related ideas without a live search.
+
+Agents reach it through a small MCP server (stdio JSON-RPC, no dependencies)
+exposing one tool, search, which returns the best-matching earlier searches
+and results. Lookups are local and take milliseconds, against seconds and a
+WebSearch budget unit for a live search.
+
+Usage:
+    python -m src.research.knowledge_base learn logs/runs
+    python -m src.research.knowledge_base search "vertical farming market size"
+    python -m src.research.knowledge_base stats
+"""
+# pyright: reportAny=false, reportExplicitAny=false
+
+import argparse
+import json
+import logging
+import re
+import sqlite3
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, TextIO
+
+from claude_code_sdk import McpServerConfig
+
+from ..utils.json_validator import json_object, json_objects, load_json_object
+from .fetch_cache import FetchCache
+from .pre_research import SearchResult, normalize_query
+from .prefetch import page_excerpt
+from .urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# MCP server name and the tool name agents see
+KB_SERVER = "knowledge_base"
+KB_TOOL = f"mcp__{KB_SERVER}__search"
+
+# Entry kinds
+SEARCH = "search"  # A search query with its summary text
+RESULT = "result"  # A result URL with its title and page snippet
+
+_URL = re.compile(r"https?://[^\s>)\]]+")
+_TERM = re.compile(r"\w+")
+_MAX_TERMS = 12
+_SNIPPET_CHARS = 600
+_PROTOCOL_VERSION = "2024-11-05"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL UNIQUE,
+    query TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    snippet TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    captured_at TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    query, title, snippet, content='entries', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, query, title, snippet)
+    VALUES (new.id, new.query, new.title, new.snippet);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, query, title, snippet)
+    VALUES ('delete', old.id, old.query, old.title, old.snippet);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, query, title, snippet)
+    VALUES ('delete', old.id, old.query, old.title, old.snippet);
+    INSERT INTO entries_fts(rowid, query, title, snippet)
+    VALUES (new.id, new.query, new.title, new.snippet);
+END;
+CREATE TABLE IF NOT EXISTS learned (source TEXT PRIMARY KEY);
+"""
+
+# Newer captures replace older ones, but never with an empty snippet or title
+_UPSERT = """
+INSERT INTO entries (kind, key, query, title, url, snippet, source, captured_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET
+    query = excluded.query,
+    title = CASE WHEN excluded.title != '' THEN excluded.title ELSE title END,
+    snippet = CASE WHEN excluded.snippet != '' THEN excluded.snippet ELSE snippet END,
+    source = excluded.source,
+    captured_at = excluded.captured_at
+WHERE excluded.captured_at >= captured_at
+"""
+
+_TOOL_SPEC: dict[str, Any] = {
+    "name": "search",
+    "description": (
+        "Full-text search over web searches and results from earlier analyses. "
+        + "Instant and free: call it before WebSearch with the query you would search."
+    ),
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "What to look up"},
+            "limit": {
+                "type": "integer",
+                "description": "Maximum entries to return (default 8)",
+                "minimum": 1,
+                "maximum": 20,
+            },
+        },
+        "required": ["query"],
+    },
+}
+
+
+@dataclass
+class KnowledgeHit:
+    """One stored search or result matching a lookup."""
+
+    kind: str
+    query: str
+    title: str
+    url: str
+    snippet: str
+    captured_at: str
+
+
+class KnowledgeBase:
+    """Searches and results from past runs, indexed for full-text search."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open (and create if needed) the knowledge base.
+
+        Args:
+            path: SQLite database file (e.g., .cache/knowledge_base.sqlite3)
+        """
+        self.path: Path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Concurrent runs share the file; wait for each other's writes
+        self.db: sqlite3.Connection = sqlite3.connect(path, timeout=30)
+        _ = self.db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        self.db.commit()
+        self.db.close()
+
+    def add_search(
+        self, query: str, summary: str, source: str = "", captured_at: str | None = None
+    ) -> None:
+        """
+        Store a search query with its summary text.
+
+        Args:
+            query: Search query
+            summary: Summary of what the search found
+            source: Where it was captured (run id or "pre_research")
+            captured_at: ISO timestamp (defaults to now)
+        """
+        when = captured_at or datetime.now().isoformat(timespec="seconds")
+        _ = self.db.execute(
+            _UPSERT,
+            (SEARCH, f"search:{normalize_query(query)}", query, "", "", summary, source, when),
+        )
+
+    def add_result(
+        self,
+        url: str,
+        title: str = "",
+        query: str = "",
+        snippet: str = "",
+        source: str = "",
+        captured_at: str | None = None,
+    ) -> None:
+        """
+        Store a search result, keyed by its canonical URL.
+
+        Args:
+            url: Result URL
+            title: Result title
+            query: Query that found it
+            snippet: Page text relevant to the query
+            source: Where it was captured (run id or "pre_research")
+            captured_at: ISO timestamp (defaults to now)
+        """
+        canonical = canonicalize_url(url)
+        when = captured_at or datetime.now().isoformat(timespec="seconds")
+        _ = self.db.execute(
+            _UPSERT, (RESULT, canonical, query, title, canonical, snippet, source, when)
+        )
+
+    def _learned(self, source: str) -> bool:
+        """Mark a source as learned, returning whether it already was."""
+        cursor = self.db.execute(
+            "INSERT OR IGNORE INTO learned (source) VALUES (?)", (source,)
+        )
+        return cursor.rowcount == 0
+
+    def learn_from_run(self, run_dir: Path, fetch_cache: FetchCache | None = None) -> int:
+        """
+        Index the WebSearch results logged in a run's messages.jsonl, once.
+
+        Args:
+            run_dir: Run folder holding messages.jsonl
+            fetch_cache: Fetched pages, used for result snippets when cached
+
+        Returns:
+            Number of searches indexed
+        """
+        messages_file = run_dir / "messages.jsonl"
+        if not messages_file.exists() or self._learned(f"run:{run_dir.name}"):
+            return 0
+
+        searches = 0
+        with open(messages_file) as f:
+            for line in f:
+                try:
+                    entry = load_json_object(line)
+                except json.JSONDecodeError:
+                    continue
+                when = str(entry.get("timestamp", ""))[:19] or None
+                artifacts = json_object(entry.get("artifacts"))
+                for block in json_objects(artifacts.get("blocks")):
+                    results = json_objects(block.get("search_results"))
+                    if not results:
+                        continue
+                    query = str(block.get("search_query", ""))
+                    if query:
+                        self.add_search(
+                            query, str(block.get("search_summary", "")), run_dir.name, when
+                        )
+                    for result in results:
+                        url = str(result.get("url", ""))
+                        if not url.startswith("http"):
+                            continue
+                        title = str(result.get("title", ""))
+                        page = fetch_cache.get(canonicalize_url(url)) if fetch_cache else None
+                        snippet = (
+                            page_excerpt(page.text, f"{title} {query}", _SNIPPET_CHARS)
+                            if page is not None
+                            else ""
+                        )
+                        self.add_result(url, title, query, snippet, run_dir.name, when)
+                    searches += 1
+        self.db.commit()
+        return searches
+
+    def learn_from_runs(self, runs_dir: Path, fetch_cache: FetchCache | None = None) -> int:
+        """
+        Index every run not learned from yet.
+
+        Args:
+            runs_dir: Directory holding one folder per run (e.g., logs/runs)
+            fetch_cache: Fetched pages, used for result snippets when cached
+
+        Returns:
+            Number of searches indexed
+        """
+        return sum(
+            self.learn_from_run(messages_file.parent, fetch_cache)
+            for messages_file in sorted(runs_dir.glob("*/messages.jsonl"))
+        )
+
+    def learn_from_search_cache(self, cache_dir: Path) -> int:
+        """
+        Index pre-research results, once per cached query.
+
+        Args:
+            cache_dir: SearchCache directory (e.g., .cache/search)
+
+        Returns:
+            Number of searches indexed
+        """
+        searches = 0
+        for path in sorted(cache_dir.glob("*.json")):
+            if self._learned(f"search_cache:{path.name}"):
+                continue
+            try:
+                result = SearchResult(**json.loads(path.read_text()))
+            except (json.JSONDecodeError, TypeError, OSError):
+                continue
+            when = datetime.fromtimestamp(path.stat().st_mtime).isoformat(timespec="seconds")
+            self.add_search(result.query, result.text, "pre_research", when)
+            for finding in result.text.splitlines():
+                match = _URL.search(finding)
+                if match:
+                    snippet = " ".join(_URL.sub("", finding).strip(" -*<>").split())
+                    self.add_result(
+                        match.group(0).rstrip(".,"),
+                        query=result.query,
+                        snippet=snippet,
+                        source="pre_research",
+                        captured_at=when,
+                    )
+            searches += 1
+        self.db.commit()
+        return searches
+
+    def search(
+        self, text: str, limit: int = 8, max_age_days: float | None = None
+    ) -> list[KnowledgeHit]:
+        """
+        Find the stored searches and results that best match a lookup.
+
+        Args:
+            text: Lookup text, e.g. the query about to be searched
+            limit: Maximum hits
+            max_age_days: Ignore entries captured longer ago than this
+
+        Returns:
+            Hits, best match first
+        """
+        terms = list(dict.fromkeys(t for t in _TERM.findall(text.lower()) if len(t) > 1))
+        if not terms:
+            return []
+        match = " OR ".join(f'"{term}"' for term in terms[:_MAX_TERMS])
+        cutoff = (
+            (datetime.now() - timedelta(days=max_age_days)).isoformat(timespec="seconds")
+            if max_age_days is not None
+            else ""
+        )
+        rows = self.db.execute(
+            """
+            SELECT e.kind, e.query, e.title, e.url, e.snippet, e.captured_at
+            FROM entries_fts JOIN entries e ON e.id = entries_fts.rowid
+            WHERE entries_fts MATCH ? AND e.captured_at >= ?
+            ORDER BY bm25(entries_fts, 2.0, 3.0, 1.0)
+            LIMIT ?
+            """,
+            (match, cutoff, limit),
+        ).fetchall()
+        return [KnowledgeHit(*row) for row in rows]
+
+    def stats(self) -> dict[str, int]:
+        """Entry counts by kind, plus the number of learned sources."""
+        counts = dict(
+            self.db.execute("SELECT kind, COUNT(*) FROM entries GROUP BY kind").fetchall()
+        )
+        learned = self.db.execute("SELECT COUNT(*) FROM learned").fetchone()[0]
+        return {
+            "searches": int(counts.get(SEARCH, 0)),
+            "results": int(counts.get(RESULT, 0)),
+            "learned_sources": int(learned),
+        }
+
+
+def render_hits(hits: list[KnowledgeHit]) -> str:
+    """
+    Render lookup hits as the tool's text output.
+
+    Args:
+        hits: Hits from KnowledgeBase.search
+
+    Returns:
+        Markdown list of earlier searches and results
+    """
+    if not hits:
+        return "No stored research matches. Use WebSearch for this."
+
+    lines: list[str] = []
+    for hit in hits:
+        date = hit.captured_at[:10]
+        if hit.kind == SEARCH:
+            lines.append(f'### Earlier search: "{hit.query}" ({date})')
+            lines.append(hit.snippet[:1500] or "(no summary stored)")
+        else:
+            lines.append(f"### {hit.title or hit.url} ({date})")
+            lines.append(f"<{hit.url}>, found by: {hit.query}")
+            if hit.snippet:
+                lines.append(f'Excerpt: "{hit.snippet[:_SNIPPET_CHARS]}"')
+        lines.append("")
+    lines.append(
+        "WebFetch a source before citing a figure from it; "
+        + "use WebSearch for anything these don't cover or that looks out of date."
+    )
+    return "\n".join(lines) + "\n"
+
+
+def server_config(db_path: Path, max_age_days: float | None = None) -> McpServerConfig:
+    """
+    MCP server configuration that exposes a knowledge base to an agent session.
+
+    Args:
+        db_path: SQLite database file
+        max_age_days: Ignore entries captured longer ago than this
+
+    Returns:
+        Stdio server configuration for ClaudeCodeOptions.mcp_servers
+    """
+    args = ["-m", __name__, "--db", str(db_path), "serve"]
+    if max_age_days is not None:
+        args += ["--max-age-days", str(max_age_days)]
+    project_root = Path(__file__).resolve().parents[2]
+    return {
+        "type": "stdio",
+        "command": sys.executable,
+        "args": args,
+        "env": {"PYTHONPATH": str(project_root)},
+    }
+
+
+def handle_request(
+    kb: KnowledgeBase, request: dict[str, Any], max_age_days: float | None = None
+) -> dict[str, Any] | None:
+    """
+    Answer one MCP JSON-RPC request.
+
+    Args:
+        kb: Knowledge base to search
+        request: Parsed JSON-RPC message
+        max_age_days: Ignore entries captured longer ago than this
+
+    Returns:
+        JSON-RPC response, or None for notifications
+    """
+    request_id = request.get("id")
+    if request_id is None:
+        return None
+    method = request.get("method")
+    params: dict[str, Any] = request.get("params") or {}
+
+    if method == "initialize":
+        result: dict[str, Any] = {
+            "protocolVersion": params.get("protocolVersion", _PROTOCOL_VERSION),
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": KB_SERVER, "version": "1.0"},
+        }
+    elif method == "ping":
+        result = {}
+    elif method == "tools/list":
+        result = {"tools": [_TOOL_SPEC]}
+    elif method == "tools/call" and params.get("name") == _TOOL_SPEC["name"]:
+        arguments: dict[str, Any] = params.get("arguments") or {}
+        try:
+            limit = min(max(int(arguments.get("limit", 8)), 1), 20)
+        except (TypeError, ValueError):
+            limit = 8
+        hits = kb.search(str(arguments.get("query", "")), limit, max_age_days)
+        result = {"content": [{"type": "text", "text": render_hits(hits)}], "isError": False}
+    else:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": -32601, "message": f"Unsupported request: {method}"},
+        }
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def serve(
+    kb: KnowledgeBase,
+    max_age_days: float | None = None,
+    stdin: TextIO = sys.stdin,
+    stdout: TextIO = sys.stdout,
+) -> None:
+    """Run the MCP server over newline-delimited JSON-RPC until stdin closes."""
+    for line in stdin:
+        try:
+            request = load_json_object(line)
+        except json.JSONDecodeError:
+            continue
+        if not request:
+            continue
+        response = handle_request(kb, request, max_age_days)
+        if response is not None:
+            _ = stdout.write(json.dumps(response) + "\n")
+            stdout.flush()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Learn from runs, search, show stats or serve the knowledge base."""
+    parser = argparse.ArgumentParser(
+        description="Local research knowledge base built from past web searches"
+    )
+    _ = parser.add_argument(
+        "--db",
+        default=".cache/knowledge_base.sqlite3",
+        help="Database file (default: .cache/knowledge_base.sqlite3)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    learn = commands.add_parser("learn", help="Index runs and pre-research not seen yet")
+    _ = learn.add_argument("runs_dir", nargs="?", default="logs/runs")
+    _ = learn.add_argument("--cache-dir", default=".cache", help="Fetch and search caches")
+    search = commands.add_parser("search", help="Look up stored research")
+    _ = search.add_argument("query")
+    _ = search.add_argument("--limit", type=int, default=8)
+    _ = commands.add_parser("stats", help="Show entry counts")
+    server = commands.add_parser("serve", help="Run the MCP server on stdio")
+    _ = server.add_argument("--max-age-days", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    kb = KnowledgeBase(Path(args.db))
+    try:
+        if args.command == "learn":
+            cache_dir = Path(args.cache_dir)
+            runs = kb.learn_from_runs(Path(args.runs_dir), FetchCache(cache_dir / "fetch"))
+            cached = kb.learn_from_search_cache(cache_dir / "search")
+            print(f"Indexed {runs} searches from runs and {cached} from pre-research")
+        elif args.command == "search":
+            print(render_hits(kb.search(args.query, args.limit)), end="")
+        elif args.command == "stats":
+            for name, count in kb.stats().items():
+                print(f"{name}: {count}")
+        else:
+            serve(kb, args.max_age_days)
+    finally:
+        kb.close()
+
+
+if __name__ == "__main__":
+    main()
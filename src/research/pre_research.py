@@ -0,0 +1,303 @@
+"""Run the analyst's web research up front, concurrently.
+
+In a normal session the analyst issues WebSearch calls one at a time, each
+costing a model turn and a tool round trip. Pre-research replaces most of
+them: one quick planning call lists the queries the analysis needs, then
+SearchExecutor runs them concurrently (rate limited, through a disk cache)
+in minimal single-query sessions. The consolidated results are given to the
+analyst with its prompt, so it only searches for what they don't cover.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+from claude_code_sdk import (
+    AssistantMessage,
+    ClaudeCodeOptions,
+    ResultMessage,
+    TextBlock,
+    query,
+)
+
+if TYPE_CHECKING:
+    from ..core.run_analytics import RunAnalytics
+
+logger = logging.getLogger(__name__)
+
+# Analytics agent name for the planning and search sessions
+PRE_RESEARCH = "pre_research"
+
+_LIST_ITEM = re.compile(r"^\s*(?:[-*]|\d+[.)])\s+(.+?)\s*$")
+
+
+@dataclass
+class SearchResult:
+    """Findings for one search query."""
+
+    query: str
+    text: str = ""
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the search produced usable findings."""
+        return bool(self.text) and not self.error
+
+
+class Searcher(Protocol):
+    """Anything that can run a search query asynchronously."""
+
+    async def search(self, query: str) -> SearchResult:
+        """Run a query and return its findings."""
+        ...
+
+
+def normalize_query(text: str) -> str:
+    """Case- and whitespace-insensitive form of a query, used as cache key."""
+    return " ".join(text.lower().split())
+
+
+class SearchCache:
+    """Store SearchResults as one JSON file per normalized query."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached results (created if missing)
+        """
+        self.cache_dir: Path = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, query: str) -> Path:
+        """Cache file path for a query."""
+        digest = hashlib.sha256(normalize_query(query).encode()).hexdigest()[:24]
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, query: str) -> SearchResult | None:
+        """Return the cached result for a query, if any."""
+        path = self.path_for(query)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text())  # pyright: ignore[reportAny]
+            return SearchResult(**data)  # pyright: ignore[reportAny]
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.debug(f"Ignoring corrupt cache entry {path}: {e}")
+            return None
+
+    def put(self, result: SearchResult) -> None:
+        """Store a successful result (failures are retried on the next run)."""
+        if not result.ok:
+            return
+        try:
+            _ = self.path_for(result.query).write_text(json.dumps(asdict(result)))
+        except OSError as e:
+            logger.warning(f"Failed to cache search {result.query!r}: {e}")
+
+
+async def _session_text(
+    prompt: str,
+    options: ClaudeCodeOptions,
+    run_analytics: "RunAnalytics | None",
+) -> tuple[str, str]:
+    """Run a one-shot session and return (assistant text, error)."""
+    texts: list[str] = []
+    error = ""
+    async for message in query(prompt=prompt, options=options):
+        if run_analytics:
+            run_analytics.track_message(message, PRE_RESEARCH, 1)
+        if isinstance(message, AssistantMessage):
+            texts.extend(b.text for b in message.content if isinstance(b, TextBlock))
+        elif isinstance(message, ResultMessage) and message.is_error:
+            error = message.subtype
+    return "\n\n".join(texts).strip(), error
+
+
+class ClaudeSearcher:
+    """Run each query in a minimal session whose only tool is WebSearch."""
+
+    def __init__(
+        self,
+        prompt_template: str,
+        system_prompt: str,
+        model: str | None = None,
+        max_turns: int = 3,
+        run_analytics: "RunAnalytics | None" = None,
+    ) -> None:
+        """
+        Initialize the searcher.
+
+        Args:
+            prompt_template: User prompt with a {query} placeholder
+            system_prompt: System prompt for the search sessions
+            model: Model for the search sessions (None uses the default)
+            max_turns: Turn limit per search session
+            run_analytics: Analytics to track the sessions with
+        """
+        self.prompt_template: str = prompt_template
+        self.system_prompt: str = system_prompt
+        self.model: str | None = model
+        self.max_turns: int = max_turns
+        self.run_analytics: "RunAnalytics | None" = run_analytics
+
+    async def search(self, query: str) -> SearchResult:
+        """Run one query and return the session's summary of the results."""
+        options = ClaudeCodeOptions(
+            system_prompt=self.system_prompt,
+            allowed_tools=["WebSearch"],
+            max_turns=self.max_turns,
+            model=self.model,
+        )
+        text, error = await _session_text(
+            self.prompt_template.format(query=query), options, self.run_analytics
+        )
+        return SearchResult(query=query, text=text, error=error)
+
+
+def parse_queries(text: str, max_queries: int) -> list[str]:
+    """
+    Extract search queries from a planning response.
+
+    Args:
+        text: Planning response with one query per list item
+        max_queries: Maximum queries to keep
+
+    Returns:
+        Distinct queries, in the order given
+    """
+    queries: list[str] = []
+    seen: set[str] = set()
+    for line in text.splitlines():
+        match = _LIST_ITEM.match(line)
+        if not match:
+            continue
+        candidate = match.group(1).strip().strip("\"'`")
+        if candidate and normalize_query(candidate) not in seen:
+            seen.add(normalize_query(candidate))
+            queries.append(candidate)
+    return queries[:max_queries]
+
+
+async def plan_queries(
+    prompt: str,
+    system_prompt: str,
+    max_queries: int,
+    model: str | None = None,
+    run_analytics: "RunAnalytics | None" = None,
+) -> list[str]:
+    """
+    Ask for the search queries an analysis needs, in one tool-less turn.
+
+    Args:
+        prompt: Formatted planning prompt
+        system_prompt: System prompt for the planning session
+        max_queries: Maximum queries to keep
+        model: Model for the planning call (None uses the default)
+        run_analytics: Analytics to track the session with
+
+    Returns:
+        Planned queries (empty if the call failed)
+    """
+    options = ClaudeCodeOptions(
+        system_prompt=system_prompt, allowed_tools=[], max_turns=1, model=model
+    )
+    text, error = await _session_text(prompt, options, run_analytics)
+    if error:
+        logger.warning(f"Research planning call failed: {error}")
+    return parse_queries(text, max_queries)
+
+
+class SearchExecutor:
+    """Run queries concurrently with a start-rate limit and a shared cache."""
+
+    def __init__(
+        self,
+        searcher: Searcher,
+        cache: SearchCache,
+        concurrency: int = 4,
+        min_interval: float = 0.5,
+    ) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            searcher: Searcher used on cache misses
+            cache: Shared result cache
+            concurrency: Maximum searches in flight
+            min_interval: Minimum seconds between search starts
+        """
+        self.searcher: Searcher = searcher
+        self.cache: SearchCache = cache
+        self.min_interval: float = min_interval
+        self.search_count: int = 0
+        self.cache_hits: int = 0
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+        self._rate_lock: asyncio.Lock = asyncio.Lock()
+        self._last_start: float = 0.0
+
+    async def run(self, queries: list[str]) -> list[SearchResult]:
+        """
+        Run all queries.
+
+        Args:
+            queries: Queries to run
+
+        Returns:
+            One result per query, in order
+        """
+        return list(await asyncio.gather(*(self._run_one(q) for q in queries)))
+
+    async def _throttle(self) -> None:
+        """Wait until min_interval has passed since the previous start."""
+        async with self._rate_lock:
+            wait = self._last_start + self.min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_start = time.monotonic()
+
+    async def _run_one(self, query: str) -> SearchResult:
+        """Run one query through the cache."""
+        cached = self.cache.get(query)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        async with self._semaphore:
+            await self._throttle()
+            try:
+                result = await self.searcher.search(query)
+            except Exception as e:
+                result = SearchResult(query=query, error=str(e))
+        self.search_count += 1
+        self.cache.put(result)
+        return result
+
+
+def render_research(results: list[SearchResult]) -> str:
+    """
+    Render search results as a markdown brief for the analyst.
+
+    Args:
+        results: Results from SearchExecutor.run
+
+    Returns:
+        One section per successful query, with failed queries listed last
+    """
+    lines = ["# Pre-Research Results", ""]
+    for result in results:
+        if result.ok:
+            lines += [f"## {result.query}", "", result.text, ""]
+    failed = [result.query for result in results if not result.ok]
+    if failed:
+        lines += ["## Queries Without Results", ""]
+        lines += [f"- {query}" for query in failed]
+        lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,539 @@
+"""Pre-verify citations before the fact-checker fetches them itself.
+
+AnalysisWatcher polls the analysis file(s) during the analyst session. Once a
+section no longer contains TODO markers, its claims are queued with the URLs
+of the references they cite. Right before fact-checking, the whole analysis
+is queued as well, so every cited URL is fetched even without the watcher.
+CitationPrefetcher workers fetch each canonical URL once, concurrently
+(through the shared FetchCache), and check that the figures stated in the
+claim appear on the cited page. A claim only counts as supported when its
+distinctive figures (multi-digit or with a unit, not bare years) appear next
+to the claim's key terms; numbers that merely occur somewhere on the page are
+reported as a hint. The fact-checker then starts with these verdicts, plus
+page excerpts where they are inconclusive, and only spends WebFetch calls
+where neither settles the claim.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..utils.analysis_sections import TITLE_KEY, parse_sections
+from ..utils.claims import (
+    CITATION_PATTERN,
+    REFERENCE_SECTIONS,
+    Claim,
+    extract_claims,
+    parse_reference_entries,
+)
+from .fetch_cache import FetchCache
+from .fetcher import FetchResult, Fetcher
+from .urls import canonicalize_url
+
+if TYPE_CHECKING:
+    from .source_registry import SourceRegistry
+
+logger = logging.getLogger(__name__)
+
+_URL = re.compile(r"https?://[^\s>)\]]+")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+# A number with an optional currency sign before it and unit after it
+_FIGURE = re.compile(
+    r"([$€£]\s?)?(\d+(?:[.,]\d+)*)\s?"
+    + r"(%|percent\b|million\b|billion\b|trillion\b|thousand\b|bn\b|[kmbtx]\b)?",
+    re.IGNORECASE,
+)
+_YEAR = re.compile(r"(19|20)\d\d")
+_KEY_WORD = re.compile(r"[a-z]{4,}")
+_STOPWORDS = set(
+    (
+        "about after also been from have into more most over than that their there "
+        + "these this were will with"
+    ).split()
+)
+_TODO_MARKER = "[TODO"
+_NEAR_CHARS = 300  # Max distance between a figure and a key term on the page
+_WORD = re.compile(r"[a-z]{5,}")
+
+# Pre-verification statuses
+SUPPORTED = "supported"  # Key figures appear on the page next to the claim's terms
+NUMBERS_FOUND = "numbers_found"  # Figures appear on the page, but not as evidence
+FIGURES_MISSING = "figures_missing"  # Page fetched, some figures not found
+UNREACHABLE = "unreachable"  # Page could not be fetched
+UNCHECKED = "unchecked"  # Page fetched, claim has no figures to compare
+
+
+@dataclass
+class PreVerification:
+    """Background verdict for one claim/citation pair."""
+
+    claim_key: str
+    claim: str
+    section: str
+    citation: str
+    url: str
+    status: str
+    missing: list[str] = field(default_factory=list)
+    # Page text around the claim's terms, for claims the fact-checker can
+    # judge from it (figures missing, or no figures); never for mere hints
+    excerpt: str = ""
+
+
+def extract_url(reference: str) -> str | None:
+    """Return the first URL in a reference entry, canonicalized."""
+    match = _URL.search(reference)
+    return canonicalize_url(match.group(0).rstrip(".,")) if match else None
+
+
+def page_excerpt(page_text: str, claim_text: str, width: int = 600) -> str:
+    """
+    Find the part of a page most relevant to a claim.
+
+    Args:
+        page_text: Fetched page text
+        claim_text: Claim the page is cited for
+        width: Excerpt length in characters
+
+    Returns:
+        The window containing the most distinct claim terms (figures and
+        long words), or an empty string if none occur on the page
+    """
+    claim = CITATION_PATTERN.sub("", claim_text)
+    terms: set[str] = set(_NUMBER.findall(claim)) | set(_WORD.findall(claim.lower()))
+    lowered = page_text.lower()
+    positions = sorted(
+        (match.start(), term)
+        for term in terms
+        for match in re.finditer(re.escape(term.lower()), lowered)
+    )
+    if not positions:
+        return ""
+
+    # Slide a window over term occurrences, keeping the most distinct terms
+    counts: Counter[str] = Counter()
+    left = 0
+    best_start, best_score = 0, 0
+    for position, term in positions:
+        counts[term] += 1
+        while positions[left][0] <= position - width:
+            counts[positions[left][1]] -= 1
+            if not counts[positions[left][1]]:
+                del counts[positions[left][1]]
+            left += 1
+        if len(counts) > best_score:
+            span = position - positions[left][0]
+            best_start = max(0, positions[left][0] - (width - span) // 2)
+            best_score = len(counts)
+    return " ".join(page_text[best_start : best_start + width].split())
+
+
+def _normalize_number(raw: str) -> str:
+    """Normalize a number as written ("1,200" -> "1200", "4.50" -> "4.5")."""
+    value = raw.replace(",", "")
+    if "." in value:
+        value = value.rstrip("0").rstrip(".")
+    return value
+
+
+def _numbers(text: str) -> set[str]:
+    """Normalized numbers in text."""
+    found: list[str] = _NUMBER.findall(text)
+    return {_normalize_number(raw) for raw in found}
+
+
+def _key_figures(text: str) -> set[str]:
+    """Numbers distinctive enough to serve as evidence.
+
+    Figures with a currency sign or unit count, as do multi-digit numbers
+    other than bare years; single digits and years match almost any page.
+    """
+    figures: set[str] = set()
+    for match in _FIGURE.finditer(text):
+        value = _normalize_number(match.group(2))
+        digits = sum(c.isdigit() for c in value)
+        has_unit = bool(match.group(1) or match.group(3))
+        if has_unit or (digits >= 2 and not _YEAR.fullmatch(value)):
+            figures.add(value)
+    return figures
+
+
+def _stems(text: str) -> set[str]:
+    """Crude stems of the content words in text ("reaches" -> "reach")."""
+    words: list[str] = _KEY_WORD.findall(text.lower())
+    return {word[:5] for word in words if word not in _STOPWORDS}
+
+
+def _near_key_terms(figure: str, page_text: str, terms: set[str]) -> bool:
+    """Whether the figure occurs on the page within reach of a key term."""
+    for match in _NUMBER.finditer(page_text):
+        if _normalize_number(match.group(0)) != figure:
+            continue
+        window = page_text[
+            max(0, match.start() - _NEAR_CHARS) : match.end() + _NEAR_CHARS
+        ]
+        if _stems(window) & terms:
+            return True
+    return False
+
+
+def pre_verify(claim: Claim, citation: str, url: str, page: FetchResult) -> PreVerification:
+    """
+    Compare a claim's figures against the text of its cited page.
+
+    Args:
+        claim: Claim to check
+        citation: Citation number the claim uses for this page
+        url: Cited URL
+        page: Fetched page
+
+    Returns:
+        PreVerification with the resulting status
+    """
+    result = PreVerification(
+        claim_key=claim.key,
+        claim=claim.text,
+        section=claim.section,
+        citation=f"[{citation}]",
+        url=url,
+        status=UNREACHABLE,
+    )
+    if not page.ok:
+        return result
+
+    figures = _numbers(CITATION_PATTERN.sub("", claim.text))
+    if not figures:
+        result.status = UNCHECKED
+        result.excerpt = page_excerpt(page.text, claim.text)
+        return result
+
+    page_numbers = _numbers(page.text)
+    result.missing = sorted(f for f in figures if f not in page_numbers)
+    if result.missing:
+        result.status = FIGURES_MISSING
+    else:
+        # Only distinctive figures found next to the claim's own terms are evidence
+        key_figures = _key_figures(CITATION_PATTERN.sub("", claim.text))
+        terms = _stems(_NUMBER.sub(" ", claim.text))
+        supported = bool(key_figures) and all(
+            _near_key_terms(f, page.text, terms) for f in key_figures
+        )
+        result.status = SUPPORTED if supported else NUMBERS_FOUND
+    if result.status == FIGURES_MISSING:
+        result.excerpt = page_excerpt(page.text, claim.text)
+    return result
+
+
+def completed_sections(text: str) -> list[str]:
+    """Names of body sections that are written (non-empty, no TODO markers)."""
+    return [
+        name
+        for name, body in parse_sections(text).items()
+        if name != TITLE_KEY
+        and not name.lower().startswith(REFERENCE_SECTIONS)
+        and body
+        and _TODO_MARKER not in body
+    ]
+
+
+class CitationPrefetcher:
+    """Background workers that fetch cited pages and pre-verify claims."""
+
+    def __init__(
+        self,
+        fetcher: Fetcher,
+        cache: FetchCache,
+        concurrency: int = 4,
+        fetch_timeout: float | None = None,
+        max_page_chars: int | None = None,
+        registry: "SourceRegistry | None" = None,
+    ) -> None:
+        """
+        Initialize the prefetcher.
+
+        Args:
+            fetcher: Fetcher used on cache misses
+            cache: Shared page cache
+            concurrency: Number of worker tasks
+            fetch_timeout: Overall deadline per fetch in seconds (None waits)
+            max_page_chars: Page text kept per URL (None keeps all)
+            registry: Source health; known-bad URLs get a cached failure unfetched
+        """
+        self.fetcher: Fetcher = fetcher
+        self.cache: FetchCache = cache
+        self.concurrency: int = concurrency
+        self.fetch_timeout: float | None = fetch_timeout
+        self.max_page_chars: int | None = max_page_chars
+        self.registry: "SourceRegistry | None" = registry
+        self.fetch_count: int = 0
+        self.cache_hits: int = 0
+        self.skipped_known_bad: int = 0
+        # Fetched pages with their latency, for the source registry
+        self.fetch_log: list[tuple[FetchResult, float]] = []
+        # Sum and maximum of fetch latencies: sequential vs concurrent cost
+        self.fetch_seconds: float = 0.0
+        self.slowest_fetch: float = 0.0
+
+        self._queue: asyncio.Queue[tuple[Claim, str, str]] = asyncio.Queue()
+        self._workers: list[asyncio.Task[None]] = []
+        self._submitted: set[tuple[str, str]] = set()
+        self._pages: dict[str, asyncio.Future[FetchResult]] = {}
+        self._results: dict[tuple[str, str], PreVerification] = {}
+
+    def start(self) -> None:
+        """Start the worker tasks (idempotent)."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+            ]
+
+    def submit(self, claims: list[Claim], references: dict[str, str]) -> int:
+        """
+        Queue claims whose citations resolve to URLs.
+
+        Args:
+            claims: Claims to pre-verify
+            references: Citation number -> reference entry as written
+
+        Returns:
+            Number of newly queued claim/citation pairs
+        """
+        queued = 0
+        for claim in claims:
+            for citation in claim.citations:
+                url = extract_url(references.get(citation, ""))
+                if not url or (claim.key, url) in self._submitted:
+                    continue
+                self._submitted.add((claim.key, url))
+                self._queue.put_nowait((claim, citation, url))
+                queued += 1
+        return queued
+
+    def submit_analysis(self, text: str, exclude: set[str] | None = None) -> int:
+        """
+        Queue every cited claim of an analysis.
+
+        Args:
+            text: Analysis markdown
+            exclude: Keys of claims that need no fetch (e.g. memoized verdicts)
+
+        Returns:
+            Number of newly queued claim/citation pairs
+        """
+        claims = [c for c in extract_claims(text) if c.key not in (exclude or set())]
+        return self.submit(claims, parse_reference_entries(text))
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """
+        Wait for queued work to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks."""
+        for worker in self._workers:
+            _ = worker.cancel()
+        _ = await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def results(self, claim_keys: set[str] | None = None) -> list[PreVerification]:
+        """
+        Completed pre-verifications.
+
+        Args:
+            claim_keys: Restrict to these claims (e.g. those in the current analysis)
+
+        Returns:
+            Pre-verifications in completion order
+        """
+        return [
+            r
+            for r in self._results.values()
+            if claim_keys is None or r.claim_key in claim_keys
+        ]
+
+    async def _page(self, url: str) -> FetchResult:
+        """Fetch a page once, sharing the in-flight request between workers."""
+        if url not in self._pages:
+            future: asyncio.Future[FetchResult] = asyncio.get_running_loop().create_future()
+            self._pages[url] = future
+            cached = self.cache.get(url)
+            reason = self.registry.known_bad(url) if self.registry else None
+            if cached is not None:
+                self.cache_hits += 1
+                future.set_result(cached)
+            elif reason:
+                self.skipped_known_bad += 1
+                future.set_result(FetchResult(url=url, error=f"Known bad source: {reason}"))
+            else:
+                started = time.monotonic()
+                try:
+                    page = await asyncio.wait_for(
+                        self.fetcher.fetch(url), timeout=self.fetch_timeout
+                    )
+                except asyncio.TimeoutError:
+                    page = FetchResult(url=url, error=f"Timed out after {self.fetch_timeout}s")
+                except Exception as e:
+                    page = FetchResult(url=url, error=str(e))
+                elapsed = time.monotonic() - started
+                self.fetch_seconds += elapsed
+                self.slowest_fetch = max(self.slowest_fetch, elapsed)
+                if self.max_page_chars is not None:
+                    page.text = page.text[: self.max_page_chars]
+                self.fetch_count += 1
+                self.fetch_log.append((page, elapsed))
+                self.cache.put(page)
+                future.set_result(page)
+        return await self._pages[url]
+
+    async def _worker(self) -> None:
+        """Process queued claims until cancelled."""
+        while True:
+            claim, citation, url = await self._queue.get()
+            try:
+                page = await self._page(url)
+                self._results[(claim.key, url)] = pre_verify(claim, citation, url, page)
+            except Exception as e:
+                logger.debug(f"Pre-verification failed for {url}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+class AnalysisWatcher:
+    """Poll analysis files and queue claims from sections as they are completed."""
+
+    def __init__(
+        self,
+        paths: list[Path],
+        prefetcher: CitationPrefetcher,
+        interval: float = 2.0,
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            paths: Analysis files to watch (missing files are skipped)
+            prefetcher: Prefetcher receiving completed sections' claims
+            interval: Seconds between polls
+        """
+        self.paths: list[Path] = paths
+        self.prefetcher: CitationPrefetcher = prefetcher
+        self.interval: float = interval
+        self._mtimes: dict[Path, float] = {}
+
+    def scan(self) -> int:
+        """
+        Queue claims from completed sections of files changed since the last scan.
+
+        Returns:
+            Number of newly queued claim/citation pairs
+        """
+        queued = 0
+        for path in self.paths:
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if self._mtimes.get(path) == mtime:
+                continue
+            self._mtimes[path] = mtime
+
+            text = path.read_text()
+            done = set(completed_sections(text))
+            claims = [c for c in extract_claims(text) if c.section in done]
+            queued += self.prefetcher.submit(claims, parse_reference_entries(text))
+        return queued
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Poll until stop is set, then scan once more."""
+        while not stop.is_set():
+            _ = self.scan()
+            try:
+                _ = await asyncio.wait_for(stop.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+        _ = self.scan()
+
+
+def load_pre_verifications(path: Path) -> list[PreVerification]:
+    """
+    Load pre-verifications saved by the pipeline.
+
+    Args:
+        path: JSON list of pre-verifications
+
+    Returns:
+        Pre-verifications, empty if the file is missing or unreadable
+    """
+    if not path.exists():
+        return []
+    try:
+        data = json.loads(path.read_text())  # pyright: ignore[reportAny]
+        return [PreVerification(**item) for item in data]  # pyright: ignore[reportAny]
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable prefetch results {path}: {e}")
+        return []
+
+
+def render_pre_verifications(results: list[PreVerification]) -> str:
+    """
+    Render pre-verification verdicts as a prompt section for the fact-checker.
+
+    Args:
+        results: Pre-verifications to include
+
+    Returns:
+        Markdown section, or an empty string if there are no results
+    """
+    if not results:
+        return ""
+
+    groups = [
+        (
+            SUPPORTED,
+            "Supported: the claim's key figures appear on the cited page next to "
+            + "its terms. Do not re-fetch these unless the claim looks misleading.",
+        ),
+        (
+            NUMBERS_FOUND,
+            "Numbers found on page (hint only): the figures occur on the cited page, "
+            + "but not clearly as evidence for the claim. Verify these as usual.",
+        ),
+        (FIGURES_MISSING, "Figures not found on the cited page. Verify these first."),
+        (UNREACHABLE, "Cited page could not be fetched. Check that the URL is valid."),
+        (UNCHECKED, "Page fetched, but the claim has no figures to compare."),
+    ]
+    lines = [
+        "## Pre-verified Citations",
+        "",
+        "The pipeline fetched the cited pages before this session. Where a page "
+        + "excerpt is given, judge the claim from it instead of fetching the page.",
+    ]
+    for status, heading in groups:
+        entries = [r for r in results if r.status == status]
+        if not entries:
+            continue
+        lines.extend(["", f"**{heading}**", ""])
+        for r in entries:
+            entry = f"- {r.section}: {r.claim} {r.citation} <{r.url}>"
+            if r.missing:
+                entry += f" (missing: {', '.join(r.missing)})"
+            lines.append(entry)
+            if r.excerpt:
+                lines.append(f'  - Page excerpt: "{r.excerpt}"')
+    return "\n".join(lines) + "\n"
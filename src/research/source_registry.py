@@ -0,0 +1,522 @@
+"""Learn which cited sources are reliable from past fetches and fact-checks.
+
+SourceRegistry keeps fetch statistics per canonical URL and per domain:
+attempts, failures, paywalls, latency, and how often the fact-checker found a
+citation to them false or outdated. It learns from the WebFetch results in
+each run's messages.jsonl, from the pipeline's own citation prefetches and
+from fact_check_iteration_N.json files. URLs that never worked (or whose
+domain almost never works) are known bad: the prefetcher returns a cached
+failure for them instead of fetching, and agents are told to avoid them.
+Known-bad verdicts expire, so a source that recovers is tried again.
+
+Usage:
+    python -m src.research.source_registry [--learn logs/runs] [--urls]
+"""
+# pyright: reportAny=false, reportExplicitAny=false
+
+import argparse
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from ..utils.json_validator import json_object, json_objects, load_json_object
+from .fetcher import FetchResult
+from .urls import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+# A URL is known bad after this many failures without a single success
+_URL_MIN_FAILURES = 2
+# A domain is known bad once this many attempts fail at this rate or more
+_DOMAIN_MIN_ATTEMPTS = 5
+_DOMAIN_MAX_ERROR_RATE = 0.8
+
+# Fact-check issue types that point at the cited source itself
+CITATION_ISSUE_TYPES = ("false_citation", "outdated_citation")
+
+_PAYWALL = re.compile(
+    r"paywall|subscribe to (?:read|continue)|subscription required|"
+    + r"subscribers only|sign in to (?:read|continue)|status code 402|\b402 payment",
+    re.IGNORECASE,
+)
+_STATUS_PAYWALL = (401, 402)
+# Paywalled pages are short teasers; longer pages only mention subscriptions
+_PAYWALL_MAX_CHARS = 5000
+
+
+def detect_paywall(text: str, status: int = 0, length: int | None = None) -> bool:
+    """
+    Whether a fetch result looks like a paywall or login wall.
+
+    Args:
+        text: Fetched content, or a preview of it
+        status: HTTP status, if known
+        length: Length of the full content when text is only a preview
+
+    Returns:
+        True for paywall statuses, or short pages with paywall wording
+    """
+    if status in _STATUS_PAYWALL:
+        return True
+    full_length = len(text) if length is None else length
+    return full_length < _PAYWALL_MAX_CHARS and bool(_PAYWALL.search(text))
+
+
+def domain_of(url: str) -> str:
+    """Host of a URL without a leading www."""
+    host = (urlsplit(url).hostname or "").lower()
+    return host.removeprefix("www.")
+
+
+@dataclass
+class SourceStats:
+    """Fetch statistics for one URL or domain."""
+
+    attempts: int = 0
+    failures: int = 0
+    paywalls: int = 0
+    citation_issues: int = 0  # Fact-check false/outdated citation issues
+    total_seconds: float = 0.0
+    last_error: str = ""
+    last_success: str = ""
+    last_seen: str = ""
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of attempts that failed (paywalls included)."""
+        return self.failures / self.attempts if self.attempts else 0.0
+
+    @property
+    def avg_seconds(self) -> float:
+        """Average fetch latency."""
+        return self.total_seconds / self.attempts if self.attempts else 0.0
+
+
+class SourceRegistry:
+    """Per-URL and per-domain source health, persisted as JSON."""
+
+    def __init__(
+        self, path: Path, retry_after_days: float = 7.0, slow_seconds: float = 15.0
+    ) -> None:
+        """
+        Load the registry, starting empty if the file is missing or unreadable.
+
+        Args:
+            path: JSON file holding the statistics (e.g., .cache/source_registry.json)
+            retry_after_days: Known-bad verdicts older than this are retried
+            slow_seconds: Average latency at which a domain counts as slow
+        """
+        self.path: Path = path
+        self.retry_after_days: float = retry_after_days
+        self.slow_seconds: float = slow_seconds
+        self.urls: dict[str, SourceStats] = {}
+        self.domains: dict[str, SourceStats] = {}
+        self.learned: list[str] = []  # Runs and fact-check files already counted
+        if not path.exists():
+            return
+        try:
+            data: dict[str, Any] = json.loads(path.read_text())
+            self.urls = {k: SourceStats(**v) for k, v in data.get("urls", {}).items()}
+            self.domains = {
+                k: SourceStats(**v) for k, v in data.get("domains", {}).items()
+            }
+            self.learned = list(data.get("learned", []))
+        except (json.JSONDecodeError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable source registry {path}: {e}")
+
+    def save(self) -> None:
+        """Write the registry to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "urls": {k: asdict(v) for k, v in self.urls.items()},
+            "domains": {k: asdict(v) for k, v in self.domains.items()},
+            "learned": self.learned,
+        }
+        _ = self.path.write_text(json.dumps(data, indent=2) + "\n")
+
+    def _stats(self, url: str) -> list[SourceStats]:
+        """Stats entries (URL, then domain) to update for a URL."""
+        canonical = canonicalize_url(url)
+        return [
+            self.urls.setdefault(canonical, SourceStats()),
+            self.domains.setdefault(domain_of(canonical), SourceStats()),
+        ]
+
+    def record_fetch(
+        self,
+        url: str,
+        ok: bool,
+        seconds: float,
+        error: str = "",
+        paywall: bool = False,
+        when: str | None = None,
+    ) -> None:
+        """
+        Record the outcome of one fetch of a URL.
+
+        Args:
+            url: URL fetched (canonicalized here)
+            ok: Whether usable content came back
+            seconds: Fetch latency
+            error: Error message, if the fetch failed
+            paywall: Whether the page was behind a paywall or login
+            when: ISO timestamp of the fetch (defaults to now)
+        """
+        when = when or datetime.now().isoformat(timespec="seconds")
+        for stats in self._stats(url):
+            stats.attempts += 1
+            stats.total_seconds += seconds
+            stats.last_seen = max(stats.last_seen, when)
+            if paywall:
+                stats.paywalls += 1
+            if ok and not paywall:
+                stats.last_success = max(stats.last_success, when)
+            else:
+                stats.failures += 1
+                stats.last_error = "paywalled" if paywall and not error else error[:200]
+
+    def record_page(self, page: FetchResult, seconds: float) -> None:
+        """Record a prefetcher fetch result."""
+        self.record_fetch(
+            page.url,
+            page.ok,
+            seconds,
+            page.error or (f"HTTP {page.status}" if not page.ok else ""),
+            detect_paywall(page.text, page.status),
+            page.fetched_at[:19],
+        )
+
+    def record_citation_issue(self, url: str) -> None:
+        """Record a false or outdated citation found by the fact-checker."""
+        for stats in self._stats(url):
+            stats.citation_issues += 1
+
+    def known_bad(self, url: str, now: datetime | None = None) -> str | None:
+        """
+        Explain why a URL should not be fetched, if it is known bad.
+
+        Args:
+            url: URL about to be fetched
+            now: Current time (defaults to now)
+
+        Returns:
+            Reason such as "failed 3 times (HTTP 404)", or None to go ahead
+        """
+        canonical = canonicalize_url(url)
+        cutoff = ((now or datetime.now()) - timedelta(days=self.retry_after_days)).isoformat()
+
+        stats = self.urls.get(canonical)
+        if (
+            stats is not None
+            and stats.failures >= _URL_MIN_FAILURES
+            and not stats.last_success
+            and stats.last_seen >= cutoff
+        ):
+            if stats.paywalls:
+                return f"paywalled ({stats.paywalls} of {stats.attempts} fetches)"
+            return f"failed {stats.failures} times ({stats.last_error or 'unknown error'})"
+
+        domain = self.domains.get(domain_of(canonical))
+        if (
+            domain is not None
+            and domain.attempts >= _DOMAIN_MIN_ATTEMPTS
+            and domain.error_rate >= _DOMAIN_MAX_ERROR_RATE
+            and domain.last_seen >= cutoff
+        ):
+            return f"domain fails {domain.error_rate:.0%} of {domain.attempts} fetches"
+        return None
+
+    def is_slow(self, url: str) -> bool:
+        """Whether a URL's domain is slow on average."""
+        domain = self.domains.get(domain_of(canonicalize_url(url)))
+        return domain is not None and domain.avg_seconds >= self.slow_seconds
+
+    def unreliable_domains(self, limit: int = 10) -> list[tuple[str, str]]:
+        """
+        Domains agents should prefer not to cite.
+
+        Args:
+            limit: Maximum domains to return
+
+        Returns:
+            (domain, reason) pairs, worst error rate first
+        """
+        found: list[tuple[float, str, str]] = []
+        for name, stats in self.domains.items():
+            reasons: list[str] = []
+            if stats.attempts >= _DOMAIN_MIN_ATTEMPTS and stats.error_rate >= 0.5:
+                reasons.append(f"fails {stats.error_rate:.0%} of fetches")
+            if stats.paywalls and stats.paywalls * 2 >= stats.attempts:
+                reasons.append("usually paywalled")
+            if stats.attempts and stats.avg_seconds >= self.slow_seconds:
+                reasons.append(f"slow (avg {stats.avg_seconds:.0f}s)")
+            if stats.citation_issues >= 2:
+                reasons.append(f"{stats.citation_issues} false or outdated citations")
+            if reasons:
+                found.append((stats.error_rate, name, ", ".join(reasons)))
+        return [(name, reason) for _, name, reason in sorted(found, reverse=True)[:limit]]
+
+    def learn_from_messages(self, messages_file: Path) -> int:
+        """
+        Record the WebFetch results in a run's message log.
+
+        Latency is the time between the tool call and its result message.
+
+        Args:
+            messages_file: messages.jsonl written by RunAnalytics
+
+        Returns:
+            Number of fetches recorded
+        """
+        pending: dict[str, tuple[str, datetime]] = {}
+        recorded = 0
+        with open(messages_file) as f:
+            for line in f:
+                try:
+                    entry = load_json_object(line)
+                    when = datetime.fromisoformat(str(entry["timestamp"]))
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    continue
+                message = json_object(entry.get("message"))
+                for block in json_objects(message.get("content")):
+                    call_input = json_object(block.get("input"))
+                    if (
+                        block.get("type") == "ToolUseBlock"
+                        and block.get("name") == "WebFetch"
+                        and call_input.get("url")
+                    ):
+                        pending[str(block.get("id"))] = (str(call_input["url"]), when)
+                artifacts = json_object(entry.get("artifacts"))
+                for block in json_objects(artifacts.get("blocks")):
+                    call = pending.pop(str(block.get("tool_use_id")), None)
+                    if call is None:
+                        continue
+                    url, started = call
+                    preview = str(block.get("content_preview") or "")
+                    failed = bool(block.get("is_error"))
+                    # The preview is truncated: judge page length by the full
+                    # result, and skip the check for logs that predate it
+                    length = block.get("content_length")
+                    self.record_fetch(
+                        url,
+                        ok=not failed,
+                        seconds=(when - started).total_seconds(),
+                        error=preview[:200] if failed else "",
+                        paywall=isinstance(length, int)
+                        and detect_paywall(preview, length=length),
+                        when=when.isoformat(timespec="seconds"),
+                    )
+                    recorded += 1
+        return recorded
+
+    def learn_from_fact_check(self, fact_check: dict[str, Any]) -> int:
+        """
+        Record the false and outdated citations in a fact-check.
+
+        Args:
+            fact_check: Parsed fact_check_iteration_N.json
+
+        Returns:
+            Number of citation issues recorded
+        """
+        recorded = 0
+        for issue in json_objects(fact_check.get("issues")):
+            details = json_object(issue.get("details"))
+            url = str(details.get("url_checked", ""))
+            if details.get("issue_type") in CITATION_ISSUE_TYPES and url.startswith("http"):
+                self.record_citation_issue(url)
+                recorded += 1
+        return recorded
+
+    def learn_from_runs(self, runs_dir: Path) -> int:
+        """
+        Record the WebFetch results of every run not learned from yet.
+
+        Args:
+            runs_dir: Directory holding one folder per run (e.g., logs/runs)
+
+        Returns:
+            Number of fetches recorded
+        """
+        return sum(
+            self.learn_from_run(messages_file.parent)
+            for messages_file in sorted(runs_dir.glob("*/messages.jsonl"))
+        )
+
+    def learn_from_run(self, run_dir: Path) -> int:
+        """
+        Record the WebFetch results of one finished run, once.
+
+        Args:
+            run_dir: Run folder holding messages.jsonl
+
+        Returns:
+            Number of fetches recorded (0 if already learned or no log exists)
+        """
+        messages_file = run_dir / "messages.jsonl"
+        if run_dir.name in self.learned or not messages_file.exists():
+            return 0
+        self.learned.append(run_dir.name)
+        return self.learn_from_messages(messages_file)
+
+    def learn_from_fact_check_files(self, paths: list[Path]) -> int:
+        """
+        Record the citation issues of fact-check files not learned from yet.
+
+        Args:
+            paths: fact_check_iteration_N.json files
+
+        Returns:
+            Number of citation issues recorded
+        """
+        recorded = 0
+        for path in paths:
+            key = str(path.resolve())
+            if key in self.learned:
+                continue
+            try:
+                data = load_json_object(path.read_text())
+            except (OSError, json.JSONDecodeError):
+                continue
+            if data:
+                recorded += self.learn_from_fact_check(data)
+                self.learned.append(key)
+        return recorded
+
+
+def render_unreliable_sources(registry: SourceRegistry, limit: int = 10) -> str:
+    """
+    Render a prompt section steering the analyst away from unreliable domains.
+
+    Args:
+        registry: Learned source health
+        limit: Maximum domains to list
+
+    Returns:
+        Markdown section, or an empty string if no domain is unreliable
+    """
+    domains = registry.unreliable_domains(limit)
+    if not domains:
+        return ""
+    lines = [
+        "## Source Reliability",
+        "",
+        "Past runs had trouble with these sources. Prefer other sources for "
+        + "the same facts, and cite them only if nothing else has the figure.",
+        "",
+    ]
+    lines += [f"- {domain}: {reason}" for domain, reason in domains]
+    return "\n".join(lines) + "\n"
+
+
+def render_cited_sources(registry: SourceRegistry, urls: list[str]) -> str:
+    """
+    Render a prompt section on the health of an analysis's cited URLs.
+
+    Args:
+        registry: Learned source health
+        urls: URLs cited by the analysis
+
+    Returns:
+        Markdown section, or an empty string if every cited source looks healthy
+    """
+    bad: list[str] = []
+    slow: list[str] = []
+    for url in dict.fromkeys(canonicalize_url(u) for u in urls):
+        reason = registry.known_bad(url)
+        if reason:
+            bad.append(f"- <{url}>: {reason}")
+        elif registry.is_slow(url):
+            slow.append(f"- <{url}>")
+    if not bad and not slow:
+        return ""
+    lines = ["## Cited Source Health", ""]
+    if bad:
+        lines += [
+            "These cited URLs are known to be unusable. Do not WebFetch them; "
+            + "report the claims as unverifiable citations unless another source "
+            + "confirms them.",
+            "",
+            *bad,
+            "",
+        ]
+    if slow:
+        lines += [
+            "These cited URLs are on slow domains. Fetch them last, and only if "
+            + "the claim matters.",
+            "",
+            *slow,
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def format_registry(
+    registry: SourceRegistry, show_urls: bool = False, limit: int = 30
+) -> str:
+    """
+    Format the learned statistics as a plain-text table.
+
+    Args:
+        registry: Source registry to show
+        show_urls: List URLs instead of domains
+        limit: Maximum rows, most attempted first
+
+    Returns:
+        Table text
+    """
+    entries = registry.urls if show_urls else registry.domains
+    if not entries:
+        return "No sources recorded yet.\n"
+
+    width = min(max(len(name) for name in entries), 60)
+    lines = [
+        f"{'url' if show_urls else 'domain':<{width}} {'n':>4} {'fail':>5} "
+        + f"{'paywall':>7} {'avg':>6} {'cit':>4}  status"
+    ]
+    ranked = sorted(entries.items(), key=lambda item: item[1].attempts, reverse=True)
+    for name, stats in ranked[:limit]:
+        probe = name if show_urls else f"https://{name}/"
+        status = registry.known_bad(probe) or ("slow" if registry.is_slow(probe) else "ok")
+        lines.append(
+            f"{name[:width]:<{width}} {stats.attempts:>4} {stats.error_rate:>5.0%} "
+            + f"{stats.paywalls:>7} {stats.avg_seconds:>5.1f}s "
+            + f"{stats.citation_issues:>4}  {status}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the learned source statistics, optionally learning from runs first."""
+    parser = argparse.ArgumentParser(
+        description="Show and learn the source reliability registry"
+    )
+    _ = parser.add_argument(
+        "--registry",
+        default=".cache/source_registry.json",
+        help="Registry file (default: .cache/source_registry.json)",
+    )
+    _ = parser.add_argument(
+        "--learn",
+        metavar="RUNS_DIR",
+        help="Learn from runs not seen yet (e.g., logs/runs) and save",
+    )
+    _ = parser.add_argument("--urls", action="store_true", help="Show URLs, not domains")
+    _ = parser.add_argument("--limit", type=int, default=30, help="Maximum rows")
+    args = parser.parse_args(argv)
+
+    registry = SourceRegistry(Path(args.registry))
+    if args.learn:
+        recorded = registry.learn_from_runs(Path(args.learn))
+        registry.save()
+        print(f"Learned {recorded} fetches from {args.learn}\n")
+    print(format_registry(registry, args.urls, args.limit), end="")
+
+
+if __name__ == "__main__":
+    main()
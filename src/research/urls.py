@@ -0,0 +1,36 @@
+"""URL normalization shared by the fetch cache, claim memo and registries."""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click, never select content
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "ref_src")
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so variants of the same page share one fetch and cache entry.
+
+    Lowercases the scheme and host, drops default ports, fragments and
+    tracking parameters, and sorts the remaining query parameters. The path
+    is kept as written, since servers may treat it case-sensitively.
+
+    Args:
+        url: URL as cited
+
+    Returns:
+        Canonical URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and str(parts.port) != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(_TRACKING_PARAMS)
+        )
+    )
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
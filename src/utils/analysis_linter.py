@@ -0,0 +1,183 @@
+"""Local checks for analysis markdown that don't need a model.
+
+Many reviewer rejections are mechanical: the analysis is too short, still
+has template TODO markers, lost a section, states figures without a
+citation, or has a broken reference list. lint_analysis finds these in
+milliseconds so the analyst can fix them before a reviewer round is spent.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from .analysis_sections import TITLE_KEY, parse_sections
+from .claims import (
+    CITATION_PATTERN,
+    REFERENCE_ENTRY_PATTERN,
+    REFERENCE_SECTIONS,
+    expand_citation,
+)
+
+_TODO_MARKER = "[TODO"
+
+# Money, percentages and scaled quantities - the figures reviewers expect cited
+_FIGURE = re.compile(
+    r"[$€£]\s?\d|\d(?:\.\d+)?\s?%|\b\d[\d,.]*\s?(?:[kmb]n?|million|billion|trillion)\b",
+    re.IGNORECASE,
+)
+_SENTENCE = re.compile(r"(?<=[.!?])\s+")
+
+
+@dataclass
+class LintIssue:
+    """A single problem found by the linter."""
+
+    rule: str
+    message: str
+    section: str = ""
+    blocking: bool = True
+
+
+def _is_references(name: str) -> bool:
+    """Check whether a section holds the reference list."""
+    return name.lower().startswith(REFERENCE_SECTIONS)
+
+
+def _uncited_sentences(content: str) -> list[str]:
+    """Sentences of a section body that state a figure without a citation."""
+    return [
+        sentence
+        for sentence in _SENTENCE.split(" ".join(content.split()))
+        if _FIGURE.search(sentence) and not CITATION_PATTERN.search(sentence)
+    ]
+
+
+def find_uncited_figures(text: str) -> list[tuple[str, str]]:
+    """
+    Find quantitative claims that have no citation.
+
+    Args:
+        text: Analysis markdown
+
+    Returns:
+        (section, sentence) for each uncited figure, in document order
+    """
+    return [
+        (name, sentence)
+        for name, content in parse_sections(text).items()
+        if name != TITLE_KEY and not _is_references(name)
+        for sentence in _uncited_sentences(content)
+    ]
+
+
+def lint_analysis(
+    text: str,
+    required_sections: list[str],
+    min_words: int,
+    max_uncited_figures: int = 3,
+) -> list[LintIssue]:
+    """
+    Check an analysis for mechanical problems.
+
+    Args:
+        text: Analysis markdown
+        required_sections: Section names the analysis must contain (from its template)
+        min_words: Minimum word count of the body, excluding references
+        max_uncited_figures: Uncited figures tolerated before the rule blocks
+
+    Returns:
+        Issues found, blocking ones first
+    """
+    sections = parse_sections(text)
+    body = {
+        name: content
+        for name, content in sections.items()
+        if name != TITLE_KEY and not _is_references(name)
+    }
+    issues: list[LintIssue] = []
+
+    # Word count
+    words = sum(len(content.split()) for content in body.values())
+    if words < min_words:
+        issues.append(
+            LintIssue("word_count", f"Analysis has {words} words, minimum is {min_words}")
+        )
+
+    # Leftover template markers
+    for name, content in sections.items():
+        if _TODO_MARKER in content:
+            issues.append(
+                LintIssue("todo_marker", "Template TODO marker left in place", name)
+            )
+
+    # Missing or empty sections
+    for name in required_sections:
+        if name == TITLE_KEY:
+            continue
+        if name not in sections:
+            issues.append(LintIssue("missing_section", "Section is missing", name))
+        elif not sections[name]:
+            issues.append(LintIssue("missing_section", "Section is empty", name))
+
+    # Reference list: duplicate numbers and citations without an entry
+    reference_numbers: list[str] = []
+    for name, content in sections.items():
+        if _is_references(name):
+            for line in content.splitlines():
+                match = REFERENCE_ENTRY_PATTERN.match(line)
+                if match:
+                    reference_numbers.append(match.group(1))
+    for number, count in Counter(reference_numbers).items():
+        if count > 1:
+            issues.append(
+                LintIssue(
+                    "duplicate_citation",
+                    f"Reference [{number}] is listed {count} times",
+                    "References",
+                )
+            )
+
+    known = set(reference_numbers)
+    uncited: list[tuple[str, str]] = []
+    for name, content in body.items():
+        cited = {
+            number
+            for match in CITATION_PATTERN.finditer(content)
+            for number in expand_citation(match.group(1))
+        }
+        for number in sorted(cited - known, key=lambda n: int(n) if n.isdigit() else 0):
+            issues.append(
+                LintIssue(
+                    "unknown_citation", f"Citation [{number}] has no reference entry", name
+                )
+            )
+        uncited.extend((name, sentence) for sentence in _uncited_sentences(content))
+
+    blocking_uncited = len(uncited) > max_uncited_figures
+    for name, sentence in uncited:
+        issues.append(
+            LintIssue(
+                "uncited_figure",
+                f'Figure without a citation: "{sentence[:120]}"',
+                name,
+                blocking=blocking_uncited,
+            )
+        )
+
+    return sorted(issues, key=lambda issue: not issue.blocking)
+
+
+def format_lint_issues(issues: list[LintIssue]) -> str:
+    """
+    Render lint issues as a markdown list for the analyst.
+
+    Args:
+        issues: Issues to render
+
+    Returns:
+        One bullet per issue
+    """
+    return "\n".join(
+        f"- **{issue.section}**: {issue.message}" if issue.section else f"- {issue.message}"
+        for issue in issues
+    )
@@ -0,0 +1,224 @@
+"""Section-level parsing and diffing of analysis markdown.
+
+Analyses follow the template in config/templates/agents/analyst/analysis.md:
+a single `# Title` line followed by `## Section` blocks, and a metadata
+footer appended by the pipeline. These helpers split an analysis into its
+sections and compare two iterations section by section.
+"""
+
+import difflib
+import re
+from dataclasses import dataclass, field
+
+# Marker that starts the auto-generated metadata footer
+METADATA_MARKER = "<!-- Analysis Metadata"
+
+# Key used for the title line and anything before the first section
+TITLE_KEY = "Title"
+
+_SECTION_HEADING = re.compile(r"^## +(.+?)\s*$", re.MULTILINE)
+
+
+def strip_metadata(text: str) -> str:
+    """
+    Remove the auto-generated metadata footer from an analysis.
+
+    Args:
+        text: Analysis markdown
+
+    Returns:
+        Analysis content without the trailing metadata block
+    """
+    index = text.find(METADATA_MARKER)
+    if index == -1:
+        return text.rstrip()
+
+    content = text[:index].rstrip()
+    # The footer is preceded by a horizontal rule
+    if content.endswith("---"):
+        content = content[:-3].rstrip()
+    return content
+
+
+def parse_sections(text: str) -> dict[str, str]:
+    """
+    Split an analysis into its sections.
+
+    Args:
+        text: Analysis markdown
+
+    Returns:
+        Ordered mapping of section name to section body. The title line and
+        any content before the first `##` heading are stored under TITLE_KEY.
+    """
+    content = strip_metadata(text)
+    sections: dict[str, str] = {}
+
+    matches = list(_SECTION_HEADING.finditer(content))
+    preamble_end = matches[0].start() if matches else len(content)
+    preamble = content[:preamble_end].strip()
+    if preamble:
+        sections[TITLE_KEY] = preamble
+
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        sections[match.group(1)] = content[match.end() : end].strip()
+
+    return sections
+
+
+def render_sections(sections: dict[str, str]) -> str:
+    """
+    Render a section mapping back into analysis markdown.
+
+    Args:
+        sections: Ordered mapping as returned by parse_sections
+
+    Returns:
+        Markdown with a `##` heading per section
+    """
+    parts: list[str] = []
+    for name, body in sections.items():
+        if name == TITLE_KEY:
+            parts.append(body)
+        else:
+            parts.append(f"## {name}\n\n{body}" if body else f"## {name}")
+    return "\n\n".join(parts) + "\n"
+
+
+def _normalize(body: str) -> str:
+    """Collapse whitespace so formatting-only edits don't count as changes."""
+    return " ".join(body.split())
+
+
+def summarize_section(body: str, max_words: int = 30) -> str:
+    """
+    Produce a one-line summary of a section: its first sentence, truncated.
+
+    Args:
+        body: Section body
+        max_words: Maximum number of words to keep
+
+    Returns:
+        Short plain-text summary
+    """
+    text = _normalize(body)
+    sentence = re.split(r"(?<=[.!?])\s", text, maxsplit=1)[0]
+    words = sentence.split()
+    if len(words) > max_words:
+        return " ".join(words[:max_words]) + "..."
+    return sentence
+
+
+@dataclass
+class SectionDiff:
+    """Section-level comparison between two analysis iterations."""
+
+    changed: list[str] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    # Fraction of words changed per changed/added section (0.0-1.0)
+    change_ratios: dict[str, float] = field(default_factory=dict)
+    # Word counts of the new iteration's sections, used for weighting
+    word_counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def modified(self) -> list[str]:
+        """Sections the reviewer needs to look at (changed or added)."""
+        return self.changed + self.added
+
+    @property
+    def changed_fraction(self) -> float:
+        """Word-weighted fraction of the new analysis that changed."""
+        total = sum(self.word_counts.values())
+        if total == 0:
+            return 0.0
+        changed_words = sum(
+            self.word_counts.get(name, 0) * ratio
+            for name, ratio in self.change_ratios.items()
+        )
+        return changed_words / total
+
+
+def diff_sections(old_text: str, new_text: str) -> SectionDiff:
+    """
+    Compare two analysis iterations section by section.
+
+    Args:
+        old_text: Previous iteration markdown
+        new_text: Current iteration markdown
+
+    Returns:
+        SectionDiff describing which sections changed and by how much
+    """
+    old_sections = parse_sections(old_text)
+    new_sections = parse_sections(new_text)
+    diff = SectionDiff()
+
+    for name, body in new_sections.items():
+        diff.word_counts[name] = len(body.split())
+        if name not in old_sections:
+            diff.added.append(name)
+            diff.change_ratios[name] = 1.0
+            continue
+
+        old_body = _normalize(old_sections[name])
+        new_body = _normalize(body)
+        if old_body == new_body:
+            diff.unchanged.append(name)
+            continue
+
+        matcher = difflib.SequenceMatcher(
+            None, old_body.split(), new_body.split(), autojunk=False
+        )
+        diff.changed.append(name)
+        diff.change_ratios[name] = 1.0 - matcher.ratio()
+
+    diff.removed = [name for name in old_sections if name not in new_sections]
+    return diff
+
+
+@dataclass
+class Completeness:
+    """How much of an analysis template has been filled in."""
+
+    filled: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)  # Absent, empty or still TODO
+    words: int = 0
+
+    @property
+    def filled_fraction(self) -> float:
+        """Fraction of required sections that are filled."""
+        total = len(self.filled) + len(self.missing)
+        return len(self.filled) / total if total else 0.0
+
+
+def assess_completeness(text: str, required_sections: list[str]) -> Completeness:
+    """
+    Check which template sections an analysis has filled in.
+
+    Args:
+        text: Analysis markdown
+        required_sections: Section names from the template (TITLE_KEY is ignored)
+
+    Returns:
+        Completeness with filled and missing sections and the body word count
+    """
+    sections = parse_sections(text)
+    result = Completeness()
+    for name in required_sections:
+        if name == TITLE_KEY:
+            continue
+        body = sections.get(name, "")
+        if body and "[TODO" not in body:
+            result.filled.append(name)
+        else:
+            result.missing.append(name)
+    result.words = sum(
+        len(body.split())
+        for name, body in sections.items()
+        if name != TITLE_KEY and not name.lower().startswith("reference")
+    )
+    return result
+
@@ -0,0 +1,87 @@
+"""Inline input artifacts into agent user prompts.
+
+Agents normally receive file paths and spend a model turn on a Read tool
+call before doing any real work. When inlining is enabled, the contents of
+read-only input files are appended to the end of the user prompt so that the
+stable instructions stay at the front (cache-friendly) and the agent can start
+working immediately. Artifacts above the size threshold keep the path-based flow.
+"""
+
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def build_inlined_artifacts_section(
+    artifacts: list[tuple[str, Path | None]], max_chars: int
+) -> tuple[str, list[Path]]:
+    """
+    Build a prompt section embedding the contents of input artifacts.
+
+    Args:
+        artifacts: (label, path) pairs in the order they should appear.
+            Missing or None paths are skipped.
+        max_chars: Maximum size of a single artifact to inline. Larger
+            artifacts are left out and the agent reads them from disk.
+
+    Returns:
+        Tuple of (section text, list of inlined paths). The section text is
+        empty when nothing could be inlined.
+    """
+    blocks: list[str] = []
+    inlined: list[Path] = []
+
+    for label, path in artifacts:
+        if path is None or not path.exists():
+            continue
+
+        try:
+            content = path.read_text()
+        except OSError as e:
+            logger.warning(f"Could not inline {path}: {e}")
+            continue
+
+        if len(content) > max_chars:
+            logger.debug(
+                f"Artifact {path} too large to inline ({len(content)} > {max_chars} chars)"
+            )
+            continue
+
+        fence = "````" if "```" in content else "```"
+        language = "json" if path.suffix == ".json" else "markdown"
+        blocks.append(
+            f"### {label}\n\nPath: {path}\n\n{fence}{language}\n{content.rstrip()}\n{fence}"
+        )
+        inlined.append(path)
+
+    if not blocks:
+        return "", []
+
+    header = (
+        "## Inlined Files\n\n"
+        + "The current contents of the following input files are included below. "
+        + "Do NOT use the Read tool on them - work from this text directly. "
+        + "Files you need to edit must still be Read before editing."
+    )
+    return "\n\n".join([header, *blocks]), inlined
+
+
+def append_inlined_artifacts(
+    user_prompt: str, artifacts: list[tuple[str, Path | None]], max_chars: int
+) -> tuple[str, list[Path]]:
+    """
+    Append inlined artifacts to the end of a user prompt.
+
+    Args:
+        user_prompt: The formatted user prompt
+        artifacts: (label, path) pairs to inline
+        max_chars: Maximum size of a single inlined artifact
+
+    Returns:
+        Tuple of (prompt with inlined section appended, list of inlined paths)
+    """
+    section, inlined = build_inlined_artifacts_section(artifacts, max_chars)
+    if not section:
+        return user_prompt, []
+    return f"{user_prompt.rstrip()}\n\n{section}\n", inlined
@@ -0,0 +1,409 @@
+"""Claim extraction and verdict carry-forward for incremental fact-checking.
+
+A claim is a sentence in the analysis body that cites a reference or states a
+figure. Claims are keyed by their normalized text plus the references they
+cite (resolved to the reference entry, so renumbering the reference list does
+not invalidate a claim but swapping its source does). Comparing the claim sets
+of two iterations tells the fact-checker which claims still need verification
+and which previous verdicts can be carried forward unchanged.
+"""
+# pyright: reportAny=false, reportExplicitAny=false
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from .analysis_sections import TITLE_KEY, parse_sections
+from .json_validator import json_object, json_objects
+
+# Sections that hold the reference list rather than claims
+REFERENCE_SECTIONS = ("references", "sources", "citations")
+
+CITATION_PATTERN = re.compile(r"\[(\d+(?:\s*[,-]\s*\d+)*)\]")
+REFERENCE_ENTRY_PATTERN = re.compile(r"^\s*(?:[-*]\s*)?\[(\d+)\]\s*(.+)$")
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+(?=[A-Z$\"*\[(])")
+_HAS_FIGURE = re.compile(r"\d")
+
+# Word overlap above which an issue's quoted claim is matched to a claim
+_MATCH_THRESHOLD = 0.5
+
+# Fact-check rule: reject on any High or this many Medium issues
+_MEDIUM_REJECT_COUNT = 3
+
+
+@dataclass(frozen=True)
+class Claim:
+    """A checkable statement extracted from an analysis."""
+
+    section: str
+    text: str
+    citations: tuple[str, ...] = ()
+    # Reference entries the citations resolve to (same order as citations)
+    sources: tuple[str, ...] = ()
+
+    @property
+    def key(self) -> str:
+        """Identity of the claim across iterations."""
+        return normalize_claim(self.text) + "|" + "|".join(self.sources or self.citations)
+
+
+@dataclass
+class ClaimDiff:
+    """Comparison of the claims in two analysis iterations."""
+
+    new: list[Claim] = field(default_factory=list)
+    unchanged: list[Claim] = field(default_factory=list)
+    removed: list[Claim] = field(default_factory=list)
+
+    @property
+    def changed_fraction(self) -> float:
+        """Fraction of current claims that are new or modified."""
+        total = len(self.new) + len(self.unchanged)
+        return len(self.new) / total if total else 0.0
+
+
+def normalize_claim(text: str) -> str:
+    """Lowercase, drop citation markers and markdown emphasis, collapse whitespace."""
+    text = CITATION_PATTERN.sub("", text)
+    text = re.sub(r"[*_`]", "", text)
+    return " ".join(text.lower().split()).strip(" .")
+
+
+def expand_citation(marker: str) -> list[str]:
+    """Expand '1, 3-5' into ['1', '3', '4', '5']."""
+    numbers: list[str] = []
+    for part in marker.split(","):
+        part = part.strip()
+        if "-" in part:
+            start, end = (p.strip() for p in part.split("-", 1))
+            if start.isdigit() and end.isdigit() and int(end) - int(start) < 50:
+                numbers.extend(str(n) for n in range(int(start), int(end) + 1))
+                continue
+        if part.isdigit():
+            numbers.append(part)
+    return numbers
+
+
+def parse_reference_entries(text: str) -> dict[str, str]:
+    """
+    Map citation numbers to their reference entries as written.
+
+    Args:
+        text: Analysis markdown
+
+    Returns:
+        Mapping such as {"1": 'Mordor Intelligence. "..." <https://...>'}
+    """
+    references: dict[str, str] = {}
+    for name, body in parse_sections(text).items():
+        if not name.lower().startswith(REFERENCE_SECTIONS):
+            continue
+        for line in body.splitlines():
+            match = REFERENCE_ENTRY_PATTERN.match(line)
+            if match:
+                references[match.group(1)] = match.group(2).strip()
+    return references
+
+
+def parse_references(text: str) -> dict[str, str]:
+    """
+    Map citation numbers to their normalized reference entries.
+
+    Args:
+        text: Analysis markdown
+
+    Returns:
+        Mapping such as {"1": "mordor intelligence. ... <https://...>"}
+    """
+    return {
+        number: " ".join(entry.lower().split())
+        for number, entry in parse_reference_entries(text).items()
+    }
+
+
+def extract_claims(text: str) -> list[Claim]:
+    """
+    Extract checkable claims from an analysis.
+
+    Args:
+        text: Analysis markdown
+
+    Returns:
+        Claims in document order, without duplicates
+    """
+    references = parse_references(text)
+    claims: list[Claim] = []
+    seen: set[str] = set()
+
+    for name, body in parse_sections(text).items():
+        if name == TITLE_KEY or name.lower().startswith(REFERENCE_SECTIONS):
+            continue
+        for line in body.splitlines():
+            line = line.strip().lstrip("-*>| ").strip()
+            if not line or line.startswith("#") or set(line) <= set("-|: "):
+                continue
+            for sentence in _SENTENCE_SPLIT.split(line):
+                sentence = sentence.strip()
+                citations = tuple(
+                    n
+                    for marker in CITATION_PATTERN.findall(sentence)
+                    for n in expand_citation(marker)
+                )
+                if not citations and not _HAS_FIGURE.search(CITATION_PATTERN.sub("", sentence)):
+                    continue
+                claim = Claim(
+                    section=name,
+                    text=sentence,
+                    citations=citations,
+                    sources=tuple(references.get(n, f"[{n}]") for n in citations),
+                )
+                if claim.key not in seen:
+                    seen.add(claim.key)
+                    claims.append(claim)
+
+    return claims
+
+
+def diff_claims(old_text: str, new_text: str) -> ClaimDiff:
+    """
+    Compare the claims of two analysis iterations.
+
+    Args:
+        old_text: Previous iteration markdown
+        new_text: Current iteration markdown
+
+    Returns:
+        ClaimDiff with new/modified, unchanged and removed claims
+    """
+    old_claims = extract_claims(old_text)
+    old_keys = {c.key for c in old_claims}
+    new_claims = extract_claims(new_text)
+    new_keys = {c.key for c in new_claims}
+
+    diff = ClaimDiff()
+    for claim in new_claims:
+        (diff.unchanged if claim.key in old_keys else diff.new).append(claim)
+    diff.removed = [c for c in old_claims if c.key not in new_keys]
+    return diff
+
+
+def _words(text: str) -> set[str]:
+    """Word set used to match quoted claims to extracted claims."""
+    return {w for w in re.findall(r"[a-z0-9$%.]+", text) if len(w) > 2}
+
+
+def match_claim(quote: str, claims: list[Claim]) -> Claim | None:
+    """Find the claim an issue's quoted text refers to."""
+    normalized = normalize_claim(quote)
+    if not normalized:
+        return None
+
+    best: Claim | None = None
+    best_score = 0.0
+    quote_words = _words(normalized)
+    for claim in claims:
+        claim_text = normalize_claim(claim.text)
+        if normalized in claim_text or claim_text in normalized:
+            return claim
+        claim_words = _words(claim_text)
+        if quote_words and claim_words:
+            score = len(quote_words & claim_words) / len(quote_words | claim_words)
+            if score > best_score:
+                best, best_score = claim, score
+
+    return best if best_score >= _MATCH_THRESHOLD else None
+
+
+def carry_forward_issues(
+    previous_fact_check: dict[str, Any],
+    old_text: str,
+    new_text: str,
+    diff: ClaimDiff,
+    previous_iteration: int,
+) -> list[dict[str, Any]]:
+    """
+    Select previous fact-check issues that still apply to unchanged claims.
+
+    An issue is carried forward when the claim it quotes is unchanged. Issues
+    on modified claims are dropped because those claims are re-verified, and
+    issues on removed claims are dropped because they no longer apply. Issues
+    whose quote cannot be matched to any claim are kept only if the quoted
+    text still appears verbatim in the new analysis.
+
+    Args:
+        previous_fact_check: Parsed fact_check_iteration_{N-1}.json
+        old_text: Previous iteration markdown
+        new_text: Current iteration markdown
+        diff: Result of diff_claims(old_text, new_text)
+        previous_iteration: Iteration number of the previous fact-check
+
+    Returns:
+        Issues to include in the current fact-check
+    """
+    issues = json_objects(previous_fact_check.get("issues"))
+    if not issues:
+        return []
+
+    old_claims = extract_claims(old_text)
+    unchanged_keys = {c.key for c in diff.unchanged}
+    new_content = normalize_claim(new_text)
+    carried: list[dict[str, Any]] = []
+
+    for issue in issues:
+        quote = str(issue.get("claim", ""))
+        claim = match_claim(quote, old_claims)
+        if claim is not None:
+            keep = claim.key in unchanged_keys
+        else:
+            keep = bool(normalize_claim(quote)) and normalize_claim(quote) in new_content
+        if keep:
+            carried.append({**issue, "carried_forward_from": previous_iteration})
+
+    return carried
+
+
+def _as_int(value: object) -> int:
+    """Coerce a statistics value to int (agents sometimes write strings)."""
+    try:
+        return int(str(value))
+    except ValueError:
+        return 0
+
+
+def recommend_from_issues(issues: list[dict[str, Any]]) -> str:
+    """Apply the fact-check rule: reject on any High or 3+ Medium issues."""
+    severities = [str(i.get("severity", "")).lower() for i in issues]
+    if "high" in severities or severities.count("medium") >= _MEDIUM_REJECT_COUNT:
+        return "reject"
+    return "approve"
+
+
+def merge_carried_forward(
+    fact_check: dict[str, Any],
+    carried: list[dict[str, Any]],
+    unchanged_count: int,
+    previous_iteration: int,
+) -> dict[str, Any]:
+    """
+    Merge carried-forward verdicts into a fact-check of the changed claims.
+
+    Args:
+        fact_check: Fact-check JSON covering only new or modified claims
+        carried: Issues returned by carry_forward_issues
+        unchanged_count: Number of unchanged claims whose verdicts were carried
+        previous_iteration: Iteration the verdicts were carried from
+
+    Returns:
+        Fact-check JSON covering the whole analysis
+    """
+    issues = json_objects(fact_check.get("issues"))
+    reported = {normalize_claim(str(i.get("claim", ""))) for i in issues}
+    issues.extend(
+        i for i in carried if normalize_claim(str(i.get("claim", ""))) not in reported
+    )
+
+    stats = dict(json_object(fact_check.get("statistics")))
+    stats["total_claims"] = _as_int(stats.get("total_claims", 0)) + unchanged_count
+    stats["verified_claims"] = _as_int(stats.get("verified_claims", 0)) + max(
+        unchanged_count - len(carried), 0
+    )
+    stats["carried_forward_claims"] = unchanged_count
+
+    merged: dict[str, Any] = {**fact_check, "issues": issues, "statistics": stats}
+    if not fact_check.get("iteration_recommendation"):
+        merged["iteration_recommendation"] = recommend_from_issues(issues)
+        merged["iteration_reason"] = (
+            f"No claims changed since iteration {previous_iteration}; "
+            + f"{unchanged_count} verdicts carried forward with {len(issues)} open issues."
+        )
+    elif (
+        fact_check.get("iteration_recommendation") == "approve"
+        and recommend_from_issues(issues) == "reject"
+    ):
+        merged["iteration_recommendation"] = "reject"
+        merged["iteration_reason"] = (
+            f"{fact_check.get('iteration_reason', '')} Unresolved issues carried "
+            + f"forward from iteration {previous_iteration} still require revision."
+        ).strip()
+
+    return merged
+
+
+def partition_claims(
+    claims: list[Claim], claims_per_shard: int, max_shards: int
+) -> list[list[Claim]]:
+    """
+    Partition claims into balanced shards, keeping each section together.
+
+    The shard count adapts to the number of claims: one shard per
+    claims_per_shard claims, capped at max_shards. Sections are assigned
+    largest first to the lightest shard so related claims (which often share
+    sources) are verified by the same session.
+
+    Args:
+        claims: Claims to verify
+        claims_per_shard: Target number of claims per shard
+        max_shards: Upper bound on the shard count
+
+    Returns:
+        Non-empty shards in document order; a single shard when sharding
+        would not help
+    """
+    if not claims:
+        return []
+
+    by_section: dict[str, list[Claim]] = {}
+    for claim in claims:
+        by_section.setdefault(claim.section, []).append(claim)
+
+    shard_count = min(
+        max(1, -(-len(claims) // max(claims_per_shard, 1))),
+        max(max_shards, 1),
+        len(by_section),
+    )
+    shards: list[list[Claim]] = [[] for _ in range(shard_count)]
+    for section_claims in sorted(by_section.values(), key=len, reverse=True):
+        min(shards, key=len).extend(section_claims)
+
+    order = {claim.key: i for i, claim in enumerate(claims)}
+    return [sorted(shard, key=lambda c: order[c.key]) for shard in shards if shard]
+
+
+def merge_shard_results(results: list[dict[str, object]]) -> dict[str, Any]:
+    """
+    Merge per-shard fact-check results into one fact-check.
+
+    Args:
+        results: Validated fact-check JSON from each shard
+
+    Returns:
+        Fact-check JSON with combined issues, summed statistics and a
+        recommendation recomputed from the combined issues
+    """
+    issues: list[dict[str, Any]] = []
+    stats: dict[str, int] = {}
+    for result in results:
+        issues.extend(json_objects(result.get("issues")))
+        for key, value in json_object(result.get("statistics")).items():
+            stats[key] = stats.get(key, 0) + _as_int(value)
+
+    severities = [str(i.get("severity", "")).lower() for i in issues]
+    counts = ", ".join(
+        f"{severities.count(level)} {level.title()}" for level in ("high", "medium", "low")
+    )
+    recommendation = recommend_from_issues(issues)
+    reasons = [
+        str(r.get("iteration_reason", "")).strip()
+        for r in results
+        if r.get("iteration_recommendation") == "reject" and r.get("iteration_reason")
+    ]
+    reason = f"Merged from {len(results)} shards: {counts} severity issues."
+    if recommendation == "reject" and reasons:
+        reason += " " + " ".join(reasons)
+
+    return {
+        "issues": issues,
+        "statistics": stats,
+        "iteration_recommendation": recommendation,
+        "iteration_reason": reason,
+    }
@@ -3,7 +3,7 @@
 
 import json
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, cast
 
 
 class JsonResponseValidator:
@@ -217,6 +217,30 @@ class JsonResponseValidator:
         except Exception as e:
             return False, f"Error reading file: {str(e)}"
 
+    def describe_problem(self, file_path: Path) -> str | None:
+        """
+        Describe why a JSON output file is unusable, after automatic fixes.
+
+        Args:
+            file_path: Path to the JSON file
+
+        Returns:
+            Problem description for the agent to act on, or None if the file
+            is valid or fix_common_issues can repair it
+        """
+        if not file_path.exists():
+            return f"The output file {file_path} does not exist."
+        try:
+            with open(file_path, "r") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            return f"The output file is not valid JSON: {e}"
+        if not isinstance(data, dict) or not data:
+            return "The output file is empty. Fill in the template structure."
+
+        is_valid, error_msg = self.validate(self.fix_common_issues(data))
+        return None if is_valid else error_msg
+
     def fix_common_issues(self, data: dict[str, Any]) -> dict[str, Any]:
         """
         Attempt to fix common issues in data.
@@ -368,5 +392,25 @@ class JsonResponseValidator:
             return obj if not self._contains_todo(obj) else None
 
 
+def json_object(value: object) -> dict[str, Any]:
+    """Narrow a parsed JSON value to an object (empty if it is not one)."""
+    return cast(dict[str, Any], value) if isinstance(value, dict) else {}
+
+
+def json_list(value: object) -> list[object]:
+    """Narrow a parsed JSON value to a list (empty if it is not one)."""
+    return cast(list[object], value) if isinstance(value, list) else []
+
+
+def json_objects(value: object) -> list[dict[str, Any]]:
+    """The objects in a parsed JSON list, skipping any other entries."""
+    return [json_object(item) for item in json_list(value) if isinstance(item, dict)]
+
+
+def load_json_object(text: str) -> dict[str, Any]:
+    """Parse JSON text into an object (empty if it holds something else)."""
+    return json_object(json.loads(text))
+
+
 # Backward compatibility alias
 FeedbackValidator = JsonResponseValidator
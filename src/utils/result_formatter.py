@@ -23,6 +23,8 @@ def format_pipeline_result(result: PipelineResult, with_review: bool) -> None:
     if with_review:
         # Review mode - show iteration info
         print(f"\n✅ Analysis completed after {iterations} iteration(s)")
+        if result.get("stop_reason"):
+            print(f"   Stopped: {result.get('stop_reason')}")
         if analysis_file:
             print(f"   Analysis: {analysis_file}")
         if feedback_file:
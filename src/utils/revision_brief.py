@@ -0,0 +1,238 @@
+"""Build a compact revision brief from reviewer and fact-check outputs.
+
+The raw feedback JSON files repeat a lot and carry fields the analyst does
+not act on (strengths, verification notes, evidence, statistics). This module
+turns them into a single deterministic markdown instruction set: issues are
+grouped by section, deduplicated, and ordered by severity.
+"""
+# pyright: reportAny=false, reportExplicitAny=false
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from .json_validator import json_list, json_object, json_objects
+
+# Severity tiers shared by reviewer and fact-checker outputs (lower = more urgent)
+TIER_LABELS: dict[int, str] = {
+    0: "Must Fix",
+    1: "Should Fix",
+    2: "Optional Polish",
+}
+
+_REVIEWER_TIERS: dict[str, int] = {
+    "critical_issues": 0,
+    "improvements": 1,
+    "minor_suggestions": 2,
+}
+
+_FACT_CHECK_TIERS: dict[str, int] = {
+    "high": 0,
+    "medium": 1,
+    "low": 2,
+}
+
+# Token overlap above which two issues in the same section are considered duplicates
+_DUPLICATE_THRESHOLD = 0.5
+
+
+@dataclass
+class BriefItem:
+    """A single actionable item in the revision brief."""
+
+    section: str
+    tier: int
+    text: str
+    suggestion: str
+    sources: list[str] = field(default_factory=list)
+
+
+def _words(text: str) -> set[str]:
+    """Lowercased word set used for overlap comparisons."""
+    return {w for w in re.findall(r"[a-z0-9$%.]+", text.lower()) if len(w) > 2}
+
+
+def _overlap(a: BriefItem, b: BriefItem) -> float:
+    """Jaccard overlap between two items' issue and suggestion text."""
+    words_a = _words(f"{a.text} {a.suggestion}")
+    words_b = _words(f"{b.text} {b.suggestion}")
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def _reviewer_items(feedback: dict[str, Any]) -> list[BriefItem]:
+    """Extract actionable items from reviewer feedback."""
+    items: list[BriefItem] = []
+    for key, tier in _REVIEWER_TIERS.items():
+        for entry in json_list(feedback.get(key)):
+            fields = json_object(entry)
+            if isinstance(entry, str):
+                items.append(BriefItem("General", tier, entry, "", ["reviewer"]))
+            elif isinstance(entry, dict):
+                items.append(
+                    BriefItem(
+                        section=str(fields.get("section") or "General"),
+                        tier=tier,
+                        text=str(fields.get("issue", "")).strip(),
+                        suggestion=str(fields.get("suggestion", "")).strip(),
+                        sources=["reviewer"],
+                    )
+                )
+    return items
+
+
+def _fact_check_items(fact_check: dict[str, Any]) -> list[BriefItem]:
+    """Extract actionable items from fact-check results."""
+    items: list[BriefItem] = []
+    for issue in json_objects(fact_check.get("issues")):
+        details = json_object(issue.get("details"))
+        tier = _FACT_CHECK_TIERS.get(str(issue.get("severity", "")).lower(), 1)
+
+        claim = str(issue.get("claim", "")).strip()
+        citation = str(details.get("citation_ref", "")).strip()
+        explanation = str(details.get("explanation", "")).strip()
+        text = f'"{claim}"'
+        if citation and citation.lower() not in ("none", "n/a"):
+            text += f" {citation}"
+        if explanation:
+            text += f" - {explanation}"
+
+        issue_type = str(details.get("issue_type", "")).strip()
+        items.append(
+            BriefItem(
+                section=str(issue.get("section") or "General"),
+                tier=tier,
+                text=text,
+                suggestion=str(details.get("suggestion", "")).strip(),
+                sources=[f"fact-check:{issue_type}" if issue_type else "fact-check"],
+            )
+        )
+    return items
+
+
+def _deduplicate(items: list[BriefItem]) -> list[BriefItem]:
+    """Merge overlapping items within the same section, keeping the most severe."""
+    kept: list[BriefItem] = []
+    for item in sorted(items, key=lambda i: i.tier):
+        duplicate = next(
+            (k for k in kept if is_same_issue(k, item)),
+            None,
+        )
+        if duplicate is None:
+            kept.append(item)
+        else:
+            for source in item.sources:
+                if source not in duplicate.sources:
+                    duplicate.sources.append(source)
+    return kept
+
+
+def build_revision_brief(
+    feedback: dict[str, Any] | None,
+    fact_check: dict[str, Any] | None,
+    iteration: int,
+) -> str:
+    """
+    Build a compact markdown revision brief.
+
+    Args:
+        feedback: Parsed reviewer feedback JSON (or None)
+        fact_check: Parsed fact-check JSON (or None)
+        iteration: Iteration the feedback was produced for
+
+    Returns:
+        Markdown brief with deduplicated issues grouped by severity and section
+    """
+    items: list[BriefItem] = []
+    lines = [f"# Revision Brief (feedback on iteration {iteration})", ""]
+
+    if feedback:
+        items.extend(_reviewer_items(feedback))
+        lines.append(
+            f"- Reviewer: {feedback.get('iteration_recommendation', 'unknown')}"
+            + f" - {feedback.get('iteration_reason', '')}".rstrip(" -")
+        )
+    if fact_check:
+        items.extend(_fact_check_items(fact_check))
+        lines.append(
+            f"- Fact-check: {fact_check.get('iteration_recommendation', 'unknown')}"
+            + f" - {fact_check.get('iteration_reason', '')}".rstrip(" -")
+        )
+
+    items = _deduplicate(items)
+    if not items:
+        lines.extend(["", "No actionable issues were raised."])
+        return "\n".join(lines) + "\n"
+
+    for tier, label in TIER_LABELS.items():
+        tier_items = [i for i in items if i.tier == tier]
+        if not tier_items:
+            continue
+        lines.extend(["", f"## {label}"])
+
+        # Sections keep the order in which they were first raised
+        sections: list[str] = []
+        for item in tier_items:
+            if item.section not in sections:
+                sections.append(item.section)
+
+        for section in sections:
+            lines.extend(["", f"### {section}", ""])
+            for item in tier_items:
+                if item.section != section:
+                    continue
+                entry = f"- {item.text}"
+                if item.suggestion:
+                    entry += f" -> {item.suggestion}"
+                entry += f" ({', '.join(item.sources)})"
+                lines.append(entry)
+
+    return "\n".join(lines) + "\n"
+
+
+def feedback_items(
+    feedback: dict[str, Any] | None,
+    fact_check: dict[str, Any] | None,
+) -> list[BriefItem]:
+    """
+    Extract deduplicated issues from reviewer and fact-check outputs.
+
+    Args:
+        feedback: Parsed reviewer feedback JSON (or None)
+        fact_check: Parsed fact-check JSON (or None)
+
+    Returns:
+        Items ordered by tier
+    """
+    items: list[BriefItem] = []
+    if feedback:
+        items.extend(_reviewer_items(feedback))
+    if fact_check:
+        items.extend(_fact_check_items(fact_check))
+    return _deduplicate(items)
+
+
+def is_same_issue(a: BriefItem, b: BriefItem) -> bool:
+    """Check whether two items raise the same issue in the same section."""
+    return (
+        a.section.lower() == b.section.lower()
+        and _overlap(a, b) >= _DUPLICATE_THRESHOLD
+    )
+
+
+def count_must_fix(
+    feedback: dict[str, Any] | None,
+    fact_check: dict[str, Any] | None,
+) -> int:
+    """
+    Count the "Must Fix" items (critical reviewer issues, High fact-check issues).
+
+    Args:
+        feedback: Parsed reviewer feedback JSON (or None)
+        fact_check: Parsed fact-check JSON (or None)
+
+    Returns:
+        Number of deduplicated top-severity items
+    """
+    return sum(1 for item in feedback_items(feedback, fact_check) if item.tier == 0)
@@ -0,0 +1,161 @@
+"""Split the analysis template into section groups and merge the results.
+
+Section-parallel generation gives each analyst sub-session a partial template
+holding only its group of sections plus a References section. Each part
+numbers its citations from [1], so merging renumbers them into one shared
+reference list, deduplicating sources cited by more than one part.
+"""
+
+import re
+
+from .analysis_sections import TITLE_KEY, parse_sections, render_sections
+from .claims import (
+    CITATION_PATTERN,
+    REFERENCE_ENTRY_PATTERN,
+    REFERENCE_SECTIONS,
+    expand_citation,
+)
+
+_URL = re.compile(r"https?://[^\s>)\]]+")
+
+
+def _is_references(name: str) -> bool:
+    """Check whether a section holds the reference list."""
+    return name.lower().startswith(REFERENCE_SECTIONS)
+
+
+def build_group_template(template: str, group: list[str]) -> str:
+    """
+    Build a partial analysis template containing only one group of sections.
+
+    Args:
+        template: Full analysis template markdown
+        group: Section names to keep
+
+    Returns:
+        Template with the title, the group's sections and the References section
+    """
+    sections = parse_sections(template)
+    kept = {
+        name: body
+        for name, body in sections.items()
+        if name == TITLE_KEY or name in group or _is_references(name)
+    }
+    return render_sections(kept)
+
+
+def _reference_key(entry: str) -> str:
+    """Identity of a reference: its URL, or its normalized text if it has none."""
+    match = _URL.search(entry)
+    return match.group(0).rstrip(".,") if match else " ".join(entry.lower().split())
+
+
+def merge_group_analyses(template: str, parts: list[str]) -> str:
+    """
+    Merge section-group analyses into a single analysis.
+
+    Sections follow the template order. The title comes from the first part.
+    Citations are renumbered into one reference list in order of first use.
+
+    Args:
+        template: Full analysis template markdown (defines section order)
+        parts: Completed partial analyses, one per section group
+
+    Returns:
+        Merged analysis markdown
+    """
+    section_order = [
+        name
+        for name in parse_sections(template)
+        if name != TITLE_KEY and not _is_references(name)
+    ]
+    references_name = next(
+        (name for name in parse_sections(template) if _is_references(name)),
+        "References",
+    )
+
+    merged_refs: list[str] = []
+    ref_index: dict[str, int] = {}
+    bodies: dict[str, str] = {}
+    title = ""
+
+    for part in parts:
+        sections = parse_sections(part)
+        if not title:
+            title = sections.get(TITLE_KEY, "")
+
+        # Local citation number -> reference entry
+        local_refs: dict[str, str] = {}
+        for name, body in sections.items():
+            if _is_references(name):
+                for line in body.splitlines():
+                    match = REFERENCE_ENTRY_PATTERN.match(line)
+                    if match:
+                        local_refs[match.group(1)] = match.group(2).strip()
+
+        def renumber(match: re.Match[str], refs: dict[str, str] = local_refs) -> str:
+            numbers: list[str] = []
+            for local in expand_citation(match.group(1)):
+                entry = refs.get(local)
+                if entry is None:
+                    return match.group(0)  # Unknown reference, leave untouched
+                key = _reference_key(entry)
+                if key not in ref_index:
+                    merged_refs.append(entry)
+                    ref_index[key] = len(merged_refs)
+                number = str(ref_index[key])
+                if number not in numbers:
+                    numbers.append(number)
+            return "[" + ", ".join(numbers) + "]"
+
+        for name, body in sections.items():
+            if name in section_order and name not in bodies:
+                bodies[name] = CITATION_PATTERN.sub(renumber, body)
+
+    result: dict[str, str] = {}
+    if title:
+        result[TITLE_KEY] = title
+    for name in section_order:
+        if name in bodies:
+            result[name] = bodies[name]
+    result[references_name] = "\n\n".join(
+        f"[{i}] {entry}" for i, entry in enumerate(merged_refs, start=1)
+    )
+    return render_sections(result)
+
+
+def render_research_cache(queries: list[str], results: list[dict[str, str]]) -> str:
+    """
+    Render the shared research cache read by concurrent section sub-sessions.
+
+    Args:
+        queries: Web searches run so far
+        results: Search results as {"title", "url"} dicts
+
+    Returns:
+        Markdown listing searches and unique sources
+    """
+    lines = [
+        "# Shared Research Cache",
+        "",
+        "Searches already run by the other section analysts. Reuse these sources",
+        "instead of repeating the searches. This file is refreshed as research runs.",
+        "",
+        "## Searches",
+        "",
+    ]
+    lines.extend(f"- {query}" for query in dict.fromkeys(queries))
+    if not queries:
+        lines.append("(none yet)")
+
+    lines.extend(["", "## Sources Found", ""])
+    seen: set[str] = set()
+    for result in results:
+        url = result.get("url", "")
+        if url and url not in seen:
+            seen.add(url)
+            lines.append(f"- {result.get('title', '') or url}: <{url}>")
+    if not seen:
+        lines.append("(none yet)")
+
+    return "\n".join(lines) + "\n"
@@ -18,3 +18,18 @@ def create_slug(idea: str, max_length: int = 50) -> str:
     slug = re.sub(r"[-\s]+", "-", slug)
     return slug[:max_length].strip("-")
 
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of model tokens in a text.
+
+    Uses the common ~4 characters per token heuristic, which is accurate
+    enough for comparing prompt sizes without a tokenizer dependency.
+
+    Args:
+        text: The text to measure
+
+    Returns:
+        Approximate token count
+    """
+    return (len(text) + 3) // 4
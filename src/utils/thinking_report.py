@@ -0,0 +1,193 @@
+"""Correlate extended-thinking volume with outcomes and duration across runs.
+
+Reads the run_summary.json files written by RunAnalytics and, per agent,
+groups iterations by the thinking budget they ran with. For each budget it
+reports the approval rate, average thinking volume and average duration,
+plus the correlation of thinking volume with duration and with approval.
+A budget whose approval rate matches a larger one at lower duration is a
+candidate for cutting.
+
+Usage:
+    python -m src.utils.thinking_report [logs/runs]
+"""
+# pyright: reportExplicitAny=false, reportAny=false
+
+import argparse
+import json
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class ThinkingSample:
+    """Thinking volume and result of one agent iteration."""
+
+    run_id: str
+    agent: str
+    iteration: int
+    budget: int | None
+    thinking_chars: int
+    duration_seconds: float
+    approved: bool | None  # None when the iteration was never reviewed
+
+
+@dataclass
+class BudgetStats:
+    """Aggregates for one agent at one thinking budget."""
+
+    samples: int = 0
+    approvals: int = 0
+    reviewed: int = 0
+    thinking_chars: list[int] = field(default_factory=list)
+    durations: list[float] = field(default_factory=list)
+
+    @property
+    def approval_rate(self) -> float | None:
+        """Fraction of reviewed iterations that were approved."""
+        return self.approvals / self.reviewed if self.reviewed else None
+
+
+def load_samples(runs_dir: Path) -> list[ThinkingSample]:
+    """
+    Load per-iteration thinking samples from run summaries.
+
+    Analyst iterations take the reviewer's outcome for the same iteration,
+    since the reviewer is what judges the analyst's work.
+
+    Args:
+        runs_dir: Directory holding one folder per run (e.g., logs/runs)
+
+    Returns:
+        Samples for every agent iteration found
+    """
+    samples: list[ThinkingSample] = []
+    for summary_file in sorted(runs_dir.glob("*/run_summary.json")):
+        try:
+            summary: dict[str, Any] = json.loads(summary_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            continue
+        metrics: dict[str, dict[str, Any]] = summary.get("agent_metrics", {})
+        outcomes = {
+            (m["agent_name"], m["iteration"]): m.get("outcome") for m in metrics.values()
+        }
+        for m in metrics.values():
+            outcome = m.get("outcome") or outcomes.get(("reviewer", m["iteration"]))
+            samples.append(
+                ThinkingSample(
+                    run_id=summary.get("run_id", summary_file.parent.name),
+                    agent=m["agent_name"],
+                    iteration=m["iteration"],
+                    budget=m.get("thinking_budget"),
+                    thinking_chars=m.get("total_thinking_length", 0),
+                    duration_seconds=m.get("duration_seconds") or 0.0,
+                    approved=None if outcome is None else outcome == "approve",
+                )
+            )
+    return samples
+
+
+def _correlation(xs: list[float], ys: list[float]) -> float | None:
+    """Pearson correlation, or None when it is undefined."""
+    if len(xs) < 3:
+        return None
+    try:
+        return statistics.correlation(xs, ys)
+    except statistics.StatisticsError:
+        return None  # Constant input
+
+
+def summarize(samples: list[ThinkingSample]) -> dict[str, dict[str, Any]]:
+    """
+    Aggregate samples per agent and thinking budget.
+
+    Args:
+        samples: Samples from load_samples
+
+    Returns:
+        Per agent: {"budgets": {budget: BudgetStats}, "corr_duration": float|None,
+        "corr_approval": float|None}
+    """
+    report: dict[str, dict[str, Any]] = {}
+    for agent in sorted({s.agent for s in samples}):
+        agent_samples = [s for s in samples if s.agent == agent]
+        budgets: dict[str, BudgetStats] = {}
+        for sample in agent_samples:
+            stats = budgets.setdefault(str(sample.budget or "default"), BudgetStats())
+            stats.samples += 1
+            stats.thinking_chars.append(sample.thinking_chars)
+            stats.durations.append(sample.duration_seconds)
+            if sample.approved is not None:
+                stats.reviewed += 1
+                stats.approvals += int(sample.approved)
+
+        reviewed = [s for s in agent_samples if s.approved is not None]
+        report[agent] = {
+            "budgets": budgets,
+            "corr_duration": _correlation(
+                [float(s.thinking_chars) for s in agent_samples],
+                [s.duration_seconds for s in agent_samples],
+            ),
+            "corr_approval": _correlation(
+                [float(s.thinking_chars) for s in reviewed],
+                [float(bool(s.approved)) for s in reviewed],
+            ),
+        }
+    return report
+
+
+def format_report(report: dict[str, dict[str, Any]]) -> str:
+    """
+    Render the summary as a plain-text table per agent.
+
+    Args:
+        report: Output of summarize
+
+    Returns:
+        Report text
+    """
+    if not report:
+        return "No run summaries found."
+
+    def fmt(value: float | None, spec: str) -> str:
+        return "-" if value is None else format(value, spec)
+
+    lines: list[str] = []
+    for agent, data in report.items():
+        lines.append(f"## {agent}")
+        lines.append(
+            f"{'budget':>10} {'n':>4} {'approved':>9} {'thinking':>10} {'duration':>9}"
+        )
+        budgets: dict[str, BudgetStats] = data["budgets"]
+        for budget, stats in budgets.items():
+            lines.append(
+                f"{budget:>10} {stats.samples:>4} "
+                + f"{fmt(stats.approval_rate, '.0%'):>9} "
+                + f"{statistics.mean(stats.thinking_chars):>10.0f} "
+                + f"{statistics.mean(stats.durations):>8.1f}s"
+            )
+        lines.append(
+            "corr(thinking, duration) = "
+            + fmt(data["corr_duration"], "+.2f")
+            + ", corr(thinking, approved) = "
+            + fmt(data["corr_approval"], "+.2f")
+        )
+        lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the thinking report for a runs directory."""
+    parser = argparse.ArgumentParser(
+        description="Correlate extended-thinking volume with outcomes and duration"
+    )
+    _ = parser.add_argument(
+        "runs_dir", nargs="?", default="logs/runs", help="Run summaries directory"
+    )
+    args = parser.parse_args(argv)
+    print(format_report(summarize(load_samples(Path(args.runs_dir)))), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,14 @@ from unittest.mock import patch, AsyncMock
 
 import pytest
 from claude_code_sdk.types import (
+    AssistantMessage,
     ResultMessage,
+    ToolUseBlock,
 )
 
 from src.agents.analyst import AnalystAgent
 from src.core.config import AnalystConfig
+from src.core.run_analytics import RunAnalytics
 from src.core.types import AnalystContext, Success, Error
 from tests.fixtures.test_data import TEST_IDEAS
 from tests.unit.base_test import BaseAgentTest
@@ -88,6 +91,33 @@ class TestAnalystAgent(BaseAgentTest):
             assert context.analysis_output_path.exists()
             assert context.analysis_output_path.read_text().startswith("# Analysis")
 
+    @pytest.mark.asyncio
+    async def test_auxiliary_session_keeps_own_metrics(
+        self, config: AnalystConfig, context: AnalystContext
+    ):
+        """Test that a session with its own analytics name leaves the analyst's untouched."""
+        assert self.temp_dir is not None
+        analytics = RunAnalytics(run_id="run", output_dir=self.temp_dir)
+        context.run_analytics = analytics
+        context.analytics_name = "analyst_enrichment"
+
+        with patch("src.agents.analyst.ClaudeSDKClient") as MockClient:
+            mock_client = self._create_mock_client()
+            MockClient.return_value = mock_client
+
+            async def mock_receive():
+                context.analysis_output_path.write_text("# Analysis\nContent here")
+                yield self._create_result_message(is_error=False)
+
+            mock_client.receive_response = mock_receive
+            result = await AnalystAgent(config).process(TEST_IDEAS["simple"], context)
+
+        assert isinstance(result, Success)
+        metrics = analytics.agent_metrics[("analyst_enrichment", 1)]
+        assert (metrics.num_turns, metrics.max_turns) == (1, 10)
+        assert ("analyst", 1) not in analytics.agent_metrics
+        analytics.finalize()
+
     @pytest.mark.asyncio
     async def test_failure_when_no_file_created(
         self, config: AnalystConfig, context: AnalystContext
@@ -247,3 +277,83 @@ class TestAnalystAgent(BaseAgentTest):
         # Should raise ValueError for missing context
         with pytest.raises(ValueError, match="Analyst requires context"):
             _ = await agent.process("test idea", None)
+
+    @pytest.mark.asyncio
+    async def test_lint_gate_sends_fixes_in_same_session(
+        self, config: AnalystConfig, context: AnalystContext
+    ):
+        """Test that blocking lint issues trigger a follow-up query before returning."""
+        config.lint_gate = True
+        config.min_words = 5
+        _ = context.analysis_output_path.write_text(
+            "# Title\n\n## What We Do\n\n[TODO: describe]\n"
+        )
+        drafts = [
+            "# CropBot\n\n## What We Do\n\n[TODO: describe]\n",
+            "# CropBot\n\n## What We Do\n\nCropBot rents robot teams to small farms.\n",
+        ]
+        queries: list[str] = []
+
+        with patch("src.agents.analyst.ClaudeSDKClient") as MockClient:
+            mock_client = self._create_mock_client()
+            MockClient.return_value = mock_client
+
+            async def mock_query(prompt: str):
+                queries.append(prompt)
+
+            async def mock_receive():
+                context.analysis_output_path.write_text(drafts[len(queries) - 1])
+                yield self._create_result_message()
+
+            mock_client.query = mock_query
+            mock_client.receive_response = mock_receive
+
+            agent = AnalystAgent(config)
+            result = await agent.process(TEST_IDEAS["simple"], context)
+
+        assert isinstance(result, Success)
+        assert len(queries) == 2
+        assert "Template TODO marker" in queries[1]
+
+    @pytest.mark.asyncio
+    async def test_search_over_budget_is_interrupted(
+        self, config: AnalystConfig, context: AnalystContext
+    ):
+        """Test that a search over budget interrupts the turn and sends a correction."""
+        config.max_websearches = 1
+        queries: list[str] = []
+
+        with patch("src.agents.analyst.ClaudeSDKClient") as MockClient:
+            mock_client = self._create_mock_client()
+            MockClient.return_value = mock_client
+
+            async def mock_query(prompt: str):
+                queries.append(prompt)
+
+            async def mock_receive():
+                if len(queries) == 1:
+                    for number in range(2):
+                        yield AssistantMessage(
+                            content=[
+                                ToolUseBlock(
+                                    id=f"search_{number}",
+                                    name="WebSearch",
+                                    input={"query": "farm robots"},
+                                )
+                            ],
+                            model="test-model",
+                        )
+                else:
+                    context.analysis_output_path.write_text("# Analysis\nContent")
+                yield self._create_result_message()
+
+            mock_client.query = mock_query
+            mock_client.receive_response = mock_receive
+
+            agent = AnalystAgent(config)
+            result = await agent.process(TEST_IDEAS["simple"], context)
+
+        assert isinstance(result, Success)
+        mock_client.interrupt.assert_awaited_once()
+        assert len(queries) == 2
+        assert "Budget reached" in queries[1]
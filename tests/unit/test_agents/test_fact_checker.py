@@ -421,3 +421,202 @@ Everyone is doing AI now.
         assert isinstance(result, Success)
         # Analytics should have recorded the run
         assert analytics.webfetch_count >= 0  # May or may not have fetches
+
+    def _setup_incremental(self, config, context, revised: str):
+        """Write a previous iteration and fact-check for incremental tests."""
+        assert self.temp_dir is not None
+        config.incremental = True
+        config.prompts_dir = Path("config/prompts").resolve()
+        config.system_prompt = "agents/factchecker/system.md"
+        previous = self.temp_dir / "iteration_1.md"
+        previous.write_text(context.analysis_input_path.read_text())
+        previous_fact_check = self.temp_dir / "fact_check_iteration_1.json"
+        previous_fact_check.write_text(
+            json.dumps(
+                {
+                    "issues": [
+                        {
+                            "claim": "Major competitors include OpenAI, Google, and Anthropic",
+                            "section": "Competition",
+                            "severity": "High",
+                            "details": {"issue_type": "false_citation"},
+                        }
+                    ],
+                    "statistics": {"total_claims": 3, "verified_claims": 2},
+                    "iteration_recommendation": "reject",
+                    "iteration_reason": "False citation.",
+                }
+            )
+        )
+        context.analysis_input_path.write_text(revised)
+        context.iteration = 2
+        context.previous_analysis_path = previous
+        context.previous_fact_check_path = previous_fact_check
+
+    @pytest.mark.asyncio
+    async def test_incremental_skips_agent_when_no_claims_changed(
+        self, config, context
+    ):
+        """Test that unchanged claims reuse previous verdicts without a session."""
+        self._setup_incremental(config, context, context.analysis_input_path.read_text())
+        agent = FactCheckerAgent(config)
+
+        with patch("src.agents.fact_checker.ClaudeSDKClient") as MockClient:
+            with patch.object(
+                agent, "_validate_analysis_path", return_value=context.analysis_input_path
+            ):
+                result = await agent.process("", context)
+
+        assert isinstance(result, Success)
+        MockClient.assert_not_called()
+        fact_check = json.loads(context.fact_check_output_path.read_text())
+        assert fact_check["iteration_recommendation"] == "reject"
+        assert fact_check["issues"][0]["carried_forward_from"] == 1
+        assert fact_check["statistics"]["total_claims"] == 3
+
+    @pytest.mark.asyncio
+    async def test_incremental_sends_only_changed_claims(self, config, context):
+        """Test that only modified claims are listed for verification."""
+        original = context.analysis_input_path.read_text()
+        self._setup_incremental(config, context, original.replace("$150B", "$180B"))
+        agent = FactCheckerAgent(config)
+
+        mock_client = self._create_mock_client()
+
+        async def mock_receive():
+            # Agent verifies the one changed claim and approves
+            context.fact_check_output_path.write_text(
+                json.dumps(
+                    {
+                        "issues": [],
+                        "statistics": {"total_claims": 1, "verified_claims": 1},
+                        "iteration_recommendation": "approve",
+                        "iteration_reason": "Updated market figure is supported.",
+                    }
+                )
+            )
+            yield self._create_result_message(is_error=False)
+
+        mock_client.receive_response = mock_receive
+
+        with patch("src.agents.fact_checker.ClaudeSDKClient", return_value=mock_client):
+            with patch.object(
+                agent, "_validate_analysis_path", return_value=context.analysis_input_path
+            ):
+                result = await agent.process("", context)
+
+        assert isinstance(result, Success)
+        prompt = mock_client.query.call_args[0][0]
+        assert "Incremental Fact-Check" in prompt
+        assert "$180B in 2024" in prompt
+        assert "38% CAGR" not in prompt
+        assert "gartner ai report 2024" in prompt
+
+        # Carried-forward High issue overrides the template's approval
+        fact_check = json.loads(context.fact_check_output_path.read_text())
+        assert fact_check["iteration_recommendation"] == "reject"
+        assert fact_check["statistics"]["total_claims"] == 3
+
+    @pytest.mark.asyncio
+    async def test_sharded_fact_check_merges_shard_outputs(self, config, context):
+        """Test that claims are split across sessions and merged into one file."""
+        config.sharded = True
+        config.claims_per_shard = 1
+        config.prompts_dir = Path("config/prompts").resolve()
+        config.system_prompt = "agents/factchecker/system.md"
+        agent = FactCheckerAgent(config)
+
+        prompts: list[str] = []
+
+        def make_client(*_args, **_kwargs):
+            mock_client = self._create_mock_client()
+
+            async def mock_query(prompt: str):
+                prompts.append(prompt)
+                shard_file = Path(
+                    prompt.split("**Fact-check output**: ")[1].splitlines()[0]
+                )
+                severity = "High" if "Competition" in prompt.split("## Claims")[1] else "Low"
+                shard_file.write_text(
+                    json.dumps(
+                        {
+                            "issues": [{"claim": shard_file.name, "severity": severity}],
+                            "statistics": {"total_claims": 1, "verified_claims": 1},
+                            "iteration_recommendation": "approve",
+                            "iteration_reason": "Checked.",
+                        }
+                    )
+                )
+
+            async def mock_receive():
+                yield self._create_result_message(is_error=False)
+
+            mock_client.query = mock_query
+            mock_client.receive_response = mock_receive
+            return mock_client
+
+        with patch("src.agents.fact_checker.ClaudeSDKClient", side_effect=make_client):
+            with patch.object(
+                agent, "_validate_analysis_path", return_value=context.analysis_input_path
+            ):
+                result = await agent.process("", context)
+
+        assert isinstance(result, Success)
+        # Market Analysis (2 claims) and Competition (1 claim) -> 2 shards
+        assert len(prompts) == 2
+        assert all("Shard" in p and "at most 5 WebFetch" in p for p in prompts)
+
+        fact_check = json.loads(context.fact_check_output_path.read_text())
+        assert len(fact_check["issues"]) == 2
+        assert fact_check["statistics"]["total_claims"] == 2
+        assert fact_check["iteration_recommendation"] == "reject"
+
+    @pytest.mark.asyncio
+    async def test_prefetch_results_appended_to_prompt(self, config, context):
+        """Test that background pre-verifications are passed to the session."""
+        from src.research import FetchResult, pre_verify
+        from src.utils.claims import extract_claims
+
+        config.prompts_dir = Path("config/prompts").resolve()
+        config.system_prompt = "agents/factchecker/system.md"
+        agent = FactCheckerAgent(config)
+
+        claim = extract_claims(context.analysis_input_path.read_text())[0]
+        page = FetchResult(url="https://a", status=200, text="nothing relevant")
+        prefetch_file = context.fact_check_output_path.with_name("prefetch.json")
+        prefetch_file.write_text(
+            json.dumps([pre_verify(claim, "1", "https://a", page).__dict__])
+        )
+        context.prefetch_results_path = prefetch_file
+
+        prompts: list[str] = []
+        mock_client = self._create_mock_client()
+
+        async def mock_query(prompt: str):
+            prompts.append(prompt)
+            context.fact_check_output_path.write_text(
+                json.dumps(
+                    {
+                        "issues": [],
+                        "statistics": {"total_claims": 1},
+                        "iteration_recommendation": "approve",
+                        "iteration_reason": "Checked.",
+                    }
+                )
+            )
+
+        async def mock_receive():
+            yield self._create_result_message(is_error=False)
+
+        mock_client.query = mock_query
+        mock_client.receive_response = mock_receive
+
+        with patch("src.agents.fact_checker.ClaudeSDKClient", return_value=mock_client):
+            with patch.object(
+                agent, "_validate_analysis_path", return_value=context.analysis_input_path
+            ):
+                result = await agent.process("", context)
+
+        assert isinstance(result, Success)
+        assert "## Pre-verified Citations" in prompts[0]
+        assert claim.text in prompts[0]
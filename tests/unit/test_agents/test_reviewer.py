@@ -106,6 +106,72 @@ class TestReviewerAgent(BaseAgentTest):
                 # Verify it's valid JSON
                 _ = json.loads(context.feedback_output_path.read_text())  # pyright: ignore[reportAny]
 
+    @pytest.mark.asyncio
+    async def test_model_selection_per_iteration(
+        self, config: ReviewerConfig, context: ReviewerContext
+    ):
+        """Test that the iteration's model and the fallback reach the SDK options."""
+        config.model = "haiku"
+        config.fallback_model = "sonnet"
+        config.iteration_models = {1: "opus"}
+
+        with patch(
+            "src.agents.reviewer.ReviewerAgent._validate_analysis_path"
+        ) as mock_validate:
+            mock_validate.return_value = context.analysis_input_path
+
+            with patch("src.agents.reviewer.ClaudeSDKClient") as MockClient:
+                mock_client = self._create_mock_client()
+                MockClient.return_value = mock_client
+
+                async def mock_receive():
+                    _ = context.feedback_output_path.write_text(
+                        json.dumps({"iteration_recommendation": "approve"})
+                    )
+                    yield self._create_result_message(is_error=False)
+
+                mock_client.receive_response = mock_receive
+                _ = await ReviewerAgent(config).process("", context)
+
+                options = MockClient.call_args.kwargs["options"]
+                assert options.model == "opus"
+                assert options.extra_args == {"fallback-model": "sonnet"}
+
+    @pytest.mark.asyncio
+    async def test_thinking_budget_passed_to_cli(
+        self, config: ReviewerConfig, context: ReviewerContext
+    ):
+        """Test that a configured thinking budget becomes a CLI flag and is recorded."""
+        from src.core.run_analytics import RunAnalytics
+
+        config.max_thinking_tokens = 4000
+        config.iteration_thinking_tokens = {1: 2000}
+        assert self.temp_dir is not None
+        context.run_analytics = RunAnalytics("test", self.temp_dir / "runs")
+
+        with patch(
+            "src.agents.reviewer.ReviewerAgent._validate_analysis_path"
+        ) as mock_validate:
+            mock_validate.return_value = context.analysis_input_path
+
+            with patch("src.agents.reviewer.ClaudeSDKClient") as MockClient:
+                mock_client = self._create_mock_client()
+                MockClient.return_value = mock_client
+
+                async def mock_receive():
+                    _ = context.feedback_output_path.write_text(
+                        json.dumps({"iteration_recommendation": "approve"})
+                    )
+                    yield self._create_result_message(is_error=False)
+
+                mock_client.receive_response = mock_receive
+                _ = await ReviewerAgent(config).process("", context)
+
+                options = MockClient.call_args.kwargs["options"]
+                assert options.extra_args == {"max-thinking-tokens": "2000"}
+                metrics = context.run_analytics.agent_metrics[("reviewer", 1)]
+                assert metrics.thinking_budget == 2000
+
     @pytest.mark.asyncio
     async def test_failure_when_no_feedback_created(
         self, config: ReviewerConfig, context: ReviewerContext
@@ -276,3 +342,148 @@ class TestReviewerAgent(BaseAgentTest):
                     assert isinstance(result, Success)
                     feedback_data = json.loads(context.feedback_output_path.read_text())
                     assert feedback_data["iteration_recommendation"] == recommendation
+
+    @pytest.mark.asyncio
+    async def test_inline_artifacts_embeds_analysis_in_prompt(
+        self, config: ReviewerConfig, context: ReviewerContext
+    ):
+        """Test that inline mode sends the analysis content with the user prompt."""
+        config.inline_artifacts = True
+
+        with patch(
+            "src.agents.reviewer.ReviewerAgent._validate_analysis_path"
+        ) as mock_validate:
+            mock_validate.return_value = context.analysis_input_path
+
+            with patch("src.agents.reviewer.ClaudeSDKClient") as MockClient:
+                mock_client = self._create_mock_client()
+                MockClient.return_value = mock_client
+
+                async def mock_receive():
+                    feedback = {
+                        "overall_assessment": "Solid analysis.",
+                        "iteration_recommendation": "approve",
+                        "iteration_reason": "Analysis meets all requirements",
+                    }
+                    _ = context.feedback_output_path.write_text(json.dumps(feedback))
+                    yield self._create_result_message(is_error=False)
+
+                mock_client.receive_response = mock_receive
+                agent = ReviewerAgent(config)
+                result = await agent.process("", context)
+
+                assert isinstance(result, Success)
+                user_prompt = mock_client.query.call_args[0][0]  # pyright: ignore[reportAny]
+                assert "## Inlined Files" in user_prompt
+                assert "Content here." in user_prompt
+
+    @pytest.mark.asyncio
+    async def test_incremental_review_sends_only_changed_sections(
+        self, config: ReviewerConfig, context: ReviewerContext
+    ):
+        """Test that incremental mode builds the prompt from the section diff."""
+        assert self.temp_dir is not None
+        config.incremental_review = True
+        config.prompts_dir = Path("config/prompts").resolve()
+        context.iteration = 2
+
+        iteration_dir = context.analysis_input_path.parent
+        previous = iteration_dir / "iteration_1.md"
+        _ = previous.write_text(
+            "# Title\n\n## What We Do\n\nWe rent robots.\n\n"
+            + "## Market Size\n\nThe market is $25B.\n"
+        )
+        _ = context.analysis_input_path.write_text(
+            "# Title\n\n## What We Do\n\nWe rent robots.\n\n"
+            + "## Market Size\n\nThe market is $14B per the USDA.\n"
+        )
+        previous_feedback = iteration_dir / "reviewer_feedback_iteration_1.json"
+        _ = previous_feedback.write_text('{"critical_issues": [{"issue": "Bad TAM"}]}')
+        context.previous_analysis_path = previous
+        context.previous_feedback_path = previous_feedback
+
+        with patch(
+            "src.agents.reviewer.ReviewerAgent._validate_analysis_path"
+        ) as mock_validate:
+            mock_validate.return_value = context.analysis_input_path
+
+            with patch("src.agents.reviewer.ClaudeSDKClient") as MockClient:
+                mock_client = self._create_mock_client()
+                MockClient.return_value = mock_client
+
+                async def mock_receive():
+                    feedback = {
+                        "overall_assessment": "Fixed.",
+                        "iteration_recommendation": "approve",
+                        "iteration_reason": "TAM issue resolved",
+                    }
+                    _ = context.feedback_output_path.write_text(json.dumps(feedback))
+                    yield self._create_result_message(is_error=False)
+
+                mock_client.receive_response = mock_receive
+                agent = ReviewerAgent(config)
+                result = await agent.process("", context)
+
+                assert isinstance(result, Success)
+                user_prompt = mock_client.query.call_args[0][0]  # pyright: ignore[reportAny]
+                assert "Incremental Review" in user_prompt
+                assert "$14B per the USDA" in user_prompt
+                assert "Bad TAM" in user_prompt
+                # Unchanged section appears only as a summary line
+                assert "- **What We Do**: We rent robots." in user_prompt
+
+    @pytest.mark.asyncio
+    async def test_missing_feedback_repaired_in_session(
+        self, config: ReviewerConfig, context: ReviewerContext
+    ):
+        """Test that a repair turn on the open session recovers missing feedback."""
+        from src.core.run_analytics import RunAnalytics
+
+        assert self.temp_dir is not None
+        assert self.temp_dir is not None
+        context.run_analytics = RunAnalytics("test", self.temp_dir / "runs")
+        queries: list[str] = []
+
+        with patch(
+            "src.agents.reviewer.ReviewerAgent._validate_analysis_path",
+            return_value=context.analysis_input_path,
+        ):
+            with patch("src.agents.reviewer.ClaudeSDKClient") as MockClient:
+                mock_client = self._create_mock_client()
+                MockClient.return_value = mock_client
+
+                async def mock_query(prompt: str):
+                    queries.append(prompt)
+
+                async def mock_receive():
+                    # Only the repair turn writes the feedback
+                    if len(queries) > 1:
+                        feedback = {
+                            "overall_assessment": "Solid.",
+                            "iteration_recommendation": "approve",
+                            "iteration_reason": "Meets the bar.",
+                        }
+                        _ = context.feedback_output_path.write_text(json.dumps(feedback))
+                    yield self._create_result_message(is_error=False)
+
+                mock_client.query = mock_query
+                mock_client.receive_response = mock_receive
+                result = await ReviewerAgent(config).process("", context)
+
+        assert isinstance(result, Success)
+        assert len(queries) == 2
+        assert "was not filled in" in queries[1]
+        assert context.run_analytics.repairs[0]["succeeded"] is True
+        assert context.run_analytics.repairs[0]["turns"] == 1
+
+    def test_session_limits_appended_after_static_prompt(self, config: ReviewerConfig):
+        """Test that limits vary only at the end so the prompt prefix is cacheable."""
+        agent = ReviewerAgent(config)
+
+        few = agent.build_system_prompt(max_websearches=2)
+        many = agent.build_system_prompt(max_websearches=9)
+
+        static = agent.load_system_prompt().rstrip()
+        assert few.startswith(static) and many.startswith(static)
+        assert "{max_websearches}" not in few
+        assert few.endswith("2 web searches max | Tools: Read, Edit, WebSearch, WebFetch, TodoWrite\n")
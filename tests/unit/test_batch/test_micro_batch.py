@@ -0,0 +1,82 @@
+"""Unit tests for micro-batched analyst sessions."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.batch.micro_batch import plan_micro_batches, run_micro_batch
+from src.core.config import AnalystConfig, SystemConfig
+from src.core.types import AnalystContext, Error
+
+TEMPLATE = "# [Title]\n\n## What We Do\n\n[TODO: 100 words]\n\n## Market Size\n\n[TODO: 100 words]\n"
+COMPLETE = "# Idea\n\n## What We Do\n\nWe rent robots.\n\n## Market Size\n\nLarge and growing.\n"
+
+
+@pytest.fixture
+def system_config(tmp_path, monkeypatch):
+    """Create a system configuration with an analyst template."""
+    monkeypatch.chdir(tmp_path)  # Run analytics are written to logs/runs
+    template_dir = tmp_path / "config" / "templates" / "agents" / "analyst"
+    template_dir.mkdir(parents=True)
+    _ = (template_dir / "analysis.md").write_text(TEMPLATE)
+    return SystemConfig(
+        project_root=tmp_path,
+        analyses_dir=tmp_path / "analyses",
+        config_dir=tmp_path / "config",
+        logs_dir=tmp_path / "logs",
+    )
+
+
+class TestPlanMicroBatches:
+    """Test grouping of ideas into micro-batches."""
+
+    def test_groups_short_ideas(self):
+        """Test that short ideas are grouped and long ones run alone."""
+        ideas = [("A", ""), ("B", ""), ("C", "x" * 500), ("D", ""), ("E", "")]
+
+        groups, singles = plan_micro_batches(ideas, size=3, max_chars=300)
+
+        assert groups == [[("A", ""), ("B", ""), ("D", "")]]
+        assert singles == [("C", "x" * 500), ("E", "")]
+
+    def test_disabled(self):
+        """Test that a size below two disables micro-batching."""
+        groups, singles = plan_micro_batches([("A", ""), ("B", "")], size=1, max_chars=300)
+
+        assert groups == []
+        assert singles == [("A", ""), ("B", "")]
+
+
+class TestRunMicroBatch:
+    """Test the shared analyst session for a group of ideas."""
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_keeps_completed_drafts(self, system_config):
+        """Test that one unfinished idea doesn't sink the others."""
+        seen: list[AnalystContext] = []
+
+        async def write_first_only(_idea: str, context: AnalystContext):
+            seen.append(context)
+            _ = context.analysis_output_path.write_text(COMPLETE)
+            return Error(message="Agent failed to write analysis")
+
+        with patch("src.batch.micro_batch.AnalystAgent") as agent_class:
+            agent_class.return_value.process = AsyncMock(side_effect=write_first_only)
+            outcomes = await run_micro_batch(
+                [("Robot farms", ""), ("Drone deliveries", "")],
+                system_config,
+                AnalystConfig(max_turns=10, prompts_dir=Path("config/prompts")),
+            )
+
+        assert [o.slug for o in outcomes] == ["robot-farms", "drone-deliveries"]
+        assert [o.succeeded for o in outcomes] == [True, False]
+        assert outcomes[0].analysis_file.exists()
+        # The unfinished idea falls back to its own session from the template
+        assert not outcomes[1].analysis_file.exists()
+
+        context = seen[0]
+        assert context.extra_output_paths == [outcomes[1].analysis_file]
+        assert context.prompt_vars["idea_count"] == "2"
+        assert agent_class.call_args.args[0].max_turns == 20
+        assert list(Path("logs/runs").glob("*_micro_batch_robot-farms/run_summary.json"))
@@ -4,9 +4,11 @@ import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
+from pathlib import Path
 
 from src.batch.processor import BatchProcessor, show_progress
 from src.core.config import SystemConfig, AnalystConfig, ReviewerConfig, FactCheckerConfig
+from src.batch.micro_batch import MicroBatchOutcome
 from src.core.types import PipelineMode, PipelineResult
 
 
@@ -216,6 +218,45 @@ class TestBatchProcessor:
                     assert results["success-idea"]["success"] is True
                     assert results["failure-idea"]["success"] is False
     
+    @pytest.mark.asyncio
+    async def test_micro_batch_groups_short_ideas(self, batch_processor, capsys):
+        """Test that short ideas share a first-draft session and are compared."""
+        batch_processor.micro_batch_size = 2
+        
+        async def drafts(group, *_):
+            return [
+                MicroBatchOutcome(
+                    slug=title.lower(), idea=title, analysis_file=Path(f"{title}.md"),
+                    succeeded=title == "Alpha", cost_share_usd=0.5,
+                )
+                for title, _ in group
+            ]
+        
+        with patch('src.batch.processor.run_micro_batch', side_effect=drafts) as mock_run:
+            with patch('src.batch.processor.AnalysisPipeline') as mock_pipeline_class:
+                mock_pipeline_class.return_value.process = AsyncMock(
+                    side_effect=lambda: {"success": True, "cost_usd": 0.25}
+                )
+                results = await batch_processor.process_batch(
+                    [("Alpha", ""), ("Beta", ""), ("Gamma", "x" * 400)]
+                )
+        
+        assert mock_run.call_count == 1
+        assert len(results) == 3
+        first_drafts = {
+            call.kwargs["idea"]: call.kwargs["first_draft_ready"]
+            for call in mock_pipeline_class.call_args_list
+        }
+        assert first_drafts["Alpha"] is True
+        assert first_drafts["Beta"] is False  # Falls back to its own session
+        assert first_drafts["Gamma\n\n" + "x" * 400] is False
+        
+        comparison = batch_processor.micro_batch_comparison()
+        assert comparison["micro_batched"]["ideas"] == 2
+        assert comparison["micro_batched"]["cost_per_idea_usd"] == pytest.approx(0.75)
+        assert comparison["single"]["cost_per_idea_usd"] == pytest.approx(0.25)
+        assert "Micro-batching (amortized per idea)" in capsys.readouterr().out
+    
     def test_display_summary(self, batch_processor, capsys):
         """Test the display_summary method."""
         # Set up test data
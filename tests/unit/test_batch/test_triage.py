@@ -0,0 +1,128 @@
+"""Unit tests for triage screening."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from claude_code_sdk import AssistantMessage, ResultMessage, TextBlock
+
+from src.batch.processor import BatchProcessor
+from src.batch.triage import (
+    TriageEntry,
+    TriageStore,
+    idea_key,
+    parse_scores,
+    screen_ideas,
+    select_promoted,
+)
+from src.core.config import AnalystConfig, FactCheckerConfig, ReviewerConfig, SystemConfig
+from src.core.types import PipelineMode
+
+
+def make_entry(title: str, score: float, description: str = "") -> TriageEntry:
+    """Create a screening result for an idea."""
+    return TriageEntry(
+        key=idea_key(title, description),
+        slug=title.lower(),
+        title=title,
+        score=score,
+        rationale="",
+        screened_at="2025-01-01T00:00:00",
+    )
+
+
+class TestTriage:
+    """Test scoring, promotion and the triage store."""
+
+    def test_parse_scores_skips_invalid_entries(self):
+        """Test that out-of-range ids and scores are ignored."""
+        text = (
+            '{"scores": [{"id": 1, "score": 8, "rationale": "Big market"},'
+            + ' {"id": 2, "score": 42}, {"id": 7, "score": 5}, {"score": 3}]}'
+        )
+
+        scores = parse_scores(text, [("A", ""), ("B", "")])
+
+        assert scores == {0: (8.0, "Big market")}
+        assert parse_scores("not json", [("A", "")]) == {}
+        fenced = 'Scores:\n```json\n{"scores": [{"id": 1, "score": 7}]}\n```'
+        assert parse_scores(fenced, [("A", "")]) == {0: (7.0, "")}
+
+    @pytest.mark.asyncio
+    async def test_screening_session_has_no_tools(self, tmp_path, monkeypatch):
+        """Test that screening runs a tool-less session with its own system prompt."""
+        monkeypatch.chdir(tmp_path)
+        calls = []
+
+        async def fake_query(prompt, options):
+            calls.append((prompt, options))
+            reply = '```json\n{"scores": [{"id": 2, "score": 8, "rationale": "Timing"}]}\n```'
+            yield AssistantMessage(content=[TextBlock(text=reply)], model="test")
+            yield ResultMessage(
+                subtype="success",
+                duration_ms=10,
+                duration_api_ms=10,
+                is_error=False,
+                num_turns=1,
+                session_id="s",
+            )
+
+        config = AnalystConfig(prompts_dir=Path(__file__).parents[3] / "config" / "prompts")
+        with patch("src.batch.triage.query", fake_query):
+            entries = await screen_ideas(
+                [("A", "First"), ("B", "Second")], config, tmp_path / "out" / "1.json"
+            )
+
+        [(prompt, options)] = calls
+        assert options.allowed_tools == []
+        assert "screening" in options.system_prompt
+        assert "### Idea 2" in prompt and "{ideas}" not in prompt
+        assert [(e.title, e.score) for e in entries] == [("B", 8.0)]
+        assert '"score": 8' in (tmp_path / "out" / "1.json").read_text()
+
+    def test_select_promoted(self):
+        """Test threshold and top-K promotion."""
+        entries = [make_entry("A", 6), make_entry("B", 9), make_entry("C", 7.5)]
+
+        assert [e.title for e in select_promoted(entries, 7)] == ["B", "C"]
+        assert [e.title for e in select_promoted(entries, 0, top_k=1)] == ["B"]
+
+    def test_store_round_trip_and_edits(self, tmp_path):
+        """Test that stored scores survive reloads but not idea edits."""
+        store = TriageStore(tmp_path / "triage.json")
+        store.put(make_entry("A", 8, "Original description"))
+        store.save()
+
+        reloaded = TriageStore(tmp_path / "triage.json")
+
+        entry = reloaded.get("A", "Original description")
+        assert entry is not None and entry.score == 8
+        assert reloaded.get("A", "Edited description") is None
+
+    @pytest.mark.asyncio
+    async def test_triage_batch_only_screens_new_ideas(self, tmp_path):
+        """Test that unchanged ideas keep their stored score."""
+        store = TriageStore(tmp_path / "triage.json")
+        store.put(make_entry("Known", 8))
+        store.save()
+        analyst_config = AnalystConfig(triage_batch_size=10)
+        processor = BatchProcessor(
+            system_config=Mock(spec=SystemConfig),
+            analyst_config=analyst_config,
+            reviewer_config=Mock(spec=ReviewerConfig),
+            fact_checker_config=Mock(spec=FactCheckerConfig),
+            mode=PipelineMode.TRIAGE,
+        )
+
+        async def score(group, *_):
+            return [make_entry(title, 5) for title, _ in group]
+
+        with patch("src.batch.processor.screen_ideas", side_effect=score) as mock_screen:
+            results = await processor.process_batch(
+                [("Known", ""), ("New", "")], pending_file=tmp_path / "pending.md"
+            )
+
+        assert mock_screen.call_args.args[0] == [("New", "")]
+        assert results["known"].get("score") == 8
+        assert results["new"].get("score") == 5
+        assert TriageStore(tmp_path / "triage.json").get("New", "") is not None
@@ -99,6 +99,22 @@ class TestConfiguration(BaseAgentTest):
         assert config.allowed_tools == original_tools
         assert "NewTool" not in config.allowed_tools
 
+    def test_model_for_iteration(self):
+        """Test that per-iteration models override the agent's model."""
+        config = ReviewerConfig(model="sonnet", iteration_models={3: "opus"})
+
+        assert config.model_for_iteration(1) == "sonnet"
+        assert config.model_for_iteration(3) == "opus"
+        assert AnalystConfig().model_for_iteration(1) is None
+
+    def test_thinking_tokens_for_iteration(self):
+        """Test that per-iteration thinking budgets override the agent's budget."""
+        config = FactCheckerConfig(max_thinking_tokens=4000, iteration_thinking_tokens={1: 0})
+
+        assert config.thinking_tokens_for_iteration(1) == 0
+        assert config.thinking_tokens_for_iteration(2) == 4000
+        assert ReviewerConfig().thinking_tokens_for_iteration(1) is None
+
     def test_config_modification(self):
         """Test that configurations can be modified after creation."""
         config = ReviewerConfig()
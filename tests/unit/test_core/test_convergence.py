@@ -0,0 +1,78 @@
+"""Tests for review loop convergence detection."""
+
+from src.core.config import ReviewerConfig
+from src.core.convergence import ConvergenceDetector
+
+ANALYSIS = """# CropBot
+
+## Market Size
+
+Agricultural robotics reaches $25B in 2025 [1].
+
+## Competition
+
+John Deere dominates large farms.
+"""
+
+
+def _feedback(*issues: tuple[str, str]) -> dict[str, object]:
+    """Reviewer feedback with critical issues given as (section, issue) pairs."""
+    return {
+        "critical_issues": [
+            {"section": section, "issue": issue, "suggestion": ""}
+            for section, issue in issues
+        ],
+        "iteration_recommendation": "reject",
+    }
+
+
+class TestConvergenceDetector:
+    """Test stop decisions from diff size, severity and carried-over issues."""
+
+    def test_first_iteration_never_stops(self):
+        """Test that a single observation is not enough to decide."""
+        detector = ConvergenceDetector(ReviewerConfig())
+
+        signals = detector.observe(1, ANALYSIS, None, _feedback(("Market Size", "No TAM")))
+
+        assert signals.changed_fraction == 1.0
+        assert signals.weighted_issues == 3.0
+        assert detector.stop_reason() is None
+
+    def test_repeated_issues_on_unchanged_analysis_stop(self):
+        """Test that marginal edits with carried-over issues converge."""
+        detector = ConvergenceDetector(ReviewerConfig())
+        feedback = _feedback(("Market Size", "No TAM calculation for small farms"))
+
+        _ = detector.observe(1, ANALYSIS, None, feedback)
+        signals = detector.observe(2, ANALYSIS, ANALYSIS, feedback)
+
+        assert signals.carried_over == 1
+        reason = detector.stop_reason()
+        assert reason is not None and reason.startswith("marginal edits")
+
+    def test_new_issues_keep_iterating(self):
+        """Test that fresh issues mean the review is still making progress."""
+        detector = ConvergenceDetector(ReviewerConfig())
+
+        _ = detector.observe(1, ANALYSIS, None, _feedback(("Market Size", "No TAM")))
+        _ = detector.observe(
+            2, ANALYSIS, ANALYSIS, _feedback(("Competition", "Missing AgEagle and Naio"))
+        )
+
+        assert detector.stop_reason() is None
+
+    def test_large_improvement_keeps_iterating(self):
+        """Test that a big drop in weighted issues is not treated as a plateau."""
+        detector = ConvergenceDetector(ReviewerConfig())
+        revised = ANALYSIS.replace("dominates large farms", "leads; Naio targets vineyards")
+        first = _feedback(
+            ("Market Size", "No TAM calculation"),
+            ("Competition", "Missing major competitors"),
+            ("Competition", "No moat explained anywhere"),
+        )
+
+        _ = detector.observe(1, ANALYSIS, None, first)
+        _ = detector.observe(2, revised, ANALYSIS, _feedback(("Market Size", "No TAM calculation")))
+
+        assert detector.stop_reason() is None
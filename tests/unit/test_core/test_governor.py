@@ -0,0 +1,56 @@
+"""Tests for runtime tool budget enforcement."""
+
+from pathlib import Path
+
+from claude_code_sdk.types import AssistantMessage, ToolUseBlock, UserMessage
+
+from src.core.governor import OUTPUT_LIMIT, ToolBudgetGovernor
+
+
+def _tool_call(name: str, number: int) -> AssistantMessage:
+    """Assistant message holding a single tool call."""
+    return AssistantMessage(
+        content=[ToolUseBlock(id=f"tool_{number}", name=name, input={})],
+        model="test-model",
+    )
+
+
+class TestToolBudgetGovernor:
+    """Test counting, corrections and output size checks."""
+
+    def test_flags_calls_over_budget(self):
+        """Test that the call after the budget is spent gets a correction."""
+        governor = ToolBudgetGovernor({"WebSearch": 2})
+
+        assert governor.observe(_tool_call("WebSearch", 1)) is None
+        assert governor.observe(_tool_call("WebFetch", 2)) is None
+        assert governor.observe(_tool_call("WebSearch", 3)) is None
+        correction = governor.observe(_tool_call("WebSearch", 4))
+
+        assert correction is not None
+        assert "Do not call WebSearch again" in correction
+        assert governor.counts == {"WebSearch": 3, "WebFetch": 1}
+        assert [e.to_dict() for e in governor.events] == [
+            {"tool": "WebSearch", "limit": 2, "used": 3, "action": "interrupted"}
+        ]
+
+    def test_stops_correcting_after_max_corrections(self):
+        """Test that events are still recorded once corrections run out."""
+        governor = ToolBudgetGovernor({"WebSearch": 0}, max_corrections=1)
+
+        assert governor.observe(_tool_call("WebSearch", 1)) is not None
+        assert governor.observe(_tool_call("WebSearch", 2)) is None
+        assert [e.action for e in governor.events] == ["interrupted", "exceeded"]
+
+    def test_flags_output_over_limit_once(self, tmp_path: Path):
+        """Test that an oversized output file is reported after a tool result."""
+        output_file = tmp_path / "analysis.md"
+        _ = output_file.write_text("x" * 120)
+        governor = ToolBudgetGovernor({}, output_file, output_limit=100)
+
+        correction = governor.observe(UserMessage(content="tool result"))
+
+        assert correction is not None
+        assert "120 characters" in correction
+        assert governor.events[0].tool == OUTPUT_LIMIT
+        assert governor.observe(UserMessage(content="tool result")) is None
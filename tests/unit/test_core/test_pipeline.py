@@ -11,6 +11,7 @@ import pytest
 
 from src.core.pipeline import AnalysisPipeline
 from src.core.config import SystemConfig, AnalystConfig, ReviewerConfig, FactCheckerConfig
+from src.core.run_analytics import RunAnalytics
 from src.core.types import PipelineMode, Success, Error
 from tests.unit.base_test import BaseAgentTest
 
@@ -188,6 +189,7 @@ class TestAnalysisPipeline(BaseAgentTest):
 
             # Assert exactly 2 iterations occurred
             assert result["iterations"] == 2
+            assert result.get("stop_reason") == "max_iterations"
             assert mock_analyst.process.call_count == 2  # pyright: ignore[reportAny]
             # Reviewer called only once (not on final iteration)
             assert mock_reviewer.process.call_count == 1  # pyright: ignore[reportAny]
@@ -418,3 +420,420 @@ class TestAnalysisPipeline(BaseAgentTest):
                     assert mock_reviewer.process.call_count == expected_reviewer_calls  # pyright: ignore[reportAny]
                 else:
                     MockReviewer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_revision_brief_passed_to_analyst(
+        self,
+        system_config: SystemConfig,
+        analyst_config: AnalystConfig,
+        reviewer_config: ReviewerConfig,
+        fact_checker_config: FactCheckerConfig,
+    ):
+        """Test that revision iterations receive a condensed brief when enabled."""
+        reviewer_config.max_iterations = 2
+        analyst_config.use_revision_brief = True
+
+        pipeline = AnalysisPipeline(
+            idea="AI fitness app",
+            system_config=system_config,
+            analyst_config=analyst_config,
+            reviewer_config=reviewer_config,
+            fact_checker_config=fact_checker_config,
+            mode=PipelineMode.ANALYZE_AND_REVIEW,
+        )
+
+        with (
+            patch("src.core.pipeline.AnalystAgent") as MockAnalyst,
+            patch("src.core.pipeline.ReviewerAgent") as MockReviewer,
+        ):
+            mock_analyst = AsyncMock()
+            mock_analyst.process = AsyncMock(return_value=Success())
+            MockAnalyst.return_value = mock_analyst
+
+            mock_reviewer = AsyncMock()
+            mock_reviewer.process = AsyncMock(return_value=Success())
+            MockReviewer.return_value = mock_reviewer
+
+            def create_rejection_feedback(*_args: Any, **_kwargs: Any) -> None:
+                feedback_file = (
+                    pipeline.iterations_dir
+                    / f"reviewer_feedback_iteration_{pipeline.iteration_count}.json"
+                )
+                feedback = {
+                    "strengths": ["Nice opening"],
+                    "critical_issues": [
+                        {
+                            "section": "Market Size",
+                            "issue": "No TAM",
+                            "suggestion": "Add a sourced TAM",
+                        }
+                    ],
+                    "iteration_recommendation": "reject",
+                }
+                _ = feedback_file.write_text(json.dumps(feedback))
+
+            with patch.object(
+                pipeline,
+                "_save_analysis_iteration",
+                side_effect=create_rejection_feedback,
+            ):
+                _ = await pipeline.process()
+
+            first_context = mock_analyst.process.call_args_list[0][0][1]  # pyright: ignore[reportAny]
+            second_context = mock_analyst.process.call_args_list[1][0][1]  # pyright: ignore[reportAny]
+            assert first_context.revision_brief_input_path is None  # pyright: ignore[reportAny]
+
+            brief_path: Path = second_context.revision_brief_input_path  # pyright: ignore[reportAny]
+            assert brief_path.name == "revision_brief_iteration_1.md"
+            brief = brief_path.read_text()
+            assert "Add a sourced TAM" in brief
+            assert "Nice opening" not in brief
+
+    @pytest.mark.asyncio
+    async def test_parallel_sections_merges_group_outputs(
+        self,
+        system_config: SystemConfig,
+        analyst_config: AnalystConfig,
+        reviewer_config: ReviewerConfig,
+        fact_checker_config: FactCheckerConfig,
+    ):
+        """Test that section groups run separately and merge into iteration 1."""
+        assert system_config.template_dir is not None
+        _ = (system_config.template_dir / "agents" / "analyst" / "analysis.md").write_text(
+            "# [Title]\n\n## What We Do\n\n[TODO]\n\n## Market Size\n\n[TODO]\n\n"
+            + "## References\n\n[TODO]\n"
+        )
+        analyst_config.parallel_sections = True
+        analyst_config.section_groups = [["What We Do"], ["Market Size"]]
+        analyst_config.pre_research = True
+
+        pipeline = AnalysisPipeline(
+            idea="AI fitness app",
+            system_config=system_config,
+            analyst_config=analyst_config,
+            reviewer_config=reviewer_config,
+            fact_checker_config=fact_checker_config,
+            mode=PipelineMode.ANALYZE,
+        )
+        research = Path(system_config.template_dir) / "research.md"
+        _ = research.write_text("## Findings\n")
+        pipeline._run_pre_research = AsyncMock(return_value=research)  # pyright: ignore[reportPrivateUsage]
+
+        async def write_part(_idea: str, context: Any) -> Success:
+            sections = context.prompt_vars.get("sections")  # pyright: ignore[reportAny]
+            if sections:
+                _ = context.analysis_output_path.write_text(  # pyright: ignore[reportAny]
+                    f"# FitAI\n\n## {sections}\n\n{sections} text [1].\n\n"
+                    + f"## References\n\n[1] Source for {sections}. <https://x.com/{len(sections)}>\n"
+                )
+            return Success()
+
+        with patch("src.core.pipeline.AnalystAgent") as MockAnalyst:
+            mock_analyst = AsyncMock()
+            mock_analyst.process = AsyncMock(side_effect=write_part)
+            MockAnalyst.return_value = mock_analyst
+
+            result = await pipeline.process()
+
+        assert result["success"] is True
+        contexts = [c[0][1] for c in mock_analyst.process.call_args_list]  # pyright: ignore[reportAny]
+        # Two section groups plus the consistency pass
+        assert [c.user_prompt_template for c in contexts] == [  # pyright: ignore[reportAny]
+            "agents/analyst/user/section_group.md",
+            "agents/analyst/user/section_group.md",
+            "agents/analyst/user/consistency.md",
+        ]
+        assert "WebSearch" not in contexts[2].tools  # pyright: ignore[reportAny]
+        # Pre-research results reach every section group
+        assert [c.research_input_path for c in contexts[:2]] == [research, research]  # pyright: ignore[reportAny]
+        # Each sub-session keeps its own metrics, apart from the analyst's
+        assert [c.analytics_name for c in contexts] == [  # pyright: ignore[reportAny]
+            "analyst_group_1",
+            "analyst_group_2",
+            "analyst_consistency",
+        ]
+
+        merged = (pipeline.iterations_dir / "iteration_1.md").read_text()
+        assert merged.index("## What We Do") < merged.index("## Market Size")
+        assert "Market Size text [2]." in merged
+        assert "[2] Source for Market Size." in merged
+        assert (pipeline.iterations_dir / "research_cache.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_two_tier_draft_enriches_uncited_figures(
+        self,
+        system_config: SystemConfig,
+        analyst_config: AnalystConfig,
+        reviewer_config: ReviewerConfig,
+        fact_checker_config: FactCheckerConfig,
+    ):
+        """Test that a no-web draft is followed by a targeted enrichment session."""
+        analyst_config.allowed_tools = ["WebSearch", "WebFetch", "TodoWrite"]
+        analyst_config.two_tier_draft = True
+        analyst_config.enrichment_max_websearches = 2
+        pipeline = AnalysisPipeline(
+            idea="AI fitness app",
+            system_config=system_config,
+            analyst_config=analyst_config,
+            reviewer_config=reviewer_config,
+            fact_checker_config=fact_checker_config,
+            mode=PipelineMode.ANALYZE,
+        )
+
+        async def write_draft(_idea: str, context: Any) -> Success:
+            if not context.user_prompt_template:  # pyright: ignore[reportAny]
+                _ = context.analysis_output_path.write_text(  # pyright: ignore[reportAny]
+                    "# FitAI\n\n## Market Size\n\nFitness apps earn $14B a year.\n"
+                )
+            return Success()
+
+        with patch("src.core.pipeline.AnalystAgent") as MockAnalyst:
+            mock_analyst = AsyncMock()
+            mock_analyst.process = AsyncMock(side_effect=write_draft)
+            MockAnalyst.return_value = mock_analyst
+
+            result = await pipeline.process()
+
+        assert result["success"] is True
+        draft, enrichment = [c[0][1] for c in mock_analyst.process.call_args_list]  # pyright: ignore[reportAny]
+        assert draft.tools == ["TodoWrite"]  # pyright: ignore[reportAny]
+        assert enrichment.user_prompt_template == "agents/analyst/user/enrichment.md"  # pyright: ignore[reportAny]
+        assert "$14B a year" in enrichment.prompt_vars["targets"]  # pyright: ignore[reportAny]
+        assert draft.analytics_name == "analyst"  # pyright: ignore[reportAny]
+        assert enrichment.analytics_name == "analyst_enrichment"  # pyright: ignore[reportAny]
+        enrichment_config = MockAnalyst.call_args_list[-1][0][0]  # pyright: ignore[reportAny]
+        assert enrichment_config.max_websearches == 2  # pyright: ignore[reportAny]
+
+    async def _run_speculative_pipeline(
+        self,
+        system_config: SystemConfig,
+        analyst_config: AnalystConfig,
+        reviewer_config: ReviewerConfig,
+        fact_checker_config: FactCheckerConfig,
+        fact_check_severity: str,
+        analyst_seconds: float = 0.2,
+        fact_check_seconds: float = 0.05,
+    ) -> tuple[AnalysisPipeline, list[Any]]:
+        """Run a two-iteration speculative pipeline where the reviewer rejects first."""
+        import asyncio
+
+        reviewer_config.max_iterations = 2
+        reviewer_config.speculative_revision = True
+        pipeline = AnalysisPipeline(
+            idea="AI fitness app",
+            system_config=system_config,
+            analyst_config=analyst_config,
+            reviewer_config=reviewer_config,
+            fact_checker_config=fact_checker_config,
+            mode=PipelineMode.ANALYZE_REVIEW_WITH_FACT_CHECK,
+        )
+
+        async def analyst_process(_idea: str, context: Any) -> Success:
+            if context.revision_brief_input_path:  # pyright: ignore[reportAny]
+                await asyncio.sleep(analyst_seconds)
+            return Success()
+
+        async def reviewer_process(_input: str, context: Any) -> Success:
+            _ = context.feedback_output_path.write_text(  # pyright: ignore[reportAny]
+                json.dumps({"iteration_recommendation": "reject", "improvements": []})
+            )
+            return Success()
+
+        async def fact_checker_process(_input: str, context: Any) -> Success:
+            await asyncio.sleep(fact_check_seconds)
+            issue = {"claim": "X", "section": "Market", "severity": fact_check_severity}
+            _ = context.fact_check_output_path.write_text(  # pyright: ignore[reportAny]
+                json.dumps({"issues": [issue], "iteration_recommendation": "reject"})
+            )
+            return Success()
+
+        with (
+            patch("src.core.pipeline.AnalystAgent") as MockAnalyst,
+            patch("src.core.pipeline.ReviewerAgent") as MockReviewer,
+            patch("src.core.pipeline.FactCheckerAgent") as MockFactChecker,
+        ):
+            mock_analyst = AsyncMock()
+            mock_analyst.process = AsyncMock(side_effect=analyst_process)
+            MockAnalyst.return_value = mock_analyst
+            MockReviewer.return_value.process = AsyncMock(side_effect=reviewer_process)
+            MockFactChecker.return_value.process = AsyncMock(
+                side_effect=fact_checker_process
+            )
+
+            with patch.object(pipeline, "_save_analysis_iteration"):
+                result = await pipeline.process()
+
+        assert result["success"] is True
+        contexts = [c[0][1] for c in mock_analyst.process.call_args_list]  # pyright: ignore[reportAny]
+        return pipeline, contexts
+
+    @pytest.mark.asyncio
+    async def test_speculative_revision_merges_late_feedback(
+        self,
+        system_config: SystemConfig,
+        analyst_config: AnalystConfig,
+        reviewer_config: ReviewerConfig,
+        fact_checker_config: FactCheckerConfig,
+    ):
+        """Test that a minor late rejection is merged with a follow-up edit."""
+        pipeline, contexts = await self._run_speculative_pipeline(
+            system_config, analyst_config, reviewer_config, fact_checker_config, "Low"
+        )
+
+        # Iteration 1, speculative iteration 2, follow-up edit - no rerun
+        assert [c.iteration for c in contexts] == [1, 2, 2]  # pyright: ignore[reportAny]
+        assert contexts[1].feedback_input_path is None  # pyright: ignore[reportAny]
+        assert contexts[2].user_prompt_template == "agents/analyst/user/follow_up.md"  # pyright: ignore[reportAny]
+        assert pipeline.iteration_count == 2
+        assert (pipeline.iterations_dir / "follow_up_brief_iteration_1.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_speculation_saves_only_the_analyst_time(
+        self,
+        system_config: SystemConfig,
+        analyst_config: AnalystConfig,
+        reviewer_config: ReviewerConfig,
+        fact_checker_config: FactCheckerConfig,
+    ):
+        """Test that an analyst finishing before the late check saves only its own time."""
+        with patch.object(RunAnalytics, "record_speculation", autospec=True) as record:
+            _ = await self._run_speculative_pipeline(
+                system_config,
+                analyst_config,
+                reviewer_config,
+                fact_checker_config,
+                "Low",
+                analyst_seconds=0.05,
+                fact_check_seconds=0.4,
+            )
+
+        _, iteration, outcome = record.call_args.args  # pyright: ignore[reportAny]
+        assert (iteration, outcome) == (2, "follow_up")
+        assert 0.0 < record.call_args.kwargs["seconds_saved"] < 0.3  # pyright: ignore[reportAny]
+
+    @pytest.mark.asyncio
+    async def test_speculative_revision_discarded_on_must_fix(
+        self,
+        system_config: SystemConfig,
+        analyst_config: AnalystConfig,
+        reviewer_config: ReviewerConfig,
+        fact_checker_config: FactCheckerConfig,
+    ):
+        """Test that a High severity late result discards the speculation."""
+        pipeline, contexts = await self._run_speculative_pipeline(
+            system_config, analyst_config, reviewer_config, fact_checker_config, "High"
+        )
+
+        # Speculative iteration 2 is cancelled and rerun with both feedback files
+        assert [c.iteration for c in contexts] == [1, 2, 2]  # pyright: ignore[reportAny]
+        rerun = contexts[2]
+        assert rerun.user_prompt_template is None  # pyright: ignore[reportAny]
+        assert rerun.feedback_input_path.name == "reviewer_feedback_iteration_1.json"  # pyright: ignore[reportAny]
+        assert rerun.fact_check_input_path.name == "fact_check_iteration_1.json"  # pyright: ignore[reportAny]
+        assert pipeline.iteration_count == 2
+
+    @pytest.mark.asyncio
+    async def test_convergence_stops_review_loop(
+        self,
+        system_config: SystemConfig,
+        analyst_config: AnalystConfig,
+        reviewer_config: ReviewerConfig,
+        fact_checker_config: FactCheckerConfig,
+    ):
+        """Test that repeated issues on an unchanged analysis stop the loop early."""
+        reviewer_config.max_iterations = 4
+        reviewer_config.convergence_detection = True
+
+        pipeline = AnalysisPipeline(
+            idea="AI fitness app",
+            system_config=system_config,
+            analyst_config=analyst_config,
+            reviewer_config=reviewer_config,
+            fact_checker_config=fact_checker_config,
+            mode=PipelineMode.ANALYZE_AND_REVIEW,
+        )
+
+        feedback = {
+            "critical_issues": [
+                {"section": "Market", "issue": "No TAM calculation", "suggestion": "Add TAM"}
+            ],
+            "iteration_recommendation": "reject",
+        }
+
+        def write_feedback(*_args: Any, **_kwargs: Any) -> None:
+            feedback_file = (
+                pipeline.iterations_dir
+                / f"reviewer_feedback_iteration_{pipeline.iteration_count}.json"
+            )
+            _ = feedback_file.write_text(json.dumps(feedback))
+
+        with (
+            patch("src.core.pipeline.AnalystAgent") as MockAnalyst,
+            patch("src.core.pipeline.ReviewerAgent") as MockReviewer,
+        ):
+            MockAnalyst.return_value.process = AsyncMock(return_value=Success())
+            MockReviewer.return_value.process = AsyncMock(return_value=Success())
+
+            with patch.object(
+                pipeline, "_save_analysis_iteration", side_effect=write_feedback
+            ):
+                result = await pipeline.process()
+
+        # Iteration 2 repeats iteration 1's issue without changing the analysis
+        assert result["iterations"] == 2
+        stop_reason = result.get("stop_reason")
+        assert stop_reason is not None
+        assert stop_reason.startswith("converged: marginal edits")
+
+    @pytest.mark.asyncio
+    async def test_salvage_continues_partial_analysis(
+        self,
+        system_config: SystemConfig,
+        analyst_config: AnalystConfig,
+        reviewer_config: ReviewerConfig,
+        fact_checker_config: FactCheckerConfig,
+    ):
+        """Test that a failed but mostly written analysis is completed, not rerun."""
+        assert system_config.template_dir is not None
+        template = system_config.template_dir / "agents" / "analyst" / "analysis.md"
+        _ = template.write_text(
+            "# Title\n\n## Problem\n\n[TODO: problem]\n\n"
+            + "## Solution\n\n[TODO: solution]\n\n## Market\n\n[TODO: market]\n"
+        )
+        analyst_config.salvage_partial = True
+        analyst_config.min_words = 3
+
+        pipeline = AnalysisPipeline(
+            idea="AI fitness app",
+            system_config=system_config,
+            analyst_config=analyst_config,
+            reviewer_config=reviewer_config,
+            fact_checker_config=fact_checker_config,
+            mode=PipelineMode.ANALYZE,
+        )
+        analysis_file = pipeline.iterations_dir / "iteration_1.md"
+        prompts: list[str | None] = []
+
+        async def analyst_process(_idea: str, context: Any) -> Success | Error:
+            prompts.append(context.user_prompt_template)
+            if len(prompts) == 1:
+                # Runs out of turns after two of three sections
+                text = analysis_file.read_text()
+                text = text.replace("[TODO: problem]", "Gyms are empty.")
+                _ = analysis_file.write_text(
+                    text.replace("[TODO: solution]", "A coaching app.")
+                )
+                return Error(message="max turns reached")
+            _ = analysis_file.write_text(
+                analysis_file.read_text().replace("[TODO: market]", "Large market.")
+            )
+            return Success()
+
+        with patch("src.core.pipeline.AnalystAgent") as MockAnalyst:
+            MockAnalyst.return_value.process = analyst_process
+            result = await pipeline.process()
+
+        assert result["success"] is True
+        assert prompts == [None, "agents/analyst/user/continuation.md"]
+        assert "Large market." in analysis_file.read_text()
+
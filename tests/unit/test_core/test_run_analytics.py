@@ -321,3 +321,122 @@ class TestRunAnalytics:
 
         assert analytics.message_count == 2
         assert analytics.messages_file.exists()
+
+    def test_savings_include_estimated_latency(self, analytics):
+        """Test that recorded turn savings are converted into latency at finalize."""
+        analytics.record_savings("reviewer", 1, "inline_artifacts", turns=2)
+        analytics.track_message(
+            ResultMessage(
+                subtype="success",
+                duration_ms=12000,
+                duration_api_ms=10000,
+                is_error=False,
+                num_turns=5,
+                session_id="session_1",
+            ),
+            agent_name="reviewer",
+            iteration=1,
+        )
+
+        analytics.finalize()
+
+        summary = json.loads((analytics.output_dir / "run_summary.json").read_text())
+        savings = summary["aggregated_stats"]["estimated_savings"]["inline_artifacts"]
+        assert savings["turns"] == 2
+        # 10s over 5 turns = 2s per turn, 2 turns saved = 4s
+        assert savings["latency_seconds"] == 4.0
+
+    def test_usage_broken_down_by_model(self, analytics):
+        """Test that cost and latency are grouped by the model that produced them."""
+        for agent, model, cost, session in [
+            ("reviewer", "claude-haiku", 0.01, "s1"),
+            ("reviewer", "claude-haiku", 0.03, "s1"),  # Same session, cumulative
+            ("analyst", "claude-opus", 0.50, "s2"),
+        ]:
+            analytics.track_message(
+                AssistantMessage(content=[TextBlock(text="Done")], model=model),
+                agent_name=agent,
+                iteration=1,
+            )
+            analytics.track_message(
+                ResultMessage(
+                    subtype="success",
+                    duration_ms=4000,
+                    duration_api_ms=3000,
+                    is_error=False,
+                    num_turns=2,
+                    session_id=session,
+                    total_cost_usd=cost,
+                ),
+                agent_name=agent,
+                iteration=1,
+            )
+
+        analytics.finalize()
+
+        summary = json.loads((analytics.output_dir / "run_summary.json").read_text())
+        by_model = summary["aggregated_stats"]["by_model"]
+        assert by_model["claude-haiku"]["results"] == 2
+        assert by_model["claude-haiku"]["cost_usd"] == 0.03
+        assert by_model["claude-haiku"]["duration_seconds"] == 8.0
+        assert by_model["claude-opus"]["avg_cost_usd"] == 0.5
+
+    def test_turn_limit_hits_and_early_finishes(self, analytics):
+        """Test that sessions are reported by how they used their turn limit."""
+        for agent, subtype, turns in [
+            ("analyst", "error_max_turns", 40),
+            ("reviewer", "success", 5),
+            ("fact_checker", "success", 30),
+        ]:
+            analytics.record_turn_limit(agent, 1, 40)
+            analytics.track_message(
+                ResultMessage(
+                    subtype=subtype,
+                    duration_ms=1000,
+                    duration_api_ms=800,
+                    is_error=subtype != "success",
+                    num_turns=turns,
+                    session_id=agent,
+                ),
+                agent_name=agent,
+                iteration=1,
+            )
+
+        analytics.finalize()
+
+        summary = json.loads((analytics.output_dir / "run_summary.json").read_text())
+        turn_limits = summary["aggregated_stats"]["turn_limits"]
+        assert turn_limits["sessions"] == 3
+        assert [e["agent"] for e in turn_limits["limit_hits"]] == ["analyst"]
+        assert [e["agent"] for e in turn_limits["early_finishes"]] == ["reviewer"]
+
+    def test_prompt_cache_hit_rate(self, analytics):
+        """Test that cache token counts are summed and turned into hit rates."""
+        for agent, usage in [
+            ("analyst", {"input_tokens": 100, "cache_creation_input_tokens": 900}),
+            ("reviewer", {"input_tokens": 50, "cache_read_input_tokens": 950}),
+        ]:
+            analytics.track_message(
+                ResultMessage(
+                    subtype="success",
+                    duration_ms=1000,
+                    duration_api_ms=800,
+                    is_error=False,
+                    num_turns=1,
+                    session_id=agent,
+                    usage=usage,
+                ),
+                agent_name=agent,
+                iteration=1,
+            )
+
+        analytics.finalize()
+
+        summary = json.loads((analytics.output_dir / "run_summary.json").read_text())
+        cache = summary["aggregated_stats"]["prompt_cache"]
+        assert cache["cache_read_input_tokens"] == 950
+        assert cache["hit_rate"] == 0.475
+        assert cache["by_agent"]["reviewer"]["hit_rate"] == 0.95
+        assert cache["by_agent"]["analyst"]["hit_rate"] == 0.0
+        metrics = summary["agent_metrics"]["analyst_iteration_1"]
+        assert metrics["cache_creation_input_tokens"] == 900
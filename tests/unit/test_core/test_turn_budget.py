@@ -0,0 +1,60 @@
+"""Tests for the learned turn budget policy."""
+
+import json
+from pathlib import Path
+
+from src.core.config import SystemConfig
+from src.core.turn_budget import TurnBudgetPolicy
+
+
+def _write_run(runs_dir: Path, run_id: str, mode: str | None, reviewer_turns: int):
+    """Write a run summary with one first-iteration reviewer session."""
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True)
+    summary = {
+        "run_id": run_id,
+        "mode": mode,
+        "agent_metrics": {
+            "reviewer_iteration_1": {
+                "agent_name": "reviewer",
+                "iteration": 1,
+                "num_turns": reviewer_turns,
+            }
+        },
+    }
+    _ = (run_dir / "run_summary.json").write_text(json.dumps(summary))
+
+
+class TestTurnBudgetPolicy:
+    """Test percentile limits, margins and fallbacks."""
+
+    def test_percentile_with_margin(self):
+        """Test that the limit is the percentile of usage plus the margin."""
+        policy = TurnBudgetPolicy(percentile=0.5, margin=0.5, min_samples=3)
+        for turns in (8, 10, 12):
+            policy.add("reviewer", "review", 1, turns)
+
+        assert policy.max_turns("reviewer", "review", 1, default=50) == 15
+        # Revisions are tracked separately and have no history yet
+        assert policy.max_turns("reviewer", "review", 2, default=50) == 50
+
+    def test_from_runs_requires_enough_samples(self, tmp_path: Path):
+        """Test loading history and keeping the default below min_samples."""
+        runs_dir = tmp_path / "runs"
+        for number, turns in enumerate((4, 6, 30)):
+            _write_run(runs_dir, f"run_{number}", "review", turns)
+        _write_run(runs_dir, "old_run", None, 99)  # No mode recorded, ignored
+        config = SystemConfig(
+            project_root=tmp_path,
+            analyses_dir=tmp_path / "analyses",
+            config_dir=tmp_path / "config",
+            logs_dir=tmp_path / "logs",
+            turn_budget_percentile=1.0,
+            turn_budget_margin=0.0,
+            turn_budget_min_samples=3,
+        )
+
+        policy = TurnBudgetPolicy.from_runs(runs_dir, config)
+
+        assert policy.max_turns("reviewer", "review", 1, default=50) == 30
+        assert policy.max_turns("analyst", "review", 1, default=50) == 50
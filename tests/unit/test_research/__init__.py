@@ -0,0 +1 @@
+"""Unit tests for background research helpers."""
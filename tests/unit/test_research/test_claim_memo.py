@@ -0,0 +1,183 @@
+"""Tests for the claim-verification memo."""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from src.research import ClaimMemo, PreVerification, render_memo_hits
+from src.utils.claims import extract_claims
+
+ANALYSIS = """# CropBot: Robot Fleets for Small Farms
+
+## Market Size
+
+Agricultural robotics reaches $25B in 2025 [1]. Adoption grew 38% last year [2].
+
+## Competition
+
+Three startups raised $40M in 2024 [3].
+
+## References
+
+[1] Mordor Intelligence. "Agricultural Robots Market." 2025. <https://example.com/ag>
+
+[2] USDA. "Farm Technology Survey." 2024. <https://example.com/usda>
+
+[3] Crunchbase. "Farm robotics funding." <https://example.com/funding>
+"""
+
+FACT_CHECK: dict[str, Any] = {
+    "issues": [
+        {
+            "claim": "Adoption grew 38% last year",
+            "section": "Market Size",
+            "severity": "High",
+            "details": {
+                "issue_type": "false_citation",
+                "citation_ref": "[2]",
+                "url_checked": "https://example.com/usda",
+                "explanation": "The survey reports 21%.",
+                "evidence": "Adoption grew 21% in 2024.",
+                "suggestion": "Use 21%.",
+            },
+        }
+    ],
+    "statistics": {
+        "total_claims": 3,
+        "verified_claims": 2,
+        "unverified_claims": 0,
+        "false_claims": 1,
+    },
+    "iteration_recommendation": "reject",
+    "iteration_reason": "One high severity issue.",
+}
+
+CHECKED_AT = datetime(2025, 1, 1)
+
+
+def make_memo(tmp_path: Path) -> ClaimMemo:
+    """Create a memo filled from the sample fact-check."""
+    memo = ClaimMemo(tmp_path / "claim_memo.json", ttl_days=30)
+    market = extract_claims(ANALYSIS)[0]
+    pre_verified = [
+        PreVerification(
+            claim_key=market.key,
+            claim=market.text,
+            section=market.section,
+            citation="1",
+            url="https://example.com/ag",
+            status="supported",
+        )
+    ]
+    _ = memo.record_fact_check(
+        ANALYSIS,
+        FACT_CHECK,
+        pre_verified,
+        now=CHECKED_AT,
+        fetched_urls={"https://example.com/funding?utm_source=x"},
+    )
+    return memo
+
+
+class TestClaimMemo:
+    """Test storing, looking up and expiring memoized verdicts."""
+
+    def test_verdicts_from_fact_check(self, tmp_path):
+        """Test that flagged, prefetched and unflagged claims get their verdicts."""
+        memo = make_memo(tmp_path)
+        # Another idea cites the same facts with different wording and a
+        # tracking parameter on the URL
+        other = ANALYSIS.replace("CropBot", "AgriDrone").replace(
+            "example.com/usda>", "example.com/usda?utm_source=x>"
+        )
+
+        hits = memo.lookup(other, now=CHECKED_AT + timedelta(days=1))
+
+        verdicts = {hit.section: [e.verdict for e in hit.entries] for hit in hits}
+        assert [hit.passed for hit in hits] == [True, False, True]
+        assert [e.verdict for hit in hits for e in hit.entries] == [
+            "supported",
+            "false_citation",
+            "no_issue",
+        ]
+        assert verdicts["Competition"] == ["no_issue"]
+        assert hits[1].entries[0].evidence == "Adoption grew 21% in 2024."
+        assert (memo.hits, memo.stale, memo.misses) == (3, 0, 0)
+
+    def test_expired_verdicts_are_stale(self, tmp_path):
+        """Test that verdicts past their TTL are counted as stale, not hits."""
+        memo = make_memo(tmp_path)
+        changed = ANALYSIS.replace("$40M", "$45M")
+
+        hits = memo.lookup(changed, now=CHECKED_AT + timedelta(days=31))
+
+        assert hits == []
+        assert (memo.hits, memo.stale, memo.misses) == (0, 2, 1)
+
+    def test_ingest_validates_and_save_merges(self, tmp_path):
+        """Test that invalid fact-checks are skipped and concurrent saves merge."""
+        analysis = tmp_path / "iteration_1.md"
+        _ = analysis.write_text(ANALYSIS)
+        invalid = tmp_path / "fact_check_iteration_1.json"
+        _ = invalid.write_text(json.dumps({"issues": "none"}))
+        valid = tmp_path / "fact_check_iteration_2.json"
+        _ = valid.write_text(json.dumps(FACT_CHECK))
+
+        first = ClaimMemo(tmp_path / "claim_memo.json")
+        second = ClaimMemo(tmp_path / "claim_memo.json")
+        assert first.ingest(analysis, invalid) == 0
+        # The market claim passed without anyone fetching its page
+        fetched = {"https://example.com/funding"}
+        assert first.ingest(analysis, valid, fetched_urls=fetched) == 2
+        first.save()
+        _ = second.record_fact_check(
+            "## Market\n\nFarms number 2M [1].\n\n## References\n\n[1] <https://x.com/farms>\n",
+            {"issues": []},
+            fetched_urls={"https://x.com/farms"},
+        )
+        second.save()
+
+        reloaded = ClaimMemo(tmp_path / "claim_memo.json")
+        assert len(reloaded.entries) == 3
+        assert {e.origin for e in reloaded.entries.values()} == {
+            "fact_check_iteration_2.json",
+            "",
+        }
+
+    def test_only_checked_verdicts_are_stored_or_renewed(self, tmp_path):
+        """Test that unfetched passes are skipped and reused verdicts keep their age."""
+        memo = make_memo(tmp_path)
+        original = {key: entry.checked_at for key, entry in memo.entries.items()}
+        market, _, competition = extract_claims(ANALYSIS)
+        carried = {
+            **FACT_CHECK,
+            "issues": [{**FACT_CHECK["issues"][0], "carried_forward_from": 1}],
+        }
+
+        # A later check that reused the market verdict, carried the adoption
+        # issue forward and fetched the funding page for another claim
+        stored = memo.record_fact_check(
+            ANALYSIS,
+            carried,
+            now=CHECKED_AT + timedelta(days=20),
+            fetched_urls={"https://example.com/funding"},
+            reused={market.key},
+        )
+
+        assert stored == 0
+        assert {key: e.checked_at for key, e in memo.entries.items()} == original
+        unfetched = ClaimMemo(tmp_path / "other.json")
+        assert unfetched.record_fact_check(ANALYSIS, {"issues": []}) == 0
+        assert competition.key not in {hit.claim_key for hit in unfetched.lookup(ANALYSIS)}
+
+    def test_render_memo_hits(self, tmp_path):
+        """Test that passed and flagged claims are rendered separately."""
+        memo = make_memo(tmp_path)
+
+        text = render_memo_hits(memo.lookup(ANALYSIS, now=CHECKED_AT))
+
+        passed, flagged = text.split("**Flagged")
+        assert "Agricultural robotics reaches $25B" in passed
+        assert "false_citation (High) for <https://example.com/usda>" in flagged
+        assert render_memo_hits([]) == ""
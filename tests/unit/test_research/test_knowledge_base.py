@@ -0,0 +1,156 @@
+"""Tests for the local research knowledge base."""
+
+import io
+import json
+
+from src.research import (
+    FetchCache,
+    FetchResult,
+    KnowledgeBase,
+    SearchCache,
+    SearchResult,
+    render_hits,
+)
+from src.research.knowledge_base import KB_TOOL, handle_request, serve, server_config
+
+
+def search_entry(
+    timestamp: str, query: str, summary: str, results: list[dict[str, str]]
+) -> str:
+    """One messages.jsonl line carrying a logged WebSearch result."""
+    block = {
+        "type": "ToolResultBlock",
+        "correlated_tool": "WebSearch",
+        "search_results": results,
+        "search_query": query,
+        "search_summary": summary,
+    }
+    return json.dumps(
+        {"timestamp": timestamp, "message": {}, "artifacts": {"blocks": [block]}}
+    )
+
+
+def make_kb(tmp_path) -> KnowledgeBase:
+    """Create a knowledge base that has learned one run."""
+    run_dir = tmp_path / "runs" / "20250101_000000_vertical-farm"
+    run_dir.mkdir(parents=True)
+    lines = [
+        search_entry(
+            "2025-01-01T00:00:00.123",
+            "vertical farming market size 2024",
+            "The vertical farming market was valued at $6.9B in 2024.",
+            [
+                {"title": "Vertical Farming Market Report", "url": "https://mkt.com/vf?utm_source=x"},
+                {"title": "Indoor Agriculture Outlook", "url": "https://agri.org/outlook"},
+            ],
+        ),
+        search_entry(
+            "2025-01-01T00:01:00",
+            "drone delivery regulations",
+            "FAA Part 108 proposes beyond-visual-line-of-sight rules.",
+            [{"title": "FAA drone rules", "url": "https://faa.gov/part108"}],
+        ),
+    ]
+    _ = (run_dir / "messages.jsonl").write_text("\n".join(lines) + "\n")
+    fetch_cache = FetchCache(tmp_path / "fetch")
+    fetch_cache.put(
+        FetchResult(
+            url="https://agri.org/outlook",
+            status=200,
+            text="Intro. Indoor agriculture revenue reached $12B, led by vertical farms.",
+        )
+    )
+    kb = KnowledgeBase(tmp_path / "kb.sqlite3")
+    assert kb.learn_from_runs(tmp_path / "runs", fetch_cache) == 2
+    assert kb.learn_from_runs(tmp_path / "runs", fetch_cache) == 0
+    return kb
+
+
+class TestKnowledgeBase:
+    """Test indexing past research and looking it up."""
+
+    def test_learn_and_search(self, tmp_path):
+        """Test that logged searches are indexed once and ranked by relevance."""
+        kb = make_kb(tmp_path)
+
+        hits = kb.search("Vertical farming market")
+
+        search = next(hit for hit in hits if hit.kind == "search")
+        assert search.snippet.startswith("The vertical farming market")
+        assert hits[0].url == "https://mkt.com/vf"
+        assert {hit.url for hit in hits} >= {"https://mkt.com/vf", "https://agri.org/outlook"}
+        outlook = next(hit for hit in hits if hit.url == "https://agri.org/outlook")
+        assert "$12B" in outlook.snippet
+        assert "faa.gov" not in render_hits(hits)
+        assert kb.stats() == {"searches": 2, "results": 3, "learned_sources": 1}
+
+    def test_upsert_and_max_age(self, tmp_path):
+        """Test that re-captured results replace older ones and age filtering."""
+        kb = make_kb(tmp_path)
+        kb.add_result(
+            "https://mkt.com/vf", query="vertical farming", snippet="Updated: $7.3B in 2025."
+        )
+
+        hits = kb.search("vertical farming", limit=20)
+        recent = kb.search("vertical farming", limit=20, max_age_days=30)
+
+        report = [hit for hit in hits if hit.url == "https://mkt.com/vf"]
+        assert len(report) == 1
+        assert report[0].title == "Vertical Farming Market Report"
+        assert report[0].snippet == "Updated: $7.3B in 2025."
+        assert [hit.url for hit in recent] == ["https://mkt.com/vf"]
+        assert kb.search("?!") == []
+
+    def test_learn_from_search_cache(self, tmp_path):
+        """Test that pre-research results and their cited URLs are indexed."""
+        cache = SearchCache(tmp_path / "search")
+        cache.put(
+            SearchResult(
+                query="lab grown meat costs",
+                text="- Cultivated meat costs fell to $17/lb <https://gfi.org/costs>\n- No URL here",
+            )
+        )
+        kb = KnowledgeBase(tmp_path / "kb.sqlite3")
+
+        assert kb.learn_from_search_cache(tmp_path / "search") == 1
+        assert kb.learn_from_search_cache(tmp_path / "search") == 0
+
+        hits = kb.search("cultivated meat cost")
+        assert sorted(hit.kind for hit in hits) == ["result", "search"]
+        result = next(hit for hit in hits if hit.kind == "result")
+        assert (result.url, result.snippet) == (
+            "https://gfi.org/costs",
+            "Cultivated meat costs fell to $17/lb",
+        )
+
+    def test_mcp_server(self, tmp_path):
+        """Test the stdio server's handshake, tool listing and tool call."""
+        kb = make_kb(tmp_path)
+        requests = [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {"protocolVersion": "2025-03-26"}},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "tools/call",
+                "params": {"name": "search", "arguments": {"query": "drone regulations"}},
+            },
+        ]
+        stdin = io.StringIO("\n".join(json.dumps(r) for r in requests) + "\nnot json\n")
+        stdout = io.StringIO()
+
+        serve(kb, stdin=stdin, stdout=stdout)
+
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert [r["id"] for r in responses] == [1, 2, 3]
+        assert responses[0]["result"]["protocolVersion"] == "2025-03-26"
+        assert [t["name"] for t in responses[1]["result"]["tools"]] == ["search"]
+        text = responses[2]["result"]["content"][0]["text"]
+        assert "FAA Part 108" in text
+        unsupported = handle_request(kb, {"id": 4, "method": "resources/list"})
+        assert unsupported is not None and unsupported["error"]["code"] == -32601
+
+        config = server_config(tmp_path / "kb.sqlite3", 90)
+        assert "args" in config and config["args"][-3:] == ["serve", "--max-age-days", "90"]
+        assert KB_TOOL == "mcp__knowledge_base__search"
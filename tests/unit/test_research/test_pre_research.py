@@ -0,0 +1,79 @@
+"""Tests for the concurrent pre-research stage."""
+
+import asyncio
+
+import pytest
+
+from src.research import SearchCache, SearchExecutor, SearchResult, render_research
+from src.research.pre_research import parse_queries
+
+
+class StubSearcher:
+    """Searcher answering every query, tracking how many run at once."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    async def search(self, query: str) -> SearchResult:
+        self.calls.append(query)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if query == "nothing":
+            return SearchResult(query=query, error="error_max_turns")
+        return SearchResult(query=query, text=f"- Finding for {query} <https://x.com>")
+
+
+class TestPreResearch:
+    """Test query planning, concurrent execution and rendering."""
+
+    def test_parse_queries(self):
+        """Test that list items are extracted, deduplicated and capped."""
+        text = (
+            "Here are the queries:\n"
+            '- "US farm robotics market size 2025"\n'
+            "2. Agricultural drone startups funding 2024\n"
+            "* us farm robotics MARKET size 2025\n"
+            "- Labor shortage farms 2025\n"
+        )
+
+        queries = parse_queries(text, max_queries=2)
+
+        assert queries == [
+            "US farm robotics market size 2025",
+            "Agricultural drone startups funding 2024",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_executor_limits_concurrency_and_caches(self, tmp_path):
+        """Test that searches run concurrently up to the limit and are cached."""
+        searcher = StubSearcher()
+        cache = SearchCache(tmp_path / "search")
+        executor = SearchExecutor(searcher, cache, concurrency=2, min_interval=0)
+
+        results = await executor.run(["a", "b", "c", "nothing"])
+
+        assert [r.query for r in results] == ["a", "b", "c", "nothing"]
+        assert searcher.max_in_flight == 2
+        assert [r.ok for r in results] == [True, True, True, False]
+
+        # Successful results are served from the cache; failures are retried
+        rerun = SearchExecutor(searcher, cache, concurrency=2, min_interval=0)
+        _ = await rerun.run(["A", "nothing"])
+        assert rerun.cache_hits == 1
+        assert searcher.calls.count("nothing") == 2
+
+    def test_render_research(self):
+        """Test that failed queries are listed separately."""
+        text = render_research(
+            [
+                SearchResult(query="market size", text="- $25B <https://x.com>"),
+                SearchResult(query="nothing", error="failed"),
+            ]
+        )
+
+        assert "## market size\n\n- $25B <https://x.com>" in text
+        assert text.rstrip().endswith("## Queries Without Results\n\n- nothing")
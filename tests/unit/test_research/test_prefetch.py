@@ -0,0 +1,195 @@
+"""Tests for citation prefetch and pre-verification."""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from src.research import (
+    AnalysisWatcher,
+    CitationPrefetcher,
+    FetchCache,
+    FetchResult,
+    canonicalize_url,
+    completed_sections,
+    pre_verify,
+    render_pre_verifications,
+)
+from src.utils.claims import extract_claims
+
+ANALYSIS = """# CropBot: Robot Fleets for Small Farms
+
+## Market Size
+
+Agricultural robotics reaches $25B in 2025 [1]. Adoption grew 38% last year [2].
+
+## Competition
+
+[TODO: Competitive landscape]
+
+## References
+
+[1] Mordor Intelligence. "Agricultural Robots Market." 2025. <https://example.com/Ag>
+
+[2] USDA. "Farm Technology Survey." 2024. <https://example.com/usda>
+"""
+
+PAGES = {
+    "https://example.com/Ag": "The market will reach $25 billion by 2025.",
+    "https://example.com/usda": "Adoption grew 21% in 2024.",
+}
+
+
+class StubFetcher:
+    """Fetcher serving fixed pages and counting requests."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def fetch(self, url: str) -> FetchResult:
+        self.calls.append(url)
+        if url not in PAGES:
+            return FetchResult(url=url, status=404, error="Not Found")
+        return FetchResult(url=url, status=200, text=PAGES[url])
+
+
+class TestPreVerify:
+    """Test claim/page comparison."""
+
+    def test_completed_sections_skip_todo(self):
+        """Test that sections still holding TODO markers are not complete."""
+        assert completed_sections(ANALYSIS) == ["Market Size"]
+
+    def test_figures_found_and_missing(self):
+        """Test that claims are supported only when all figures appear."""
+        first, second = extract_claims(ANALYSIS)
+        ag = FetchResult(url="u", status=200, text=PAGES["https://example.com/Ag"])
+        usda = FetchResult(url="u", status=200, text=PAGES["https://example.com/usda"])
+
+        assert pre_verify(first, "1", "u", ag).status == "supported"
+        result = pre_verify(second, "2", "u", usda)
+        assert result.status == "figures_missing"
+        assert result.missing == ["38"]
+        assert result.excerpt == "Adoption grew 21% in 2024."
+
+    def test_numbers_without_context_are_a_hint(self):
+        """Test that figures found away from the claim's terms are not support."""
+        first = extract_claims(ANALYSIS)[0]
+        page = "Agricultural robotics overview. " + "x " * 400 + "Page 25 of 2025."
+        years = extract_claims("## Market\n\nFarms adopted robots in 2024 [1].\n")[0]
+
+        far = FetchResult(url="u", status=200, text=page)
+        year_only = FetchResult(url="u", status=200, text="Robots on farms, 2024.")
+
+        hint = pre_verify(first, "1", "u", far)
+        assert hint.status == "numbers_found"
+        assert hint.excerpt == ""  # Hints never replace a fetch
+        assert pre_verify(years, "1", "u", year_only).status == "numbers_found"
+
+    def test_unreachable_page(self):
+        """Test that failed fetches are reported as unreachable."""
+        claim = extract_claims(ANALYSIS)[0]
+
+        result = pre_verify(claim, "1", "u", FetchResult(url="u", error="timeout"))
+
+        assert result.status == "unreachable"
+
+
+    def test_canonicalize_url(self):
+        """Test that cosmetic URL variants map to one canonical URL."""
+        canonical = "https://example.com/Report?a=1&b=2"
+
+        assert canonicalize_url("HTTPS://Example.COM:443/Report?b=2&a=1#top") == canonical
+        assert canonicalize_url("https://example.com/Report?a=1&utm_source=x&b=2") == canonical
+        assert canonicalize_url("https://example.com") == "https://example.com/"
+
+
+class SlowFetcher:
+    """Fetcher that takes a fixed time per page."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays: dict[str, float] = delays
+
+    async def fetch(self, url: str) -> FetchResult:
+        await asyncio.sleep(self.delays[url])
+        return FetchResult(url=url, status=200, text="Market reached 25 billion.")
+
+
+class TestCitationPrefetcher:
+    """Test background fetching driven by the analysis watcher."""
+
+    @pytest.mark.asyncio
+    async def test_watcher_prefetches_completed_sections(self, tmp_path: Path):
+        """Test that completed sections are fetched once and cached."""
+        analysis = tmp_path / "iteration_1.md"
+        _ = analysis.write_text(ANALYSIS)
+        fetcher = StubFetcher()
+        prefetcher = CitationPrefetcher(fetcher, FetchCache(tmp_path / "cache"))
+        prefetcher.start()
+
+        stop = asyncio.Event()
+        stop.set()
+        await AnalysisWatcher([analysis], prefetcher).run(stop)
+        assert await prefetcher.drain(timeout=5)
+        await prefetcher.stop()
+
+        # URL case is preserved for the fetch
+        assert sorted(fetcher.calls) == sorted(PAGES)
+        statuses = {r.citation: r.status for r in prefetcher.results()}
+        assert statuses == {"[1]": "supported", "[2]": "figures_missing"}
+
+        # A second prefetcher reuses the disk cache
+        second = StubFetcher()
+        cached = CitationPrefetcher(second, FetchCache(tmp_path / "cache"))
+        cached.start()
+        _ = cached.submit(extract_claims(ANALYSIS), {"1": ANALYSIS.split("[1] ")[-1]})
+        assert await cached.drain(timeout=5)
+        await cached.stop()
+        assert second.calls == []
+        assert cached.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_fetches_concurrently_with_deadline(self, tmp_path: Path):
+        """Test that waiting costs about the slowest fetch, capped by the timeout."""
+        analysis = (
+            "# X\n\n## Market Size\n\n"
+            + "Market A is 25 [1]. Market B is 25 [2]. Market C is 25 [3].\n\n"
+            + "## References\n\n[1] A. <https://a.com/>\n\n[2] B. <https://b.com/>\n\n"
+            + "[3] C. <https://c.com/>\n"
+        )
+        fetcher = SlowFetcher(
+            {"https://a.com/": 0.2, "https://b.com/": 0.2, "https://c.com/": 5}
+        )
+        prefetcher = CitationPrefetcher(
+            fetcher, FetchCache(tmp_path / "cache"), concurrency=3, fetch_timeout=0.3
+        )
+        prefetcher.start()
+
+        started = time.monotonic()
+        assert prefetcher.submit_analysis(analysis) == 3
+        assert await prefetcher.drain(timeout=5)
+        elapsed = time.monotonic() - started
+        await prefetcher.stop()
+
+        assert elapsed < 0.6
+        assert prefetcher.fetch_seconds > elapsed  # Sequential fetching would cost more
+        statuses = {r.url: r.status for r in prefetcher.results()}
+        assert statuses["https://a.com/"] == "supported"
+        assert statuses["https://c.com/"] == "unreachable"
+
+    def test_render_groups_by_status(self):
+        """Test that the prompt section lists unverified claims with missing figures."""
+        first, second = extract_claims(ANALYSIS)
+        results = [
+            pre_verify(first, "1", "https://a", FetchResult(url="a", status=200, text="25 2025")),
+            pre_verify(second, "2", "https://b", FetchResult(url="b", status=200, text="x")),
+        ]
+
+        section = render_pre_verifications(results)
+
+        assert section.startswith("## Pre-verified Citations")
+        assert "(missing: 38)" in section
+        assert "**Numbers found on page (hint only)" in section
+        assert "Do not re-fetch" not in section
+        assert render_pre_verifications([]) == ""
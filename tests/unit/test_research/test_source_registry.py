@@ -0,0 +1,174 @@
+"""Tests for the source reliability registry."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.research import (
+    CitationPrefetcher,
+    FetchCache,
+    FetchResult,
+    SourceRegistry,
+    render_cited_sources,
+    render_unreliable_sources,
+)
+from src.research.source_registry import format_registry, main
+
+
+def log_entry(
+    timestamp: str, message: dict[str, Any], artifacts: dict[str, Any] | None = None
+) -> str:
+    """One messages.jsonl line."""
+    return json.dumps(
+        {"timestamp": timestamp, "message": message, "artifacts": artifacts or {}}
+    )
+
+
+def fetch_call(tool_id: str, url: str) -> dict[str, Any]:
+    """Assistant message calling WebFetch."""
+    return {
+        "type": "AssistantMessage",
+        "content": [
+            {"type": "ToolUseBlock", "name": "WebFetch", "id": tool_id, "input": {"url": url}}
+        ],
+    }
+
+
+def fetch_result(
+    tool_id: str, is_error: bool, preview: str, length: int | None = None
+) -> dict[str, Any]:
+    """Artifacts of the user message carrying a WebFetch result."""
+    return {
+        "blocks": [
+            {
+                "type": "ToolResultBlock",
+                "tool_use_id": tool_id,
+                "is_error": is_error,
+                "content_preview": preview,
+                "content_length": len(preview) if length is None else length,
+                "correlated_tool": "WebFetch",
+            }
+        ]
+    }
+
+
+class TestSourceRegistry:
+    """Test learning source health and acting on it."""
+
+    def test_learn_from_run_messages(self, tmp_path):
+        """Test that WebFetch calls are paired with results, once per run."""
+        run_dir = tmp_path / "runs" / "20250101_000000_idea"
+        run_dir.mkdir(parents=True)
+        lines = [
+            log_entry("2025-01-01T00:00:00", fetch_call("a", "https://dead.com/report")),
+            log_entry(
+                "2025-01-01T00:00:04",
+                {"type": "UserMessage", "content": []},
+                fetch_result("a", True, "Request failed with status code 404"),
+            ),
+            log_entry("2025-01-01T00:00:05", fetch_call("b", "https://news.com/story")),
+            log_entry(
+                "2025-01-01T00:00:06",
+                {"type": "UserMessage", "content": []},
+                fetch_result("b", False, "Subscribe to continue reading."),
+            ),
+            # A full article whose preview mentions subscribing is not a paywall
+            log_entry("2025-01-01T00:00:07", fetch_call("c", "https://blog.com/post")),
+            log_entry(
+                "2025-01-01T00:00:08",
+                {"type": "UserMessage", "content": []},
+                fetch_result("c", False, "Subscribe to continue reading.", 20000),
+            ),
+        ]
+        _ = (run_dir / "messages.jsonl").write_text("\n".join(lines) + "\n")
+        registry = SourceRegistry(tmp_path / "registry.json")
+
+        assert registry.learn_from_runs(tmp_path / "runs") == 3
+        assert registry.learn_from_runs(tmp_path / "runs") == 0
+
+        dead = registry.urls["https://dead.com/report"]
+        assert (dead.attempts, dead.failures, dead.avg_seconds) == (1, 1, 4.0)
+        assert "404" in dead.last_error
+        assert registry.domains["news.com"].paywalls == 1
+        assert registry.domains["blog.com"].paywalls == 0
+
+    def test_known_bad_and_retry(self, tmp_path):
+        """Test that repeated failures mark a URL bad until the retry period ends."""
+        registry = SourceRegistry(tmp_path / "registry.json", retry_after_days=7)
+        for _ in range(2):
+            registry.record_fetch(
+                "https://www.dead.com/report?utm_source=x", False, 2.0, "HTTP 404",
+                when="2025-01-01T00:00:00",
+            )
+        registry.record_fetch("https://ok.com/", True, 1.0, when="2025-01-01T00:00:00")
+
+        dead = "https://WWW.dead.com/report#summary"
+        assert registry.known_bad(dead, now=datetime(2025, 1, 2)) == (
+            "failed 2 times (HTTP 404)"
+        )
+        assert registry.known_bad("https://ok.com/", now=datetime(2025, 1, 2)) is None
+        assert registry.known_bad(dead, now=datetime(2025, 2, 1)) is None
+
+    def test_fact_check_issues_and_rendering(self, tmp_path):
+        """Test that citation issues and slow domains reach the prompt sections."""
+        registry = SourceRegistry(tmp_path / "registry.json", slow_seconds=10)
+        fact_check = {
+            "issues": [
+                {"details": {"issue_type": "outdated_citation", "url_checked": "https://old.com/a"}},
+                {"details": {"issue_type": "false_citation", "url_checked": "https://old.com/b"}},
+                {"details": {"issue_type": "unsupported_claim", "url_checked": "N/A"}},
+            ]
+        }
+        assert registry.learn_from_fact_check(fact_check) == 2
+        registry.record_fetch("https://slow.org/x", True, 30.0)
+        for _ in range(2):
+            registry.record_fetch("https://dead.com/x", False, 1.0, "timeout")
+
+        guidance = render_unreliable_sources(registry)
+        cited = render_cited_sources(
+            registry, ["https://dead.com/x", "https://slow.org/x", "https://fine.net/"]
+        )
+
+        assert "- old.com: 2 false or outdated citations" in guidance
+        assert "- slow.org: slow (avg 30s)" in guidance
+        bad, slow = cited.split("slow domains")
+        assert "<https://dead.com/x>: failed 2 times (timeout)" in bad
+        assert "<https://slow.org/x>" in slow
+        assert "fine.net" not in cited
+
+    @pytest.mark.asyncio
+    async def test_prefetcher_skips_known_bad(self, tmp_path):
+        """Test that known-bad URLs get a cached failure without a fetch."""
+        registry = SourceRegistry(tmp_path / "registry.json")
+        for _ in range(2):
+            registry.record_fetch("https://dead.com/x", False, 1.0, "HTTP 500")
+
+        class NoFetcher:
+            async def fetch(self, url: str) -> FetchResult:
+                raise AssertionError(f"Fetched {url}")
+
+        prefetcher = CitationPrefetcher(
+            NoFetcher(), FetchCache(tmp_path / "cache"), registry=registry
+        )
+        page = await prefetcher._page("https://dead.com/x")  # pyright: ignore[reportPrivateUsage]
+
+        assert page.error.startswith("Known bad source: failed 2 times")
+        assert prefetcher.skipped_known_bad == 1
+        assert prefetcher.fetch_log == []
+
+    def test_inspection_cli(self, tmp_path, capsys):
+        """Test that the CLI prints the learned per-domain table."""
+        registry = SourceRegistry(tmp_path / "registry.json")
+        registry.record_fetch("https://ok.com/a", True, 2.0)
+        registry.save()
+
+        main(["--registry", str(tmp_path / "registry.json")])
+
+        output = capsys.readouterr().out
+        assert output.splitlines()[1].split() == ["ok.com", "1", "0%", "0", "2.0s", "0", "ok"]
+        assert format_registry(SourceRegistry(Path(tmp_path / "none.json"))) == (
+            "No sources recorded yet.\n"
+        )
@@ -0,0 +1,75 @@
+"""Tests for the pre-review analysis linter."""
+
+from src.utils.analysis_linter import (
+    find_uncited_figures,
+    format_lint_issues,
+    lint_analysis,
+)
+
+ANALYSIS = """# CropBot: Robot Fleets for Small Farms
+
+## What We Do
+
+CropBot rents robot teams to small farms. Farmers pay per acre.
+
+## Market Size
+
+Agricultural robotics reaches $25B in 2025 [1].
+
+## References
+
+[1] Mordor Intelligence. "Agricultural Robots Market." 2025. <https://example.com/ag>
+"""
+
+SECTIONS = ["Title", "What We Do", "Market Size", "References"]
+
+
+def _rules(issues, blocking_only: bool = True) -> list[str]:
+    return [i.rule for i in issues if i.blocking or not blocking_only]
+
+
+class TestAnalysisLinter:
+    """Test mechanical checks run before review."""
+
+    def test_clean_analysis_passes(self):
+        """Test that a complete, cited analysis has no issues."""
+        assert lint_analysis(ANALYSIS, SECTIONS, min_words=10) == []
+
+    def test_word_count_todo_and_missing_section(self):
+        """Test the structural rules."""
+        draft = ANALYSIS.replace(
+            "Agricultural robotics reaches $25B in 2025 [1].", "[TODO: market]"
+        ).replace("## What We Do", "## About")
+
+        issues = lint_analysis(draft, SECTIONS, min_words=500)
+
+        assert _rules(issues) == ["word_count", "todo_marker", "missing_section"]
+        assert issues[2].section == "What We Do"
+
+    def test_reference_list_problems(self):
+        """Test duplicate reference numbers and citations without an entry."""
+        draft = ANALYSIS.replace("[1].", "[1, 2].") + "\n[1] Duplicate entry.\n"
+
+        issues = lint_analysis(draft, SECTIONS, min_words=10)
+
+        assert _rules(issues) == ["duplicate_citation", "unknown_citation"]
+        assert "[2]" in issues[1].message
+
+    def test_uncited_figures_block_above_threshold(self):
+        """Test that a few uncited figures warn and many block."""
+        draft = ANALYSIS.replace("Farmers pay per acre.", "Farmers pay $40 per acre.")
+
+        warned = lint_analysis(draft, SECTIONS, min_words=10, max_uncited_figures=1)
+        blocked = lint_analysis(draft, SECTIONS, min_words=10, max_uncited_figures=0)
+
+        assert _rules(warned, blocking_only=False) == ["uncited_figure"]
+        assert _rules(warned) == []
+        assert _rules(blocked) == ["uncited_figure"]
+        assert "$40" in format_lint_issues(blocked)
+
+    def test_find_uncited_figures(self):
+        """Test that only uncited figures outside references are returned."""
+        draft = ANALYSIS.replace("pay per acre.", "pay $40 per acre.")
+
+        assert find_uncited_figures(ANALYSIS) == []
+        assert find_uncited_figures(draft) == [("What We Do", "Farmers pay $40 per acre.")]
@@ -0,0 +1,111 @@
+"""Tests for analysis section parsing and diffing."""
+
+from src.utils.analysis_sections import (
+    TITLE_KEY,
+    assess_completeness,
+    diff_sections,
+    parse_sections,
+    render_sections,
+    strip_metadata,
+    summarize_section,
+)
+
+ANALYSIS = """# CropBot: Robot Fleets for Small Farms
+
+## What We Do
+
+CropBot rents robot teams to small farms. Farmers pay per acre.
+
+## Market Size
+
+Agricultural robotics reaches $25B in 2025 [1].
+
+## References
+
+[1] Mordor Intelligence. "Agricultural Robots Market." 2025. <https://example.com/ag>
+
+---
+<!-- Analysis Metadata - Auto-generated, Do Not Edit -->
+<!--
+Iteration: 1
+-->
+"""
+
+
+class TestAnalysisSections:
+    """Test section-level helpers used by incremental review."""
+
+    def test_strip_metadata_removes_footer(self):
+        """Test that the metadata footer and its rule are removed."""
+        content = strip_metadata(ANALYSIS)
+
+        assert "Analysis Metadata" not in content
+        assert not content.endswith("---")
+        assert content.endswith("<https://example.com/ag>")
+
+    def test_parse_sections(self):
+        """Test splitting an analysis into ordered sections."""
+        sections = parse_sections(ANALYSIS)
+
+        assert list(sections) == [TITLE_KEY, "What We Do", "Market Size", "References"]
+        assert sections[TITLE_KEY] == "# CropBot: Robot Fleets for Small Farms"
+        assert sections["Market Size"] == "Agricultural robotics reaches $25B in 2025 [1]."
+
+    def test_render_round_trip(self):
+        """Test that rendering parsed sections preserves structure."""
+        sections = parse_sections(ANALYSIS)
+
+        assert parse_sections(render_sections(sections)) == sections
+
+    def test_diff_detects_changed_sections(self):
+        """Test that only edited sections are reported as changed."""
+        revised = ANALYSIS.replace("$25B in 2025", "$14B in 2024")
+
+        diff = diff_sections(ANALYSIS, revised)
+
+        assert diff.changed == ["Market Size"]
+        assert "What We Do" in diff.unchanged
+        assert diff.added == []
+        assert diff.removed == []
+        assert 0 < diff.changed_fraction < 1
+
+    def test_whitespace_only_edits_are_unchanged(self):
+        """Test that reflowed text is not treated as a change."""
+        revised = ANALYSIS.replace("small farms. Farmers", "small farms.\nFarmers")
+
+        diff = diff_sections(ANALYSIS, revised)
+
+        assert diff.changed == []
+        assert diff.changed_fraction == 0
+
+    def test_added_and_removed_sections(self):
+        """Test detection of sections that appear or disappear."""
+        revised = ANALYSIS.replace("## Market Size", "## Why Now?")
+
+        diff = diff_sections(ANALYSIS, revised)
+
+        assert diff.added == ["Why Now?"]
+        assert diff.removed == ["Market Size"]
+        assert diff.modified == ["Why Now?"]
+
+    def test_summarize_section(self):
+        """Test that summaries keep the first sentence."""
+        summary = summarize_section("First sentence here. Second sentence.")
+
+        assert summary == "First sentence here."
+
+    def test_assess_completeness(self):
+        """Test that TODO and absent sections count as missing."""
+        draft = ANALYSIS.replace(
+            "Agricultural robotics reaches $25B in 2025 [1].", "[TODO: 100 words]"
+        )
+
+        state = assess_completeness(
+            draft, [TITLE_KEY, "What We Do", "Market Size", "Business Model"]
+        )
+
+        assert state.filled == ["What We Do"]
+        assert state.missing == ["Market Size", "Business Model"]
+        assert state.filled_fraction == 1 / 3
+        assert state.words > 0
+
@@ -0,0 +1,74 @@
+"""Tests for artifact inlining utilities."""
+
+from pathlib import Path
+
+from src.utils.artifact_inlining import (
+    append_inlined_artifacts,
+    build_inlined_artifacts_section,
+)
+
+
+class TestArtifactInlining:
+    """Test inlining of input files into user prompts."""
+
+    def test_small_artifacts_are_inlined(self, tmp_path: Path):
+        """Test that artifacts under the threshold are embedded with their path."""
+        analysis = tmp_path / "iteration_1.md"
+        _ = analysis.write_text("# Analysis\n\nContent here.")
+        feedback = tmp_path / "feedback.json"
+        _ = feedback.write_text('{"iteration_recommendation": "reject"}')
+
+        section, inlined = build_inlined_artifacts_section(
+            [("Analysis", analysis), ("Feedback", feedback)], max_chars=1000
+        )
+
+        assert inlined == [analysis, feedback]
+        assert "Content here." in section
+        assert str(analysis) in section
+        assert "```json" in section
+        assert "Do NOT use the Read tool" in section
+
+    def test_large_artifacts_fall_back_to_paths(self, tmp_path: Path):
+        """Test that artifacts over the threshold are left out."""
+        analysis = tmp_path / "iteration_1.md"
+        _ = analysis.write_text("x" * 500)
+
+        section, inlined = build_inlined_artifacts_section(
+            [("Analysis", analysis)], max_chars=100
+        )
+
+        assert section == ""
+        assert inlined == []
+
+    def test_missing_artifacts_are_skipped(self, tmp_path: Path):
+        """Test that None and nonexistent paths are ignored."""
+        section, inlined = build_inlined_artifacts_section(
+            [("Missing", tmp_path / "nope.md"), ("None", None)], max_chars=1000
+        )
+
+        assert section == ""
+        assert inlined == []
+
+    def test_inlined_section_appended_after_instructions(self, tmp_path: Path):
+        """Test that inlined content goes at the end of the prompt."""
+        analysis = tmp_path / "iteration_1.md"
+        _ = analysis.write_text("Inlined body")
+
+        prompt, inlined = append_inlined_artifacts(
+            "# Instructions\n\nReview it.", [("Analysis", analysis)], max_chars=1000
+        )
+
+        assert inlined == [analysis]
+        assert prompt.startswith("# Instructions")
+        assert prompt.index("Review it.") < prompt.index("Inlined body")
+
+    def test_nested_code_fences_are_preserved(self, tmp_path: Path):
+        """Test that content containing code fences uses a longer fence."""
+        analysis = tmp_path / "iteration_1.md"
+        _ = analysis.write_text("```python\nprint(1)\n```")
+
+        section, _ = build_inlined_artifacts_section(
+            [("Analysis", analysis)], max_chars=1000
+        )
+
+        assert "````markdown" in section
@@ -0,0 +1,133 @@
+"""Tests for claim extraction and verdict carry-forward."""
+
+from src.utils.claims import (
+    carry_forward_issues,
+    diff_claims,
+    extract_claims,
+    merge_carried_forward,
+    merge_shard_results,
+    partition_claims,
+)
+
+ANALYSIS = """# CropBot
+
+## Market Size
+
+Agricultural robotics reaches $25B in 2025 [1]. Farmers love new tools.
+
+## Competition
+
+John Deere holds 60% of the tractor market [2].
+
+## References
+
+[1] Mordor Intelligence. "Agricultural Robots Market." 2025. <https://example.com/ag>
+[2] Statista. "Tractor market share." 2024. <https://example.com/tractors>
+"""
+
+
+class TestClaims:
+    """Test claim extraction and incremental fact-check helpers."""
+
+    def test_extract_claims_keeps_cited_and_numeric_sentences(self):
+        """Test that only checkable sentences become claims."""
+        claims = extract_claims(ANALYSIS)
+
+        assert [c.text for c in claims] == [
+            "Agricultural robotics reaches $25B in 2025 [1].",
+            "John Deere holds 60% of the tractor market [2].",
+        ]
+        assert claims[0].citations == ("1",)
+        assert "mordor intelligence" in claims[0].sources[0]
+
+    def test_renumbered_references_keep_claims_unchanged(self):
+        """Test that keys follow the reference entry, not its number."""
+        renumbered = (
+            ANALYSIS.replace("[1]", "[9]")
+            .replace("[2]", "[1]")
+            .replace("[9]", "[2]")
+        )
+
+        diff = diff_claims(ANALYSIS, renumbered)
+
+        assert diff.new == []
+        assert len(diff.unchanged) == 2
+
+    def test_modified_claim_and_swapped_source_are_new(self):
+        """Test that edited text or a different source needs re-verification."""
+        revised = ANALYSIS.replace("$25B", "$14B").replace(
+            "<https://example.com/tractors>", "<https://example.com/other>"
+        )
+
+        diff = diff_claims(ANALYSIS, revised)
+
+        assert len(diff.new) == 2
+        assert diff.unchanged == []
+        assert diff.changed_fraction == 1.0
+
+    def test_issues_on_unchanged_claims_carry_forward(self):
+        """Test that only issues on unchanged claims survive."""
+        previous = {
+            "issues": [
+                {"claim": "Agricultural robotics reaches $25B", "severity": "High"},
+                {"claim": "John Deere holds 60% of the tractor market", "severity": "Low"},
+            ]
+        }
+        revised = ANALYSIS.replace("$25B", "$14B")
+
+        diff = diff_claims(ANALYSIS, revised)
+        carried = carry_forward_issues(previous, ANALYSIS, revised, diff, 1)
+
+        assert [i["severity"] for i in carried] == ["Low"]
+        assert carried[0]["carried_forward_from"] == 1
+
+    def test_merge_updates_statistics_and_recommendation(self):
+        """Test that a carried High issue overrides an approval."""
+        fact_check = {
+            "issues": [],
+            "statistics": {"total_claims": 1, "verified_claims": 1},
+            "iteration_recommendation": "approve",
+            "iteration_reason": "Changed claims verified.",
+        }
+        carried = [{"claim": "Old claim", "severity": "High", "carried_forward_from": 1}]
+
+        merged = merge_carried_forward(fact_check, carried, unchanged_count=3, previous_iteration=1)
+
+        assert merged["statistics"]["total_claims"] == 4
+        assert merged["statistics"]["verified_claims"] == 3
+        assert merged["iteration_recommendation"] == "reject"
+        assert len(merged["issues"]) == 1
+
+    def test_partition_adapts_shard_count_and_keeps_sections(self):
+        """Test that shard count follows claim count and sections stay whole."""
+        claims = extract_claims(ANALYSIS)
+
+        assert len(partition_claims(claims, claims_per_shard=8, max_shards=4)) == 1
+        shards = partition_claims(claims, claims_per_shard=1, max_shards=4)
+        assert len(shards) == 2
+        assert {c.section for c in shards[0]} != {c.section for c in shards[1]}
+        assert partition_claims([], claims_per_shard=1, max_shards=4) == []
+
+    def test_merge_shard_results(self):
+        """Test that shard issues and statistics are combined."""
+        shards: list[dict[str, object]] = [
+            {
+                "issues": [{"claim": "A", "severity": "Medium"}],
+                "statistics": {"total_claims": 4, "verified_claims": "3"},
+                "iteration_recommendation": "approve",
+                "iteration_reason": "Fine.",
+            },
+            {
+                "issues": [{"claim": "B", "severity": "High"}],
+                "statistics": {"total_claims": 2, "verified_claims": 1},
+                "iteration_recommendation": "reject",
+                "iteration_reason": "B is false.",
+            },
+        ]
+
+        merged = merge_shard_results(shards)
+
+        assert len(merged["issues"]) == 2
+        assert merged["statistics"] == {"total_claims": 6, "verified_claims": 4}
+        assert merged["iteration_recommendation"] == "reject"
+        assert "B is false." in merged["iteration_reason"]
@@ -88,6 +88,21 @@ class TestFeedbackValidator:
         finally:
             temp_path.unlink(missing_ok=True)
 
+    def test_describe_problem(self, validator, valid_feedback, tmp_path):
+        """Test repair descriptions: None when fixable, the cause otherwise."""
+        import json
+
+        feedback_file = tmp_path / "feedback.json"
+        feedback_file.write_text(json.dumps(valid_feedback))
+        assert validator.describe_problem(feedback_file) is None
+
+        feedback_file.write_text("{broken json}")
+        assert "not valid JSON" in validator.describe_problem(feedback_file)
+
+        valid_feedback["iteration_recommendation"] = "maybe"
+        feedback_file.write_text(json.dumps(valid_feedback))
+        assert "allowed values" in validator.describe_problem(feedback_file)
+
     def test_fix_common_issues_missing_fields(self, validator):
         """Test auto-adding required fields."""
         feedback = {}  # Empty feedback
@@ -0,0 +1,121 @@
+"""Tests for revision brief generation."""
+
+from src.utils.revision_brief import build_revision_brief
+
+
+class TestRevisionBrief:
+    """Test merging reviewer and fact-check outputs into a compact brief."""
+
+    def _feedback(self) -> dict[str, object]:
+        return {
+            "overall_assessment": "Promising but weak on market sizing.",
+            "strengths": ["Clear problem statement"],
+            "critical_issues": [
+                {
+                    "section": "Market Size",
+                    "issue": "TAM figure of $25B is not supported by the cited source",
+                    "suggestion": "Find a credible source for the $25B TAM figure",
+                }
+            ],
+            "improvements": [
+                {
+                    "section": "Competition & Moat",
+                    "issue": "Missing major competitors",
+                    "suggestion": "Add the top 3 incumbents",
+                }
+            ],
+            "minor_suggestions": [
+                {
+                    "section": "What We Do",
+                    "issue": "Wordy",
+                    "suggestion": "Tighten the opening",
+                }
+            ],
+            "verification_notes": ["Searched 'ag robotics market' - found $14B"],
+            "iteration_recommendation": "reject",
+            "iteration_reason": "TAM is unsupported.",
+        }
+
+    def _fact_check(self) -> dict[str, object]:
+        return {
+            "issues": [
+                {
+                    "claim": "Market is $25B in 2025",
+                    "section": "Market Size",
+                    "severity": "Medium",
+                    "details": {
+                        "issue_type": "false_citation",
+                        "citation_ref": "[6]",
+                        "url_checked": "https://example.com/report",
+                        "explanation": "Cited source does not support the $25B TAM figure",
+                        "evidence": "Page shows $14B",
+                        "suggestion": "Find a credible source for the $25B TAM figure",
+                    },
+                },
+                {
+                    "claim": "Labor is 40% of costs",
+                    "section": "The Problem",
+                    "severity": "Low",
+                    "details": {
+                        "issue_type": "unsupported_claim",
+                        "citation_ref": "none",
+                        "explanation": "No citation",
+                        "evidence": "",
+                        "suggestion": "Cite the USDA source",
+                    },
+                },
+            ],
+            "statistics": {"total_claims": 12, "verified_claims": 10},
+            "iteration_recommendation": "reject",
+            "iteration_reason": "False citation on TAM.",
+        }
+
+    def test_non_actionable_fields_are_dropped(self):
+        """Test that strengths, verification notes and evidence are excluded."""
+        brief = build_revision_brief(self._feedback(), self._fact_check(), 1)
+
+        assert "Clear problem statement" not in brief
+        assert "ag robotics market" not in brief
+        assert "Page shows $14B" not in brief
+        assert "example.com/report" not in brief
+        assert "total_claims" not in brief
+
+    def test_issues_ordered_by_severity(self):
+        """Test that must-fix items come before optional polish."""
+        brief = build_revision_brief(self._feedback(), self._fact_check(), 1)
+
+        assert brief.index("## Must Fix") < brief.index("## Should Fix")
+        assert brief.index("## Should Fix") < brief.index("## Optional Polish")
+        assert brief.index("Market Size") < brief.index("Tighten the opening")
+
+    def test_overlapping_issues_deduplicated_by_section(self):
+        """Test that the same TAM issue from both agents appears once."""
+        brief = build_revision_brief(self._feedback(), self._fact_check(), 1)
+
+        assert brief.count("Find a credible source for the $25B TAM figure") == 1
+        assert "reviewer, fact-check:false_citation" in brief
+
+    def test_recommendations_summarized(self):
+        """Test that each agent's recommendation appears in the header."""
+        brief = build_revision_brief(self._feedback(), self._fact_check(), 2)
+
+        assert "feedback on iteration 2" in brief
+        assert "- Reviewer: reject - TAM is unsupported." in brief
+        assert "- Fact-check: reject - False citation on TAM." in brief
+
+    def test_brief_is_smaller_than_raw_feedback(self):
+        """Test that the brief is more compact than the raw JSON."""
+        import json
+
+        raw = json.dumps(self._feedback(), indent=2) + json.dumps(
+            self._fact_check(), indent=2
+        )
+        brief = build_revision_brief(self._feedback(), self._fact_check(), 1)
+
+        assert len(brief) < len(raw)
+
+    def test_empty_inputs(self):
+        """Test brief generation with no feedback at all."""
+        brief = build_revision_brief(None, None, 1)
+
+        assert "No actionable issues" in brief
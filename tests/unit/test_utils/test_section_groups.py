@@ -0,0 +1,111 @@
+"""Tests for section-group templates and merging."""
+
+from src.utils.analysis_sections import parse_sections
+from src.utils.section_groups import (
+    build_group_template,
+    merge_group_analyses,
+    render_research_cache,
+)
+
+TEMPLATE = """# [Company Name]: [One-line Description]
+
+## What We Do
+
+[TODO: 50 words]
+
+## Market Size
+
+[TODO: 100 words]
+
+## Competition & Moat
+
+[TODO: 150 words]
+
+## References
+
+[TODO: Add citations]
+"""
+
+PART_1 = """# CropBot: Robot Fleets for Farms
+
+## What We Do
+
+CropBot rents robots to farms [1].
+
+## References
+
+[1] USDA. "Farm Labor." 2024. <https://usda.gov/labor>
+"""
+
+PART_2 = """# AgriBot: Farm Robots
+
+## Market Size
+
+Robots reach $14B [1]. Labor is scarce [2].
+
+## Competition & Moat
+
+Deere leads [3].
+
+## References
+
+[1] Mordor. "Ag Robots." 2025. <https://mordor.com/ag>
+
+[2] USDA. "Farm Labor Survey." 2024. <https://usda.gov/labor>
+
+[3] Statista. "Tractors." 2024. <https://statista.com/tractors>
+"""
+
+
+class TestSectionGroups:
+    """Test helpers for section-parallel analyst generation."""
+
+    def test_group_template_keeps_title_group_and_references(self):
+        """Test that a partial template holds only its group's sections."""
+        partial = parse_sections(build_group_template(TEMPLATE, ["Market Size"]))
+
+        assert list(partial) == ["Title", "Market Size", "References"]
+
+    def test_merge_orders_sections_and_uses_first_title(self):
+        """Test that merged sections follow the template order."""
+        merged = parse_sections(merge_group_analyses(TEMPLATE, [PART_2, PART_1]))
+
+        assert list(merged) == [
+            "Title",
+            "What We Do",
+            "Market Size",
+            "Competition & Moat",
+            "References",
+        ]
+        assert merged["Title"] == "# AgriBot: Farm Robots"
+
+    def test_merge_renumbers_and_deduplicates_citations(self):
+        """Test that citations map to one shared, deduplicated reference list."""
+        merged = parse_sections(merge_group_analyses(TEMPLATE, [PART_1, PART_2]))
+
+        assert merged["What We Do"] == "CropBot rents robots to farms [1]."
+        assert merged["Market Size"] == "Robots reach $14B [2]. Labor is scarce [1]."
+        assert merged["Competition & Moat"] == "Deere leads [3]."
+        references = merged["References"]
+        assert references.count("usda.gov/labor") == 1
+        assert references.startswith("[1] USDA.")
+        assert "[3] Statista." in references
+
+    def test_research_cache_lists_unique_sources(self):
+        """Test rendering of the shared research cache."""
+        cache = render_research_cache(
+            ["ag robots market", "ag robots market"],
+            [
+                {"title": "Mordor", "url": "https://mordor.com/ag"},
+                {"title": "Mordor again", "url": "https://mordor.com/ag"},
+            ],
+        )
+
+        assert cache.count("- ag robots market") == 1
+        assert cache.count("mordor.com/ag") == 1
+
+    def test_empty_research_cache(self):
+        """Test the cache before any research has run."""
+        cache = render_research_cache([], [])
+
+        assert cache.count("(none yet)") == 2
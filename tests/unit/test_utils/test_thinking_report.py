@@ -0,0 +1,64 @@
+"""Tests for the thinking-volume report."""
+
+import json
+from pathlib import Path
+
+from src.utils.thinking_report import format_report, load_samples, summarize
+
+
+def _write_run(runs_dir: Path, run_id: str, budget: int, chars: int, outcome: str):
+    """Write a minimal run summary with one analyst and one reviewer iteration."""
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True)
+    metrics = {
+        "analyst_iteration_1": {
+            "agent_name": "analyst",
+            "iteration": 1,
+            "thinking_budget": 8000,
+            "total_thinking_length": 5000,
+            "duration_seconds": 120.0,
+        },
+        "reviewer_iteration_1": {
+            "agent_name": "reviewer",
+            "iteration": 1,
+            "thinking_budget": budget,
+            "total_thinking_length": chars,
+            "duration_seconds": chars / 100,
+            "outcome": outcome,
+        },
+    }
+    summary = {"run_id": run_id, "agent_metrics": metrics}
+    _ = (run_dir / "run_summary.json").write_text(json.dumps(summary))
+
+
+class TestThinkingReport:
+    """Test loading, grouping and correlating thinking samples."""
+
+    def test_groups_by_budget_with_outcomes(self, tmp_path: Path):
+        """Test that samples are grouped per budget and analysts inherit outcomes."""
+        _write_run(tmp_path, "run_a", 2000, 1000, "approve")
+        _write_run(tmp_path, "run_b", 8000, 6000, "approve")
+        _write_run(tmp_path, "run_c", 8000, 9000, "reject")
+
+        samples = load_samples(tmp_path)
+        report = summarize(samples)
+
+        assert len(samples) == 6
+        analyst = report["analyst"]["budgets"]["8000"]
+        assert (analyst.samples, analyst.approvals, analyst.reviewed) == (3, 2, 3)
+        reviewer = report["reviewer"]
+        assert reviewer["budgets"]["2000"].approval_rate == 1.0
+        assert reviewer["budgets"]["8000"].approval_rate == 0.5
+        assert reviewer["corr_duration"] == 1.0
+        assert reviewer["corr_approval"] < 0
+
+    def test_format_report(self, tmp_path: Path):
+        """Test that the report renders a row per budget and handles no data."""
+        _write_run(tmp_path, "run_a", 2000, 1000, "approve")
+
+        text = format_report(summarize(load_samples(tmp_path)))
+
+        assert "## reviewer" in text
+        assert "2000" in text
+        assert "corr(thinking, duration) = -" in text
+        assert format_report({}) == "No run summaries found."